@@ -0,0 +1,740 @@
+"""Asyncio acquisition core shared by the GUI and the headless CLI. No Qt imports."""
+import numpy as np
+import alarms
+import asyncio
+import calibration
+import collections
+import contextlib
+import comm
+import metrics
+import time
+from typing import Tuple
+
+
+RECENT_SEQUENCES = 256  # answered sequence numbers remembered for duplicate detection
+POLL_INTERVAL = 0.005  # seconds, only used where the port has no pollable file descriptor
+READ_SIZE = 65536  # maximum bytes taken from the port per wakeup
+
+
+class FrameLost(Exception):
+    """A sequenced request whose reply never came, detected because a later request was answered first."""
+
+
+class StreamFailed(Exception):
+    """A stream giving up after comm.FAILURE_LIMIT failed frames in a row."""
+
+
+class Frame:
+    """A parsed dataframe and where and when it came from."""
+
+    def __init__(self, data: np.ndarray, device_id: str, sent: float, received: float,
+                 stamps: metrics.FrameStamps = None, sequence: int = None):
+        self.data = data
+        self.sequence = sequence
+        self.device_id = device_id
+        self.sent = sent  # time.perf_counter() when the request was written
+        self.received = received  # time.perf_counter() when the dataframe was complete
+        # wall clock time of arrival, comparable across devices and processes
+        self.timestamp = time.time() - (time.perf_counter() - received)
+        # stage timestamps for the consumer to complete (displayed, saved) and finish
+        self.stamps = stamps
+
+    def latency(self) -> float:
+        """Request to complete dataframe, in milliseconds."""
+        return (self.received - self.sent) * 1000
+
+
+class Device:
+    """Protocol driver for one camera on an asyncio event loop.
+
+    Incoming bytes are split into lines as they arrive: commands and dataframes are queued for the request
+    waiting on them, anything else is handed to on_message. Real serial ports are watched through their file
+    descriptor, so waiting costs nothing; ports without one (DummySerial, Windows) are polled every POLL_INTERVAL.
+    """
+
+    def __init__(self, serial, device_id: str = "0", on_message=None, on_error=None,
+                 counters: metrics.Counters = None, frame_timer: metrics.FrameTimer = None,
+                 calibration: calibration.Calibration = None, alarms: alarms.AlarmSet = None, on_alarm=None):
+        self.serial = serial
+        self.device_id = device_id
+        # applied to every frame as soon as it's parsed
+        self.calibration = calibration
+        # checked on every frame as soon as it's parsed; state changes go to on_alarm(device_id, event)
+        self.alarms = alarms
+        self.on_alarm = on_alarm
+        self.on_message = on_message
+        self.on_error = on_error
+        self.counters = counters if counters else metrics.Counters()
+        self.frame_timer = frame_timer if frame_timer else metrics.FrameTimer()
+        self.decoder = comm.FrameDecoder()
+        self.compressed = False
+        # the device acknowledged <k1>: every dataframe must carry a valid checksum
+        self.checksum = False
+        # a restart of the compressed encoding was sent, and its ack is nobody's reply
+        self.keyframe_requested = False
+        self.buffer = bytearray()
+        # framed commands waiting for write_pending
+        self.pending = bytearray()
+        self.write_scheduled = False
+        self.commands = asyncio.Queue()
+        self.dataframes = asyncio.Queue()
+        # Unsequenced responses carry no identity, so only one such exchange may be in flight at a time
+        self.lock = asyncio.Lock()
+        # Sequenced requests in send order: sequence -> (future, sent, stamps)
+        self.outstanding = {}
+        self.answered = collections.deque(maxlen=RECENT_SEQUENCES)
+        self.next_sequence = 0
+        self.loop = None
+        self.fd = None
+        self.poller = None
+
+    def start(self):
+        """Begins reading from the port on the current event loop."""
+        self.loop = asyncio.get_event_loop()
+        try:
+            self.fd = self.serial.fileno()
+            self.loop.add_reader(self.fd, self.read_available)
+        except (AttributeError, NotImplementedError):
+            self.fd = None
+            self.poller = self.loop.create_task(self.poll())
+
+    def close(self):
+        """Stops reading. The serial port itself is left to the caller."""
+        if self.fd is not None:
+            self.loop.remove_reader(self.fd)
+            self.fd = None
+        if self.poller:
+            self.poller.cancel()
+            self.poller = None
+
+    async def poll(self):
+        while True:
+            self.read_available()
+            await asyncio.sleep(POLL_INTERVAL)
+
+    def read_available(self):
+        """Takes whatever the port has buffered and dispatches every complete line."""
+        try:
+            waiting = self.serial.inWaiting()
+            chunk = self.serial.read(min(waiting, READ_SIZE)) if waiting else b''
+        except Exception as error:
+            self.close()
+            if self.on_error:
+                self.on_error(error)
+            return
+        if not chunk:
+            return
+        self.frame_timer.stamp("first_byte")
+        self.counters.bytes += len(chunk)
+        self.buffer += chunk
+        *lines, rest = self.buffer.split(b'\n')
+        self.buffer = bytearray(rest)
+        for line in lines:
+            self.dispatch(comm.strip_line(bytes(line)))
+
+    def dispatch(self, raw_line: bytes):
+        if not raw_line:
+            return
+        if comm.is_command(raw_line):
+            cmd = comm.decode_command(raw_line)
+            if self.keyframe_requested and cmd.encode('utf-8') == comm.COMPRESS_COMMAND + b'1':
+                self.keyframe_requested = False
+                return
+            self.commands.put_nowait(cmd)
+        elif comm.is_dataframe(raw_line):
+            self.frame_timer.stamp("received")
+            try:
+                sequence, payload = comm.split_sequence(comm.decode_df(raw_line, self.checksum))
+            except ValueError as error:
+                self.reject(error)
+                return
+            if sequence is None:
+                self.dataframes.put_nowait((payload, time.perf_counter()))
+            else:
+                self.match(sequence, payload, time.perf_counter())
+        elif self.checksum and comm.is_partial_dataframe(raw_line):
+            # without checksums such a line may just as well be a device log message
+            self.reject(comm.ChecksumError("truncated dataframe"))
+        elif self.on_message:
+            self.on_message(raw_line.decode('utf-8', 'replace'))
+
+    def reject(self, error: ValueError):
+        """Fails the request a corrupt dataframe most likely answered, without parsing it.
+
+        The device answers in order, so that's the oldest outstanding sequenced request, or else the
+        unsequenced request waiting on self.dataframes.
+        """
+        self.counters.corrupt += 1
+        self.request_keyframe()
+        if self.outstanding:
+            future = self.outstanding.pop(next(iter(self.outstanding)))[0]
+            if not future.done():
+                future.set_exception(error)
+        else:
+            self.dataframes.put_nowait((error, time.perf_counter()))
+
+    def match(self, sequence: int, payload: str, received: float):
+        """Hands a sequenced dataframe to its request. Requests sent before it and still unanswered are lost."""
+        entry = self.outstanding.pop(sequence, None)
+        if entry is None:
+            if sequence in self.answered:
+                self.counters.duplicates += 1
+            else:
+                # the request already timed out
+                self.counters.dropped += 1
+            return
+        self.answered.append(sequence)
+        # the device answers in order, so anything older than this reply won't be answered any more
+        for older in list(self.outstanding):
+            if self.outstanding[older][1] > entry[1]:
+                break
+            future = self.outstanding.pop(older)[0]
+            self.counters.lost += 1
+            if not future.done():
+                future.set_exception(FrameLost(f"no reply to request {older}"))
+        entry[2].stamp("received")
+        if not entry[0].done():
+            entry[0].set_result((payload, received))
+
+    def send_command(self, cmd: bytes, flush: bool = True):
+        """Writes a framed command in one call, so it goes out in one USB transfer.
+
+        A port error is handled as in port_failed, then raised.
+        """
+        encoded = comm.ENCODED_COMMANDS.get(cmd) or comm.encode_command(cmd)
+        try:
+            self.serial.write(encoded)
+            if flush:
+                self.serial.flush()
+        except Exception as error:
+            self.port_failed(error)
+            raise
+
+    def flush(self):
+        """Flushes commands written with flush=False. A port error is handled as in port_failed, then raised."""
+        try:
+            self.serial.flush()
+        except Exception as error:
+            self.port_failed(error)
+            raise
+
+    def port_failed(self, error: Exception):
+        """Stops reading from a port that failed, fails the requests waiting on it and passes the error to on_error."""
+        self.close()
+        for future, _, _ in self.outstanding.values():
+            if not future.done():
+                future.set_exception(error)
+        self.outstanding.clear()
+        if self.on_error:
+            self.on_error(error)
+
+    def queue_command(self, cmd: bytes):
+        """Queues a command to be written on the next loop iteration.
+
+        Everything queued before then is coalesced into a single write and flush, which is what keeps
+        pipelined requests from costing a USB transaction each.
+        """
+        self.pending += comm.ENCODED_COMMANDS.get(cmd) or comm.encode_command(cmd)
+        if not self.write_scheduled:
+            self.write_scheduled = True
+            self.loop.call_soon(self.write_pending)
+
+    def write_pending(self):
+        self.write_scheduled = False
+        if not self.pending:
+            return
+        data = bytes(self.pending)
+        self.pending.clear()
+        try:
+            self.serial.write(data)
+            self.serial.flush()
+        except Exception as error:
+            self.port_failed(error)
+
+    async def ping(self) -> float:
+        """Pings the device and returns the round trip time in milliseconds.
+
+        Raises:
+            asyncio.TimeoutError: no reply within comm.PING_TIMEOUT
+            ValueError: the reply wasn't a pong
+        """
+        async with self.lock:
+            return await self.ping_locked()
+
+    async def ping_locked(self) -> float:
+        """As ping. The caller must hold self.lock."""
+        sent = time.perf_counter()
+        try:
+            reply = await self.transact(comm.PING_COMMAND)
+        except asyncio.TimeoutError:
+            self.counters.timeouts += 1
+            self.counters.ping_rtt = None
+            raise
+        if reply != comm.PING_RESPONSE.decode('utf-8'):
+            raise ValueError(f"unexpected ping response {reply!r}")
+        self.counters.ping_rtt = (time.perf_counter() - sent) * 1000
+        return self.counters.ping_rtt
+
+    async def exchange(self, cmd: bytes, timeout: float = comm.PING_TIMEOUT) -> str:
+        """Sends a command and returns the device's command reply. Raises asyncio.TimeoutError."""
+        async with self.lock:
+            return await self.transact(cmd, timeout)
+
+    async def transact(self, cmd: bytes, timeout: float = comm.PING_TIMEOUT) -> str:
+        """As exchange. The caller must hold self.lock."""
+        clear(self.commands)
+        self.send_command(cmd)
+        return await asyncio.wait_for(self.commands.get(), timeout)
+
+    async def negotiate_baudrate(self, on_message=None) -> int:
+        """Switches the link to the fastest baudrate both ends support, falling back one rate at a time.
+
+        Every switch is verified with pings at the new rate; if they fail both ends return to the rate that
+        worked. Returns the rate in use afterwards.
+        """
+        report = on_message if on_message else (lambda line: None)
+        try:
+            supported = comm.parse_baudrates(await self.exchange(comm.BAUD_QUERY_COMMAND))
+        except asyncio.TimeoutError:
+            report("Device doesn't support baudrate negotiation")
+            return self.serial.baudrate
+        host = [int(rate) for rate in comm.list_baudrates() if rate.isdigit()]
+        current = self.serial.baudrate
+        for rate in sorted(set(supported) & set(host), reverse=True):
+            if rate <= current:
+                break
+            if await self.switch_baudrate(rate):
+                report(f"Switched to {rate} baud")
+                return rate
+            report(f"{rate} baud failed verification, falling back")
+        return self.serial.baudrate
+
+    async def switch_baudrate(self, rate: int) -> bool:
+        """Moves both ends to rate and verifies it with pings, restoring the previous rate on failure.
+
+        The lock is held throughout, so no other command or request goes out while the two ends disagree.
+        """
+        async with self.lock:
+            return await self.switch_baudrate_locked(rate)
+
+    async def switch_baudrate_locked(self, rate: int) -> bool:
+        """As switch_baudrate. The caller must hold self.lock."""
+        previous = self.serial.baudrate
+        cmd = comm.BAUD_SET_COMMAND + str(rate).encode('utf-8')
+        try:
+            ack = await self.transact(cmd)
+        except asyncio.TimeoutError:
+            return False
+        if ack.encode('utf-8') != cmd:
+            return False
+        await asyncio.sleep(comm.BAUD_SETTLE)
+        self.serial.baudrate = rate
+        self.buffer.clear()
+        for attempt in range(comm.BAUD_VERIFY_PINGS):
+            try:
+                await self.ping_locked()
+                return True
+            except (asyncio.TimeoutError, ValueError):
+                pass
+        # The device gives up on the new rate by itself; wait for it, then follow
+        await asyncio.sleep(comm.BAUD_REVERT_TIMEOUT)
+        self.serial.baudrate = previous
+        self.buffer.clear()
+        return False
+
+    async def set_option(self, command: bytes, enable: bool) -> bool:
+        """Turns a dataframe option such as compression on or off. Returns False if the device didn't acknowledge."""
+        cmd = command + (b'1' if enable else b'0')
+        try:
+            ack = await self.exchange(cmd)
+        except asyncio.TimeoutError:
+            return False
+        return ack.encode('utf-8') == cmd
+
+    async def set_compression(self, enable: bool = True) -> bool:
+        """Asks the device for compressed (or plain) dataframes."""
+        acknowledged = await self.set_option(comm.COMPRESS_COMMAND, enable)
+        self.compressed = enable and acknowledged
+        # the next compressed frame is a keyframe
+        self.decoder.reset()
+        return acknowledged
+
+    def request_keyframe(self):
+        """After a missed frame, asks the device to restart the compressed encoding instead of waiting for the next keyframe."""
+        if self.compressed and not self.keyframe_requested:
+            self.decoder.reset()
+            self.keyframe_requested = True
+            # written straight away so it goes out ahead of the next request
+            with contextlib.suppress(Exception):
+                # a port error has been handled by send_command, and fails the next request anyway
+                self.send_command(comm.COMPRESS_COMMAND + b'1')
+
+    async def set_checksum(self, enable: bool = True) -> bool:
+        """Asks the device to append a CRC-32 to every dataframe. Only then are truncated or unchecked frames rejected."""
+        acknowledged = await self.set_option(comm.CHECKSUM_COMMAND, enable)
+        self.checksum = enable and acknowledged
+        return acknowledged
+
+    async def measure_frame_rate(self, frames: int = 5) -> float:
+        """Requests frames back to back and returns the achieved frames per second.
+
+        The probe frames are timed on a throwaway FrameTimer, so they stay out of the run's latency histograms.
+        """
+        run_timer = self.frame_timer
+        self.frame_timer = metrics.FrameTimer()
+        start = time.perf_counter()
+        count = 0
+        try:
+            async for frame in self.stream(frames):
+                count += 1
+        finally:
+            self.frame_timer = run_timer
+        return count / (time.perf_counter() - start)
+
+    async def request_frame(self) -> Frame:
+        """Requests a single frame and waits for it to arrive and parse, repeating the request if the reply is corrupt.
+
+        Raises:
+            asyncio.TimeoutError: no dataframe within comm.REQUEST_TIMEOUT
+            comm.ChecksumError: still corrupt after comm.CORRUPT_RETRIES repeats
+            ValueError: the dataframe couldn't be parsed
+        """
+        for attempt in range(comm.CORRUPT_RETRIES + 1):
+            try:
+                async with self.lock:
+                    self.write_request()
+                    self.flush()
+                    sent = self.mark_sent()
+                    return await self.receive_frame(sent)
+            except comm.ChecksumError:
+                if attempt == comm.CORRUPT_RETRIES:
+                    raise
+                self.counters.retries += 1
+
+    def write_request(self):
+        """Writes a frame request without flushing the port. The caller must hold self.lock."""
+        # Anything still queued is a late reply to an earlier request
+        self.counters.dropped += clear(self.dataframes)
+        self.send_command(comm.REQUEST_COMMAND, flush=False)
+
+    def mark_sent(self) -> float:
+        """Starts timing the request just flushed and returns its send time."""
+        self.frame_timer.start()
+        return time.perf_counter()
+
+    async def receive_frame(self, sent: float) -> Frame:
+        """Waits for the dataframe answering the request sent at `sent` and parses it. Raises as request_frame."""
+        try:
+            raw_data, received = await asyncio.wait_for(self.dataframes.get(), comm.REQUEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.frame_timer.cancel()
+            self.counters.timeouts += 1
+            raise
+        if isinstance(raw_data, comm.ChecksumError):
+            self.frame_timer.cancel()
+            raise raw_data
+        try:
+            array = self.decoder.decode(raw_data)
+        except ValueError:
+            self.request_keyframe()
+            self.frame_timer.cancel()
+            self.counters.parse_errors += 1
+            raise
+        array = self.correct(array, received)
+        self.frame_timer.stamp("parsed")
+        self.counters.frames += 1
+        return Frame(array, self.device_id, sent, received, self.frame_timer.detach())
+
+    def correct(self, array: np.ndarray, received: float) -> np.ndarray:
+        """Calibrates a freshly parsed frame and checks its alarms, before anyone else gets to see it."""
+        if self.calibration:
+            array = self.calibration.apply(array)
+        if self.alarms:
+            for event in self.alarms.check(array, received):
+                self.counters.alarms += 1
+                if self.on_alarm:
+                    self.on_alarm(self.device_id, event)
+        return array
+
+    async def request_sequenced(self) -> Frame:
+        """Requests a frame tagged with a sequence number, without waiting for earlier requests to be answered.
+
+        Raises:
+            asyncio.TimeoutError: no dataframe within comm.REQUEST_TIMEOUT
+            FrameLost: a later request was answered first
+            comm.ChecksumError: the reply was corrupt; pipeline replaces the request
+            ValueError: the dataframe couldn't be parsed
+        """
+        sequence = self.next_sequence
+        self.next_sequence = (sequence + 1) % comm.SEQ_MODULUS
+        future = self.loop.create_future()
+        stamps = self.frame_timer.begin()
+        sent = time.perf_counter()
+        self.outstanding[sequence] = (future, sent, stamps)
+        self.queue_command(comm.sequenced_request(sequence))
+        try:
+            payload, received = await asyncio.wait_for(future, comm.REQUEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.outstanding.pop(sequence, None)
+            self.counters.timeouts += 1
+            raise
+        try:
+            array = self.decoder.decode(payload)
+        except ValueError:
+            self.request_keyframe()
+            self.counters.parse_errors += 1
+            raise
+        array = self.correct(array, received)
+        stamps.stamp("parsed")
+        self.counters.frames += 1
+        return Frame(array, self.device_id, sent, received, stamps, sequence)
+
+    async def pipeline(self, frames: int = None, duration: float = None, depth: int = 4, on_failure=None):
+        """Like stream, but keeps up to depth sequenced requests in flight so the link never sits idle."""
+        end = time.monotonic() + duration if duration else None
+        in_flight = collections.deque()
+        count = 0
+        failures = 0
+        try:
+            while True:
+                while len(in_flight) < depth and (frames is None or count + len(in_flight) < frames) \
+                        and (end is None or time.monotonic() < end):
+                    in_flight.append(asyncio.ensure_future(self.request_sequenced()))
+                if not in_flight:
+                    break
+                try:
+                    frame = await in_flight.popleft()
+                except (asyncio.TimeoutError, FrameLost, ValueError) as error:
+                    if on_failure:
+                        on_failure(self.device_id, error)
+                    failures = self.count_failure(failures, error)
+                    continue
+                failures = 0
+                count += 1
+                yield frame
+        finally:
+            for request in in_flight:
+                request.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def stream(self, frames: int = None, duration: float = None, on_failure=None):
+        """Yields frames requested back to back until the count or duration is reached.
+
+        Timeouts and format errors are counted and passed to on_failure(device_id, error), then the stream carries on,
+        unless comm.FAILURE_LIMIT frames have failed in a row.
+
+        Raises:
+            StreamFailed: comm.FAILURE_LIMIT failed frames in a row
+        """
+        end = time.monotonic() + duration if duration else None
+        count = 0
+        failures = 0
+        while (frames is None or count < frames) and (end is None or time.monotonic() < end):
+            try:
+                frame = await self.request_frame()
+            except (asyncio.TimeoutError, ValueError) as error:
+                if on_failure:
+                    on_failure(self.device_id, error)
+                failures = self.count_failure(failures, error)
+                continue
+            failures = 0
+            count += 1
+            yield frame
+
+    def count_failure(self, failures: int, error: Exception) -> int:
+        """Returns the failures in a row including this one, raising StreamFailed once that reaches comm.FAILURE_LIMIT."""
+        failures += 1
+        if failures >= comm.FAILURE_LIMIT:
+            raise StreamFailed(f"{self.device_id}: gave up after {failures} failed frames in a row, "
+                               f"the last {error!r}") from error
+        return failures
+
+    def queue_depths(self) -> Tuple[int, int]:
+        """Returns the number of unhandled (commands, dataframes)."""
+        return self.commands.qsize(), self.dataframes.qsize()
+
+
+def clear(queue: asyncio.Queue) -> int:
+    """Empties a queue without waiting, returning how many items were discarded."""
+    count = 0
+    while not queue.empty():
+        queue.get_nowait()
+        count += 1
+    return count
+
+
+class FrameSet:
+    """The frames answering one synchronized trigger, keyed by device id."""
+
+    def __init__(self, number: int, sent: dict, frames: dict, failures: dict):
+        self.number = number
+        self.sent = sent  # device id -> time.perf_counter() the request was flushed
+        self.frames = frames  # device id -> Frame, for the devices that answered
+        self.failures = failures  # device id -> exception, for those that didn't
+
+    def skew(self) -> float:
+        """Time between the first and last device being triggered, in milliseconds."""
+        return (max(self.sent.values()) - min(self.sent.values())) * 1000
+
+    def spread(self) -> float:
+        """Time between the first and last dataframe arriving, in milliseconds."""
+        received = [frame.received for frame in self.frames.values()]
+        return (max(received) - min(received)) * 1000 if received else 0.0
+
+    def complete(self) -> bool:
+        return not self.failures
+
+
+class DeviceManager:
+    """Several cameras on one event loop. Each device runs its own request loop; frames are merged as they arrive."""
+
+    def __init__(self):
+        self.devices = {}
+        self.sets = 0
+        self.skew = metrics.Histogram(metrics.SKEW_BUCKETS_MS)
+        self.spread = metrics.Histogram(metrics.SKEW_BUCKETS_MS)
+
+    def add(self, serial, device_id: str, **kwargs) -> Device:
+        """Adds a device. kwargs are passed on to Device."""
+        if device_id in self.devices:
+            raise ValueError(f"duplicate device id {device_id!r}")
+        device = Device(serial, device_id, **kwargs)
+        self.devices[device_id] = device
+        return device
+
+    def start(self):
+        for device in self.devices.values():
+            device.start()
+
+    def close(self):
+        for device in self.devices.values():
+            device.close()
+
+    async def stream(self, frames: int = None, duration: float = None, on_failure=None, depth: int = 1):
+        """Yields frames from all devices concurrently, in arrival order. frames is per device.
+
+        With depth above 1 each device pipelines that many sequenced requests. An error ending one device's
+        stream, such as the port failing, is raised here and stops the others.
+        """
+        merged = asyncio.Queue()
+
+        async def forward(device: Device):
+            if depth > 1:
+                frame_stream = device.pipeline(frames, duration, depth, on_failure)
+            else:
+                frame_stream = device.stream(frames, duration, on_failure)
+            try:
+                async for frame in frame_stream:
+                    await merged.put(frame)
+            except Exception as error:
+                await merged.put(error)
+            finally:
+                await merged.put(None)
+
+        tasks = [asyncio.ensure_future(forward(device))
+                 for device in self.devices.values()]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                frame = await merged.get()
+                if frame is None:
+                    remaining -= 1
+                elif isinstance(frame, Exception):
+                    raise frame
+                else:
+                    yield frame
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def trigger(self) -> FrameSet:
+        """Requests a frame from every device at once and collects the replies into a FrameSet.
+
+        All requests are written before any port is flushed, so the cross-device skew is bounded by the
+        flushes alone. The send time of every device is recorded so the skew can be measured.
+        """
+        devices = list(self.devices.values())
+        async with contextlib.AsyncExitStack() as stack:
+            # Always taken in the same order, so triggers can't deadlock each other
+            for device in devices:
+                await stack.enter_async_context(device.lock)
+            for device in devices:
+                device.write_request()
+            sent = {}
+            for device in devices:
+                device.flush()
+                sent[device.device_id] = device.mark_sent()
+            results = await asyncio.gather(
+                *(device.receive_frame(sent[device.device_id]) for device in devices),
+                return_exceptions=True)
+        frames = {}
+        failures = {}
+        for device, result in zip(devices, results):
+            if isinstance(result, Frame):
+                frames[device.device_id] = result
+            elif isinstance(result, (asyncio.TimeoutError, ValueError)):
+                failures[device.device_id] = result
+            else:
+                raise result
+        self.sets += 1
+        frame_set = FrameSet(self.sets, sent, frames, failures)
+        self.skew.record(frame_set.skew())
+        if len(frames) > 1:
+            self.spread.record(frame_set.spread())
+        return frame_set
+
+    async def sync_stream(self, sets: int = None, duration: float = None, on_failure=None):
+        """Yields synchronized FrameSets back to back until the count or duration is reached.
+
+        Devices that miss a trigger are passed to on_failure(device_id, error) and left out of that set.
+
+        Raises:
+            StreamFailed: comm.FAILURE_LIMIT triggers in a row that no device answered
+        """
+        end = time.monotonic() + duration if duration else None
+        count = 0
+        failures = 0
+        while (sets is None or count < sets) and (end is None or time.monotonic() < end):
+            frame_set = await self.trigger()
+            if on_failure:
+                for device_id, error in frame_set.failures.items():
+                    on_failure(device_id, error)
+            if frame_set.frames:
+                failures = 0
+            else:
+                failures += 1
+                if failures >= comm.FAILURE_LIMIT:
+                    raise StreamFailed(f"gave up after {failures} triggers in a row that no device answered")
+            count += 1
+            yield frame_set
+
+    async def negotiate(self, frames: int = 5) -> dict:
+        """Negotiates the fastest baudrate with every device, then measures the frame rate each achieves.
+
+        Returns:
+            dict: device id -> (baudrate, frames per second)
+        """
+        async def negotiate_one(device: Device):
+            rate = await device.negotiate_baudrate(device.on_message)
+            return rate, await device.measure_frame_rate(frames)
+        results = await asyncio.gather(*(negotiate_one(device) for device in self.devices.values()))
+        return dict(zip(self.devices, results))
+
+    async def set_compression(self, enable: bool = True) -> dict:
+        """Switches every device's dataframe encoding. Returns device id -> whether it acknowledged."""
+        results = await asyncio.gather(*(device.set_compression(enable) for device in self.devices.values()))
+        return dict(zip(self.devices, results))
+
+    async def set_checksum(self, enable: bool = True) -> dict:
+        """Switches every device's dataframe checksums. Returns device id -> whether it acknowledged."""
+        results = await asyncio.gather(*(device.set_checksum(enable) for device in self.devices.values()))
+        return dict(zip(self.devices, results))
+
+    def counters(self) -> metrics.Counters:
+        """Sums the counters of all devices."""
+        total = metrics.Counters()
+        for device in self.devices.values():
+            for name in ("frames", "bytes", "parse_errors", "corrupt", "retries", "alarms",
+                         "timeouts", "dropped", "lost", "duplicates"):
+                setattr(total, name, getattr(total, name) + getattr(device.counters, name))
+        return total
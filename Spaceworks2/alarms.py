@@ -0,0 +1,132 @@
+"""Temperature alarms, checked on every frame as soon as it is parsed.
+
+An alarm spec is a quantity, a comparison and a limit:
+
+    max>45          hottest pixel above 45 °C
+    min<5           coldest pixel below 5 °C
+    mean>30         frame mean above 30 °C
+    rate>2          hottest pixel rising faster than 2 °C/s
+    roi:die>40      mean of the ROI named 'die' above 40 °C
+
+An alarm is raised when its condition starts to hold and cleared once the value is back past the limit by
+HYSTERESIS, so a value hovering at the limit doesn't flood the log.
+"""
+from pathlib import Path
+import numpy as np
+import re
+import time
+import roi
+
+
+HYSTERESIS = 0.5  # °C, or °C/s for rates
+ALARMS_FILE = "alarms.csv"
+RAISED = "raised"
+CLEARED = "cleared"
+
+SPEC_PATTERN = re.compile(r"^\s*(max|min|mean|rate|roi:[^<>]+?)\s*([<>])\s*(-?[\d.]+)\s*$")
+
+
+class Alarm:
+    """One condition, and whether it currently holds."""
+
+    def __init__(self, spec: str):
+        match = SPEC_PATTERN.match(spec)
+        if not match:
+            raise ValueError(f"bad alarm {spec!r}, expected e.g. max>45, rate>2 or roi:NAME>40")
+        self.quantity, comparison, limit = match.groups()
+        self.spec = spec.strip()
+        self.above = comparison == '>'
+        try:
+            self.limit = float(limit)
+        except ValueError:
+            raise ValueError(f"bad limit in alarm {spec!r}")
+        self.active = False
+
+    def update(self, value: float) -> str:
+        """Returns RAISED or CLEARED when the alarm changes state, else None."""
+        sign = 1 if self.above else -1
+        if not self.active and sign * (value - self.limit) > 0:
+            self.active = True
+            return RAISED
+        if self.active and sign * (value - self.limit) < -HYSTERESIS:
+            self.active = False
+            return CLEARED
+        return None
+
+
+class AlarmEvent:
+    """An alarm changing state on a particular frame."""
+
+    def __init__(self, alarm: Alarm, state: str, value: float, timestamp: float):
+        self.alarm = alarm
+        self.state = state
+        self.value = value
+        self.timestamp = timestamp  # wall clock
+
+    def describe(self) -> str:
+        unit = "°C/s" if self.alarm.quantity == "rate" else "°C"
+        return f"{self.alarm.spec} {self.state} ({self.value:.2f} {unit})"
+
+
+class AlarmSet:
+    """The alarms of one device. Only the quantities some alarm needs are computed for each frame."""
+
+    def __init__(self, specs: list[str], rois: roi.RoiSet = None):
+        self.alarms = [Alarm(spec) for spec in specs]
+        self.rois = rois
+        self.roi_index = {}
+        for alarm in self.alarms:
+            if alarm.quantity.startswith("roi:"):
+                name = alarm.quantity[len("roi:"):]
+                if not rois or name not in rois.names:
+                    raise ValueError(f"alarm {alarm.spec!r} needs an ROI named {name!r}")
+                self.roi_index[alarm.quantity] = rois.names.index(name)
+        self.quantities = {alarm.quantity for alarm in self.alarms}
+        self.previous = None  # (time, max) of the previous frame, for rates
+
+    def __len__(self) -> int:
+        return len(self.alarms)
+
+    def check(self, data: np.ndarray, received: float) -> list[AlarmEvent]:
+        """Evaluates every alarm on a frame that arrived at time.perf_counter() `received`. Returns the state changes."""
+        values = {}
+        if "max" in self.quantities or "rate" in self.quantities:
+            values["max"] = float(data.max())
+        if "min" in self.quantities:
+            values["min"] = float(data.min())
+        if "mean" in self.quantities:
+            values["mean"] = float(data.mean())
+        if "rate" in self.quantities:
+            if self.previous and received > self.previous[0]:
+                values["rate"] = (values["max"] - self.previous[1]) / (received - self.previous[0])
+            self.previous = (received, values["max"])
+        if self.roi_index:
+            means = self.rois.evaluate(data)[:, 0]
+            for quantity, index in self.roi_index.items():
+                values[quantity] = float(means[index])
+        timestamp = time.time() - (time.perf_counter() - received)
+        changes = []
+        for alarm in self.alarms:
+            if alarm.quantity not in values:
+                continue
+            state = alarm.update(values[alarm.quantity])
+            if state:
+                changes.append(AlarmEvent(alarm, state, values[alarm.quantity], timestamp))
+        return changes
+
+
+class AlarmLog:
+    """Appends alarm events to a run's alarms.csv, flushed as each is written so the record survives a crash."""
+
+    def __init__(self, run_dir: Path):
+        new = not (run_dir / ALARMS_FILE).exists()
+        self.file = open(run_dir / ALARMS_FILE, 'a')
+        if new:
+            self.file.write("device,timestamp,alarm,state,value\n")
+
+    def write(self, device_id: str, event: AlarmEvent):
+        self.file.write(f"{device_id},{event.timestamp:.6f},{event.alarm.spec},{event.state},{event.value:.3f}\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
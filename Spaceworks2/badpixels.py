@@ -0,0 +1,112 @@
+"""Detection of stuck, dead and noisy pixels across a run, and their repair from neighbouring pixels.
+
+    python badpixels.py data/run_3
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import numpy as np
+import comm
+import sys
+
+
+STUCK_STD = 1e-3  # °C; a pixel varying less than this over a run isn't responding
+NOISY_FACTOR = 5  # times the median pixel's temporal standard deviation
+OUTLIER_MADS = 6  # robust standard deviations from its neighbours before a pixel counts as an outlier
+MAD_SCALE = 1.4826  # median absolute deviation -> standard deviation for normal noise
+
+# 8-connected neighbourhood, then the ring around it for pixels whose close neighbours are all bad
+NEIGHBOURS = [[(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx],
+              [(dy, dx) for dy in range(-2, 3) for dx in range(-2, 3) if max(abs(dy), abs(dx)) == 2]]
+
+
+def neighbour_median(image: np.ndarray) -> np.ndarray:
+    """Median of each pixel's 8 neighbours, edges replicated."""
+    padded = np.pad(image, 1, mode='edge')
+    rows, cols = image.shape
+    shifted = np.stack([padded[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols] for dy, dx in NEIGHBOURS[0]])
+    return np.median(shifted, axis=0)
+
+
+def detect(frames: np.ndarray) -> np.ndarray:
+    """Flags the bad pixels of a camera from a stack of its frames, all statistics computed over the whole stack at once.
+
+    A pixel is bad if it is stuck (no temporal variation while the rest of the sensor varies), noisy (far more
+    temporal variation than the typical pixel), or an outlier (its mean far from that of its neighbours).
+
+    Args:
+        frames (np.ndarray): (n, rows, cols) stack, ideally of a scene without sharp edges
+
+    Returns:
+        np.ndarray: (rows, cols) boolean mask, True for bad pixels
+    """
+    frames = np.asarray(frames, dtype=float)
+    mean = frames.mean(axis=0)
+    bad = np.zeros(mean.shape, dtype=bool)
+    if len(frames) > 1:
+        std = frames.std(axis=0)
+        typical = np.median(std)
+        if typical > STUCK_STD:
+            bad |= std < STUCK_STD
+            bad |= std > NOISY_FACTOR * typical
+    deviation = mean - neighbour_median(mean)
+    centre = np.median(deviation)
+    spread = MAD_SCALE * np.median(np.abs(deviation - centre))
+    if spread > 0:
+        bad |= np.abs(deviation - centre) > OUTLIER_MADS * spread
+    return bad
+
+
+class RepairMap:
+    """Replaces bad pixels with the mean of their good neighbours, precomputed as gather indices and weights."""
+
+    def __init__(self, bad: np.ndarray):
+        self.bad = np.asarray(bad, dtype=bool)
+        rows, cols = self.bad.shape
+        targets = np.flatnonzero(self.bad)
+        width = max(len(ring) for ring in NEIGHBOURS)
+        self.targets = targets
+        self.sources = np.zeros((len(targets), width), dtype=np.intp)
+        self.weights = np.zeros((len(targets), width))
+        unrepairable = []
+        for i, target in enumerate(targets):
+            y, x = divmod(target, cols)
+            for ring in NEIGHBOURS:
+                good = [(y + dy) * cols + x + dx for dy, dx in ring
+                        if 0 <= y + dy < rows and 0 <= x + dx < cols and not self.bad[y + dy, x + dx]]
+                if good:
+                    self.sources[i, :len(good)] = good
+                    self.weights[i, :len(good)] = 1 / len(good)
+                    break
+            else:
+                unrepairable.append((x, y))
+        if unrepairable:
+            raise ValueError(f"no good pixels near {unrepairable}")
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Repairs a frame, in place if it is contiguous, and returns it. One gather, one weighted sum and one scatter."""
+        if not data.flags.c_contiguous:
+            data = np.ascontiguousarray(data)
+        flat = data.reshape(-1)
+        flat[self.targets] = np.einsum('ij,ij->i', flat[self.sources], self.weights)
+        return data
+
+
+def main(argv: list[str] = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("run_dir", type=Path, help="run to analyse")
+    args = parser.parse_args(argv)
+    try:
+        bad = detect(comm.load_run(args.run_dir))
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{bad.sum()} bad pixels" + (":" if bad.any() else ""))
+    for y, x in zip(*np.nonzero(bad)):
+        print(f"  {x},{y}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4962 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02\x63\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x30\x36\x38\
-\x38\x30\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x36\x32\x2e\x35\
-\x22\x20\x63\x79\x3d\x22\x34\x30\x22\x20\x72\x3d\x22\x32\x35\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\x66\x30\x66\x31\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x2f\
-\x3e\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\
-\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\
-\x22\x36\x30\x22\x20\x79\x3d\x22\x32\x35\x22\x2f\x3e\x0a\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\x22\x36\x30\
-\x22\x20\x79\x3d\x22\x33\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\
-\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xcb\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x30\x22\x3e\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\
-\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\
-\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x2d\x34\x36\x33\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x34\x32\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x36\x34\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\x33\x20\
-\x4c\x38\x2c\x2d\x30\x2e\x35\x20\x4c\x33\x2c\x34\x2e\x35\x20\x4c\
-\x38\x2c\x39\x2e\x35\x20\x4c\x38\x2c\x35\x20\x43\x31\x31\x2e\x33\
-\x2c\x35\x20\x31\x34\x2c\x37\x2e\x37\x20\x31\x34\x2c\x31\x31\x20\
-\x43\x31\x34\x2c\x31\x34\x2e\x33\x20\x31\x31\x2e\x33\x2c\x31\x37\
-\x20\x38\x2c\x31\x37\x20\x43\x34\x2e\x37\x2c\x31\x37\x20\x32\x2c\
-\x31\x34\x2e\x33\x20\x32\x2c\x31\x31\x20\x4c\x30\x2c\x31\x31\x20\
-\x43\x30\x2c\x31\x35\x2e\x34\x20\x33\x2e\x36\x2c\x31\x39\x20\x38\
-\x2c\x31\x39\x20\x43\x31\x32\x2e\x34\x2c\x31\x39\x20\x31\x36\x2c\
-\x31\x35\x2e\x34\x20\x31\x36\x2c\x31\x31\x20\x43\x31\x36\x2c\x36\
-\x2e\x36\x20\x31\x32\x2e\x34\x2c\x33\x20\x38\x2c\x33\x20\x4c\x38\
-\x2c\x33\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x13\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\
-\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x7a\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\x1e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x34\x22\x2f\x3e\x0a\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x00\x9f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x36\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\x30\
-\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x61\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x20\x78\x3d\x22\x38\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x1c\xac\
-\x00\
-\x00\x9c\x6b\x78\x9c\xdd\x3d\x6b\x73\xdb\xb6\xb2\xdf\xf3\x2b\x90\
-\xf4\x43\x93\x56\xb2\x2d\xbf\x92\xa8\xa7\x67\xc6\xb1\x95\x58\x53\
-\xc7\x76\x2c\xa5\xb9\x99\x3b\x9d\x84\x12\x21\x89\x35\x45\xa8\x24\
-\x65\x5b\xbd\x73\xff\xfb\xdd\xc5\x8b\x20\x08\x3e\x24\xdb\x69\xce\
-\x75\x3b\xad\x8d\xc7\x62\x77\xb1\x58\x00\xbb\x8b\xe5\xf6\x4f\x4f\
-\xc8\x4f\x84\xbc\x89\x29\xfd\x9b\x9e\x78\xf1\x35\x49\xd2\x55\x48\
-\x93\x19\xa5\xe9\x16\x54\xf1\xda\xae\xb7\x4c\x67\x2c\xee\x92\x63\
-\x16\x06\x11\x39\x59\xfe\xb5\xa4\x49\xc4\x56\xa2\x92\xfa\x41\x8a\
-\x95\x47\x21\xbd\x23\xa7\xcb\xe4\x6f\x6f\x3a\x13\x35\x61\x30\xa6\
-\x51\x42\xbb\xe4\x7d\x7f\xd8\x22\x09\xa5\xe4\xac\x7f\xdc\x3b\x1f\
-\xf4\xb6\xe6\xbe\x82\x3d\x9c\x05\x09\x81\x7f\x59\x1c\x4c\x83\xc8\
-\x0b\xc3\x15\xf1\xc8\x84\x01\x22\x6c\x42\x3e\x20\x46\x03\x44\x68\
-\x80\x08\xb5\x88\x17\xf9\xd8\x78\xe4\x25\xd4\x27\x2c\x92\x78\x6f\
-\xdb\x34\x8c\x59\xc8\x62\x92\x8c\x67\x74\x4e\x5b\x64\xb4\x4c\xb1\
-\x13\x60\x1e\x31\x72\xeb\xc1\x00\x93\x49\x10\x06\x5e\x0a\x30\x6e\
-\x83\x74\x46\x7e\x3b\xe9\x29\x5a\xdb\x0f\xf1\x23\x09\xa3\x48\x37\
-\x39\x13\x4c\x20\xcf\xe1\x8f\x17\x72\x94\x63\xb6\x58\x01\xbd\xb3\
-\x94\x3c\x1f\xbf\x20\xff\xda\xdd\xe9\xec\xb5\xe1\x3f\xfb\xff\x26\
-\xff\xb2\x58\xfc\x6f\x77\xf3\x03\x68\xbe\xdb\x81\xe6\x26\xd3\xff\
-\x2d\xa1\x5f\xd2\x78\x1e\x24\x49\x00\xfc\x01\xb2\x67\x34\xa6\xa3\
-\x15\x99\xc6\x5e\x04\x04\xb7\xc8\x04\xd8\x84\xbc\x1d\xcf\xbc\x78\
-\x0a\xdc\x49\x19\x70\x75\x45\x16\x34\x4e\xa0\x03\x1b\xa5\x5e\x10\
-\x05\xd1\x14\x01\x79\xc0\xc8\xc5\x0a\x1b\xa7\x38\x4b\x09\x9b\xa4\
-\xb7\x5e\x4c\xf9\x2c\x78\x49\xc2\xc6\x82\x87\x3e\x1b\x2f\xe7\x34\
-\x4a\xbd\x14\x87\x04\xd6\xd2\x84\x3c\x4f\x67\x14\x41\x3c\x1b\xc8\
-\x4e\xcf\x5e\xf0\xa1\x7c\xea\x85\x38\x13\x50\x4d\x54\x15\x9f\x04\
-\x06\x93\x14\xd3\x24\x8d\x83\x31\x82\x69\x41\xa3\x71\xb8\xf4\x25\
-\x26\xaa\x45\x18\xcc\x03\x39\x0e\x42\xe0\x4c\x49\x10\xee\x32\x01\
-\x52\x10\xdb\x16\x99\x33\x3f\x98\xe0\xff\x29\xa7\x6f\xb1\x1c\x85\
-\x41\x32\x6b\x21\x18\x3f\xc0\x01\x40\x1e\xa0\x3c\xc1\x72\x3e\x35\
-\x5c\xac\xb6\x51\x60\x68\x18\x22\x90\x00\x08\xe0\x44\x67\x38\x0a\
-\xd1\x4b\x19\x42\x59\x20\x7f\x53\xc9\x31\x3e\xfa\xed\x8c\xcd\xf3\
-\x24\x01\xbb\x26\xcb\x38\x82\x81\xa9\xcf\xe9\x66\xc0\x3e\x3e\xe8\
-\x9f\x74\x9c\x4a\x40\xd8\x63\xc2\xc2\x90\xdd\x02\x99\x30\x70\x04\
-\x2b\x09\x48\x4b\xba\x72\x22\x51\x84\xbc\x11\xbb\xa1\x9c\x32\x21\
-\x01\x11\x4b\x01\x6b\x81\x0d\x4e\xca\x22\x9b\x6c\x59\x95\xcc\x60\
-\x15\x91\x11\x95\x1c\x84\xf1\x83\x88\xcf\xa6\x41\x5c\x8c\x98\x24\
-\x29\x88\x44\x00\xf3\xb1\x60\x31\x1f\xd7\x26\x5a\x2d\x8a\xe1\x69\
-\x8f\x0c\x2e\xde\x0e\x3f\x1d\x5d\xf5\x48\x7f\x40\x2e\xaf\x2e\x7e\
-\xef\x9f\xf4\x4e\xc8\xb3\xa3\x01\xfc\xfd\xac\x45\x3e\xf5\x87\xa7\
-\x17\x1f\x87\x04\x5a\x5c\x1d\x9d\x0f\x3f\x93\x8b\xb7\xe4\xe8\xfc\
-\x33\xf9\xad\x7f\x7e\xd2\x22\xbd\xff\xba\xbc\xea\x0d\x06\x08\xea\
-\xe2\x8a\xf4\xdf\x5f\x9e\xf5\x7b\x50\xdc\x3f\x3f\x3e\xfb\x78\xd2\
-\x3f\x7f\x47\xde\x40\xd7\xf3\x0b\x58\x2b\x7d\x58\x24\x00\x77\x78\
-\xc1\xc7\x94\xd0\xfa\xbd\x01\xc0\xc3\xde\xef\x7b\x57\xc7\xa7\x50\
-\x72\xf4\xa6\x7f\xd6\x1f\x7e\x6e\x91\xb7\xfd\xe1\x39\x40\x26\x6f\
-\x01\xee\x11\xb9\x3c\xba\x1a\xf6\x8f\x3f\x9e\x1d\x5d\x91\xcb\x8f\
-\x57\x97\x17\x83\x1e\x20\x71\x02\x90\xcf\xfb\xe7\x6f\xaf\x60\xa0\
-\xde\xfb\xde\xf9\x10\xa9\x82\xb1\xa1\x98\xf4\x7e\x87\xbf\xc9\xe0\
-\xf4\xe8\xec\x8c\x0f\x78\xf4\x11\xc8\xb8\x1a\x20\x96\xc7\x17\x97\
-\x9f\xaf\xfa\xef\x4e\x87\xe4\xf4\xe2\xec\xa4\x07\x85\x6f\x7a\x80\
-\xdf\xd1\x9b\xb3\x9e\x18\xed\xfc\x33\x5f\x9a\x67\x47\xfd\xf7\x2d\
-\x72\x72\xf4\xfe\xe8\x5d\x8f\x77\xbc\x00\x40\x57\xbc\xa5\xc4\xf1\
-\xd3\x69\x8f\x17\xc1\x90\x47\xf0\xef\xf1\xb0\x7f\x71\x8e\xfc\x39\
-\xbe\x38\x1f\x5e\xc1\x9f\x5c\x32\x87\x17\x57\x43\xdd\xfb\x53\x7f\
-\xd0\x6b\x91\xa3\xab\xfe\x00\x99\xf3\xf6\xea\x02\x46\x40\xee\x42\
-\xa7\x0b\x0e\x07\xba\x9e\xf7\x04\x20\xe4\x3c\xe2\x8e\x40\xf4\x1c\
-\x41\x2b\x24\xe7\xe3\xa0\x97\x61\x74\xd2\x3b\x3a\x03\x70\x03\xec\
-\x6f\x4e\xe8\xd6\x43\xaa\xbd\xed\x27\x4f\xb6\x7f\x12\x8a\xfd\xfd\
-\x11\x0c\x34\x18\x7e\x3e\xeb\x0d\x4e\x7b\xbd\x21\x2f\x73\x76\xf8\
-\x30\x64\x2c\x1c\x06\x8b\x27\xff\xf3\x84\xc0\xcf\xf6\x4f\x64\x67\
-\x6b\x17\xb4\x1a\x08\x37\x0a\x63\x32\x07\xc1\x05\xc5\x40\x6e\xbc\
-\x70\x49\xa1\xc8\x4b\x7f\x4c\x50\xd6\x49\x30\x8d\x58\x2c\xf6\x81\
-\x4f\x41\xe4\xb3\xdb\x64\x0b\x01\x22\x90\x11\x8b\x7d\x0a\x7b\xd2\
-\xce\xd6\xce\x3e\x9d\xc3\xd2\x0b\x03\x9f\xfc\x40\x27\x93\x9d\x49\
-\xe7\x17\xd1\xc2\x1b\x5f\x4f\x63\xb6\x8c\xfc\x36\xdf\x2d\xba\xe4\
-\x87\xbd\xce\xde\xe1\xde\x48\x54\x7b\x61\x4a\xe3\x08\xd4\x5b\xbb\
-\xa6\xa1\x2a\x33\x61\x2f\x3c\x1f\x15\x17\x0e\xdf\xa1\x73\x51\xc6\
-\x16\xde\x38\x48\x57\x5d\xb2\xbb\xb3\xf3\xcb\x93\xff\x05\xb2\x3f\
-\x05\xfe\x94\xa6\x92\x6a\x17\x98\x9a\x91\x41\x5b\x51\xae\x2b\x9d\
-\x28\xfa\x1e\xa5\xaf\xed\x86\x75\xa3\x84\xc1\xa2\x2b\x79\xf7\x8b\
-\xc1\xc7\x76\x30\xf7\xa6\xb0\x8d\x47\x2c\xa2\x26\xee\x5d\xd0\xa7\
-\xde\x28\xa4\xbe\x45\xc4\xfe\x01\xfe\x53\x4b\x84\x03\x50\x77\x06\
-\xda\x2e\x96\xe0\x6a\xba\x1e\xcf\xe8\xf8\xfa\x0d\xbb\x93\xad\x13\
-\x64\xb0\x60\xfa\xee\x9e\xe6\xfa\x32\x85\xed\x54\xa3\x5e\xc6\xe9\
-\x39\x6c\x85\x01\xf0\x91\xa5\x29\x9b\x73\xa9\x79\x5d\x3e\x6f\x6a\
-\xdc\x32\xea\x47\x3b\xf8\x8f\x68\xfb\x0e\xd0\x5f\x64\x38\x82\x6c\
-\x9f\x53\xb1\x21\xcc\xbd\x6b\x90\xed\x65\x4c\xb9\x90\x23\x99\x8b\
-\x11\xbb\x83\x7d\x02\xb6\xfd\x1f\x53\x00\x36\x5f\xc0\x76\x08\x47\
-\x1d\x0a\xdb\x03\x6f\x93\x06\x69\x48\xb5\x84\xcf\x01\xdf\x19\xc5\
-\x2d\xa1\x4b\x3a\xb0\x5e\xe6\xbf\x54\x08\xfe\xcb\xc3\x97\xaf\x5f\
-\x8e\x73\x53\x1a\x7b\x7e\xb0\x4c\xf2\xb4\xf2\xa5\x8b\x3f\x3f\x89\
-\x63\xd9\x34\xb8\x81\xcd\x62\x99\x10\x1a\xb1\xe5\x74\xc6\x59\x0c\
-\x5b\x4f\x2a\xd0\x61\x0b\xa4\x03\x36\x50\x24\xe2\x16\xf6\x28\x2f\
-\x82\xbd\xf7\x86\x13\xa4\xc0\x70\x9c\xb1\x19\xdf\x8e\x92\xc0\x97\
-\xe4\x2e\xe1\x37\x9c\x98\x44\xee\xab\x50\x26\x17\x8d\x01\x5e\x01\
-\x11\x43\x24\x38\xc6\xcc\x03\xf8\x02\x0d\x9b\x31\xb2\xf5\xb6\x39\
-\xa1\x00\x04\x29\x3c\x50\x04\xca\x31\x44\x39\x5f\x9a\xe6\x24\x75\
-\x27\x70\x90\x49\x94\xf0\x6d\xca\xc8\x1c\xc4\x2e\xc7\x2d\x9b\xfd\
-\x4f\x94\x44\x4a\x00\x90\x55\x3b\x5b\x87\x00\x7c\xb9\x28\xb2\x48\
-\x72\xe7\x67\xc0\x12\x8f\xc3\x0a\x75\x3d\xff\x9c\x84\x76\x07\xfb\
-\xcb\x55\xbe\x1c\xc1\x09\x22\x8d\x59\xd8\x16\x67\xe9\x2e\x9e\x28\
-\x52\x38\x97\x15\xea\x17\x2c\xe1\x07\x8d\x2e\x9f\x44\x38\x03\xa5\
-\x7a\xbd\xeb\x25\x67\x29\x1b\xc5\xb9\x90\x4e\x52\xbe\xc4\x6c\x96\
-\xc6\x42\x14\x65\x4d\x6e\x9d\x74\x41\x39\x07\x63\x0f\x2e\x09\x2d\
-\x50\xf6\x70\xfc\xfc\x3d\xa0\xb7\x46\xa9\x64\xcf\x6d\xe0\xa7\x33\
-\x39\x2d\xf8\xb7\x96\xee\x0a\x80\xdd\x65\x34\xc6\x52\x38\xd8\xd6\
-\xd4\x8b\xc9\x75\x23\x90\x83\x52\x59\xef\x10\x11\xa5\x1c\x97\x71\
-\xf8\xbc\xbb\xed\xc3\xf5\x63\x9b\x37\x86\xd5\xfc\x45\xf7\xfb\xa2\
-\x74\xc5\x56\x72\x33\x7d\xd1\x80\x1c\xa1\x08\x6b\x89\xe2\x3a\xa2\
-\x01\xda\x0a\x5a\x75\xab\x0c\x5a\x26\xc0\x6e\x26\x55\xd6\xeb\xd1\
-\xaa\x5b\xa9\x09\xa9\x6e\x25\x71\xb2\x56\x65\xa6\xce\xd7\x98\x84\
-\x1a\xde\x57\x8b\x40\x35\xed\xb2\xb6\xb1\x60\xac\x85\x51\xa5\x2c\
-\xd8\xdc\xac\x6a\x53\x2d\x2d\x4d\x64\xa5\xc9\x62\x6a\x26\x4d\x4d\
-\x64\xa5\x89\xa4\x3c\x9c\x9c\x34\x9b\x13\xf8\x8d\xa6\x78\xe7\xc2\
-\xc3\x61\x09\x07\x72\x6d\x1a\xcb\x44\xae\xd7\x3a\x58\x54\xce\x7d\
-\xbe\x65\x95\x24\xe5\x5b\x56\xcb\x8a\x7b\xfc\xfa\x96\x55\xb2\xe5\
-\x1c\xff\x1b\x70\x4f\xa9\xe6\x46\x68\x59\x67\xbe\x35\xf1\x6a\xba\
-\x0d\x28\xa1\xae\x41\xcd\xd1\xac\x6a\x89\xac\x8d\xfb\xc6\x9b\x57\
-\x0d\xde\xce\x86\xd5\xdb\xc0\xda\xb8\x57\x6e\xbd\x57\x70\x66\x63\
-\x6f\x96\x70\xda\x8f\x1e\xef\xf6\x60\x0d\x54\x76\x5d\x50\x47\x4a\
-\xbb\xf9\xfa\xe7\x23\x77\xef\xdc\xbe\x5d\xd7\xa4\xd9\xf9\x06\x8f\
-\xbc\xac\x31\x87\xab\xcf\x08\xb5\x0d\xeb\x14\xbb\x63\x92\x9a\x22\
-\x5e\x8f\xaf\x6b\x5f\xbf\xdf\xe0\xeb\x0e\x5d\xc7\x28\x7b\x8f\xac\
-\x69\xf6\xf0\xdc\x5c\x9b\x20\x6b\x1d\x6c\x3c\xe2\x46\x62\xd7\x54\
-\x8f\x34\x10\xf1\xf7\x34\x5a\xbe\xf1\x1a\x18\x2b\x5c\x7a\xc3\x00\
-\x00\x88\xa6\x74\x5e\x00\x03\x97\xb3\xd8\x8b\x40\x2f\xc5\xfc\x0a\
-\x57\xe8\xd0\x15\x66\x9d\x8c\x94\xe6\x3d\x1b\x68\xa2\x7c\x07\x4b\
-\x6a\xaa\xcd\x4d\x0d\x54\x64\xdb\xb4\x3a\xa8\x1b\xa4\x4b\x7f\x22\
-\x1a\x15\x16\x32\x01\xb6\xd8\x05\xd0\x1e\x6b\xd5\x9e\x35\x12\x9a\
-\xdd\x68\x94\xf1\x1d\xee\xe6\x47\xbe\x4f\xe8\x1d\xb0\x4e\x9b\x22\
-\x4c\x2f\x03\xbf\x84\xe3\x5f\xbc\x2f\xf1\xe2\x98\xdd\xaa\xbb\xb8\
-\x61\xef\xc3\x21\x48\x07\x2d\x0e\xd9\x1f\x7b\x0e\xe3\xcc\x6b\x6d\
-\x53\xc8\xcd\x55\xa3\x89\x74\xcf\x7f\x53\x0b\xa2\x9c\xa9\x12\x60\
-\x85\x05\x52\x6d\x83\x33\x20\x34\x14\xaa\x0d\xf6\x35\xab\x5b\x17\
-\x14\x45\x9b\xde\x8d\xc3\x65\x12\xdc\xd0\x6c\x6d\x3f\xcc\xd1\xa0\
-\xe1\x60\x85\xd5\xf7\x98\xa3\xde\xff\x76\xd9\x08\xfe\xfa\x34\xd5\
-\x0f\xb4\xc1\x3c\x35\x54\xbd\x35\xa3\x34\x26\xe6\x5e\xc3\xad\x45\
-\xd2\x3a\xdc\xda\x8c\x8a\xb2\x11\xb8\x06\x6b\x73\x9d\x55\xa2\x14\
-\xab\x81\x63\xf7\x2f\xbc\xbb\x04\x6d\xac\x5b\xc3\xbc\xaa\x56\xee\
-\xce\xd6\xab\xfc\xda\x35\xc6\x6f\xbe\x03\x67\x83\xba\xe6\xe4\x68\
-\x94\x80\x72\x1c\xa7\x7d\xd0\x3d\x78\xbf\x90\xe0\xee\xe5\xb7\x71\
-\xea\xe7\x5c\xaf\x0a\x9b\x6f\x7e\xc7\xe4\xc7\xb1\xee\x53\x27\xb1\
-\xb6\x51\xd9\x54\xc9\x43\x6f\x24\x5d\x22\x85\x4b\xbd\xeb\x84\xa7\
-\xca\x06\x00\x08\x00\xbb\x0c\xd8\x99\xd3\xe6\x0c\x8e\x59\x3d\x3f\
-\x48\xcb\x55\x7b\xc7\xdf\xdd\xd9\xdd\x2b\x38\xb1\x0a\x22\xc2\x63\
-\x44\xba\x02\xff\x07\xf0\x3b\xb8\x0e\x47\x6a\x7e\x07\xe3\x98\x85\
-\xe1\x51\x4c\xbd\xbc\xc0\xb8\xe0\xb8\xe7\x2f\x87\x44\x81\x66\x7b\
-\x87\x55\xee\x4b\x15\x97\x82\x5b\x7e\xd6\x4b\x9f\x02\xd0\x57\x23\
-\xc3\x18\xc4\xb9\x45\x18\xc0\x81\x94\x38\xa2\x31\x87\x70\x3b\xa3\
-\x11\xaf\x9d\x91\x84\x13\x31\xf2\xe2\x84\xf0\xf8\x89\x71\x0a\x6b\
-\x7c\x8b\xbb\x3f\x1d\x84\x76\xbb\x12\x4a\xf1\x60\x67\x6e\xbe\x0a\
-\xd3\x63\x0f\x1d\x46\x3e\xe3\xc8\xfc\x76\xd2\x13\x11\x3c\xe8\xcb\
-\xbf\xc5\xd8\x0f\xe1\x44\x55\x08\x90\x99\x17\xf9\x21\x0f\xcd\x20\
-\x23\x3a\x66\x73\x9a\x90\x90\x63\x2e\x0f\x3b\xe2\xba\xc1\xbd\x32\
-\x2c\x0a\x57\x9c\x0a\x51\x91\x75\xc4\xa8\x12\x6c\xc6\x63\x3f\x00\
-\x40\x90\x4a\x58\x7c\xe8\xe0\x6f\x58\xa8\x9a\x7f\x50\xe1\x2d\x13\
-\x39\x20\xf2\x22\x83\xa5\x5d\x3f\x06\x7f\xe9\x0d\x4c\x84\xe0\x52\
-\x0a\xac\x40\xcd\x87\x3d\x53\x06\x4b\x02\xa8\x91\x3c\x13\xbc\xc2\
-\xd5\x36\x63\x71\xf0\x37\x8b\x52\x2f\x6c\x26\xd5\x99\x8a\x3a\xd4\
-\x6a\x2b\xd3\x85\x9d\x3d\x7e\x6e\x3b\x14\xc7\x37\xe3\x2f\xa7\x90\
-\x1b\xa2\x93\x1f\xa4\x20\xa2\x9d\x97\x4a\x4b\xb8\x30\xaf\x73\x7a\
-\x9a\x47\xa8\xac\x7f\x57\x30\xb1\x11\x07\xcc\xe3\x79\xb5\x0e\xe2\
-\xfc\x80\x93\x7a\x51\xb9\x37\x22\xaa\x88\x54\xad\x47\xb7\x31\x6a\
-\xd6\x48\xa0\x9e\xda\xfc\xe2\x58\x60\x80\x9e\x4f\x63\x16\xf5\xaf\
-\x35\x5b\x9d\x31\xa7\xae\xad\x6e\xbf\x70\x4a\x35\xcb\x9c\x2e\x36\
-\xae\x17\x4a\x5d\x74\x02\xd7\x02\x71\xd0\xf2\x3f\x82\x38\x74\x07\
-\xae\x4b\x9b\x63\xe2\xb4\x91\xa3\xa6\x99\xbe\xd3\xfd\x07\xce\x9f\
-\x8b\x46\x57\xb3\x7f\x82\xc6\x4d\xa6\x71\xb9\x90\x07\xba\x0c\xf7\
-\x3c\x71\x3e\xbb\x8d\x0a\x4d\x1c\x7b\x5a\x76\x40\xb1\x66\x7f\x81\
-\x84\x97\x41\x47\xd6\x59\x0d\x1a\xc2\x86\x59\x48\xe1\xbc\xdd\x70\
-\xc3\xd0\x6c\x75\xed\x17\xc5\x8d\xc2\xb1\x10\x1f\x68\xbf\x50\x68\
-\xdf\x6f\xb7\xa8\x27\x7e\xfd\xbd\x22\x13\xb3\xcd\x36\x8b\xa6\x94\
-\x6d\xbc\x55\xe8\x65\x66\x51\x6f\x6f\xfc\x39\x95\xba\x91\x2e\x75\
-\xad\x38\xc7\xc2\x2c\x8b\xc5\xd8\x58\x95\x7e\xd7\x84\x89\x03\xf2\
-\xc6\x2a\x34\x2f\x1e\x25\x0a\x54\x37\xda\x54\x7d\xfe\xd3\x33\x57\
-\xb9\x05\xfe\xa3\xd4\x6d\x36\x7d\x7a\x7b\x50\xb8\x97\x6e\x0e\xa5\
-\x2a\xa9\x6e\x6b\x70\x43\xd6\x1b\x43\x23\xb8\x43\x7a\x97\x36\xbf\
-\x13\xd7\x18\x0d\x1c\x37\x5f\x1c\xe3\x32\xf4\x82\xe8\xa1\x06\xaa\
-\xbb\xf8\x96\xe0\x30\x80\x5b\xd9\xbb\x58\x07\xd9\x96\x8a\x4f\x02\
-\xed\xa6\xd0\xae\xa1\x9d\xe7\x40\x6a\x75\x75\x17\x1d\x50\x11\xbd\
-\x97\x50\x10\x41\x34\x69\xc9\xc0\x36\x43\x2a\x5b\x24\x09\xa2\xb1\
-\xb8\x96\xfa\x6c\x7c\x0d\x97\x41\xb8\xef\x49\x8c\x78\x30\x32\xb9\
-\x88\xc8\xe5\xea\x43\x7a\xd8\x22\x11\x0d\xf0\xda\x27\xef\xd9\xd8\
-\x02\xe6\x2e\xb6\x2f\x8d\x09\xc5\xdd\x95\x0f\x14\xd3\x64\xc1\x0d\
-\x66\xf2\xa6\xf8\x1e\x58\x2f\x82\x83\x41\x32\x14\x52\x45\x6b\xcc\
-\x6b\x7b\x7b\x76\x1b\x0d\x4a\x0d\xf2\x36\xe8\x8c\x43\xc6\x24\x95\
-\xef\xd5\x58\x5d\x1a\x61\x97\x8f\x65\xb4\x8b\x33\xaf\x89\x5d\xa3\
-\x00\x65\xcb\x5b\x56\xc4\x79\x5d\x80\x54\xbc\x8d\xbd\x39\xfd\xef\
-\x09\xfe\x77\x30\xf3\x16\xf4\xd7\x67\xbb\xcf\xfe\x68\xa1\x57\x44\
-\x54\x75\xbb\x97\x5e\x44\x43\xf2\xeb\xaf\x64\xe7\x6e\x67\x67\x67\
-\x8f\x33\xb7\xd8\x6b\xcf\xea\x05\xac\x6f\xd6\x71\xdf\xea\x78\x8a\
-\xc6\x2a\xdd\x6b\xbf\xa4\xd7\x81\xd5\xeb\xf7\x5c\xaf\x83\x92\x5e\
-\x87\xcf\xfe\x20\x66\x2f\xfe\xc0\xc8\xcf\xe3\x79\x88\x7d\x73\x6b\
-\x45\x2f\x03\x5c\x62\x05\x13\x99\xbd\x16\x4b\x4d\x64\x4e\x63\x64\
-\x8d\x68\x14\x56\xbe\x76\x64\x01\x15\x97\x31\xbb\xc1\xa0\xd1\x19\
-\xcc\x2a\xb7\xe4\xa0\xe7\x0a\xcd\x54\x9c\x64\xc2\xf8\x83\x13\x11\
-\x19\xef\x9e\x66\xbd\xf3\x38\xa7\xb3\xa2\x76\xbf\xb2\xf6\xa0\xb2\
-\xf6\x50\xd5\x36\xb5\x8c\x02\xa5\x27\x0c\x0d\x5d\x0b\x49\xaf\x17\
-\x29\xd7\x31\x09\x26\x3a\x36\xd8\x43\x75\x35\xe5\x5a\x08\x03\x89\
-\xbd\x6b\x0c\x60\x5e\x08\x9d\x84\x61\xc3\x6e\x3e\xfc\x41\x0a\xf6\
-\x64\x37\x76\x1a\xb5\x51\x08\x53\x96\x53\x7d\xe7\x2c\x85\xf9\xee\
-\x63\x18\xf4\x8f\xf8\x94\x89\x3f\x65\x1b\xc3\x11\x77\x4a\x6d\x7d\
-\x25\x9f\xd9\xa4\x8c\x71\x9b\xa0\xb0\xa9\x45\x3e\x5d\x50\xf8\x4f\
-\x94\x86\x2b\xa5\x23\xd1\x9a\x27\x9e\xb5\x71\x2d\xe9\x07\x93\x09\
-\xe5\xfa\x89\x4b\x49\xa2\xac\x91\xc2\xdc\xc8\xb5\x1c\x41\x1b\x9f\
-\xb2\xab\xe1\x7b\x2a\x35\xd8\xc7\xfe\x16\x7f\x4f\x24\xc2\xb6\xf9\
-\xc0\xf8\x68\x4a\x0c\x8e\x0d\x64\x7f\x2e\xb7\xad\x3c\x08\x68\xc7\
-\xff\xf0\x16\x8b\x10\x3d\x15\xf8\xd8\x48\xb4\x93\x86\xce\x60\x3c\
-\x93\x11\xe0\xdc\x12\x29\x75\x2f\xbe\xeb\xc8\x1c\xe4\x13\x38\x37\
-\xb4\x6f\xa5\x5e\x1c\xb1\xd0\x97\x1b\xb0\x68\x54\x7d\x8d\x73\x1b\
-\xe4\xcd\xee\x15\x9b\x7d\x7d\xe7\x72\x53\x5a\xd9\x36\x39\xc3\xe8\
-\x6d\xc9\x46\xc3\x29\x61\x03\xb4\xb1\x2a\x03\x77\x53\x03\x4e\x6f\
-\x2f\xeb\xa0\x08\x9d\x1a\x81\x6c\x8c\x64\x15\x40\x22\x7e\x31\x43\
-\xaa\x1c\x13\x6e\xdf\x18\xb3\x9d\x29\x33\x39\x96\x3d\x65\x30\xb7\
-\x67\xb9\xfa\x2a\xb7\xcd\x42\x60\xba\x76\xfe\x3b\x50\x5e\x4f\x17\
-\x39\x21\xb8\x23\x6b\xca\x6f\xce\xdb\xe2\x7d\x9f\x8a\x35\x50\x0f\
-\x3f\x82\x08\xce\x3b\x41\x0a\xda\x9b\xcd\xc9\x57\xd7\x48\x5f\x41\
-\x3b\x30\x12\x52\x54\x77\x01\x76\xd8\xb2\xe2\x10\xd6\xe1\xc5\xe5\
-\x32\x99\xe5\x66\x6d\x83\x87\x48\xf5\xbe\x9f\x2a\x5f\x92\xeb\x3c\
-\xeb\x88\x09\xca\xbf\x77\xc9\xde\x04\xb0\xf9\x88\xa1\x77\x8c\x81\
-\xf2\x6c\x99\xf4\xf0\x92\xda\x2d\xdc\xda\x94\xcd\x23\xb3\x06\x3d\
-\x0e\x99\x88\x84\x35\x80\x8b\xb2\xfb\x80\x37\x80\x35\x8f\xb9\xd8\
-\x68\xb4\xca\x53\x49\xee\x49\x8c\x39\x3d\xc5\xb0\x9c\x62\x9d\x10\
-\xb4\x0e\xbd\x73\x8a\x99\x2e\x2f\xce\xb4\x46\xd9\x7e\x32\x66\x71\
-\xc6\x74\x68\xba\xbc\x84\x46\xd3\xda\x18\x25\x18\xc0\xdb\x9f\x38\
-\xa8\x6e\x9b\xc6\x3d\x9b\x6c\xa8\x7c\x59\xc0\xd6\x44\x41\x89\xc9\
-\x7d\xdf\x0d\x95\xae\x13\x53\x37\xea\x0b\x57\x26\x9d\xf8\xfc\x1e\
-\xa5\xa7\xfe\x62\x69\x31\xcc\x8a\x5d\x28\xf6\x3b\xdc\x3d\x3c\x38\
-\x7c\xd5\x74\x8d\xd7\x4c\x4f\xc3\x87\x7d\xcd\x74\x67\xcd\x58\xb9\
-\xd0\xc9\xfb\xd0\x57\x37\xa6\x9e\x04\x1d\x57\xaf\x0a\x94\x63\x5e\
-\x7b\x77\x17\x41\x64\x36\xb4\xcb\x55\x7b\xe5\xa3\xd7\x0d\x75\x81\
-\x0e\xb2\x97\x86\x84\x2c\x96\x5e\x15\xa8\x16\x39\x7b\x83\x6e\x96\
-\x2f\xb5\xf1\xcb\x8e\xbc\x66\xcc\x76\xa1\xa0\xfe\x85\xdc\x7a\x2c\
-\x53\xab\xb6\xfb\x54\x89\x71\xab\x28\x35\xc6\x5b\x04\x27\x3b\x8d\
-\xfa\x3c\xfb\xcc\x47\x0c\x39\x76\x18\x15\x0e\x66\x39\xc6\xcb\xb8\
-\xe1\x7a\x18\x91\xab\x68\xf8\x78\xd5\xcd\x86\xf5\x16\xb3\x02\x52\
-\xbc\xbd\x64\x51\x8d\xdc\x0f\x0f\x77\x1c\xd8\x0c\xf5\x7d\x81\xf8\
-\x31\x5b\xb4\xd1\x04\x47\xe6\x3c\x98\x31\xbc\xf5\x56\x49\x0b\x7d\
-\xfd\xdc\xda\xa2\xb0\xc0\x3c\x01\x11\x4b\xb7\xd4\xa3\xea\x6a\x9b\
-\x55\xe5\x7b\xe4\x5d\xef\xe5\x6b\x6f\x2f\xb7\xbb\xab\x3a\xdb\x24\
-\xed\x0a\xae\xd1\xec\xea\x6a\xd4\x55\xe0\x7e\xd1\x22\x29\xb5\x68\
-\xb5\xc1\xd6\xf4\xeb\x59\x3e\x1e\x13\x19\xdc\xe1\xf4\x56\x6b\x21\
-\xca\xeb\x4a\xef\xf9\x30\x86\xd8\x08\x4d\x2f\x88\x7d\xf8\x31\x63\
-\x47\x0a\xed\x2c\xc2\xb5\xc5\xb4\xee\xa0\x8e\x2d\xdd\x81\x53\x39\
-\x62\x5f\x95\x98\xf3\xf8\x9e\x53\x6a\x29\x72\x21\xd4\x65\x51\xab\
-\xa4\xa6\xa0\x18\xcd\xca\x46\x8f\x0d\x32\x6a\x1e\x8e\x08\x4b\x8d\
-\x48\x14\x2a\x4e\xa9\xeb\xc5\x14\xdd\xc7\x94\x6b\xec\xf6\xb9\x13\
-\x40\x21\x2a\xd6\xa9\x0a\xdd\x96\x4d\xc7\x0d\xc6\xee\xbd\x5c\xb4\
-\x47\x5c\xe5\x3a\x94\xac\xae\xab\xd9\x50\x0b\x91\xcc\x1b\xad\x4d\
-\xf1\x1c\xd9\x5c\x9e\x85\xdb\x4b\xd1\x85\x51\x26\x06\x2e\x52\xb9\
-\x00\x96\x12\x6b\xd4\x7e\x4b\x72\x33\x0f\xbc\x7d\x89\xbb\x1f\xb1\
-\xda\x0f\x53\xb7\xcc\x96\x8b\xdc\x22\xab\x84\x65\x3e\xdb\x2a\x6f\
-\xc4\x26\x93\xa6\x83\x56\x05\x78\x16\x01\x17\x25\xbd\x0a\x34\x6f\
-\x5d\x05\x77\x13\xc5\xda\x0c\x5e\x25\x9f\x4c\xf5\x59\xcf\xa9\x72\
-\x9d\x5e\x87\xc3\x53\x80\x9e\x05\xa2\x36\x63\x9e\x31\x9a\xcd\xbe\
-\x13\xb6\x04\x38\x79\xc5\x69\xe8\xac\x7d\xcb\x21\xf4\xf5\xc3\xb1\
-\x17\xd2\x08\xa0\x8a\xb0\x56\x87\xa1\x95\x46\x1c\xb3\xaf\x70\x80\
-\x48\x45\xbc\x25\x5f\x60\x2d\x63\xc9\x71\x50\xb2\xd4\xe3\x0e\x1f\
-\x79\xd4\x90\x99\xbe\xf0\x5c\x23\x82\x2a\x89\xef\xa5\x34\x51\xa1\
-\x99\x37\x00\x7f\x6b\x73\x3c\x14\xd3\x04\x50\x69\xd5\x6c\x0a\xa7\
-\xc2\x9e\x52\x9d\x90\xa5\x51\x5e\x17\x61\x11\xff\xc4\x2d\xe2\x68\
-\xe5\x16\x01\x99\x32\x7c\x72\xcb\x89\x68\x66\x41\xfa\xe1\xaf\xf4\
-\xcb\x58\xd6\x7e\x89\xe0\xec\x3b\x07\xb5\x34\xab\x8d\xfa\x37\x7b\
-\xac\x13\x07\x8e\x45\xf8\x1e\xa7\x8d\xce\x45\x28\x5d\xdc\xc9\xa3\
-\x44\x33\x04\xe1\x6c\x7c\xb3\x1e\x82\xd8\x23\x60\xcb\xe4\x31\x90\
-\xb4\x24\xdf\xbb\x33\xac\x52\x07\xae\x4d\xdc\x3e\x8f\x18\xe7\xc8\
-\x12\xcf\x5e\x76\x0e\x29\xd8\xc3\x76\xac\x36\x7a\x97\xd0\x1b\xc0\
-\x99\x37\xa2\xa1\x7d\x0c\x70\xba\x2d\xc8\x9b\x8b\x2b\x9e\xd8\x8a\
-\xdb\xea\x75\xdc\x79\x77\xe1\x45\xb4\xea\x44\x64\x3c\xba\x52\xab\
-\xdd\xee\xde\xc5\xec\x2d\x4d\xed\x21\xca\x06\x53\x0e\x4d\x9c\x92\
-\xd7\x30\xb0\x64\xaf\xcc\x4a\x61\x22\xe3\x1a\x43\x14\x5c\xae\x84\
-\xc7\x0f\x27\x8d\x01\xca\xa3\x8c\x0d\x31\xf3\x96\xfc\xb5\x80\x7b\
-\x0e\x8d\xd3\x55\xdb\x8f\xbd\xdb\x37\x1e\x66\x51\xdc\x31\x91\xa9\
-\xb4\xa4\x66\xf7\x0c\x23\xa5\x8f\xf4\x50\xa5\x46\x60\x3b\x68\x16\
-\x1a\x73\x17\x1a\x6a\x50\xea\x8d\x67\xa0\x4c\x46\x2a\xd3\x50\x5f\
-\x26\xda\xd2\x00\x54\xa2\x3f\x4c\x23\xa8\x13\xd0\xa5\x8c\x5d\x63\
-\x77\x8a\xfa\x27\x65\x78\x2c\x1a\x5f\x13\xdc\x41\xb6\xc8\x51\x8a\
-\x76\xea\x24\x83\xd0\xd9\x01\x45\xb5\x8c\x13\xe1\xac\x1b\x51\x1a\
-\x91\x5b\xa8\xc7\x8c\x38\xf1\x0a\xcd\xe0\x08\x60\x19\x47\x04\x36\
-\x2d\x01\x1e\xb1\x6b\x19\x18\xf0\xcc\x5f\x3e\xa8\x48\xde\x09\x5b\
-\x8c\xd9\x1c\x91\xca\x27\x00\x2a\xa8\xd8\x82\xe3\x5e\xb0\xdb\x6d\
-\xd1\x70\xbb\x1b\x8c\x5e\xc2\xfe\x2b\xcf\x89\xd9\x65\xfb\x44\x1a\
-\xf1\x79\x40\x02\x9c\xf1\x92\x60\x24\xd2\x1f\xc1\xf5\x1e\xd4\x0a\
-\xf2\x3c\xa1\x44\xf4\x4a\xf2\xb9\xca\x1a\x87\xf2\x38\xf4\x1e\xe2\
-\x62\xb4\xa8\x8c\x57\x70\x11\x90\x3b\x14\x94\xc0\x2f\x1c\x04\x9c\
-\x80\xf2\x36\x90\x32\x50\xb2\x55\x06\x0c\xed\x14\x17\x97\x64\x78\
-\xf4\x46\x6b\x23\x0e\x1b\x84\x11\x55\x49\xab\x50\xd2\x0d\x41\x6a\
-\x1c\xc5\xf8\x64\xa1\xcd\xb4\xfe\x6a\x10\xaf\x53\xe2\x56\x32\xae\
-\xf8\x4d\x6c\xb9\x3a\xda\xa3\xba\x9d\xd4\xf4\xae\x4b\x59\x7e\xe2\
-\x9c\x76\xd1\x3a\xeb\xf0\x01\xdf\xb4\x9c\x0a\xa1\x10\x9e\x20\x0d\
-\x0f\xdc\x84\xa1\x9b\x35\x32\x4e\xe4\xd5\x55\xc6\xfa\xa7\x9b\xbd\
-\x47\xdd\x1d\xef\xed\xec\xed\x6f\x30\x35\x4d\x79\x6e\x3c\x2b\x5e\
-\xdf\x20\xff\x68\xdc\xc2\x33\x54\xdb\xfd\xb8\x2f\x4f\x58\x2e\x2a\
-\xa9\xc8\xac\xc7\x9c\xc8\x9a\xfb\x6f\x3c\x1d\x79\xcf\x0f\x3b\x2d\
-\xd2\x79\xb9\xd7\x22\xbb\x7b\xbb\x2d\xdc\x79\x5e\x7c\x07\x12\xd8\
-\x9d\x04\x71\x92\x7e\xe7\xe8\xf3\x03\xd8\x70\x78\xf1\xde\xad\xf6\
-\x44\xdf\x96\xab\xd0\xa5\xfc\x64\xcd\x77\xae\xff\xf2\x4f\xfc\xff\
-\x61\x15\x88\x06\xda\xca\xe9\x73\x58\x70\x5d\xa2\x27\x89\xfa\xd6\
-\xfa\x4f\xed\x25\x0f\x33\x33\xdf\x8e\x4f\x0f\xa6\xf9\x1e\x6b\xfe\
-\x1e\x57\x6f\x3c\x1a\xd6\xdf\x40\xe7\xdd\x03\x77\xd0\x76\x67\xbd\
-\xb7\x43\xb7\xae\x43\x98\xad\x62\x91\x4b\xcf\xf1\xf2\x87\xd6\x72\
-\x75\xc7\xb2\x35\x0f\x12\xb5\x4a\x73\x43\x1d\xa7\x0c\x0d\xeb\x2a\
-\x39\xc7\x8c\x6c\xb4\xc7\x72\xba\xfe\x5f\xab\xb9\x07\xe5\x94\xb2\
-\x42\x95\x28\x3b\x93\xb0\x26\xaa\xee\x71\x66\xf1\xf1\x15\xc6\x23\
-\xe1\xfd\x8d\xd4\xdd\x3d\xb0\x07\x95\x27\x12\xc8\x3b\x75\x1e\xef\
-\xd3\x72\x94\xb9\xb4\x9e\xa8\xf8\xce\xd5\x5e\xfd\x1a\xfc\xc6\x7a\
-\xaf\xc9\xd9\xbc\xd8\xc6\x96\x3b\x41\xd6\xf7\xa9\xf6\x9a\x1e\xcf\
-\xbf\x1d\x9f\x1e\x58\xe9\x3d\xca\x14\xfe\xc3\x87\xa4\x8d\xd1\xfe\
-\x1e\x4e\x78\x0d\x90\xcf\x45\x45\xe7\x52\xff\xe4\x3d\x63\xa5\x76\
-\xcf\x7b\xa4\x1b\x72\x61\xc0\x71\x5d\x0b\x01\xec\xf1\x70\xe3\x3f\
-\x70\xf2\xa3\x87\xe2\x45\x53\x54\x32\x66\x6c\x8c\xc9\x09\x1b\x5f\
-\xe7\xbe\x76\x51\x9a\x66\xde\x74\x57\xf4\x53\x1d\x14\x5f\xb0\xa7\
-\x9b\xef\x6a\x38\xe2\xf2\x99\x8b\xee\x6c\x8c\xa9\x3f\x1e\xc4\x3b\
-\x71\x27\x03\xf7\x31\xf3\xdc\xf8\xd2\x9b\x95\xe4\xbd\x07\x26\x1a\
-\x2a\x91\x8d\x47\x46\xcb\x29\x99\x04\x77\x18\x7d\x2f\x3f\x77\x20\
-\xf3\xd8\xc8\x9c\x39\x2a\x32\x50\x24\xcf\x11\x91\x74\xc2\x1f\xab\
-\x81\x5d\x51\xfe\x80\x67\x0c\x2c\x9e\xa5\xe9\x22\xe9\x6e\x6f\x27\
-\x29\x30\x03\x01\x4c\x42\x90\xb7\x31\x9b\x6f\xe3\xa7\x9f\xf8\xf7\
-\x78\xb6\xf7\x76\x3b\xfb\x07\x3b\xaf\x76\xb6\xff\xc2\x97\x92\xe2\
-\x65\x53\x1b\xda\x79\x69\xdb\x34\xbb\xb7\x39\x02\x62\xee\x92\x1c\
-\x21\xdc\x93\x33\xf2\x62\xd9\x1c\x1d\x9c\x0d\x5c\x0c\xba\x57\xc4\
-\xe2\xb9\x17\x36\xe9\x66\xb8\xfc\xc5\x33\x2d\x91\x84\x48\x7f\x9e\
-\x41\xbd\x68\x0a\x52\xf9\x55\x09\x0f\x78\x18\xc4\xc0\x2c\xfe\xf5\
-\x22\x98\x14\x31\x8f\x1c\x82\x27\x9e\x49\xd9\x4f\x98\xf8\x6b\x51\
-\xc1\x84\x96\x7c\x74\x24\x9a\xcc\xc5\x27\xab\x4c\x10\x30\x3b\xe8\
-\x28\xe2\x2f\x42\xf1\x71\x8d\xaf\x3f\x66\x36\xe4\x49\x91\xf4\x84\
-\x06\x11\xe1\x2f\x4d\xb3\x5c\x49\x48\xad\xc8\x40\xc4\x3f\x3d\xb3\
-\x65\x08\xa2\x00\x2d\x64\x4f\x3c\x3a\xc3\xa7\x51\x5f\x39\xe3\xbf\
-\xe2\xd7\x1b\x52\xea\xf1\xe7\x5d\x5f\xcd\xe5\xf4\xb5\xc5\x1f\xad\
-\xf2\x0e\x1c\x02\xef\x94\x79\xf8\x70\x40\x68\x43\xd3\xb1\x78\xa2\
-\x85\x7f\x9b\x6f\x5a\x67\x5e\x28\x18\x80\x3e\x24\x0e\x00\x46\x60\
-\xcb\x98\xf8\x34\x09\x30\x09\x13\xff\x32\x8e\x8a\x4f\xc8\x04\x3f\
-\xef\x9b\x69\xe5\xab\x84\x14\xe5\x1c\x58\x4e\xb7\x65\x31\x3d\x65\
-\xc5\x26\x52\xe6\x78\x12\x6b\x8a\xbc\xf7\xee\x82\xf9\x72\x2e\x09\
-\x44\x87\x18\xba\x1d\x2d\x77\x98\xe1\x84\xef\xec\x2b\x2f\x7c\x23\
-\xcc\xef\xe1\x42\x03\x94\x61\x84\x5c\x98\x8b\x7b\xc0\x1a\x57\x99\
-\x80\x63\xfb\xca\xe4\x53\x1f\xe5\x1d\x53\x49\xae\x7c\x26\x5e\x0a\
-\x4e\x03\x90\x9b\x98\x7f\x20\x6f\x9e\xc8\x39\xf7\x40\x2a\x51\x3e\
-\xb7\x0a\x73\x9a\xc3\xa6\xce\xdf\xe6\xc6\xa7\x54\x46\x1e\x8a\x9d\
-\xa6\x47\xb2\x6a\xbc\x4d\x1c\x8f\x0f\xca\xcc\x87\x70\x5e\xea\x38\
-\x70\x1e\x7f\x9e\xa4\x46\xfc\x75\x4d\x68\x68\x55\x7c\x46\x16\x5d\
-\xae\xce\x7f\x66\xc4\xf9\x53\xa3\x50\x8d\xd9\x75\x95\xd9\xf7\x96\
-\x66\x43\x76\x47\x30\xd1\xe3\x59\x77\xe6\xc1\x41\x1e\xf6\x5c\x50\
-\xae\xb5\x71\xba\x37\xe8\xa9\x2f\x4a\x85\x4e\xb5\x20\xe6\x0d\xdd\
-\xdf\x1c\x36\xd1\x59\x2f\xd5\xdc\x25\x18\xbf\x83\x33\x54\x40\xe3\
-\x69\x2d\x1e\xd9\x3b\xb1\xc2\xa7\xaa\x2a\x89\xea\x7a\xfe\x9f\x0c\
-\xf4\x76\xdb\x4c\xc1\x5c\x46\xa1\xe8\xff\x65\xce\x62\xea\x98\xfd\
-\x3c\xb6\xe3\x59\x10\xfa\xb0\x4e\xf2\xb8\x6f\x32\x1c\x8d\x5c\xb2\
-\x96\xa3\xa6\x64\x30\xfd\x6e\xad\xd0\x49\xd4\xe4\xfb\x3a\x78\x5c\
-\x8a\x93\xe8\x7f\x2f\xb4\x1c\x9f\x82\x68\x88\x5c\x8d\xd2\xc8\xa1\
-\x58\x8c\x5a\x78\x10\xfe\xe1\xd3\xc2\x8a\x9e\xcd\x67\xb6\x10\x4d\
-\xba\x36\x37\x9a\xa1\xb7\x01\x76\x28\xe6\xf5\xe8\xd5\x70\x62\x63\
-\xec\x4a\xd1\xc2\xde\xf7\x40\xa8\x5c\xec\xaa\xd1\x6a\x26\x74\x08\
-\xa3\x20\x72\xd6\x9e\x00\x7a\xf0\x5d\xa0\xbf\x62\xc6\xe3\xae\x42\
-\x3a\x17\x59\x2f\xc3\x60\x1a\xc1\x96\x86\x57\x2e\x7c\x7b\xc3\x6f\
-\x81\xf6\xeb\x5e\x1d\x2a\x28\xef\x78\xa1\xfa\xbc\x06\xa8\x14\x53\
-\xf3\xab\x02\xe3\x03\x1c\x99\xd2\x31\xbf\x50\xa8\x6d\x6d\xae\xe7\
-\x5a\xd6\x00\xb6\x11\xa5\x30\xa0\xa3\x41\x1e\x81\x87\x31\xc3\x64\
-\x01\x91\x6e\xd4\x9d\x34\xf2\x3c\x38\x22\x51\x6e\xf1\xc5\x7f\xab\
-\x50\x57\x91\x52\xc0\xbd\x8b\xe7\xcc\x70\xe6\xe3\x42\x7d\x49\x7e\
-\x59\xbc\x24\xbf\xb4\x0c\x2c\xd9\xb9\x7a\xef\xc0\x42\xba\xf0\xf6\
-\x5f\x41\xd9\xb5\x1a\x5a\x98\x9b\x0f\xeb\x2b\x79\x60\x65\x0f\x6b\
-\xcb\x0c\xf6\x3b\xce\x6e\x65\x29\xc7\x54\xb7\x7c\x27\xe0\x1c\xcc\
-\xb6\x9b\xdf\xb2\xae\x8a\xdf\x4e\x3b\x6a\xc3\x14\xcd\x9d\xd7\xb5\
-\xc8\x14\xb2\xf6\xec\x97\x74\x71\x73\xd6\xd1\xbe\x24\x0f\x6a\x51\
-\xca\x8c\x16\x56\x32\x67\x77\x7a\xbc\x8a\xfa\xe6\x8f\x33\xab\x31\
-\x7d\x2a\x93\x57\xd7\x8d\x97\x6b\x57\x39\xae\x5a\x0c\xe6\xb8\x8e\
-\x04\x8e\xc6\x58\x85\x24\x5f\x4e\xcb\x51\xd1\x5b\x51\x35\xed\x25\
-\x39\x25\x6d\x7c\xaa\x46\x2c\x3e\x19\x76\x8e\x58\xc8\x85\xd1\xe0\
-\xf5\x50\x93\xb8\xe6\xd2\x9b\xb7\x2b\x9d\xbb\xd3\x9f\x62\x3d\xf7\
-\xef\xd8\xe5\xea\xe9\xbe\x91\x4d\xca\x9d\x78\xa1\xc4\xc2\xd9\x7a\
-\x52\x62\x6f\xb4\x2a\xd4\x63\x1e\xab\xb8\xf0\x16\x07\x76\xcb\x8f\
-\x91\xcc\x6d\xad\x52\x65\xf0\x94\xd4\x3a\xe1\x4f\xe4\xfc\x16\x87\
-\x22\xa4\xdd\x31\x36\x4b\x37\xca\xa5\x9b\x7a\xd1\x0e\x6d\x43\xc9\
-\xc8\x2b\x05\x52\xb0\x25\xdb\x30\xac\x07\x5a\x8d\x5e\x66\x55\xb2\
-\xac\xe1\xbb\xa5\xfb\x25\x3f\x91\x83\xe3\xf3\xe1\xb6\xfd\x41\x8f\
-\x9a\xab\xd9\x83\xbc\xed\x54\x8f\x06\x5e\xaa\x1c\x13\x59\x88\x7e\
-\xe1\xc3\x32\x99\x63\xd2\xb1\x40\x25\x0d\xe5\xef\xbf\x1e\x07\xff\
-\x8a\x4c\x8b\xea\xe9\xa3\x13\x4f\x97\x9d\xc6\xf5\xd2\xd8\xce\xc4\
-\x5a\xf2\xd0\x58\x37\x83\x75\xd6\xa1\x77\x02\x77\xf2\x33\xdf\xd1\
-\xee\x84\x75\x4e\x98\xd7\x7f\x06\x3e\x90\x94\xde\xa5\xe4\x57\x82\
-\x1f\xe7\xf6\xc2\x90\x8d\x31\x3d\xbb\xfc\x40\xbd\x5c\x7d\xea\x5b\
-\x2e\x5b\xd5\x5a\xc8\xca\xef\x52\x41\xa9\x63\x7a\x1c\x33\x7d\x3f\
-\x6e\xae\xf3\xce\xd3\x02\x63\x7c\x33\xb4\x34\x13\x50\x75\x22\xdb\
-\x4a\x2d\x5d\xa7\x8d\x37\x61\x68\x1d\x76\x85\x8d\xa9\xf1\x0c\xaa\
-\xab\x42\x9d\xa9\x09\x2b\xa7\x71\xe0\x9b\x49\x00\xea\xd2\xe1\x99\
-\x69\x0f\xb2\x3b\x89\x69\x06\xcb\x4a\xd7\x32\x79\x39\x91\x2e\xba\
-\x36\x0b\xaf\xfc\xcc\xdb\x54\xd5\xf7\x2b\xf2\x1d\x4a\xb9\x6f\xa5\
-\x48\x58\x03\xa2\xbe\x4e\x3d\x15\x2f\x20\x1d\xa0\x4b\xaf\x52\xc2\
-\x2c\xf7\x31\xc9\x65\xa7\x43\x77\x19\xf9\x0b\x27\x07\x0e\x15\xc8\
-\x08\x74\x93\xa5\x8c\x78\x37\x0c\x78\xb7\x9c\x86\x2b\xed\x73\x8b\
-\xa4\x3b\x66\x2b\xf7\x25\x8b\x32\x04\x4b\xf1\xb3\x06\x7b\x2e\x5c\
-\x58\xf0\x73\xd7\xe1\x4a\xaa\x45\x56\xe2\x97\xac\x62\x57\x55\xc0\
-\x2f\x9d\x96\x2e\x4f\xc4\xb9\x46\x31\xd3\xae\xe8\xa8\x0a\x5e\xfe\
-\x62\x73\x5e\xbb\x35\xc6\xe3\x50\x32\x79\xf5\x6a\xf4\xd2\x45\x09\
-\xaf\xa8\xa3\xe4\x94\x7a\x30\x55\xd5\x36\xe9\x8a\xe4\x3b\xb5\xee\
-\x9f\xd2\xc7\x8d\xf9\x57\x8c\x79\x54\x30\xfd\x1c\x7f\x9d\x75\x9f\
-\x84\x40\x55\xc9\x87\x6a\x35\xab\x3c\xff\x96\x3e\xa1\xd3\xe7\x0c\
-\x8c\x56\xe6\x76\x99\xae\xfe\x50\x7a\x09\x2d\xdd\xec\x66\x24\x42\
-\x35\x5a\xb5\xcd\xac\x88\xae\xfa\xd8\x9f\xda\xa1\x1d\x90\x0a\xfb\
-\x97\x13\x80\x71\xff\xab\xc6\xde\x6c\xe8\xc6\xbf\x2a\x2a\xa9\xc1\
-\xf8\x2e\x60\x8d\x68\xc8\x27\xb4\x52\x22\x31\xe1\x3f\xa5\x1b\xcb\
-\xde\xde\x3e\x3d\xd0\x1e\x0a\x7c\x22\x29\x53\x87\xa2\xdb\x5f\xc5\
-\x1f\xdc\xb2\x98\xbf\x71\x24\xda\x98\x45\x96\x51\x08\x9a\x5c\x7c\
-\xcd\x86\xe3\x82\x2e\xe5\x71\x18\x8c\xaf\x79\xe6\x1c\xd4\x87\x2e\
-\x1c\xd5\x9d\xba\xd9\x1c\x34\x6f\xae\x66\xa2\xba\x87\x25\xa0\x4d\
-\x1b\xe7\x81\x37\xbe\x28\x98\x50\x37\xb9\xa5\x70\x6d\x57\x9e\x70\
-\xdc\xaa\xce\x67\xf7\x51\x6b\xd5\xb1\xe6\xf5\x59\xaa\x51\x42\x0d\
-\x93\x88\x75\xaf\x6a\xdf\x05\x01\xfa\x84\x43\xc4\xaf\xc7\xfc\xdb\
-\x52\xea\x64\x78\x1f\x3d\x5c\x9e\x30\xfb\x31\x63\x18\xb3\xe8\xda\
-\x73\x66\x66\x3d\x50\x11\xb6\xe5\xc4\x56\x48\xaf\x93\x94\xc6\xdc\
-\x5b\x3b\xf7\x67\xd9\x29\x93\x9f\xd9\xd7\xca\x47\x54\xf6\x4c\x59\
-\x00\xe2\x71\x84\x79\x7d\xea\x7e\x82\x65\x32\x3c\x97\x3e\xbc\x63\
-\x08\x92\x01\x33\xe7\x94\x36\xcb\x1d\xe9\x45\xaa\x1f\x7d\x71\x03\
-\xdd\x22\x0c\xd2\x34\x33\x31\x56\x66\x31\xca\x99\x82\x8d\xa3\x57\
-\x9b\xcb\xbc\xab\x15\x26\x69\xb0\x53\x78\x99\x89\x1b\x32\x91\x12\
-\x11\x42\xea\xdd\x7b\x2e\xe2\x0c\x03\xc9\x12\x2f\x0d\x92\x09\x1c\
-\x0b\x59\xbc\x22\x7c\x58\xb8\xff\x0a\x2c\x13\x82\xf1\x43\x22\xd7\
-\x48\x7f\x42\x56\x6c\x89\x69\x44\xcc\x00\x35\x11\x8a\x10\xd1\xa9\
-\x87\xa7\x60\x1e\xc0\x84\x9f\x40\xf3\xff\x5c\x26\xa9\x0c\x4a\x93\
-\x79\x9c\x01\xd3\xa4\xc5\x41\xe0\xa0\x68\xe0\x4a\x56\xf3\x39\x4d\
-\x63\xd4\xc6\x64\xbc\x8c\xe1\xbe\x2d\xc2\x9f\x16\x31\xf3\x97\x63\
-\x8c\xa6\x8a\x44\x60\x51\x84\x89\xde\xbc\x30\x0b\x86\x92\x41\x41\
-\x97\x31\x9b\xa2\x8c\xe6\x33\x2d\xb7\xf2\x15\xf5\xdf\x86\x71\x67\
-\x4c\x6c\xfa\xad\xc4\x8e\xc3\x28\xa0\x84\xcb\x8d\x60\xc1\x2e\x9f\
-\xbb\x07\xcb\x39\x3d\x74\x9d\xd5\x1c\xe9\xa3\x32\xbb\x41\xd9\x3d\
-\x3b\x57\xb7\x69\xda\xfd\x38\x77\x39\xb7\x69\x2b\x73\x20\x38\x2f\
-\xf8\x4e\xca\xcc\xcf\x71\xd8\x69\x4c\x8b\x94\x99\xb9\x30\x6c\xd2\
-\xca\xbe\x34\x10\x17\xb9\x6d\x13\x9d\xa5\x52\x33\x89\x83\x13\xd8\
-\x32\xba\x2e\x17\x30\x59\xbf\xe9\x37\x88\x5e\x37\xb9\x8f\x6c\xed\
-\xe8\xb0\xd3\xec\x8b\x8a\x2d\xf3\x8f\xcc\xcf\x92\x15\x35\x4f\xf6\
-\x4e\xfa\xc7\x17\xe7\xfc\x39\x87\x52\x17\x1f\x50\x5d\x8c\x96\x41\
-\x98\xb6\x83\x48\x46\x0f\x62\x70\x68\x88\x89\x31\x60\x67\x48\x53\
-\xb8\x30\x7b\x3e\xc6\xff\xf1\x20\xbe\x55\x92\x22\x21\x33\x3a\xd7\
-\x5f\x53\xf4\xec\xd4\xee\x78\x06\x15\x29\x8c\x60\xb9\xf3\x62\x38\
-\x7e\x6d\x91\xb7\xe8\x2d\xbe\xf3\xe6\x8b\x90\x2b\x10\x2a\x57\x3d\
-\x8f\x9f\x04\x18\x70\x04\x11\x70\x5b\xe2\x12\xef\xc9\x4f\x3b\x7e\
-\xec\xb7\x38\xac\xaf\x17\xd7\x5f\x65\xb8\x1d\x8e\x0a\xf3\xb2\x92\
-\xdf\x57\xc4\xf0\x58\x9e\x44\x29\x42\x7b\x1e\xfc\xe1\x07\x5e\xc8\
-\xa6\x3a\x68\xf2\xc3\x09\xff\x5b\xec\x7b\x98\x71\xf2\x36\x08\x43\
-\x9e\x0f\x7e\x25\xfa\xc1\x5f\x49\xea\x61\xa2\x1c\x5f\x07\xf4\x01\
-\x37\xcc\x72\xa5\xdd\x40\xa9\x81\x7a\x4b\x96\xa0\xbf\xbc\x04\x3f\
-\xa7\x9d\x24\x70\x8e\x02\xa0\x32\x04\xf2\x94\xdd\x52\x1e\x4f\x7b\
-\x4b\x79\xbe\x0f\x8a\x89\x3e\x18\xc1\x19\x8a\x03\x5f\xf0\x4c\x8f\
-\x25\xd8\x4d\xc3\x84\xde\x2a\x05\xac\xa2\x3c\x73\xb1\xa3\xa2\xdd\
-\x1c\x33\x25\xe1\x5e\x13\xe2\x27\x4a\xa2\x84\x6b\xf6\x00\xd9\x89\
-\x0e\xf8\x2e\xef\x89\x3f\x1f\x78\xce\x7b\xd8\x04\xb8\xae\x56\xa9\
-\xf1\x7d\x3a\x66\x31\xcf\x7e\x9f\x6c\x99\x4d\x45\x94\x2c\x70\xc2\
-\xec\x33\x41\xed\x2e\xb8\x98\xa8\x68\x55\x2e\x11\x51\x30\x56\xdf\
-\x39\xc1\x9f\xf7\x14\x1a\x11\x79\x06\x14\x61\xa7\x4b\x0c\x6b\x03\
-\xe6\x81\x94\xa2\x01\x53\xb3\x4c\x00\x41\xd9\xe7\xf1\xb5\x82\x03\
-\x2a\xea\x33\x3f\x3f\x52\x94\xc5\xf8\x62\x3e\x46\xec\x4e\x9a\x00\
-\x93\x36\x7a\x4e\x78\xd8\x69\x82\x57\xab\x25\x95\x39\x2f\x45\xf3\
-\x36\x08\xef\x98\x3a\xa2\x7e\x45\xf5\x17\x51\x6d\x1c\x71\x55\x37\
-\x77\x88\xb1\xea\x65\x25\x29\x91\x9d\xd8\x75\x69\x0f\x76\xed\x68\
-\xbe\xa0\x51\x79\x87\x2c\x34\xc4\xe8\x02\x52\x40\xd3\xd2\x3e\xbc\
-\xb6\xd8\x29\x51\x0c\x72\xf5\xc1\x4a\xa3\x4b\x3e\xc5\x0e\x08\xf6\
-\x62\xc1\xe2\x94\xac\xa8\x58\x52\x52\x6e\x71\x89\x62\x47\x8c\x28\
-\xd6\xcd\x8d\xd1\xa0\xbc\x72\x40\xec\x97\x8d\xa9\xec\xed\x12\xc0\
-\x8a\x26\x6b\xb1\x71\x46\xc3\x45\x69\x07\xac\x2c\x76\x89\x58\x69\
-\x87\x88\x15\x9b\x73\xd5\xb0\x16\x4e\x7e\x90\x8c\x41\x9e\x4b\xfb\
-\xc8\xfa\xdc\xb7\xad\x95\xe6\x50\x31\x08\xa2\x00\x25\x7d\x1c\x07\
-\x7c\x8f\x29\x82\x93\x8d\xbe\xa8\x16\x06\x26\x46\xff\x20\x9a\xe0\
-\xaa\xe6\x19\x84\x4a\x41\x18\x8d\xdc\x50\x54\x24\x7f\x39\x08\xd5\
-\xc2\xdd\xff\xd6\x8b\x31\xb0\xbd\xbc\xbb\x6c\x90\x8b\x8e\xc5\x6f\
-\x30\x25\xea\x63\xbc\x54\x27\xfd\x4d\xa8\x52\x28\x82\xa1\x66\xdc\
-\x75\x41\xbd\x1b\x39\x98\x5b\x26\xa3\x49\xf1\x83\x01\x0e\xff\xb0\
-\x75\x40\x93\x37\x88\xff\x03\x78\xdd\x0d\x11\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\x30\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x02\x28\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\x65\
-\x28\x39\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\x2c\
-\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\x33\
-\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\x2e\
-\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\
-\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\
-\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\x33\
-\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\x35\
-\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\
-\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\x31\
-\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\x30\
-\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\x30\
-\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\
-\x61\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x62\x30\x62\x30\x62\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x9e\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\
-\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\
-\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x32\x35\x36\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x36\x2e\x30\x30\
-\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\x30\x20\x4c\x32\
-\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\x30\x2e\x39\x20\
-\x30\x2c\x32\x20\x4c\x30\x2c\x31\x34\x20\x43\x30\x2c\x31\x35\x2e\
-\x31\x20\x30\x2e\x39\x2c\x31\x36\x20\x32\x2c\x31\x36\x20\x4c\x31\
-\x38\x2c\x31\x36\x20\x43\x31\x39\x2e\x31\x2c\x31\x36\x20\x32\x30\
-\x2c\x31\x35\x2e\x31\x20\x32\x30\x2c\x31\x34\x20\x4c\x32\x30\x2c\
-\x34\x20\x43\x32\x30\x2c\x32\x2e\x39\x20\x31\x39\x2e\x31\x2c\x32\
-\x20\x31\x38\x2c\x32\x20\x4c\x31\x30\x2c\x32\x20\x4c\x38\x2c\x30\
-\x20\x4c\x38\x2c\x30\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x65\x66\x66\x30\x66\x31\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x64\x61\
-\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\
-\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\
-\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x37\x2e\x31\x20\
-\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x35\x38\x64\x33\x66\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\
-\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x33\x2c\x31\
-\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\x30\x2e\x39\x20\x76\
-\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\x66\x69\x6c\x6c\x2d\
-\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\x20\x76\x2d\x38\x20\x68\
-\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\
-\x66\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x3c\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\
-\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
-\x22\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x37\x30\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x31\x37\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x34\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\
-\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\
-\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\
-\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\
-\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\
-\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\
-\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x32\x2c\x31\x30\x20\
-\x43\x32\x2c\x35\x2e\x36\x20\x35\x2e\x36\x2c\x32\x20\x31\x30\x2c\
-\x32\x20\x43\x31\x31\x2e\x38\x2c\x32\x20\x31\x33\x2e\x35\x2c\x32\
-\x2e\x36\x20\x31\x34\x2e\x39\x2c\x33\x2e\x37\x20\x4c\x33\x2e\x37\
-\x2c\x31\x34\x2e\x39\x20\x43\x32\x2e\x36\x2c\x31\x33\x2e\x35\x20\
-\x32\x2c\x31\x31\x2e\x38\x20\x32\x2c\x31\x30\x20\x4c\x32\x2c\x31\
-\x30\x20\x5a\x20\x4d\x31\x30\x2c\x31\x38\x20\x43\x38\x2e\x32\x2c\
-\x31\x38\x20\x36\x2e\x35\x2c\x31\x37\x2e\x34\x20\x35\x2e\x31\x2c\
-\x31\x36\x2e\x33\x20\x4c\x31\x36\x2e\x33\x2c\x35\x2e\x31\x20\x43\
-\x31\x37\x2e\x34\x2c\x36\x2e\x35\x20\x31\x38\x2c\x38\x2e\x32\x20\
-\x31\x38\x2c\x31\x30\x20\x43\x31\x38\x2c\x31\x34\x2e\x34\x20\x31\
-\x34\x2e\x34\x2c\x31\x38\x20\x31\x30\x2c\x31\x38\x20\x4c\x31\x30\
-\x2c\x31\x38\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xac\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
-\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x31\x37\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\
-\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x32\x36\x35\x36\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\
-\x20\x79\x3d\x22\x34\x37\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x22\x2f\x3e\x0a\
-\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\x36\x36\x22\x20\
-\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x02\x28\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\x65\
-\x28\x39\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\x2c\
-\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\x33\
-\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\x2e\
-\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\
-\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\
-\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\x33\
-\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\x35\
-\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\
-\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\x31\
-\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\x30\
-\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\x30\
-\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x64\x61\x65\
-\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\x33\
-\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\x38\x36\
-\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x2d\
-\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x39\
-\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\
-\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\x36\x37\
-\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\x36\x34\
-\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\x34\x35\
-\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\x2c\x31\
-\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\x2c\x37\
-\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\x2f\x3e\
-\x0a\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\x33\
-\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\x38\x36\
-\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x2d\
-\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x39\
-\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\
-\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\x36\x37\
-\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\x36\x34\
-\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\x34\x35\
-\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\x2c\x31\
-\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\x2c\x37\
-\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x32\x61\x37\x39\x61\x33\x22\x20\x66\x69\x6c\x6c\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\x2f\x3e\
-\x0a\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x07\x7a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x33\x34\x64\
-\x38\x30\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x2c\x30\x2c\x30\x2c\x30\x2e\x38\
-\x2c\x34\x37\x2e\x39\x36\x30\x30\x32\x33\x2c\x39\x2e\x36\x33\x39\
-\x39\x37\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x64\x3d\x22\x4d\x20\x36\x2e\x35\x2c\x31\x35\x2e\x37\x20\x30\
-\x2c\x31\x30\x2e\x35\x20\x41\x20\x33\x34\x2e\x33\x39\x36\x2c\x33\
-\x34\x2e\x33\x39\x36\x20\x30\x20\x30\x20\x31\x20\x35\x2e\x32\x30\
-\x39\x2c\x35\x2e\x33\x30\x38\x20\x32\x39\x2e\x31\x33\x33\x2c\x32\
-\x39\x2e\x31\x33\x33\x20\x30\x20\x30\x20\x31\x20\x38\x2e\x39\x2c\
-\x32\x2e\x38\x20\x32\x30\x2e\x36\x38\x38\x2c\x32\x30\x2e\x36\x38\
-\x38\x20\x30\x20\x30\x20\x31\x20\x31\x35\x2e\x33\x37\x36\x2c\x30\
-\x2e\x34\x37\x31\x20\x32\x38\x2e\x36\x37\x2c\x32\x38\x2e\x36\x37\
-\x20\x30\x20\x30\x20\x31\x20\x32\x30\x2e\x37\x2c\x30\x20\x32\x33\
-\x2e\x35\x38\x38\x2c\x32\x33\x2e\x35\x38\x38\x20\x30\x20\x30\x20\
-\x31\x20\x32\x35\x2e\x31\x38\x38\x2c\x30\x2e\x34\x31\x32\x20\x31\
-\x39\x2e\x34\x31\x32\x2c\x31\x39\x2e\x34\x31\x32\x20\x30\x20\x30\
-\x20\x31\x20\x32\x38\x2e\x33\x35\x2c\x31\x2e\x33\x20\x32\x30\x2e\
-\x32\x32\x31\x2c\x32\x30\x2e\x32\x32\x31\x20\x30\x20\x30\x20\x31\
-\x20\x33\x32\x2e\x33\x38\x2c\x33\x2e\x33\x33\x35\x20\x31\x37\x2e\
-\x34\x39\x35\x2c\x31\x37\x2e\x34\x39\x35\x20\x30\x20\x30\x20\x31\
-\x20\x33\x34\x2e\x33\x2c\x34\x2e\x38\x20\x71\x20\x32\x2e\x35\x2c\
-\x32\x2e\x32\x20\x33\x2e\x39\x2c\x35\x2e\x31\x35\x20\x31\x2e\x34\
-\x2c\x32\x2e\x39\x35\x20\x31\x2e\x34\x2c\x36\x2e\x33\x35\x20\x61\
-\x20\x32\x31\x2e\x32\x36\x39\x2c\x32\x31\x2e\x32\x36\x39\x20\x30\
-\x20\x30\x20\x31\x20\x2d\x30\x2e\x32\x33\x39\x2c\x33\x2e\x32\x38\
-\x20\x71\x20\x2d\x30\x2e\x33\x35\x2c\x32\x2e\x32\x33\x39\x20\x2d\
-\x31\x2e\x32\x31\x31\x2c\x34\x2e\x30\x32\x20\x2d\x31\x2e\x34\x35\
-\x2c\x33\x20\x2d\x33\x2e\x36\x35\x2c\x35\x2e\x33\x35\x20\x2d\x32\
-\x2e\x32\x2c\x32\x2e\x33\x35\x20\x2d\x34\x2e\x37\x35\x2c\x34\x2e\
-\x33\x35\x20\x2d\x32\x2e\x35\x35\x2c\x32\x20\x2d\x34\x2e\x37\x35\
-\x2c\x34\x2e\x32\x20\x2d\x32\x2e\x32\x2c\x32\x2e\x32\x20\x2d\x33\
-\x2e\x36\x35\x2c\x34\x2e\x39\x20\x2d\x31\x2e\x34\x35\x2c\x32\x2e\
-\x37\x20\x2d\x31\x2e\x34\x35\x2c\x36\x2e\x35\x20\x76\x20\x35\x2e\
-\x36\x20\x68\x20\x2d\x37\x2e\x38\x20\x71\x20\x2d\x30\x2e\x35\x2c\
-\x2d\x31\x2e\x37\x20\x2d\x30\x2e\x37\x35\x2c\x2d\x33\x2e\x37\x20\
-\x2d\x30\x2e\x32\x35\x2c\x2d\x32\x20\x2d\x30\x2e\x32\x35\x2c\x2d\
-\x33\x2e\x37\x20\x61\x20\x32\x31\x2e\x33\x32\x32\x2c\x32\x31\x2e\
-\x33\x32\x32\x20\x30\x20\x30\x20\x31\x20\x30\x2e\x32\x36\x38\x2c\
-\x2d\x33\x2e\x34\x36\x34\x20\x51\x20\x31\x31\x2e\x37\x31\x33\x2c\
-\x34\x31\x2e\x35\x34\x34\x20\x31\x32\x2e\x35\x2c\x33\x39\x2e\x38\
-\x20\x31\x33\x2e\x39\x2c\x33\x36\x2e\x37\x20\x31\x36\x2c\x33\x34\
-\x2e\x33\x35\x20\x31\x38\x2e\x31\x2c\x33\x32\x20\x32\x30\x2e\x35\
-\x2c\x33\x30\x2e\x31\x20\x32\x32\x2e\x39\x2c\x32\x38\x2e\x32\x20\
-\x32\x35\x2c\x32\x36\x2e\x32\x35\x20\x41\x20\x32\x32\x2e\x32\x31\
-\x35\x2c\x32\x32\x2e\x32\x31\x35\x20\x30\x20\x30\x20\x30\x20\x32\
-\x37\x2e\x35\x35\x37\x2c\x32\x33\x2e\x34\x35\x31\x20\x31\x39\x2e\
-\x33\x38\x38\x2c\x31\x39\x2e\x33\x38\x38\x20\x30\x20\x30\x20\x30\
-\x20\x32\x38\x2e\x35\x2c\x32\x32\x2e\x31\x20\x38\x2e\x39\x37\x37\
-\x2c\x38\x2e\x39\x37\x37\x20\x30\x20\x30\x20\x30\x20\x32\x39\x2e\
-\x38\x34\x39\x2c\x31\x38\x2e\x30\x38\x35\x20\x31\x31\x2e\x32\x34\
-\x34\x2c\x31\x31\x2e\x32\x34\x34\x20\x30\x20\x30\x20\x30\x20\x32\
-\x39\x2e\x39\x2c\x31\x37\x20\x38\x2e\x32\x34\x31\x2c\x38\x2e\x32\
-\x34\x31\x20\x30\x20\x30\x20\x30\x20\x32\x37\x2e\x36\x30\x35\x2c\
-\x31\x31\x2e\x32\x37\x20\x31\x31\x2e\x30\x30\x36\x2c\x31\x31\x2e\
-\x30\x30\x36\x20\x30\x20\x30\x20\x30\x20\x32\x37\x2e\x32\x2c\x31\
-\x30\x2e\x38\x35\x20\x39\x2e\x30\x31\x32\x2c\x39\x2e\x30\x31\x32\
-\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\x36\x35\x32\x2c\x38\x2e\
-\x34\x37\x32\x20\x31\x33\x2e\x32\x32\x31\x2c\x31\x33\x2e\x32\x32\
-\x31\x20\x30\x20\x30\x20\x30\x20\x31\x39\x2e\x39\x2c\x38\x2e\x32\
-\x20\x31\x35\x2e\x30\x30\x35\x2c\x31\x35\x2e\x30\x30\x35\x20\x30\
-\x20\x30\x20\x30\x20\x31\x35\x2e\x34\x37\x36\x2c\x38\x2e\x38\x33\
-\x33\x20\x31\x33\x2e\x30\x36\x31\x2c\x31\x33\x2e\x30\x36\x31\x20\
-\x30\x20\x30\x20\x30\x20\x31\x32\x2e\x34\x35\x2c\x31\x30\x2e\x32\
-\x20\x32\x30\x2e\x37\x32\x38\x2c\x32\x30\x2e\x37\x32\x38\x20\x30\
-\x20\x30\x20\x30\x20\x38\x2e\x34\x36\x36\x2c\x31\x33\x2e\x34\x32\
-\x35\x20\x32\x36\x2e\x32\x30\x39\x2c\x32\x36\x2e\x32\x30\x39\x20\
-\x30\x20\x30\x20\x30\x20\x36\x2e\x35\x2c\x31\x35\x2e\x37\x20\x5a\
-\x20\x6d\x20\x33\x2e\x35\x32\x36\x2c\x35\x31\x2e\x39\x34\x20\x41\
-\x20\x38\x2e\x38\x36\x2c\x38\x2e\x38\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x2e\x38\x2c\x36\x39\x2e\x37\x20\x71\x20\x30\x2c\x32\x2e\
-\x37\x20\x32\x2c\x34\x2e\x37\x20\x41\x20\x38\x2e\x33\x31\x37\x2c\
-\x38\x2e\x33\x31\x37\x20\x30\x20\x30\x20\x30\x20\x31\x31\x2e\x38\
-\x36\x33\x2c\x37\x34\x2e\x34\x36\x32\x20\x36\x2e\x34\x31\x38\x2c\
-\x36\x2e\x34\x31\x38\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\x35\
-\x2c\x37\x36\x2e\x34\x20\x38\x2e\x36\x30\x35\x2c\x38\x2e\x36\x30\
-\x35\x20\x30\x20\x30\x20\x30\x20\x31\x37\x2e\x31\x32\x32\x2c\x37\
-\x36\x2e\x33\x37\x38\x20\x36\x2e\x34\x36\x31\x2c\x36\x2e\x34\x36\
-\x31\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\x33\x2c\x37\x34\x2e\
-\x35\x35\x20\x51\x20\x32\x33\x2e\x32\x2c\x37\x32\x2e\x37\x20\x32\
-\x33\x2e\x32\x2c\x36\x39\x2e\x37\x20\x41\x20\x36\x2e\x32\x32\x35\
-\x2c\x36\x2e\x32\x32\x35\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\
-\x36\x32\x31\x2c\x36\x37\x2e\x30\x32\x39\x20\x36\x2e\x39\x35\x35\
-\x2c\x36\x2e\x39\x35\x35\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\
-\x31\x35\x2c\x36\x35\x20\x38\x2e\x34\x37\x38\x2c\x38\x2e\x34\x37\
-\x38\x20\x30\x20\x30\x20\x30\x20\x32\x30\x2e\x36\x32\x39\x2c\x36\
-\x34\x2e\x35\x33\x32\x20\x36\x2e\x33\x32\x35\x2c\x36\x2e\x33\x32\
-\x35\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\x35\x2c\x36\x33\x20\
-\x71\x20\x2d\x31\x2e\x32\x32\x35\x2c\x30\x20\x2d\x32\x2e\x32\x33\
-\x38\x2c\x30\x2e\x32\x36\x34\x20\x41\x20\x35\x2e\x36\x39\x38\x2c\
-\x35\x2e\x36\x39\x38\x20\x30\x20\x30\x20\x30\x20\x31\x31\x2e\x35\
-\x35\x2c\x36\x34\x2e\x38\x20\x35\x2e\x39\x37\x36\x2c\x35\x2e\x39\
-\x37\x36\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2e\x30\x32\x36\x2c\
-\x36\x37\x2e\x36\x34\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\
-\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\
-\x3d\x22\x4d\x20\x31\x32\x2e\x39\x31\x39\x30\x38\x33\x2c\x35\x33\
-\x2e\x31\x36\x34\x30\x33\x37\x20\x34\x39\x2e\x33\x36\x39\x30\x38\
-\x31\x2c\x38\x39\x2e\x36\x31\x34\x30\x33\x35\x20\x38\x35\x2e\x38\
-\x31\x39\x30\x38\x37\x2c\x35\x33\x2e\x31\x36\x34\x30\x33\x37\x20\
-\x34\x39\x2e\x33\x36\x39\x30\x38\x31\x2c\x31\x36\x2e\x37\x31\x34\
-\x30\x34\x20\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x61\x32\x61\x32\x61\
-\x32\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\
-\x69\x64\x74\x68\x3d\x22\x37\x2e\x32\x39\x22\x20\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x9f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x20\x78\x3d\x22\x36\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\x62\x30\
-\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\x22\x34\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x32\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\
-\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x63\x38\x63\x39\x63\x61\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x37\x2e\x31\x20\
-\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x63\x38\x63\x39\x63\x61\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\
-\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x33\x2c\x31\
-\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\x30\x2e\x39\x20\x76\
-\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\x66\x69\x6c\x6c\x2d\
-\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\x20\x76\x2d\x38\x20\x68\
-\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x38\x63\x39\
-\x63\x61\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x0f\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\
-\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x32\x35\x35\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x33\x38\x31\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x32\
-\x35\x35\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x33\x38\x31\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\x30\x20\
-\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\x30\x2e\
-\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x36\x20\x43\x30\x2c\x31\
-\x37\x2e\x31\x20\x30\x2e\x39\x2c\x31\x38\x20\x32\x2c\x31\x38\x20\
-\x4c\x31\x36\x2c\x31\x38\x20\x43\x31\x37\x2e\x31\x2c\x31\x38\x20\
-\x31\x38\x2c\x31\x37\x2e\x31\x20\x31\x38\x2c\x31\x36\x20\x4c\x31\
-\x38\x2c\x34\x20\x4c\x31\x34\x2c\x30\x20\x4c\x31\x34\x2c\x30\x20\
-\x5a\x20\x4d\x39\x2c\x31\x36\x20\x43\x37\x2e\x33\x2c\x31\x36\x20\
-\x36\x2c\x31\x34\x2e\x37\x20\x36\x2c\x31\x33\x20\x43\x36\x2c\x31\
-\x31\x2e\x33\x20\x37\x2e\x33\x2c\x31\x30\x20\x39\x2c\x31\x30\x20\
-\x43\x31\x30\x2e\x37\x2c\x31\x30\x20\x31\x32\x2c\x31\x31\x2e\x33\
-\x20\x31\x32\x2c\x31\x33\x20\x43\x31\x32\x2c\x31\x34\x2e\x37\x20\
-\x31\x30\x2e\x37\x2c\x31\x36\x20\x39\x2c\x31\x36\x20\x4c\x39\x2c\
-\x31\x36\x20\x5a\x20\x4d\x31\x32\x2c\x36\x20\x4c\x32\x2c\x36\x20\
-\x4c\x32\x2c\x32\x20\x4c\x31\x32\x2c\x32\x20\x4c\x31\x32\x2c\x36\
-\x20\x4c\x31\x32\x2c\x36\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x38\x30\x34\x30\
-\x34\x61\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\
-\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x39\x30\
-\x2e\x37\x30\x38\x36\x36\x35\x2c\x31\x37\x2e\x33\x38\x35\x38\x32\
-\x36\x20\x38\x35\x2e\x30\x33\x39\x33\x37\x35\x2c\x31\x31\x2e\x37\
-\x31\x36\x35\x33\x35\x20\x36\x32\x2e\x33\x36\x32\x32\x30\x33\x2c\
-\x33\x34\x2e\x33\x39\x33\x37\x20\x33\x39\x2e\x36\x38\x35\x30\x33\
-\x39\x2c\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\x6c\x20\x2d\x35\
-\x2e\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\
-\x20\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x36\x20\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\
-\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\
-\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\x20\x32\x32\x2e\x36\
-\x37\x37\x31\x36\x34\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\
-\x20\x32\x32\x2e\x36\x37\x37\x31\x37\x32\x2c\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\x39\x2c\x2d\x35\x2e\
-\x36\x36\x39\x32\x39\x31\x20\x2d\x32\x32\x2e\x36\x37\x37\x31\x37\
-\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x7a\x22\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x79\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x63\x38\x63\x39\x63\x61\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x98\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x32\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x32\x35\x34\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x34\x32\x32\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x34\
-\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\
-\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\
-\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\
-\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\
-\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\
-\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\
-\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\x31\x2c\
-\x31\x37\x20\x4c\x39\x2c\x31\x37\x20\x4c\x39\x2c\x31\x35\x20\x4c\
-\x31\x31\x2c\x31\x35\x20\x4c\x31\x31\x2c\x31\x37\x20\x4c\x31\x31\
-\x2c\x31\x37\x20\x5a\x20\x4d\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\
-\x4c\x31\x32\x2e\x32\x2c\x31\x30\x2e\x32\x20\x43\x31\x31\x2e\x34\
-\x2c\x31\x30\x2e\x39\x20\x31\x31\x2c\x31\x31\x2e\x35\x20\x31\x31\
-\x2c\x31\x33\x20\x4c\x39\x2c\x31\x33\x20\x4c\x39\x2c\x31\x32\x2e\
-\x35\x20\x43\x39\x2c\x31\x31\x2e\x34\x20\x39\x2e\x34\x2c\x31\x30\
-\x2e\x34\x20\x31\x30\x2e\x32\x2c\x39\x2e\x37\x20\x4c\x31\x31\x2e\
-\x34\x2c\x38\x2e\x34\x20\x43\x31\x31\x2e\x38\x2c\x38\x2e\x31\x20\
-\x31\x32\x2c\x37\x2e\x36\x20\x31\x32\x2c\x37\x20\x43\x31\x32\x2c\
-\x35\x2e\x39\x20\x31\x31\x2e\x31\x2c\x35\x20\x31\x30\x2c\x35\x20\
-\x43\x38\x2e\x39\x2c\x35\x20\x38\x2c\x35\x2e\x39\x20\x38\x2c\x37\
-\x20\x4c\x36\x2c\x37\x20\x43\x36\x2c\x34\x2e\x38\x20\x37\x2e\x38\
-\x2c\x33\x20\x31\x30\x2c\x33\x20\x43\x31\x32\x2e\x32\x2c\x33\x20\
-\x31\x34\x2c\x34\x2e\x38\x20\x31\x34\x2c\x37\x20\x43\x31\x34\x2c\
-\x37\x2e\x39\x20\x31\x33\x2e\x36\x2c\x38\x2e\x37\x20\x31\x33\x2e\
-\x31\x2c\x39\x2e\x33\x20\x4c\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\
-\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x39\x39\x39\x39\
-\x35\x43\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x2d\x31\x2e\x33\x2c\x30\x2c\x30\x2c\x2d\x31\
-\x2e\x33\x2c\x2d\x33\x31\x2e\x32\x39\x32\x39\x38\x37\x2c\x35\x2e\
-\x32\x34\x33\x31\x35\x32\x39\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x65\x66\
-\x66\x30\x66\x31\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3d\x22\x34\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\
-\x65\x22\x20\x64\x3d\x22\x6d\x20\x2d\x35\x30\x2e\x30\x30\x30\x30\
-\x30\x32\x2c\x2d\x34\x35\x2e\x35\x36\x35\x37\x35\x20\x2d\x31\x31\
-\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\x31\x35\x35\x36\x34\
-\x37\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\
-\x31\x35\x35\x36\x34\x37\x33\x20\x2d\x31\x31\x2e\x36\x35\x32\x39\
-\x34\x32\x2c\x2d\x32\x30\x2e\x31\x32\x37\x38\x30\x37\x33\x20\x2d\
-\x31\x31\x2e\x36\x35\x32\x39\x34\x31\x2c\x2d\x32\x30\x2e\x31\x32\
-\x37\x38\x30\x38\x20\x32\x33\x2e\x32\x35\x37\x36\x36\x34\x2c\x2d\
-\x30\x2e\x30\x32\x37\x38\x34\x20\x7a\x22\x20\x2f\x3e\x0a\x20\x20\
-\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\
-\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\x36\x37\x38\x37\x22\x20\x79\
-\x3d\x22\x35\x31\x2e\x39\x36\x31\x30\x37\x31\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x35\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x78\x3d\x22\x36\
-\x31\x2e\x34\x35\x36\x37\x38\x37\x22\x20\x79\x3d\x22\x33\x30\x2e\
-\x39\x36\x31\x30\x37\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x65\x66\x66\x30\x66\x31\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xac\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
-\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x31\x37\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\
-\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x61\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\
-\x30\x62\x30\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x38\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x01\x18\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x30\x2e\x31\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x30\x62\x30\
-\x62\x30\x22\x20\x64\x3d\x22\x4d\x32\x32\x2e\x31\x2c\x31\x30\x32\
-\x32\x2e\x31\x4c\x2d\x32\x32\x2e\x31\x2c\x39\x37\x37\x2e\x39\x6c\
-\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\x30\x32\x32\x2e\x31\
-\x2c\x32\x32\x2e\x31\x5a\x6d\x32\x32\x30\x2c\x33\x30\x4c\x31\x39\
-\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\
-\x31\x30\x30\x30\x4c\x31\x32\x34\x32\x2e\x31\x2c\x35\x32\x2e\x31\
-\x5a\x6d\x32\x35\x30\x2c\x30\x4c\x34\x34\x37\x2e\x39\x2c\x31\x30\
-\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\
-\x34\x39\x32\x2e\x31\x2c\x35\x32\x2e\x31\x5a\x6d\x32\x35\x30\x2c\
-\x30\x4c\x36\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\
-\x30\x33\x30\x2d\x31\x30\x33\x30\x4c\x31\x37\x37\x32\x2e\x31\x2c\
-\x32\x32\x2e\x31\x5a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x2d\x38\x36\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x36\x2e\x30\x30\x30\
-\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\x43\x34\
-\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\x30\x20\
-\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\x20\x31\
-\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\x32\x30\
-\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\x30\x2c\
-\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\x30\x20\
-\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x38\x2c\x31\x35\x20\x4c\x33\
-\x2c\x31\x30\x20\x4c\x34\x2e\x34\x2c\x38\x2e\x36\x20\x4c\x38\x2c\
-\x31\x32\x2e\x32\x20\x4c\x31\x35\x2e\x36\x2c\x34\x2e\x36\x20\x4c\
-\x31\x37\x2c\x36\x20\x4c\x38\x2c\x31\x35\x20\x4c\x38\x2c\x31\x35\
-\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x84\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\
-\x28\x37\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x33\x34\x31\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x38\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\
-\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x33\x34\
-\x31\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x39\x2e\x30\x30\x30\
-\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\x31\x2e\x34\x20\
-\x4c\x31\x32\x2e\x36\x2c\x30\x20\x4c\x37\x2c\x35\x2e\x36\x20\x4c\
-\x31\x2e\x34\x2c\x30\x20\x4c\x30\x2c\x31\x2e\x34\x20\x4c\x35\x2e\
-\x36\x2c\x37\x20\x4c\x30\x2c\x31\x32\x2e\x36\x20\x4c\x31\x2e\x34\
-\x2c\x31\x34\x20\x4c\x37\x2c\x38\x2e\x34\x20\x4c\x31\x32\x2e\x36\
-\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\x32\x2e\x36\x20\x4c\x38\x2e\
-\x34\x2c\x37\x20\x4c\x31\x34\x2c\x31\x2e\x34\x20\x5a\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x61\x37\x39\x61\x33\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb2\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x37\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\
-\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x32\x39\x39\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x31\x32\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x32\
-\x39\x39\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x31\x32\x39\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x2c\x31\x36\x20\
-\x43\x31\x2c\x31\x37\x2e\x31\x20\x31\x2e\x39\x2c\x31\x38\x20\x33\
-\x2c\x31\x38\x20\x4c\x31\x31\x2c\x31\x38\x20\x43\x31\x32\x2e\x31\
-\x2c\x31\x38\x20\x31\x33\x2c\x31\x37\x2e\x31\x20\x31\x33\x2c\x31\
-\x36\x20\x4c\x31\x33\x2c\x34\x20\x4c\x31\x2c\x34\x20\x4c\x31\x2c\
-\x31\x36\x20\x4c\x31\x2c\x31\x36\x20\x5a\x20\x4d\x31\x34\x2c\x31\
-\x20\x4c\x31\x30\x2e\x35\x2c\x31\x20\x4c\x39\x2e\x35\x2c\x30\x20\
-\x4c\x34\x2e\x35\x2c\x30\x20\x4c\x33\x2e\x35\x2c\x31\x20\x4c\x30\
-\x2c\x31\x20\x4c\x30\x2c\x33\x20\x4c\x31\x34\x2c\x33\x20\x4c\x31\
-\x34\x2c\x31\x20\x4c\x31\x34\x2c\x31\x20\x5a\x22\x2f\x3e\x0a\x20\
-\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x00\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\x36\x36\x22\
-\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x35\x22\
-\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x01\x13\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x35\
-\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x35\x38\x64\x33\x66\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x7a\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\xc5\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x2e\x37\x35\
-\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x34\x35\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x65\x66\x66\x30\x66\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x38\x30\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x33\x38\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x34\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\
-\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\
-\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\
-\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\
-\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\
-\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\
-\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\x35\x2c\x31\x33\
-\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x31\x35\x20\x4c\x31\x30\x2c\
-\x31\x31\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x31\x35\x20\x4c\x35\x2c\
-\x31\x33\x2e\x36\x20\x4c\x38\x2e\x36\x2c\x31\x30\x20\x4c\x35\x2c\
-\x36\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x35\x20\x4c\x31\x30\x2c\x38\
-\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x35\x20\x4c\x31\x35\x2c\x36\
-\x2e\x34\x20\x4c\x31\x31\x2e\x34\x2c\x31\x30\x20\x4c\x31\x35\x2c\
-\x31\x33\x2e\x36\x20\x4c\x31\x35\x2c\x31\x33\x2e\x36\x20\x5a\x22\
-\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x1c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\
-\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\
-\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\
-\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\
-\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x61\x66\x61\x66\x61\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x79\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x35\x38\x64\x33\x66\x66\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x1c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\
-\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\
-\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\
-\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\
-\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x33\x64\x61\x65\x65\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x61\x66\x61\x66\x61\x66\x22\x20\x78\x3d\x22\x33\x36\x22\
-\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x35\x22\
-\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x00\x80\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x61\x66\x61\x66\x61\x66\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\x2f\x3e\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x63\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x38\x63\x64\x35\
-\x66\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x36\x32\x2e\x35\
-\x22\x20\x63\x79\x3d\x22\x34\x30\x22\x20\x72\x3d\x22\x32\x35\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\x33\x36\x33\x62\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
-\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\x2f\
-\x3e\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\
-\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\
-\x22\x36\x30\x22\x20\x79\x3d\x22\x32\x35\x22\x2f\x3e\x0a\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\x22\x36\x30\
-\x22\x20\x79\x3d\x22\x33\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\
-\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xcb\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x30\x22\x3e\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\
-\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\
-\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x2d\x34\x36\x33\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x34\x32\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x36\x34\x2e\
-\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\x33\x20\
-\x4c\x38\x2c\x2d\x30\x2e\x35\x20\x4c\x33\x2c\x34\x2e\x35\x20\x4c\
-\x38\x2c\x39\x2e\x35\x20\x4c\x38\x2c\x35\x20\x43\x31\x31\x2e\x33\
-\x2c\x35\x20\x31\x34\x2c\x37\x2e\x37\x20\x31\x34\x2c\x31\x31\x20\
-\x43\x31\x34\x2c\x31\x34\x2e\x33\x20\x31\x31\x2e\x33\x2c\x31\x37\
-\x20\x38\x2c\x31\x37\x20\x43\x34\x2e\x37\x2c\x31\x37\x20\x32\x2c\
-\x31\x34\x2e\x33\x20\x32\x2c\x31\x31\x20\x4c\x30\x2c\x31\x31\x20\
-\x43\x30\x2c\x31\x35\x2e\x34\x20\x33\x2e\x36\x2c\x31\x39\x20\x38\
-\x2c\x31\x39\x20\x43\x31\x32\x2e\x34\x2c\x31\x39\x20\x31\x36\x2c\
-\x31\x35\x2e\x34\x20\x31\x36\x2c\x31\x31\x20\x43\x31\x36\x2c\x36\
-\x2e\x36\x20\x31\x32\x2e\x34\x2c\x33\x20\x38\x2c\x33\x20\x4c\x38\
-\x2c\x33\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x13\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\
-\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x7a\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\x1e\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x34\x22\x2f\x3e\x0a\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x00\x9f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x36\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\x38\
-\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x61\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x20\x78\x3d\x22\x38\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x1c\xe3\
-\x00\
-\x00\x9f\x42\x78\x9c\xdd\x3d\x6b\x73\xdb\xb6\xb2\xdf\xf3\x2b\x90\
-\xf4\x43\x9b\x56\xb2\x2d\x3f\x13\xf5\xb4\x33\x8e\xad\xc4\x9a\xfa\
-\x15\x5b\x69\x6e\xe6\x4e\x27\xa1\x44\xc8\x62\x4d\x11\x2a\x49\xd9\
-\x56\xef\xdc\xff\x7e\x77\xf1\x20\x41\x10\x24\x21\x59\x4e\xd3\x9b\
-\x9e\xc9\x89\x08\x60\xb1\xbb\x58\x2c\x80\xc5\xee\x62\xf3\xc7\x67\
-\xe4\x47\x42\xde\xc4\x94\xfe\x4d\x8f\xbd\xf8\x96\x24\xe9\x22\xa4\
-\xc9\x84\xd2\x74\x03\x8a\x78\x69\xd7\x9b\xa7\x13\x16\x77\xc9\x11\
-\x0b\x83\x88\x1c\xcf\xff\x9a\xd3\x24\x62\x0b\x51\x48\xfd\x20\xc5\
-\xc2\xc3\x90\x3e\x90\x93\x79\xf2\xb7\x77\x33\x11\x25\x61\x30\xa2\
-\x51\x42\xbb\xe4\xac\x3f\x68\x91\x84\x52\x72\xda\x3f\xea\x9d\x5f\
-\xf7\x36\xa6\xbe\x82\x3d\x98\x04\x09\x81\xff\xb1\x38\xb8\x09\x22\
-\x2f\x0c\x17\xc4\x23\x63\x06\x88\xb0\x31\x79\x8f\x18\x5d\x23\x42\
-\xd7\x88\x50\x8b\x78\x91\x8f\x95\x87\x5e\x42\x7d\xc2\x22\x89\xf7\
-\xa6\x49\xc3\x88\x85\x2c\x26\xc9\x68\x42\xa7\xb4\x45\x86\xf3\x14\
-\x1b\x01\xe6\x11\x23\xf7\x1e\x74\x30\x1e\x07\x61\xe0\xa5\x00\xe3\
-\x3e\x48\x27\xe4\xb7\xe3\x9e\xa2\xb5\xbd\x8e\x3f\x92\x30\x8a\x74\
-\x93\x53\xc1\x04\xf2\x03\xfc\x78\x29\x7b\x39\x62\xb3\x05\xd0\x3b\
-\x49\xc9\x0f\xa3\x97\xe4\x3f\xdb\x5b\x9d\x9d\x36\xfc\xb5\xfb\x2b\
-\xf9\x8f\xc1\xe2\x5f\xed\xd5\xf7\xa0\xfa\x76\x07\xaa\xeb\x4c\xff\
-\x55\x42\xbf\xa4\xf1\x34\x48\x92\x00\xf8\x03\x64\x4f\x68\x4c\x87\
-\x0b\x72\x13\x7b\x11\x10\xdc\x22\x63\x60\x13\xf2\x76\x34\xf1\xe2\
-\x1b\xe0\x4e\xca\x80\xab\x0b\x32\xa3\x71\x02\x0d\xd8\x30\xf5\x82\
-\x28\x88\x6e\x10\x90\x07\x8c\x9c\x2d\xb0\x72\x8a\xa3\x94\xb0\x71\
-\x7a\xef\xc5\x94\x8f\x82\x97\x24\x6c\x24\x78\xe8\xb3\xd1\x7c\x4a\
-\xa3\xd4\x4b\xb1\x4b\x60\x2d\x4d\xc8\x0f\xe9\x84\x22\x88\x17\xd7\
-\xb2\xd1\x8b\x97\xbc\x2b\x9f\x7a\x21\x8e\x04\x14\x13\x55\xc4\x07\
-\x81\xc1\x20\xc5\x34\x49\xe3\x60\x84\x60\x5a\x50\x69\x14\xce\x7d\
-\x89\x89\xaa\x11\x06\xd3\x40\xf6\x83\x10\x38\x53\x12\x84\x3b\x4f\
-\x80\x14\xc4\xb6\x45\xa6\xcc\x0f\xc6\xf8\xff\x94\xd3\x37\x9b\x0f\
-\xc3\x20\x99\xb4\x10\x8c\x1f\x60\x07\x20\x0f\xf0\x3d\xc1\xef\x7c\
-\x68\xb8\x58\x6d\xa2\xc0\xd0\x30\x44\x20\x01\x10\xc0\x89\xce\x71\
-\x14\xa2\x97\x32\x84\x32\x43\xfe\xa6\x92\x63\xbc\xf7\xfb\x09\x9b\
-\x16\x49\x02\x76\x8d\xe7\x71\x04\x1d\x53\x9f\xd3\xcd\x80\x7d\xbc\
-\xd3\x3f\xe9\x28\x95\x80\xb0\xc5\x98\x85\x21\xbb\x07\x32\xa1\xe3\
-\x08\x66\x12\x90\x96\x74\xe5\x40\xa2\x08\x79\x43\x76\x47\x39\x65\
-\x42\x02\x22\x96\x02\xd6\x02\x1b\x1c\x94\x59\x3e\xd8\xb2\x28\x99\
-\xc0\x2c\x22\x43\x2a\x39\x08\xfd\x07\x11\x1f\x4d\x8d\xb8\x18\x31\
-\x49\x52\x10\x89\x00\xc6\x63\xc6\x62\xde\xaf\x49\xb4\x9a\x14\x83\
-\x93\x1e\xb9\xbe\x78\x3b\xf8\x78\x78\xd5\x23\xfd\x6b\x72\x79\x75\
-\xf1\x7b\xff\xb8\x77\x4c\x5e\x1c\x5e\xc3\xef\x17\x2d\xf2\xb1\x3f\
-\x38\xb9\xf8\x30\x20\x50\xe3\xea\xf0\x7c\xf0\x89\x5c\xbc\x25\x87\
-\xe7\x9f\xc8\x6f\xfd\xf3\xe3\x16\xe9\xfd\xd7\xe5\x55\xef\xfa\x1a\
-\x41\x5d\x5c\x91\xfe\xd9\xe5\x69\xbf\x07\x9f\xfb\xe7\x47\xa7\x1f\
-\x8e\xfb\xe7\xef\xc8\x1b\x68\x7a\x7e\x01\x73\xa5\x0f\x93\x04\xe0\
-\x0e\x2e\x78\x9f\x12\x5a\xbf\x77\x0d\xf0\xb0\xf5\x59\xef\xea\xe8\
-\x04\xbe\x1c\xbe\xe9\x9f\xf6\x07\x9f\x5a\xe4\x6d\x7f\x70\x0e\x90\
-\xc9\x5b\x80\x7b\x48\x2e\x0f\xaf\x06\xfd\xa3\x0f\xa7\x87\x57\xe4\
-\xf2\xc3\xd5\xe5\xc5\x75\x0f\x90\x38\x06\xc8\xe7\xfd\xf3\xb7\x57\
-\xd0\x51\xef\xac\x77\x3e\x40\xaa\xa0\x6f\xf8\x4c\x7a\xbf\xc3\x6f\
-\x72\x7d\x72\x78\x7a\xca\x3b\x3c\xfc\x00\x64\x5c\x5d\x23\x96\x47\
-\x17\x97\x9f\xae\xfa\xef\x4e\x06\xe4\xe4\xe2\xf4\xb8\x07\x1f\xdf\
-\xf4\x00\xbf\xc3\x37\xa7\x3d\xd1\xdb\xf9\x27\x3e\x35\x4f\x0f\xfb\
-\x67\x2d\x72\x7c\x78\x76\xf8\xae\xc7\x1b\x5e\x00\xa0\x2b\x5e\x53\
-\xe2\xf8\xf1\xa4\xc7\x3f\x41\x97\x87\xf0\xbf\xa3\x41\xff\xe2\x1c\
-\xf9\x73\x74\x71\x3e\xb8\x82\x9f\x5c\x32\x07\x17\x57\x83\xac\xf5\
-\xc7\xfe\x75\xaf\x45\x0e\xaf\xfa\xd7\xc8\x9c\xb7\x57\x17\xd0\x03\
-\x72\x17\x1a\x5d\x70\x38\xd0\xf4\xbc\x27\x00\x21\xe7\x11\x77\x04\
-\x92\x8d\x11\xd4\x42\x72\x3e\x5c\xf7\x72\x8c\x8e\x7b\x87\xa7\x00\
-\xee\x1a\xdb\xeb\x03\xba\xb1\x4e\xb5\xb7\xf9\xec\xd9\xe6\x8f\x42\
-\xb1\x9f\x1d\x42\x47\xd7\x83\x4f\xa7\xbd\xeb\x93\x5e\x6f\xc0\xbf\
-\x59\x1b\xbc\x1f\x30\x16\x0e\x82\xd9\xb3\xff\x79\x46\xe0\xcf\xe6\
-\x8f\x64\x6b\x63\x1b\xb4\x1a\x08\x37\x0a\x63\x32\x05\xc1\x05\xc5\
-\x40\xee\xbc\x70\x4e\xe1\x93\x97\x7e\x9f\xa0\xac\x93\xe0\x26\x62\
-\xb1\x58\x07\x3e\x06\x91\xcf\xee\x93\x0d\x04\x88\x40\x86\x2c\xf6\
-\x29\xac\x49\x5b\x1b\x5b\xbb\x74\x0a\x53\x2f\x0c\x7c\xf2\xdd\x4e\
-\x67\x67\x7f\x67\xf8\xb3\xa8\xe1\x8d\x6e\x6f\x62\x36\x8f\xfc\x36\
-\x5f\x2d\xba\xe4\x3b\x3a\x1e\x6f\x8d\x3b\xa2\xd8\x0b\x53\x1a\x47\
-\xa0\xde\xda\xb6\x8a\x1e\x1d\xd2\x91\xa8\xa8\xbe\xe9\xb0\x67\x9e\
-\x8f\x8a\x0b\xbb\xef\xd0\xa9\xf8\xc6\x66\xde\x28\x48\x17\x5d\xb2\
-\xbd\xb5\xf5\xf3\xb3\xff\x05\xb2\x3f\x06\xfe\x0d\x4d\x25\xd5\x36\
-\x30\x0d\x28\x82\xb6\xa2\x5c\x57\x5a\x50\x8c\x6f\x86\xde\x0f\x7b\
-\x9d\x16\xe9\xec\xef\xb6\xc8\xf6\xf6\x4e\x0b\x70\xd9\x7b\x69\x36\
-\x6c\xea\x35\x0c\x66\x5d\xc9\xcb\x9f\x35\xbe\xb6\x83\xa9\x77\x03\
-\xcb\x7a\xc4\x22\xaa\xd3\xd2\x05\xfd\xea\x0d\x43\xea\x1b\x44\x0d\
-\x77\xf1\xbf\x46\xa2\x2c\x80\xba\x13\xd0\x7e\xb1\x04\xd7\xd0\xf4\
-\x68\x42\x47\xb7\x6f\xd8\x83\xac\x9d\x20\xc3\xc5\x20\x6c\xef\x64\
-\xa3\x30\x4f\x61\x79\xcd\x50\xaf\xe2\xfc\x14\x96\xc6\x00\xf8\xca\
-\xd2\x94\x4d\xb9\x14\xbd\xae\x1e\x47\xd5\x6f\x25\xf5\xde\xf0\xf5\
-\xf0\x95\xa8\xfb\x0e\xd0\x9f\xe5\x38\x82\xac\x9f\x53\xb1\x40\x4c\
-\xbd\x5b\x90\xf5\x79\x4c\xb9\xd0\x23\x99\xb3\x21\x7b\x80\x75\x03\
-\xb6\x01\xdf\xa7\x00\x6c\x3a\x83\xe5\x11\xb6\x3e\x14\x96\x0b\x5e\
-\x27\x0d\xd2\x90\x66\x12\x3f\x05\x7c\x27\x14\x97\x88\x2e\xe9\xc0\
-\xfc\x99\xfe\x5c\x33\x11\x14\x4a\xda\x90\xc6\x9e\x1f\xcc\x93\x22\
-\xad\x7c\x2a\xe3\x9f\x1f\xc5\x36\xed\x26\xb8\x83\xc5\x63\x9e\x10\
-\x1a\xb1\xf9\xcd\x84\xb3\x18\x96\xa2\x54\xa0\xc3\x66\x48\x07\x2c\
-\xa8\x48\xc4\x3d\xac\x59\x5e\x04\x6b\xf1\x1d\x27\x48\x81\xe1\x38\
-\x63\x35\xbe\x3c\x25\x81\x2f\xc9\x9d\xc3\xbf\x70\x60\x12\xb9\xce\
-\xc2\x37\x39\x89\x34\xf0\x0a\x88\xe8\x22\xc1\x3e\x26\x1e\xc0\x17\
-\x68\x98\x8c\x91\xb5\x37\xf5\x01\x05\x20\x48\xe1\x9e\x22\x50\xf6\
-\x21\xbe\xf3\xa9\xaa\x0f\x52\x77\x0c\x1b\x9b\x44\x09\xdf\xaa\x8c\
-\x2c\x40\xec\x72\xdc\xf2\xd1\xff\x48\x49\xa4\x04\x00\x59\xb5\xb5\
-\xb1\x0f\xc0\xe7\xb3\x32\x8b\x24\x77\x7e\x02\x2c\x71\x7b\xac\x50\
-\xcf\xc6\x9f\x93\xd0\xee\x60\x7b\x39\xcb\xe7\x43\xd8\x51\xa4\x31\
-\x0b\xdb\x62\x6f\xdd\xc5\x1d\x46\x0a\xfb\xb4\x52\xf9\x8c\x25\x7c\
-\xe3\xd1\xe5\x83\x08\x7b\xa2\x34\x9b\xef\xd9\x94\x33\x94\x8f\xe2\
-\x5c\x48\xc7\x29\x9f\x62\x26\x4b\x63\x21\x8a\xb2\xa4\x30\x4f\xba\
-\xa0\xac\x83\x91\x07\x87\x86\x16\x28\x7f\xd8\x8e\xfe\x1e\xd0\x7b\
-\xed\xab\x64\xcf\x7d\xe0\xa7\x13\x39\x2c\xf8\x3b\x93\xee\x1a\x80\
-\xdd\x79\x34\xc2\xaf\xb0\xd1\x6d\x28\x17\x83\x6b\x47\xa0\x00\xa5\
-\xb6\xdc\x22\x22\x4a\x39\xce\xe3\xf0\x87\xee\x66\x88\x38\x6f\xf2\
-\xda\x30\x9d\x3f\x67\x0d\x3f\x2b\x65\xb1\x91\xdc\xdd\xbc\x74\xa0\
-\x47\x68\xc2\x46\xaa\xb8\x92\x70\xc0\x5b\x41\xab\xaf\x95\x43\xcb\
-\x25\xd8\xce\xa5\xda\xf2\xac\xb7\xfa\x5a\x6a\x44\xea\x6b\x49\x9c\
-\x8c\x69\x99\xeb\xf3\x65\x46\xa1\x81\xf9\xf5\x42\x50\x4f\xbc\x2c\
-\x75\x17\x8d\xa5\x50\xaa\x95\x06\x93\x9f\x75\x75\xea\xe5\xc5\x45\
-\x5a\x5c\xe6\x93\x9b\x3c\xb9\x48\x8b\x8b\xac\xac\x51\x52\xdc\x06\
-\x05\xfe\x45\x53\x3c\x87\xe1\x86\xb1\x82\x05\x85\x3a\xee\x52\x51\
-\x68\xb6\x0c\x1a\xb5\xa3\x5f\xac\x59\x27\x4b\xc5\x9a\xf5\xd2\x62\
-\xef\xbf\xb9\x66\x9d\x74\x59\xfb\xff\x1a\xec\x53\xfa\xd9\x09\x2f\
-\x63\xe7\xb7\x2c\x62\xae\x8b\x81\x12\xec\x06\xdc\x2c\xd5\xea\xa6\
-\xc9\xf2\xc8\xaf\xbc\x86\x35\x20\x6e\xad\x58\xbf\x1a\x2c\x8f\x7c\
-\xed\x12\x7c\x05\x9b\x37\xf6\x66\x0e\xdb\xfe\xe8\xe9\x8e\x11\x46\
-\x47\x2e\xe7\x06\xbd\xfa\xf2\x1b\x25\x7b\xeb\xc2\xfa\xdd\x54\xc5\
-\x71\xa3\x83\x9b\x5f\xe6\xcc\xe2\xfa\xcd\x42\x63\xc5\x26\xfd\x6e\
-\x19\x25\x67\xcc\x9b\x11\xb6\x2d\xf0\x8f\xec\x7d\xd9\xbe\x9b\x58\
-\x65\x2e\x96\x0d\xd5\x9e\x80\x9f\x4b\x53\x64\xcc\x85\xd5\xbb\x5c\
-\x49\xf4\x9c\xb5\x89\x83\x9c\x9f\xd1\x68\xfe\xc6\x73\xb0\x5d\xd8\
-\xb4\x87\x06\x00\x30\x4d\xe9\xb4\x04\x06\xce\x6a\xb1\x17\x81\x76\
-\x8a\xf9\x89\xae\xd4\xa0\x2b\xac\x3c\x39\x2d\xee\x2d\x1d\xf4\x51\
-\xb1\x81\x21\x38\xcb\x59\xa3\x1c\x14\x67\x5b\x37\x4a\xa8\x03\xa6\
-\x4d\xab\x22\x5a\x35\x06\x35\x01\xb6\xdc\x04\xc8\x18\x65\x0a\x3f\
-\xaf\x24\xf4\xbd\x56\x29\x1f\x07\x38\xba\x1f\xfa\x3e\xa1\x0f\xc0\
-\xca\xcc\x52\xa1\x5f\x4a\xf0\x33\x3a\xfe\xe2\x6d\x89\x17\xc7\xec\
-\x5e\x1d\xd5\x35\xf3\x20\x76\x41\x3a\x68\x90\xc8\x7f\xec\x58\x6c\
-\x37\xaf\x33\x93\x43\x61\xec\x9c\x06\xd6\x2e\x0f\x6e\x06\xc7\xca\
-\x91\xab\x00\x5e\x9a\x41\xf5\x26\x3b\x0d\x82\xa3\xd0\xad\xb0\xfa\
-\x19\xcd\xba\xa0\x4a\xda\xf4\x61\x14\xce\x93\xe0\x8e\xe6\x93\x7f\
-\x4d\x3b\x08\xc7\xde\x4a\xd3\xf3\x49\xbb\x5d\xc3\x61\xd4\xa9\x83\
-\x15\xa8\x6a\xee\x69\x95\xb1\x72\xd4\xcf\x0d\xdd\xb8\x93\xf3\xa8\
-\xfe\x96\x23\x6a\x19\x86\xad\x48\x47\x55\x17\x5c\xb3\xb5\xb9\x2e\
-\xab\x50\x96\x0d\xd0\xf1\xef\xcf\xbc\xbd\x84\xad\x4d\x60\xcd\x2c\
-\xab\xa6\xf0\xd6\xc6\xab\xe2\x24\xd6\x10\x58\x62\xad\xce\x7b\xb5\
-\x8d\xcb\xe1\x30\x01\xb5\x39\x4a\xfb\xa0\x85\xf0\x40\x22\xe1\xd5\
-\x5f\x00\xd5\x2c\xdd\x95\x9a\xdb\xd5\x58\x5c\x5c\x5b\xf9\xde\xad\
-\xfb\xdc\x4a\xad\x61\x8d\xae\x55\xd6\x03\x6f\x28\xef\x56\x4a\x86\
-\x01\xdb\xf6\x50\x7d\xbb\x06\xc0\xd0\x91\xcd\x12\x9e\xdf\xfe\x9c\
-\xc2\x16\xad\xe7\x07\xa9\xdb\x5e\xc7\x58\xfe\x0a\xfc\xe0\xce\x27\
-\x5d\x41\xcf\x1a\x2e\x30\x6c\xdb\x2a\x35\xde\xd7\xa3\x98\x85\xe1\
-\x61\x4c\xbd\xa2\x04\xd9\xe0\x38\x8c\x67\x89\x66\x73\x2d\x56\xf7\
-\xa2\xca\xe1\x05\x37\x07\x79\xab\x6c\xbf\x80\x97\x3e\xd2\x3f\x42\
-\xec\x70\x84\x25\x1d\x48\x89\x23\x1a\x73\x08\xf7\x13\x1a\xf1\xd2\
-\x09\x49\x38\x11\x43\x2f\x4e\x08\x77\xcc\x18\xa5\x30\xed\x37\xf8\
-\xbd\xaa\x85\xd0\x6e\x57\x42\x29\x6f\x09\xf5\x65\x59\x61\x7a\xe4\
-\xe1\xcd\x93\xcf\x38\x32\xbf\x1d\xf7\x84\x6b\x10\x3a\x09\xdc\xa3\
-\x53\x89\xb8\x9d\x55\x08\x90\x89\x17\xf9\x21\xf7\xf9\x20\x43\x3a\
-\x62\x53\x9a\x10\x3e\xff\xd4\xb6\x48\x9c\x55\xf8\xf5\x0e\x8b\xc2\
-\x05\xa7\x42\x14\xe4\x0d\xd1\x5d\x05\xab\x71\xa7\x12\x00\x10\xa4\
-\x12\x16\xef\x3a\xf8\x1b\x26\x6e\xc6\x3f\x28\xf0\xe6\x89\xec\x10\
-\x79\x91\xc3\xca\xee\x90\x34\xfe\xd2\x3b\x18\x08\xc1\xa5\x14\x58\
-\x81\xca\x10\x5b\xa6\x0c\xa6\x04\x50\x23\x79\x26\x78\x85\xb3\x6f\
-\xc2\xe2\xe0\x6f\x16\xa5\x5e\xe8\x26\xd5\xb9\xce\xda\xcf\xf4\x58\
-\xae\x1d\x3b\x3b\x7c\x87\xb7\x2f\x36\x7a\xda\x2f\xab\x90\x6b\xa2\
-\x53\xec\xa4\x24\xa2\x9d\x03\xa5\x35\x6c\x98\x37\xdd\x9e\x8e\x0e\
-\xe0\xbf\x7d\xb3\x7d\x57\x30\xd1\x85\x03\x56\x8d\xf3\xea\x65\xcd\
-\xcc\xad\x6d\x81\x77\x98\xe5\xd5\xc0\x89\xe8\x32\xd2\x0d\xc4\xaf\
-\x11\x75\x03\x13\x50\x6f\x6d\x7e\x68\x2d\x31\x30\x93\x07\x4d\x0a\
-\xb2\x7f\x36\x2d\x9e\x9a\x50\xd8\x16\xcf\xdd\xd2\x06\x58\xff\x66\
-\xbd\xec\xe3\x8a\xa5\xf2\xb2\x50\x20\x5b\xa2\x0e\x6a\xfe\x3b\xa8\
-\xc3\x9b\xc9\x65\x89\xb3\x0c\x5d\x66\x63\x69\xa8\x96\x9d\x1f\xff\
-\x8d\x23\x68\x23\xd2\x56\xed\x1f\x21\x72\x95\x81\x9c\xcf\xe4\x2e\
-\x31\x47\xbe\x48\x9d\xcf\xee\xa3\x52\x15\xcb\xba\x98\x6f\x72\x8c\
-\xf1\x9f\x21\xe5\x55\xd0\x91\x77\x46\x05\x47\xd8\x30\x0c\x29\x6c\
-\xe3\x1d\x17\x9d\x8c\xad\xb6\x35\xa7\xbc\xd8\x58\xe6\xe2\x9a\xd6\
-\x1c\x85\xf6\xe3\x56\x9c\x46\xe2\x9f\x60\xbd\xc9\xc5\x70\xb5\x05\
-\xc7\x91\xf2\xa7\x5b\x6e\xb2\x79\x6a\x70\xcf\xdc\x7c\x14\xb4\xf2\
-\x6a\xea\xd8\x36\x65\x2d\x33\xbb\xca\xb3\x64\x65\x6d\xfc\x6d\x53\
-\x26\xb6\xe9\x2b\x6b\xe1\xa2\x00\x55\xe8\xe0\xac\xd2\xca\x1a\xf8\
-\x9f\x1e\xbb\xda\x75\xf4\x9f\x25\x6f\xb5\x01\xcc\x96\x18\x85\x7c\
-\xe5\x02\x53\xa9\xd6\x9a\x96\x17\x3b\xe4\x6c\x71\x71\x82\x3b\xa0\
-\x0f\xa9\xfb\xd9\xbc\xc1\x98\x61\x39\x81\x63\x1f\x97\xa1\x17\x44\
-\xeb\xea\xa8\xe9\x00\x5e\x81\xc3\x35\x9c\x0e\xdf\xc5\x99\x17\x71\
-\xb5\xfc\x24\x50\xf1\x06\x2a\x3a\x5a\xa0\xf6\xa4\xea\x57\x87\xe2\
-\x6b\x2a\xfc\x11\x13\x0a\x32\x88\xe6\x36\xe9\xaa\xa7\x89\x65\x8b\
-\x24\x41\x34\x12\xe7\x63\x9f\x8d\x6e\xe1\x54\x0a\x07\x4f\x89\x12\
-\x77\xb7\x26\x17\x11\xb9\x5c\xbc\x4f\xf7\x5b\x24\xa2\x01\x9e\x3f\
-\xe5\x81\x1f\x6b\xc0\xe0\xc5\xe6\xe9\x35\xa1\xb8\x44\xf3\x8e\x62\
-\x9a\xcc\xb8\x31\x4f\x1e\x59\xcf\x80\xf7\xc2\xfd\x19\x44\x43\x21\
-\x55\x36\x13\xbd\x36\xd7\x78\xbb\xf5\xa2\xf2\x0e\xc1\x04\x9d\x73\
-\x48\x1b\xa5\xf2\x98\xeb\xbd\x54\xfa\x0c\x16\xbd\x33\xcd\xcf\xf9\
-\x45\x8f\x59\xa2\x00\xe5\xf3\x5b\x16\xc4\x45\x65\x80\x54\xbc\x8d\
-\xbd\x29\xfd\xef\x31\xfe\x7d\x3d\xf1\x66\xf4\x97\x17\xdb\x2f\xfe\
-\x68\xe1\x45\x8e\x28\xea\x76\x2f\xbd\x88\x86\xe4\x97\x5f\xc8\xd6\
-\xc3\xd6\xd6\xd6\x0e\x67\x6e\xb9\xd5\x8e\xd1\x0a\x58\xef\xd6\x70\
-\xd7\x68\x78\x82\x56\xb3\xac\xd5\x6e\x45\xab\x3d\xa3\xd5\xef\x85\
-\x56\x7b\x15\xad\xf6\x5f\xfc\x41\xf4\x56\x3c\x84\xca\x2f\xe2\xb9\
-\x8f\x6d\x0b\x93\x25\x9b\x06\x38\xc7\x4a\xb6\x3a\x73\x32\x56\xda\
-\xea\xac\xf3\xbd\x41\x34\x4a\x53\x3f\xbb\x7b\x03\x2a\x2e\x63\x76\
-\x87\x6e\xb0\x13\x18\x55\x3e\x87\xf1\xb2\x0d\xed\x65\x9c\x64\xc2\
-\x78\x48\x8d\xf0\xfd\xb7\x0f\x73\xb6\xf6\x58\x87\xb3\xa6\x74\xb7\
-\xb6\x74\xaf\xb6\x74\x5f\x95\xae\x6a\xb2\x05\xca\x8f\x19\x5a\xe0\
-\x66\x92\x7e\x2f\x52\xf7\xe1\x24\x18\x67\xde\xcf\x1e\xaa\xaf\x1b\
-\xae\x95\xd0\x55\xda\xbb\x45\x17\xed\x99\xd0\x51\xe8\x18\x6d\xe7\
-\xcb\x1f\xa4\x64\xf8\xb6\x63\x9b\xa1\x3a\x0c\x61\x08\x0b\xaa\xf0\
-\x9c\xa5\x30\xfe\x7d\x74\xf4\xfe\x1e\x83\xb7\x78\xf0\xde\x08\xf6\
-\xc5\x37\xd4\xd4\x5f\x32\xb0\x28\x65\x8c\x1b\x2b\x85\xb1\x2f\xf2\
-\xe9\x8c\xc2\x5f\x51\x1a\x2e\x94\xce\x44\x33\xa3\x08\xe4\xe3\x5a\
-\xd3\x0f\xc6\x63\xca\xf5\x15\x97\x9a\x44\x99\x49\x85\x1d\x94\x6b\
-\x3d\x82\xc6\x47\x65\xf0\xc3\x08\x32\xd5\xd9\x87\xfe\x06\x8f\xa0\
-\x12\x8e\xe9\xbc\x63\x0c\x13\x13\x9d\x63\x05\xd9\x9e\xcb\x71\xab\
-\x08\x02\xea\xf1\x1f\xde\x6c\x16\xe2\xad\x0a\x86\x57\x89\x7a\xd2\
-\x02\x1b\x8c\x26\xd2\xc7\x9d\x9b\x48\xa5\x2e\xc6\x48\x96\xfc\xce\
-\x7f\x0c\x1b\x89\xf6\xbd\xd4\x93\x43\x16\xfa\x72\x45\x16\x95\xea\
-\xcf\x86\x45\x4b\xb3\x7e\x67\xaa\x9a\xd7\xac\xfe\xcd\x8d\xab\x6d\
-\x7c\x95\xeb\xe6\x04\x1d\xd4\x25\x1f\xb5\xeb\x13\x13\xa2\x89\x56\
-\x25\xbc\xbb\x06\x78\xd9\x82\xb3\x14\x92\xd0\xca\x09\xa6\x3b\x9a\
-\x75\x10\x89\xf8\x87\xee\x2f\x66\x19\x74\xf3\xa8\x99\xaf\x56\xb9\
-\xbd\xb3\x2a\x60\x43\x5f\xb2\xe5\x0c\xac\x5d\x4a\x4b\xee\xf7\x99\
-\x0f\x83\x05\xe5\xc7\xe9\x27\x2b\x44\xbb\x0f\x91\x1b\x4c\x6c\xb1\
-\x29\xa2\x1e\x95\x4b\x85\x0a\x7f\x09\x22\xd8\x23\x05\x29\x68\x7c\
-\x36\x25\x5f\x6c\x3d\x7f\x01\x0d\xc2\x48\x48\x51\x25\x06\xd8\x60\
-\xc3\x70\xb7\x58\x86\x57\x97\xf3\x64\x52\x18\x55\xd7\xf0\x2c\x2d\
-\x30\xac\xf9\xe2\xaa\xee\x22\xcc\xb6\x09\xb6\x38\x43\x15\xa3\x7e\
-\xf2\xc8\x08\x36\x1d\x32\xbc\xda\x63\xa0\x60\x5b\x3a\x3d\xfc\x4b\
-\xe3\xb2\x6f\x2c\xe4\xfa\x3e\x3b\x03\x3d\x0a\x99\x70\x05\xd6\x80\
-\x8b\x6f\x8f\x01\xaf\x01\x73\x77\x25\x59\xa9\xb7\xda\x9d\x4c\x21\
-\x30\x48\x1f\x9e\xb2\xf7\x51\xb9\x4c\x08\x5a\x87\x3e\x58\xc5\x2c\
-\xfb\x5e\x1e\xe9\x0c\x65\x33\x70\xce\xe0\x8c\x7e\x1b\x6b\xbb\xe2\
-\xd4\xaa\x36\xb9\x66\x7d\x37\xa4\xfe\x58\x89\x6c\x81\xea\xb6\x6e\
-\x55\x34\xc9\x86\xc2\x83\x12\xb6\x3a\x0a\x4a\x4c\x1e\x1b\x3d\x55\
-\x39\x4f\x74\xdd\x99\x1d\xd2\x72\xe9\xc4\xa4\x04\x28\x3d\x6e\x7e\
-\x48\xba\x08\x17\x9d\x31\xaa\x4d\x98\x6e\x64\x35\x0c\x4f\x53\x78\
-\x63\x93\x3e\x59\xca\xb3\xce\x4e\xa9\xab\xc9\x76\x7d\x38\x64\x83\
-\x94\x05\x1e\xa8\x0f\xca\xeb\x20\xbb\xba\x9e\x05\x91\x5e\xd1\xfc\
-\xae\xea\x2b\x07\x84\xac\x62\xf6\x21\x8b\x42\x90\xd6\x89\x3c\xd8\
-\x40\x7d\x50\x35\x0a\x46\x8c\xac\x5a\xf1\xab\x89\x5f\xbe\x6d\xd6\
-\x3d\xda\x4b\x1f\x1a\xe3\x08\x1f\xc9\x42\x35\xcb\xbb\xcf\x95\xd8\
-\xb7\xca\x52\xa6\x05\x6f\x58\xd9\xab\x95\x17\xd9\xa9\x47\x7d\x14\
-\xd8\xa3\x15\x58\x98\x67\xe9\x2f\xe7\x8e\x2d\x92\xa4\x50\xe0\x18\
-\xf2\x6b\x67\xc3\x72\x93\x5f\x01\x29\x9f\x88\x72\x67\x4f\xee\x74\
-\x00\xe7\x26\x58\x3c\xb3\x33\x08\xf1\x63\x36\x6b\xa3\x9d\x8f\x4c\
-\xb9\x8f\x67\x78\xef\x2d\x92\x16\x3a\x36\x70\x8b\x8e\xc2\x02\xb3\
-\x2d\x44\x2c\xdd\x50\xa1\xe9\x8f\x8c\xea\xde\xdd\x03\x31\xd9\x3d\
-\x68\x61\x00\xb2\x2e\x26\x72\x77\xa0\xea\x9a\xa6\x70\x9b\xa7\x51\
-\xc6\xbe\x6e\x46\x8a\x8a\x7a\x28\x9b\x41\xa5\x16\xae\x37\x13\xeb\
-\x37\x92\xc6\xe5\x94\x8e\x0c\xae\x90\xd9\x52\x6d\x20\xca\xcb\x2a\
-\x6d\x0b\xd0\x87\x58\x48\xf5\xeb\x19\x73\xf3\xa4\x3b\xce\x94\xea\
-\x19\x84\x67\x66\xda\xc6\x93\x00\x56\xb5\xbb\x91\x15\xa8\x7d\x55\
-\x61\x43\xe4\x8b\x56\xa5\x79\xca\x86\x51\x97\x45\xad\x8a\x92\x92\
-\xe6\xd4\x0b\xdd\x42\x35\x72\x72\xd6\x47\x85\xa1\x58\x24\x0e\x35\
-\xfb\xdc\xe5\x5c\xaa\x1e\x63\x41\xd6\xf6\x0b\x85\x3d\x44\xc9\x5d\
-\xd8\xaa\x1c\xed\xf6\x54\x87\x33\x92\x09\x6d\x3e\x6b\x0f\xb9\x52\
-\xb6\xa8\xe1\xac\xac\x61\x49\x2e\xb9\x80\xaf\x34\x5b\x45\x98\xb7\
-\x3e\x61\x4b\xe7\xa1\xf2\x4d\x4a\x95\x58\xd8\x48\xe5\x12\x59\x49\
-\xac\x56\xfa\x35\xc9\xcd\x9d\x09\xcc\x63\xe1\xe3\x88\xcd\xae\x83\
-\x1a\xe7\xdd\x7c\x56\x98\x75\xb5\xc0\xf4\x38\xb8\xea\x4a\x6c\x3c\
-\x76\xee\xb5\xce\x03\xb6\x0c\xb9\x2c\xfb\xb5\xb0\x79\xf5\x3a\xc0\
-\x2b\x69\x5b\x37\x80\xb5\xac\xd2\x75\xaa\x03\xb3\xaa\x35\x7d\x13\
-\x12\xcf\x01\x7c\xee\xac\xeb\xc8\x3f\xad\x3b\x93\x83\xc7\x6c\x0e\
-\x80\x8a\xea\x54\xd3\x64\xbb\xc6\xe5\xd4\x97\xf7\x47\x5e\x48\x23\
-\xdf\x8b\x85\xaf\xaf\xc5\xc8\x4b\x23\x8e\xda\x17\xd8\x68\xa4\xc2\
-\x09\x95\x4f\xb3\x96\x36\xf1\x38\x28\xf9\xd5\xe3\x97\x4f\x72\x4b\
-\x22\xf3\xaa\xe1\xfe\x47\x78\x9a\x12\xdf\x4b\x69\xa2\xfc\x55\xef\
-\x00\xfe\xc6\xea\x78\x28\xae\x09\xa0\xd2\xa2\xea\x0a\xa7\xc6\x4e\
-\x53\x9f\xee\x66\xa5\x2c\x3a\xc2\x3a\xff\x91\x5b\xe7\xd1\xe2\x2e\
-\xbc\x56\xa5\x8f\xe9\x86\x15\xf1\xdc\x52\xf5\xdd\x5f\xe9\xe7\x91\
-\x2c\xfd\x1c\xc1\x9e\x79\x0a\xca\x6a\xd2\x1c\x31\xa1\x37\x59\xc6\
-\x7d\x1e\x3f\x61\x7c\x53\x1b\x6f\x3e\xe1\xeb\xec\x41\x6e\x39\xdc\
-\x30\x84\x4d\xf5\xdd\x92\x18\x62\x93\x80\xcd\x93\xa7\xc0\xd2\x98\
-\x0b\xde\x83\x66\xff\xda\xb3\x2d\xf6\xe6\xbe\x45\xdb\x71\x56\xdc\
-\x3b\xe6\xfb\x95\x92\xe5\x6d\xcb\xa8\x93\xad\x1e\xd9\xc2\x70\xea\
-\x0d\x69\x68\x6e\x17\xac\x97\x28\xe4\xcd\xc5\x15\x4f\x2c\xc6\x6f\
-\x0e\x32\xf7\xfc\xee\xcc\x8b\x68\xdd\xce\x49\x8b\x62\x53\xf3\xdf\
-\x6c\xde\xc5\x6c\x39\xae\x96\x17\x65\xed\xa9\x86\x26\xf6\xd3\x4b\
-\x98\x72\xf2\xb0\xbd\x4a\x98\xc8\x38\x67\x88\x82\xcb\xb5\xf0\xf8\
-\xa6\xc5\x19\xa0\xdc\xe2\x98\x10\xf3\xbb\x9b\xbf\x66\x70\x22\xa2\
-\x71\xba\x68\xfb\xb1\x77\xff\xc6\xc3\x2c\x96\x5b\x3a\x32\xb5\x36\
-\xdb\xfc\x44\xa2\xa5\x50\x92\xf7\x65\xa9\xe6\xff\x0f\xba\x86\xc6\
-\xfc\x42\x0f\x75\x2a\xf5\x46\x13\x50\x27\x43\x95\xd9\xa9\x2f\x13\
-\x9d\x65\x00\x54\xa2\x45\x4c\xe3\x98\x25\x00\x4c\x19\xbb\xc5\xe6\
-\x14\x35\x50\xca\x70\xbb\x34\xba\x25\xb8\xa6\x6c\x90\xc3\x14\x2d\
-\xe2\x49\x0e\xa1\xb3\x05\xaa\x6a\x1e\x27\xe2\xea\x70\x48\x69\x44\
-\xee\xa1\x1c\x33\x10\xc5\x0b\x34\xb8\x23\x80\x79\x1c\x11\x58\xc7\
-\x04\x78\xc4\xae\xa5\x61\xc0\x33\xaf\xf9\xa0\x34\x79\x23\xac\x31\
-\x62\x53\x44\xaa\x98\x70\xa9\xa4\x74\x4b\x6e\x05\x82\xdd\x76\xdb\
-\x88\xfd\xe2\x43\x6b\x25\x2c\xcd\x72\xff\x98\x1f\xd3\x8f\xe5\x75\
-\x01\x77\x97\x80\xbd\x5f\x12\x0c\x45\xba\xa9\x98\xa2\x5a\x41\x9e\
-\x27\x94\x88\x56\x49\x31\x57\x9c\xbb\xab\x91\x4d\xf3\x21\x36\x5a\
-\x95\x5a\x7f\x0a\x1b\x09\x85\x9d\x42\x55\x07\xa5\xdd\x81\x15\x52\
-\xd1\x80\x52\x09\x4b\x56\xcb\xa1\xa1\x95\xe3\xe2\x92\x0c\x0e\xdf\
-\x64\x1a\x89\x03\x07\x81\x44\x75\xd2\x2a\x7d\xe9\x86\x20\x39\x96\
-\xcf\x18\xdd\xd1\x66\x99\x0e\x73\x70\x29\xaa\xb8\xe4\xd2\x0c\x02\
-\x2e\x96\xe3\xcc\x1f\xa5\xbe\x9e\xd4\xf6\x2e\x07\xb8\xe2\x50\xba\
-\x07\x33\x69\xcb\xcf\x1e\x5f\xc8\xac\x4a\xa2\xe4\x50\x21\xcd\x16\
-\xdc\x00\x92\x55\x73\x32\x6d\x14\x55\x58\x3e\x14\xcf\x57\x0a\xfa\
-\xfd\xce\x7f\xed\xbf\xf2\x0f\x56\x18\x2a\xd7\x31\xd0\x62\xb7\x97\
-\xbf\x0e\x78\x32\x6e\xe1\xc6\xaa\x6d\x0f\x95\x2c\x12\x56\xf0\xa3\
-\x2a\x33\xeb\x29\x07\xd2\xc5\xcd\x78\x1f\x45\xf9\x00\xa4\x78\x7b\
-\x67\x1b\x45\x79\xfb\xe5\x37\x20\x81\xdd\x71\x10\x27\xe9\x37\x8e\
-\x3e\xdf\x94\x0d\x06\x17\x67\x76\x35\x28\xda\xb6\x6c\x1f\x6d\xca\
-\x50\x96\x7c\xe3\xfa\xb0\x98\x47\xe1\x1b\x53\x89\x68\xee\xad\x1d\
-\x4e\x8b\x3d\xd8\x26\x8a\x92\xc8\xaf\xad\x0f\xd5\x5a\xb3\x9e\x91\
-\xfa\x7a\x7c\x5a\x9b\x26\x7c\xaa\xf1\x7b\x5a\x3d\xf2\x64\x58\x7f\
-\x05\x1d\xf8\x08\xdc\x41\xfb\x9d\xf6\xde\x0e\xec\xba\x0f\x61\xb6\
-\xca\x9f\x6c\x7a\x8f\x7f\x5f\xb7\xd6\x5b\x76\xdb\xb6\xe4\x46\xa3\
-\x51\xa9\xae\xa8\xf3\x94\x71\x62\x59\xa5\x67\x19\xa1\x95\xd6\x60\
-\x4e\xd7\xff\x6b\xb5\xb7\x56\x4e\x29\xcb\x55\x85\xf2\xd3\x09\x73\
-\x51\x7d\x4f\x33\x8a\x4f\xaf\x40\x9e\x08\xef\xaf\xa4\xfe\x1e\x81\
-\x3d\xa8\x40\x91\xf4\xdf\xaa\x03\x79\x9b\x96\xe5\x9b\x4d\x0b\x8a\
-\x82\x7f\x99\x1a\x6c\x9e\x93\x5f\x59\x0f\xba\xec\xe5\xcb\x75\x4c\
-\x39\x14\x64\x7d\x9b\x6a\xd0\x75\x3b\xff\xf5\xf8\xb4\x66\x25\xf8\
-\x24\x43\xf8\x0f\x6f\xa2\x56\x46\xfb\x5b\xd8\x01\x3a\x20\x5f\xf0\
-\xe9\x2e\xa4\x5d\x2a\xde\xb7\x55\xdb\x4e\x1f\x91\xeb\xc9\x86\x02\
-\x47\x76\x39\x0c\xb0\xc9\xfa\x10\x58\x77\xea\xa9\x75\x71\xc3\x19\
-\x97\x9c\x1d\x2b\xa3\x72\xcc\x46\xb7\x85\x57\x4b\x8a\x19\x84\x34\
-\x67\x55\xfd\xda\xa3\x9f\x66\x6e\xfc\x25\xbb\xbc\x1e\x2d\xc4\x31\
-\x97\xc1\x3b\x59\x63\xad\xcf\xec\x11\x28\xde\x88\x5f\x56\xf0\xdb\
-\x6b\xfe\xa6\x81\xbc\x15\x4b\x8a\xb7\x10\x3a\x1a\x2a\x6f\x90\x47\
-\x86\xf3\x1b\x32\x0e\x1e\x30\x5e\x40\x3e\x53\x21\xd3\x06\xc9\x14\
-\x45\xca\x37\x51\xe4\x2a\x12\xbe\x7c\xe2\x66\x37\x03\x76\x45\x79\
-\x58\xd2\x08\x78\x3c\x49\xd3\x59\xd2\xdd\xdc\x4c\x52\x60\x06\x02\
-\x18\x87\x20\x71\x23\x36\xdd\xc4\x27\xbc\xf8\xbb\x4a\x9b\x3b\xdb\
-\x9d\xdd\xbd\xad\x57\x5b\x9b\x7f\x61\x3c\xa8\x88\xd7\x6a\x43\x3d\
-\x2f\x6d\xeb\xb6\xfb\x36\x47\x40\x0c\x5e\x52\x20\x84\xdf\x08\x0d\
-\xbd\x58\x56\xc7\x8b\x52\x97\xab\x8a\xac\x59\xc4\xe2\xa9\x17\x3a\
-\xb5\xd3\xdc\x09\x44\xf8\x99\xc8\xfa\x94\x3d\xac\xa1\x22\xb5\x82\
-\x54\xbe\x07\xe2\x01\x17\x83\x18\xd8\xc5\xdf\xa1\x82\x61\x11\x23\
-\xc9\x21\x78\x22\xfc\xcb\x0c\xcd\xe2\x51\xb1\x82\x0d\x2d\x19\x4c\
-\x25\xaa\x4c\xc5\xe3\x63\x3a\x08\x18\x1f\xbc\x72\xe2\x91\xaf\x18\
-\x32\xe4\x67\xcf\xd2\x0d\x78\x16\xaa\x6c\x48\x83\x88\xf0\x88\xda\
-\x3c\x39\x15\x92\x2b\x52\x3e\xf1\x47\x84\x36\x34\x51\x14\xa0\x85\
-\xf4\x89\x60\x3a\x0c\xf9\xfa\xc2\x59\xff\x05\xdf\xdd\x48\xa9\xc7\
-\xc3\xd6\xbe\xe8\x33\xea\x4b\x8b\x07\xe7\xf2\x06\x1c\x02\x6f\x94\
-\xdf\x15\x62\x87\x50\x87\xa6\x23\x11\x7a\x86\xbf\xf5\xd8\xdd\x89\
-\x17\x0a\x06\xe0\x6d\x14\x07\x00\x3d\xb0\x79\x4c\x7c\x9a\x04\x98\
-\xf5\x8a\xbf\x71\xa4\x7c\x1f\x72\xd1\x2f\x5e\xf1\xb4\x8a\x45\x42\
-\x8e\x0a\x57\x61\xd6\x0b\xd0\x72\xe6\xd0\x9a\xa5\xa4\xea\x02\x4b\
-\xcc\x2a\x72\xe6\x3d\x04\xd3\xf9\x54\x12\x88\x57\x6b\x78\x81\x69\
-\x5c\xac\x69\xd7\xf9\x9d\x5d\x75\x9f\xef\x84\xf9\xa3\x2e\xe3\x00\
-\x69\xe8\xa3\xe0\x44\x63\xef\xb2\xe9\xd2\x4d\x00\x32\x6f\xdd\x64\
-\x84\x92\xba\x67\x53\x89\xc5\x7c\x26\x82\x20\x6f\x02\x10\x9d\x98\
-\xbf\x76\x38\x4d\xe4\xb0\x7b\x20\x98\x28\xa2\x1b\xa5\x61\x2d\xa0\
-\xd3\x78\x73\x67\x47\xa8\x52\x4e\xd6\xc7\x52\xfd\x7e\xb3\xae\xc7\
-\x95\xae\x31\xd7\xca\xd0\xb5\x5c\x85\x66\x3e\xe9\xdc\x17\x3e\x49\
-\x35\x5f\x70\xa7\x28\x24\xbb\xc7\x47\xee\xe9\xae\x76\x83\xba\xf7\
-\xfb\x73\xed\xa3\xea\xb3\x6b\xfb\x66\x9e\x62\xdc\xba\xec\x0e\x61\
-\xac\x47\x93\xee\xc4\x83\x6d\x3d\xac\xbe\xa0\x64\x9b\x5d\x84\xef\
-\xf0\xf2\xbf\x2c\x19\x59\x72\x09\x31\x72\x78\xa3\xce\x81\x93\x2c\
-\x05\xa9\x1a\xbd\x04\x5d\x82\x70\x8c\x4a\x78\x3c\x6f\x44\x24\x0f\
-\x72\x2b\xbd\x36\x56\x4b\x55\xd7\xf3\xff\x64\xa0\xc0\xdb\x7a\xda\
-\xec\x4a\x12\x05\x80\xcf\x53\x16\x53\xcb\xf8\x17\xd1\x1d\x4d\x82\
-\xd0\x87\xc9\x52\x44\x7e\xa5\xfe\x68\x64\x13\xb7\x02\x3d\x15\xbd\
-\x65\x61\x77\xa5\x46\xa2\xa4\xd8\xd6\xc2\xe5\x6a\xa4\x04\x80\x47\
-\xe1\x65\x79\xcb\xc3\x11\xbb\x26\xd5\x51\xc0\xb1\xec\x09\xb1\x16\
-\x0e\x62\x6c\x64\x4d\xcb\x25\x06\xb7\xe4\xb9\xba\x34\x3f\xdc\xf0\
-\x5b\x05\x3d\x94\xf5\x66\xfc\x1a\x78\xb1\x32\x7a\xd5\x78\x61\xf3\
-\x47\x60\x54\x2d\x7a\xf5\x78\x39\x0a\x1e\x02\x29\x89\x9d\xb1\x38\
-\x80\x3e\x7c\x17\x64\x0f\xd2\x71\x97\xae\x90\x4e\x45\xde\x51\x00\
-\x16\xc1\xe2\x86\xa7\x30\x0c\x08\xe2\x27\x43\x33\x44\x39\xf3\x42\
-\x94\xe7\xbe\x50\xbd\x90\x02\x9a\x45\x5f\x02\xd4\x07\xed\x0d\x95\
-\x5c\xf7\xe8\x8f\x4f\x66\x26\x38\x5b\x0c\x99\xd1\x81\x69\x5b\x29\
-\x75\x68\xa9\x50\x44\x60\x3d\xd6\x99\xdc\xd7\xd2\x8e\xba\x95\x46\
-\x9e\x01\x48\xa4\x2a\x2e\xa7\x36\x68\x95\xca\x6a\x72\x27\xd8\x97\
-\xf3\x52\xb0\x5e\x67\x0b\x4e\x1a\x9d\xad\x3d\xf9\xd7\xd6\xc6\x81\
-\x79\x90\x3e\x28\x1f\xa4\x0f\x0c\x43\x4c\xbe\xf3\xde\xd9\x33\xa8\
-\x28\xe5\x3c\x50\x50\xb6\x8d\x8a\x06\x29\x7a\x3a\x81\x5a\xa6\x18\
-\xb9\xd4\xda\xf2\xf9\x81\x2d\x6b\xb3\xaa\x04\x6c\xaa\x59\xb1\x11\
-\xb0\x12\x86\xdf\x3e\x00\xb2\xac\x6e\x00\xac\xf6\xd6\x72\x3a\x0b\
-\x2b\x1f\x3b\xaf\x1b\x91\x29\xe5\x2f\xda\xad\x68\x62\xe7\xac\xa5\
-\x7e\x45\xea\xd9\xb2\xd8\x69\x35\x8c\xfc\xda\xf6\x6c\x82\x35\xe5\
-\xcd\x4f\x53\xee\xf8\x1e\x1d\xef\x34\x61\xfa\x5c\xe6\x17\x6f\xea\
-\xaf\x50\xaf\x31\x94\xd5\x3a\x3b\x74\x44\x2c\x09\x32\xb5\xce\x4b\
-\x09\xd0\x6c\x62\xa2\xe8\x73\x94\x83\x8a\x9c\x9d\x26\x3e\x35\x3d\
-\xd6\xcf\xfb\x1a\x14\x4a\x39\x42\x1c\x62\x9c\x5c\xbc\xac\x2b\x4f\
-\xef\xb6\xac\xfc\xd6\x9b\x19\x23\xcd\x41\xc7\xfc\xae\x52\x16\x68\
-\x99\xb7\xec\x09\x27\x2a\x2c\xa5\xad\x67\x15\x66\x4b\xa3\x40\x05\
-\x1c\x19\x9f\x4b\xe1\x42\xb0\xc0\x7e\x88\x64\x42\x72\x95\x22\x84\
-\xe7\x11\xcf\x92\x21\x45\xd6\xa7\x56\x14\x21\xed\x8e\xb6\xbe\xda\
-\x51\xae\xde\x08\x94\x2d\xda\x26\x98\x9c\xbe\x6a\x28\x25\xab\xb4\
-\x09\xc4\x08\x24\x73\x8b\x20\xab\xe5\x9a\x6b\x74\xd5\x7a\x13\xc3\
-\x48\x6c\x30\x34\xba\x6d\xbe\xd9\xd2\x70\xd2\x5b\x4f\x98\xaa\x8a\
-\x6b\x38\x50\x09\x37\xf2\x28\x82\xd2\x63\x42\xf9\xbd\xa7\x65\xd6\
-\x4a\x22\xaa\xe3\xd6\x9e\x88\x80\x9a\x64\x95\x2a\x6c\xd3\x8a\xa8\
-\xcd\xfa\x63\x8b\x9b\x36\x13\xde\x56\x84\x4d\x67\xd5\x60\xf6\x75\
-\xe8\x83\xc0\x9d\xfc\xc4\x57\xc2\x07\x61\xf7\x13\xa6\xfb\x9f\x80\
-\x11\x24\xa5\x0f\x29\xf9\x85\xe0\x03\xee\x5e\x18\xb2\x11\x66\xda\
-\x27\xde\x10\x1f\x37\x96\x73\x52\x3d\xd8\xb3\x51\xaf\x9b\x8c\x6c\
-\x37\x35\x94\x5a\xc6\xc7\x32\xd4\x8f\xe3\xe6\x32\x31\xaa\x06\x18\
-\xed\x15\xd9\xca\x3c\x49\xcb\x3d\x99\x55\xab\xcb\x9b\x74\xf6\x2a\
-\x0c\x6e\xc2\xb6\xb4\x7c\x39\x8f\xa8\x3a\x83\x34\x19\xb3\xb0\xf0\
-\x26\x0e\x7c\x3d\xc5\x81\xab\x63\x42\xf1\xb0\xa3\x1b\xda\xf2\xaf\
-\x4b\x19\xd5\xac\x48\x97\xaf\x52\x4b\xb1\x8a\xfa\x31\xad\xee\x69\
-\x92\x62\x83\x4a\xee\x37\x24\x84\x58\xa2\x87\xec\xdc\xf6\x5c\xc4\
-\x75\x56\x75\x65\x3b\xb3\x09\x3b\xe0\x87\xa4\x90\xef\x0f\xaf\xea\
-\xc8\x5f\x38\x58\xb0\x15\x41\xc6\xe0\x15\x5d\xca\x88\x77\xc7\x80\
-\x97\xf3\x9b\x70\x91\xdd\xf7\x45\xf2\x22\x68\xa3\xf0\x68\x49\x15\
-\x82\x95\xf8\x19\x9d\xfd\x20\xae\xcf\xe0\xcf\x43\x87\x2b\xb1\x16\
-\x59\x88\x7f\xe4\x05\xdb\xaa\x00\xfe\xd1\x69\x65\xdf\x13\xb1\x1b\
-\xaa\x62\xae\x59\xb1\x53\x55\x91\xd7\x7b\xc4\x58\xd8\x35\xce\x93\
-\x51\x7a\x80\x63\xfb\x0a\x95\xcd\x2e\x57\x36\xfb\x55\x94\x96\x2b\
-\x36\x51\x7a\x42\x3d\x18\xea\x15\xac\xe8\x25\x27\x13\xfb\xd6\xb7\
-\x32\xc0\xb3\x18\xc9\x59\x44\x05\xb3\x01\xf2\x08\xb5\x95\x70\x72\
-\x48\xf5\xd4\xa8\xa9\xe5\xae\xbb\x32\x8c\x30\xdb\xc8\xa0\x37\x36\
-\x37\x20\xa9\x34\x06\x95\xb4\x74\xf3\x13\x9b\x70\x35\x69\x35\x56\
-\x33\x3c\xd4\x9a\x7d\x97\x1a\xbb\xb6\x40\x2a\xad\x8f\x56\x00\xda\
-\xb9\xb4\x1e\x7b\xbd\xa2\x1d\xff\x3a\xaf\x2a\x87\xfe\x6d\xc0\x9c\
-\x68\x28\xa6\x0f\x53\x22\xb1\x7d\xb0\x3d\xdc\x1e\x57\x2e\x54\xc3\
-\xd7\x70\x96\x3d\x50\xaa\x14\xc3\x44\x65\x32\x57\x74\x59\x50\xbe\
-\x13\xf7\x2c\xe6\x71\x9e\x24\xb3\xba\x91\x79\x14\xc2\xca\x20\x1e\
-\x3e\xe2\xb8\xe0\x65\xf8\x28\x0c\x46\xb7\x3c\xef\x10\xea\x53\x1b\
-\x8e\xea\xac\xef\x36\x06\xee\xd5\xd5\x48\xd4\xb7\x30\x04\xd4\xb5\
-\x72\x11\xf8\xca\x47\x13\xbd\x97\x95\x0e\x4a\x5c\x1d\x56\x27\x89\
-\x37\x8a\x8b\xc9\x91\xd4\xe4\xb5\x28\x81\x6c\xb3\xe6\x94\x7d\x44\
-\xa7\x62\xe9\xf3\xe2\x37\x41\x41\xb6\x87\x22\xe2\x9f\x47\xfc\x61\
-\x32\xb5\xf7\x7c\x8c\x66\xae\x4e\x72\xfe\x94\x5e\x99\xb9\xff\xf0\
-\x39\xd3\xb3\x41\x28\x1f\xe2\x6a\x62\x6b\xe4\xd9\x4a\x8a\x33\xf7\
-\x1e\x9d\x8b\xb5\x6a\x5f\xcb\x4f\x09\x4b\x65\x77\xaa\x0a\xe6\x16\
-\x80\xb8\xa7\x64\x51\xe3\x5a\x83\xd2\x0a\x03\x50\x48\x01\xdf\xd1\
-\x04\x4b\x83\x59\xb8\x68\xd7\xbf\x5b\xf2\xb2\x2c\x17\x06\xc7\x2d\
-\x8b\xb3\x30\x48\xd3\xdc\x58\x5a\x97\x23\xaa\x68\xd4\xd6\x36\x73\
-\x6d\x3e\x27\x6c\xb5\x30\xb5\x85\x99\x22\x4d\x4f\x77\x91\x8b\x9c\
-\xf0\x86\x52\xd9\x02\x0a\xfe\x75\xe8\x36\x97\x78\x69\x90\x8c\x61\
-\xa3\xc9\xe2\x05\xe1\xdd\xc2\x89\x5c\x60\x99\x10\xf4\x95\x12\x39\
-\x5b\xfa\x63\xb2\x60\x73\x4c\xc7\xa2\xbb\xe3\x09\x7f\x8b\x88\xde\
-\x78\xb8\xef\xe6\xce\x5a\xf8\xbe\x9e\xff\xe7\x3c\x49\xa5\x0b\x9e\
-\xcc\xc5\x0d\x98\x26\x2d\x0e\x02\x3b\x45\x43\x5c\xb2\x98\x4e\x69\
-\x1a\xa3\xfe\x26\xa3\x79\x7c\x47\xa5\xab\xd7\x2c\x66\xfe\x7c\x84\
-\x9e\x63\x91\x70\xa2\x8a\x30\xb1\x9e\x17\xe6\x8e\x5f\xd2\x01\xea\
-\x32\x66\x37\x28\xc3\xc5\x6c\xd9\xad\x62\x81\xdb\xa3\x41\x0d\x76\
-\x5b\x1c\x2e\x4b\xca\x6c\xdb\x2c\xd0\x6e\xd5\xca\xdb\x4b\x3b\xc6\
-\xa5\x2b\x87\xc2\xd1\x5c\x0e\xf2\xbe\x6d\xbb\x67\xc9\xce\x95\x9b\
-\x36\xaa\x8e\xfe\x85\xb2\x55\xdf\x56\x88\x0b\xf6\x02\x93\xb6\xaa\
-\xbb\x11\xab\xcd\xc1\x4a\x99\xfe\xe8\x8a\x99\x77\xb6\x4c\x99\x9e\
-\x52\xc4\x24\xad\xea\x39\x89\xb8\xcc\x6d\x93\xe8\x3c\x73\x9d\x4e\
-\x1c\x6c\xe2\xe6\xd1\x6d\xb5\xc4\xc9\xf2\xe6\xa7\xba\xca\x57\x14\
-\x4a\xce\x1c\x7c\xf1\x32\xaf\xdb\xfc\xfd\xce\x96\xfe\x23\xbf\x42\
-\xca\x3f\xb9\x67\xf0\x27\xfd\xa3\x8b\x73\x1e\xe1\xa2\xf4\xc7\x7b\
-\xd4\x1f\xc3\x79\x10\xa6\xed\x20\x92\xae\x93\xe8\x1b\x1b\x62\x7e\
-\x11\x58\x4a\xd2\x14\xce\xec\x9e\x8f\xce\x8f\xdc\x83\x71\x91\xa4\
-\x48\xc8\x84\x4e\xb3\xb7\x3b\x3d\x33\x5f\x3f\x6e\x63\x45\x6e\x28\
-\x98\xff\xfc\x33\xec\xe0\x36\xc8\x5b\xbc\x19\x7f\xf0\xa6\xb3\x90\
-\x6b\x14\x2a\xd5\x00\x77\x1e\x05\x18\x1e\x6c\x74\x39\xdc\x96\xb0\
-\x23\x78\xf2\x21\xd1\x0f\xfd\x16\x87\xf5\xe5\xe2\xf6\x8b\xf4\x35\
-\xc4\x5e\x61\x5c\x16\xf2\x35\x4f\xf4\x0e\xe6\xd9\xa9\x22\x34\x39\
-\xc2\x0f\x3f\xf0\x42\x76\x93\x79\x8c\xbe\x3f\xe6\xbf\xc5\x42\x89\
-\x29\x3f\xef\x83\x30\xe4\x49\xfe\x17\xa2\x1d\xfc\x4a\x52\x0f\xf3\
-\x0d\xf9\x99\x37\x23\x70\x43\xff\xae\xd4\x1d\x68\x39\xd0\x77\xc9\
-\x1c\x14\x9a\x97\xe0\x33\xef\x49\x02\x3b\x2f\x00\x2a\xfd\x3f\x4f\
-\xd8\x3d\xe5\xee\xc4\xf7\x94\xa7\x4d\xa1\x98\x2f\x85\x11\x1c\xa1\
-\x38\xf0\x05\xcf\xb2\xbe\x04\xbb\x69\x98\xd0\x7b\xa5\x91\x95\x8b\
-\x6b\xc1\x71\x56\xd4\x9b\x62\xca\x29\x5c\x7c\x42\x7c\x87\x26\x4a\
-\xb8\xaa\x0f\x90\x9d\xe8\x6c\xd0\xe5\x2d\xf1\xcf\x7b\xfe\x90\x01\
-\xac\x0a\x5c\x79\xab\xf7\x0e\x7c\x3a\x62\x31\x7f\xd2\x20\xd9\xd0\
-\xab\x0a\x1f\x61\xe0\x84\xde\x66\x8c\xea\x5e\x70\x31\x51\xae\xba\
-\x5c\x22\xa2\x60\xa4\x1e\xb3\xc1\x3f\x67\x14\x2a\x11\xb9\x69\x14\
-\x3e\xb7\x73\x74\xe6\x03\xe6\x81\x94\xa2\x8d\x35\x63\x99\x00\x82\
-\xb2\xcf\x9d\x8b\x05\x07\x94\xcb\x6b\x71\x7c\xa4\x28\x8b\xfe\xc5\
-\x78\x0c\xd9\x83\xb4\x4a\x26\x6d\xbc\xf2\xe1\x3e\xb7\x09\x9e\xce\
-\xe6\x54\x26\x19\x15\xd5\xdb\x20\xbc\x23\x6a\xf3\x79\x16\xe5\x9f\
-\x45\xb9\xb6\x29\x56\xed\x2a\x5c\xac\x55\x33\x23\xd7\x8b\x6c\xc5\
-\x6e\xab\x9b\xb0\x5b\x4b\xfd\x19\x8d\x6a\x5a\xe4\xbe\x30\x5a\x1b\
-\x90\x04\x9a\x56\x37\xe2\xc5\xe5\x56\x89\xe2\x92\xb5\x11\x96\x6a\
-\x6d\x8a\xf9\x8a\x40\xbc\x67\x33\x16\xa7\x64\x41\xc5\xc4\x92\xd2\
-\x8b\x13\x15\x1b\xa2\x53\x75\x56\x5d\xeb\x0e\xbe\xd7\xf7\x88\x0d\
-\xf3\x4e\xd5\xcd\x80\x84\xb0\xa0\xc9\x72\xbc\x9c\xd0\x70\x56\xdd\
-\x02\x4b\xcb\x6d\x22\x56\xdd\x22\x62\xe5\xfa\x5c\x49\x2c\x87\x96\
-\x1f\x24\x23\x10\xed\xea\x46\xb2\x42\xe1\x9d\x75\xa5\x45\x94\xab\
-\x85\xf8\x80\x52\x3f\x8a\x03\xbe\xde\x58\xe0\xc9\x5a\x9f\x55\x15\
-\x0d\x17\x0d\x40\x10\x8d\x71\x8a\xf3\xac\x4c\xd5\x30\xb4\x5a\x76\
-\x30\x2a\xac\xa1\x06\x86\xaa\x62\x07\x70\xef\xc5\xe8\xe4\x5f\xd3\
-\x5e\xd6\x28\xf8\x08\xe3\xc3\x5b\x89\x7a\x0a\x9a\x66\x59\x98\x13\
-\xaa\x14\x8c\x60\xaa\xee\x84\x5e\x52\xf7\x5a\x52\xec\x96\xce\x6c\
-\x52\x7e\xf1\xc1\x72\xd1\x6d\x6c\xd8\xe4\x91\xe3\xff\x00\xbd\x20\
-\xd5\x42\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\x38\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x02\x28\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\x65\
-\x28\x39\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\x2c\
-\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\x33\
-\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\x2e\
-\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\
-\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\
-\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\x33\
-\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\x35\
-\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\
-\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\x31\
-\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\x30\
-\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\x30\
-\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\
-\x34\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x62\x61\x62\x39\x62\x38\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x9e\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x38\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\x3c\
-\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\
-\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\
-\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x32\x35\x36\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x36\x2e\x30\x30\
-\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x2c\x30\x20\x4c\x32\
-\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\x30\x2e\x39\x20\
-\x30\x2c\x32\x20\x4c\x30\x2c\x31\x34\x20\x43\x30\x2c\x31\x35\x2e\
-\x31\x20\x30\x2e\x39\x2c\x31\x36\x20\x32\x2c\x31\x36\x20\x4c\x31\
-\x38\x2c\x31\x36\x20\x43\x31\x39\x2e\x31\x2c\x31\x36\x20\x32\x30\
-\x2c\x31\x35\x2e\x31\x20\x32\x30\x2c\x31\x34\x20\x4c\x32\x30\x2c\
-\x34\x20\x43\x32\x30\x2c\x32\x2e\x39\x20\x31\x39\x2e\x31\x2c\x32\
-\x20\x31\x38\x2c\x32\x20\x4c\x31\x30\x2c\x32\x20\x4c\x38\x2c\x30\
-\x20\x4c\x38\x2c\x30\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x33\x31\x33\x36\x33\x62\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x35\x2e\x30\x38\x33\x33\x30\x32\x38\x20\x34\x2e\x35\x2c\x31\
-\x2e\x37\x37\x32\x39\x38\x31\x38\x20\x37\x2e\x38\x31\x30\x35\x34\
-\x30\x38\x2c\x35\x2e\x30\x38\x34\x37\x32\x33\x35\x20\x63\x20\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x20\x6c\x20\x2d\x33\x2e\x35\x39\x36\x31\
-\x32\x38\x33\x2c\x2d\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x39\x20\
-\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x20\
-\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\
-\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\x34\
-\x2e\x35\x31\x33\x35\x38\x36\x36\x20\x63\x20\x2d\x30\x2e\x31\x35\
-\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x2d\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\
-\x33\x34\x39\x20\x30\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x20\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x20\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x2c\x2d\x30\x2e\x30\x30\x31\x34\x32\x20\x7a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\
-\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x33\x61\
-\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xcb\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\
-\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\
-\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x37\x2e\x31\x20\
-\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x32\x37\x32\x62\x32\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\
-\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x33\x2c\x31\
-\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\x30\x2e\x39\x20\x76\
-\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\x66\x69\x6c\x6c\x2d\
-\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\x20\x76\x2d\x38\x20\x68\
-\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\
-\x32\x66\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x3c\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\
-\x65\x6e\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\
-\x6f\x6e\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\
-\x68\x3d\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
-\x22\x73\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x67\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x31\x37\x30\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x31\x37\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x34\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\
-\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\
-\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\
-\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\
-\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\
-\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\
-\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x32\x2c\x31\x30\x20\
-\x43\x32\x2c\x35\x2e\x36\x20\x35\x2e\x36\x2c\x32\x20\x31\x30\x2c\
-\x32\x20\x43\x31\x31\x2e\x38\x2c\x32\x20\x31\x33\x2e\x35\x2c\x32\
-\x2e\x36\x20\x31\x34\x2e\x39\x2c\x33\x2e\x37\x20\x4c\x33\x2e\x37\
-\x2c\x31\x34\x2e\x39\x20\x43\x32\x2e\x36\x2c\x31\x33\x2e\x35\x20\
-\x32\x2c\x31\x31\x2e\x38\x20\x32\x2c\x31\x30\x20\x4c\x32\x2c\x31\
-\x30\x20\x5a\x20\x4d\x31\x30\x2c\x31\x38\x20\x43\x38\x2e\x32\x2c\
-\x31\x38\x20\x36\x2e\x35\x2c\x31\x37\x2e\x34\x20\x35\x2e\x31\x2c\
-\x31\x36\x2e\x33\x20\x4c\x31\x36\x2e\x33\x2c\x35\x2e\x31\x20\x43\
-\x31\x37\x2e\x34\x2c\x36\x2e\x35\x20\x31\x38\x2c\x38\x2e\x32\x20\
-\x31\x38\x2c\x31\x30\x20\x43\x31\x38\x2c\x31\x34\x2e\x34\x20\x31\
-\x34\x2e\x34\x2c\x31\x38\x20\x31\x30\x2c\x31\x38\x20\x4c\x31\x30\
-\x2c\x31\x38\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xac\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
-\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x31\x37\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\
-\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x61\x36\x39\x36\x39\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x37\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x01\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\
-\x20\x79\x3d\x22\x34\x37\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\
-\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x31\x22\x2f\x3e\x0a\
-\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\
-\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\x36\x36\x22\x20\
-\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\x74\
-\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x35\x22\x2f\
-\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x02\x28\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x31\x30\x20\x37\x2e\x35\x29\x20\x72\x6f\x74\x61\x74\x65\
-\x28\x39\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\x2c\
-\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\x33\
-\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\x2e\
-\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\
-\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\
-\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\x33\
-\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\x35\
-\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\x38\
-\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\x31\
-\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\x30\
-\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\
-\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\
-\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\x32\
-\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\x30\
-\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\
-\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x33\x61\x34\
-\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
-\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\x33\
-\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\x38\x36\
-\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x2d\
-\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x39\
-\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\
-\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\x36\x37\
-\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\x36\x34\
-\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\x34\x35\
-\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\x2c\x31\
-\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\x2c\x37\
-\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x20\x2f\x3e\
-\x0a\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
-\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x31\x36\x2e\x35\x33\x32\x32\x37\x36\x2c\x2d\x31\x33\
-\x2e\x39\x39\x38\x36\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x3c\x70\
-\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x37\x34\x2e\x38\x33\x38\x36\
-\x33\x33\x2c\x32\x36\x2e\x33\x39\x39\x39\x36\x38\x20\x61\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x2d\
-\x34\x38\x2e\x34\x33\x38\x36\x33\x33\x2c\x34\x38\x2e\x36\x20\x34\
-\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\x30\x20\x30\x20\x30\x20\x39\
-\x37\x2e\x32\x2c\x30\x20\x34\x38\x2e\x36\x2c\x34\x38\x2e\x36\x20\
-\x30\x20\x30\x20\x30\x20\x2d\x34\x38\x2e\x37\x36\x31\x33\x36\x37\
-\x2c\x2d\x34\x38\x2e\x36\x20\x7a\x20\x6d\x20\x2d\x30\x2e\x36\x34\
-\x38\x36\x33\x33\x2c\x31\x31\x2e\x33\x34\x20\x33\x36\x2e\x34\x35\
-\x2c\x33\x36\x2e\x34\x35\x20\x4c\x20\x37\x34\x2e\x31\x39\x2c\x31\
-\x31\x30\x2e\x36\x33\x39\x39\x37\x20\x33\x37\x2e\x37\x34\x2c\x37\
-\x34\x2e\x31\x38\x39\x39\x36\x38\x20\x5a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x32\x64\x39\x33\x63\x38\x22\x20\x66\x69\x6c\x6c\x2d\
-\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x20\x2f\x3e\
-\x0a\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x07\x7a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x63\x30\x38\x63\
-\x66\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x2c\x30\x2c\x30\x2c\x30\x2e\x38\
-\x2c\x34\x37\x2e\x39\x36\x30\x30\x32\x33\x2c\x39\x2e\x36\x33\x39\
-\x39\x37\x35\x38\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x64\x3d\x22\x4d\x20\x36\x2e\x35\x2c\x31\x35\x2e\x37\x20\x30\
-\x2c\x31\x30\x2e\x35\x20\x41\x20\x33\x34\x2e\x33\x39\x36\x2c\x33\
-\x34\x2e\x33\x39\x36\x20\x30\x20\x30\x20\x31\x20\x35\x2e\x32\x30\
-\x39\x2c\x35\x2e\x33\x30\x38\x20\x32\x39\x2e\x31\x33\x33\x2c\x32\
-\x39\x2e\x31\x33\x33\x20\x30\x20\x30\x20\x31\x20\x38\x2e\x39\x2c\
-\x32\x2e\x38\x20\x32\x30\x2e\x36\x38\x38\x2c\x32\x30\x2e\x36\x38\
-\x38\x20\x30\x20\x30\x20\x31\x20\x31\x35\x2e\x33\x37\x36\x2c\x30\
-\x2e\x34\x37\x31\x20\x32\x38\x2e\x36\x37\x2c\x32\x38\x2e\x36\x37\
-\x20\x30\x20\x30\x20\x31\x20\x32\x30\x2e\x37\x2c\x30\x20\x32\x33\
-\x2e\x35\x38\x38\x2c\x32\x33\x2e\x35\x38\x38\x20\x30\x20\x30\x20\
-\x31\x20\x32\x35\x2e\x31\x38\x38\x2c\x30\x2e\x34\x31\x32\x20\x31\
-\x39\x2e\x34\x31\x32\x2c\x31\x39\x2e\x34\x31\x32\x20\x30\x20\x30\
-\x20\x31\x20\x32\x38\x2e\x33\x35\x2c\x31\x2e\x33\x20\x32\x30\x2e\
-\x32\x32\x31\x2c\x32\x30\x2e\x32\x32\x31\x20\x30\x20\x30\x20\x31\
-\x20\x33\x32\x2e\x33\x38\x2c\x33\x2e\x33\x33\x35\x20\x31\x37\x2e\
-\x34\x39\x35\x2c\x31\x37\x2e\x34\x39\x35\x20\x30\x20\x30\x20\x31\
-\x20\x33\x34\x2e\x33\x2c\x34\x2e\x38\x20\x71\x20\x32\x2e\x35\x2c\
-\x32\x2e\x32\x20\x33\x2e\x39\x2c\x35\x2e\x31\x35\x20\x31\x2e\x34\
-\x2c\x32\x2e\x39\x35\x20\x31\x2e\x34\x2c\x36\x2e\x33\x35\x20\x61\
-\x20\x32\x31\x2e\x32\x36\x39\x2c\x32\x31\x2e\x32\x36\x39\x20\x30\
-\x20\x30\x20\x31\x20\x2d\x30\x2e\x32\x33\x39\x2c\x33\x2e\x32\x38\
-\x20\x71\x20\x2d\x30\x2e\x33\x35\x2c\x32\x2e\x32\x33\x39\x20\x2d\
-\x31\x2e\x32\x31\x31\x2c\x34\x2e\x30\x32\x20\x2d\x31\x2e\x34\x35\
-\x2c\x33\x20\x2d\x33\x2e\x36\x35\x2c\x35\x2e\x33\x35\x20\x2d\x32\
-\x2e\x32\x2c\x32\x2e\x33\x35\x20\x2d\x34\x2e\x37\x35\x2c\x34\x2e\
-\x33\x35\x20\x2d\x32\x2e\x35\x35\x2c\x32\x20\x2d\x34\x2e\x37\x35\
-\x2c\x34\x2e\x32\x20\x2d\x32\x2e\x32\x2c\x32\x2e\x32\x20\x2d\x33\
-\x2e\x36\x35\x2c\x34\x2e\x39\x20\x2d\x31\x2e\x34\x35\x2c\x32\x2e\
-\x37\x20\x2d\x31\x2e\x34\x35\x2c\x36\x2e\x35\x20\x76\x20\x35\x2e\
-\x36\x20\x68\x20\x2d\x37\x2e\x38\x20\x71\x20\x2d\x30\x2e\x35\x2c\
-\x2d\x31\x2e\x37\x20\x2d\x30\x2e\x37\x35\x2c\x2d\x33\x2e\x37\x20\
-\x2d\x30\x2e\x32\x35\x2c\x2d\x32\x20\x2d\x30\x2e\x32\x35\x2c\x2d\
-\x33\x2e\x37\x20\x61\x20\x32\x31\x2e\x33\x32\x32\x2c\x32\x31\x2e\
-\x33\x32\x32\x20\x30\x20\x30\x20\x31\x20\x30\x2e\x32\x36\x38\x2c\
-\x2d\x33\x2e\x34\x36\x34\x20\x51\x20\x31\x31\x2e\x37\x31\x33\x2c\
-\x34\x31\x2e\x35\x34\x34\x20\x31\x32\x2e\x35\x2c\x33\x39\x2e\x38\
-\x20\x31\x33\x2e\x39\x2c\x33\x36\x2e\x37\x20\x31\x36\x2c\x33\x34\
-\x2e\x33\x35\x20\x31\x38\x2e\x31\x2c\x33\x32\x20\x32\x30\x2e\x35\
-\x2c\x33\x30\x2e\x31\x20\x32\x32\x2e\x39\x2c\x32\x38\x2e\x32\x20\
-\x32\x35\x2c\x32\x36\x2e\x32\x35\x20\x41\x20\x32\x32\x2e\x32\x31\
-\x35\x2c\x32\x32\x2e\x32\x31\x35\x20\x30\x20\x30\x20\x30\x20\x32\
-\x37\x2e\x35\x35\x37\x2c\x32\x33\x2e\x34\x35\x31\x20\x31\x39\x2e\
-\x33\x38\x38\x2c\x31\x39\x2e\x33\x38\x38\x20\x30\x20\x30\x20\x30\
-\x20\x32\x38\x2e\x35\x2c\x32\x32\x2e\x31\x20\x38\x2e\x39\x37\x37\
-\x2c\x38\x2e\x39\x37\x37\x20\x30\x20\x30\x20\x30\x20\x32\x39\x2e\
-\x38\x34\x39\x2c\x31\x38\x2e\x30\x38\x35\x20\x31\x31\x2e\x32\x34\
-\x34\x2c\x31\x31\x2e\x32\x34\x34\x20\x30\x20\x30\x20\x30\x20\x32\
-\x39\x2e\x39\x2c\x31\x37\x20\x38\x2e\x32\x34\x31\x2c\x38\x2e\x32\
-\x34\x31\x20\x30\x20\x30\x20\x30\x20\x32\x37\x2e\x36\x30\x35\x2c\
-\x31\x31\x2e\x32\x37\x20\x31\x31\x2e\x30\x30\x36\x2c\x31\x31\x2e\
-\x30\x30\x36\x20\x30\x20\x30\x20\x30\x20\x32\x37\x2e\x32\x2c\x31\
-\x30\x2e\x38\x35\x20\x39\x2e\x30\x31\x32\x2c\x39\x2e\x30\x31\x32\
-\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\x36\x35\x32\x2c\x38\x2e\
-\x34\x37\x32\x20\x31\x33\x2e\x32\x32\x31\x2c\x31\x33\x2e\x32\x32\
-\x31\x20\x30\x20\x30\x20\x30\x20\x31\x39\x2e\x39\x2c\x38\x2e\x32\
-\x20\x31\x35\x2e\x30\x30\x35\x2c\x31\x35\x2e\x30\x30\x35\x20\x30\
-\x20\x30\x20\x30\x20\x31\x35\x2e\x34\x37\x36\x2c\x38\x2e\x38\x33\
-\x33\x20\x31\x33\x2e\x30\x36\x31\x2c\x31\x33\x2e\x30\x36\x31\x20\
-\x30\x20\x30\x20\x30\x20\x31\x32\x2e\x34\x35\x2c\x31\x30\x2e\x32\
-\x20\x32\x30\x2e\x37\x32\x38\x2c\x32\x30\x2e\x37\x32\x38\x20\x30\
-\x20\x30\x20\x30\x20\x38\x2e\x34\x36\x36\x2c\x31\x33\x2e\x34\x32\
-\x35\x20\x32\x36\x2e\x32\x30\x39\x2c\x32\x36\x2e\x32\x30\x39\x20\
-\x30\x20\x30\x20\x30\x20\x36\x2e\x35\x2c\x31\x35\x2e\x37\x20\x5a\
-\x20\x6d\x20\x33\x2e\x35\x32\x36\x2c\x35\x31\x2e\x39\x34\x20\x41\
-\x20\x38\x2e\x38\x36\x2c\x38\x2e\x38\x36\x20\x30\x20\x30\x20\x30\
-\x20\x39\x2e\x38\x2c\x36\x39\x2e\x37\x20\x71\x20\x30\x2c\x32\x2e\
-\x37\x20\x32\x2c\x34\x2e\x37\x20\x41\x20\x38\x2e\x33\x31\x37\x2c\
-\x38\x2e\x33\x31\x37\x20\x30\x20\x30\x20\x30\x20\x31\x31\x2e\x38\
-\x36\x33\x2c\x37\x34\x2e\x34\x36\x32\x20\x36\x2e\x34\x31\x38\x2c\
-\x36\x2e\x34\x31\x38\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\x35\
-\x2c\x37\x36\x2e\x34\x20\x38\x2e\x36\x30\x35\x2c\x38\x2e\x36\x30\
-\x35\x20\x30\x20\x30\x20\x30\x20\x31\x37\x2e\x31\x32\x32\x2c\x37\
-\x36\x2e\x33\x37\x38\x20\x36\x2e\x34\x36\x31\x2c\x36\x2e\x34\x36\
-\x31\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\x33\x2c\x37\x34\x2e\
-\x35\x35\x20\x51\x20\x32\x33\x2e\x32\x2c\x37\x32\x2e\x37\x20\x32\
-\x33\x2e\x32\x2c\x36\x39\x2e\x37\x20\x41\x20\x36\x2e\x32\x32\x35\
-\x2c\x36\x2e\x32\x32\x35\x20\x30\x20\x30\x20\x30\x20\x32\x32\x2e\
-\x36\x32\x31\x2c\x36\x37\x2e\x30\x32\x39\x20\x36\x2e\x39\x35\x35\
-\x2c\x36\x2e\x39\x35\x35\x20\x30\x20\x30\x20\x30\x20\x32\x31\x2e\
-\x31\x35\x2c\x36\x35\x20\x38\x2e\x34\x37\x38\x2c\x38\x2e\x34\x37\
-\x38\x20\x30\x20\x30\x20\x30\x20\x32\x30\x2e\x36\x32\x39\x2c\x36\
-\x34\x2e\x35\x33\x32\x20\x36\x2e\x33\x32\x35\x2c\x36\x2e\x33\x32\
-\x35\x20\x30\x20\x30\x20\x30\x20\x31\x36\x2e\x35\x2c\x36\x33\x20\
-\x71\x20\x2d\x31\x2e\x32\x32\x35\x2c\x30\x20\x2d\x32\x2e\x32\x33\
-\x38\x2c\x30\x2e\x32\x36\x34\x20\x41\x20\x35\x2e\x36\x39\x38\x2c\
-\x35\x2e\x36\x39\x38\x20\x30\x20\x30\x20\x30\x20\x31\x31\x2e\x35\
-\x35\x2c\x36\x34\x2e\x38\x20\x35\x2e\x39\x37\x36\x2c\x35\x2e\x39\
-\x37\x36\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2e\x30\x32\x36\x2c\
-\x36\x37\x2e\x36\x34\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\
-\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x20\x3e\x0a\x20\
-\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\
-\x3d\x22\x4d\x20\x31\x32\x2e\x39\x31\x39\x30\x38\x33\x2c\x35\x33\
-\x2e\x31\x36\x34\x30\x33\x37\x20\x34\x39\x2e\x33\x36\x39\x30\x38\
-\x31\x2c\x38\x39\x2e\x36\x31\x34\x30\x33\x35\x20\x38\x35\x2e\x38\
-\x31\x39\x30\x38\x37\x2c\x35\x33\x2e\x31\x36\x34\x30\x33\x37\x20\
-\x34\x39\x2e\x33\x36\x39\x30\x38\x31\x2c\x31\x36\x2e\x37\x31\x34\
-\x30\x34\x20\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\
-\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x61\x32\x61\x32\x61\
-\x32\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\
-\x69\x64\x74\x68\x3d\x22\x37\x2e\x32\x39\x22\x20\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x9f\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x20\x78\x3d\x22\x36\x22\x20\x79\x3d\x22\x34\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x34\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\x62\x38\
-\x22\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\x22\x34\x22\x20\x77\
-\x69\x64\x74\x68\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
-\x22\x32\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\
-\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x36\x61\x36\x65\x37\x31\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x37\x2e\x31\x20\
-\x68\x2d\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x36\x61\x36\x65\x37\x31\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\
-\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\
-\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x33\x2c\x31\
-\x33\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x68\x30\x2e\x39\x20\x76\
-\x37\x2e\x31\x20\x68\x37\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\
-\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\x66\x69\x6c\x6c\x2d\
-\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
-\x33\x2c\x35\x20\x4c\x20\x35\x2c\x31\x33\x20\x76\x2d\x38\x20\x68\
-\x38\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x36\x61\x36\x65\
-\x37\x31\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\
-\x76\x65\x6e\x6f\x64\x64\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x0f\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\
-\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x32\x35\x35\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x33\x38\x31\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x32\
-\x35\x35\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x33\x38\x31\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\x30\x20\
-\x4c\x32\x2c\x30\x20\x43\x30\x2e\x39\x2c\x30\x20\x30\x2c\x30\x2e\
-\x39\x20\x30\x2c\x32\x20\x4c\x30\x2c\x31\x36\x20\x43\x30\x2c\x31\
-\x37\x2e\x31\x20\x30\x2e\x39\x2c\x31\x38\x20\x32\x2c\x31\x38\x20\
-\x4c\x31\x36\x2c\x31\x38\x20\x43\x31\x37\x2e\x31\x2c\x31\x38\x20\
-\x31\x38\x2c\x31\x37\x2e\x31\x20\x31\x38\x2c\x31\x36\x20\x4c\x31\
-\x38\x2c\x34\x20\x4c\x31\x34\x2c\x30\x20\x4c\x31\x34\x2c\x30\x20\
-\x5a\x20\x4d\x39\x2c\x31\x36\x20\x43\x37\x2e\x33\x2c\x31\x36\x20\
-\x36\x2c\x31\x34\x2e\x37\x20\x36\x2c\x31\x33\x20\x43\x36\x2c\x31\
-\x31\x2e\x33\x20\x37\x2e\x33\x2c\x31\x30\x20\x39\x2c\x31\x30\x20\
-\x43\x31\x30\x2e\x37\x2c\x31\x30\x20\x31\x32\x2c\x31\x31\x2e\x33\
-\x20\x31\x32\x2c\x31\x33\x20\x43\x31\x32\x2c\x31\x34\x2e\x37\x20\
-\x31\x30\x2e\x37\x2c\x31\x36\x20\x39\x2c\x31\x36\x20\x4c\x39\x2c\
-\x31\x36\x20\x5a\x20\x4d\x31\x32\x2c\x36\x20\x4c\x32\x2c\x36\x20\
-\x4c\x32\x2c\x32\x20\x4c\x31\x32\x2c\x32\x20\x4c\x31\x32\x2c\x36\
-\x20\x4c\x31\x32\x2c\x36\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\xb9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\x38\x63\
-\x39\x66\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\
-\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x39\x30\
-\x2e\x37\x30\x38\x36\x36\x35\x2c\x31\x37\x2e\x33\x38\x35\x38\x32\
-\x36\x20\x38\x35\x2e\x30\x33\x39\x33\x37\x35\x2c\x31\x31\x2e\x37\
-\x31\x36\x35\x33\x35\x20\x36\x32\x2e\x33\x36\x32\x32\x30\x33\x2c\
-\x33\x34\x2e\x33\x39\x33\x37\x20\x33\x39\x2e\x36\x38\x35\x30\x33\
-\x39\x2c\x31\x31\x2e\x37\x31\x36\x35\x33\x35\x20\x6c\x20\x2d\x35\
-\x2e\x36\x36\x39\x32\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\
-\x20\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x36\x20\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x34\x2c\
-\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\
-\x39\x31\x2c\x35\x2e\x36\x36\x39\x32\x39\x31\x20\x32\x32\x2e\x36\
-\x37\x37\x31\x36\x34\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\
-\x20\x32\x32\x2e\x36\x37\x37\x31\x37\x32\x2c\x32\x32\x2e\x36\x37\
-\x37\x31\x36\x35\x20\x35\x2e\x36\x36\x39\x32\x39\x2c\x2d\x35\x2e\
-\x36\x36\x39\x32\x39\x31\x20\x2d\x32\x32\x2e\x36\x37\x37\x31\x37\
-\x2c\x2d\x32\x32\x2e\x36\x37\x37\x31\x36\x35\x20\x7a\x22\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x09\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x4d\x20\x31\x2e\x31\x38\x39\x34\x35\x39\x32\
-\x2c\x30\x2e\x39\x31\x37\x36\x39\x37\x31\x38\x20\x34\x2e\x35\x2c\
-\x34\x2e\x32\x32\x38\x30\x31\x38\x32\x20\x37\x2e\x38\x31\x30\x35\
-\x34\x30\x38\x2c\x30\x2e\x39\x31\x36\x32\x37\x36\x34\x38\x20\x63\
-\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x20\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x2d\
-\x30\x2e\x31\x35\x37\x37\x30\x32\x20\x30\x2e\x35\x37\x31\x31\x37\
-\x34\x39\x2c\x30\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x30\
-\x2e\x31\x35\x37\x37\x30\x32\x30\x32\x20\x30\x2e\x31\x35\x37\x37\
-\x31\x32\x34\x2c\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x32\x20\x30\
-\x2c\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x32\x20\x6c\x20\x2d\x33\
-\x2e\x35\x39\x36\x31\x32\x38\x33\x2c\x33\x2e\x35\x39\x37\x33\x31\
-\x30\x32\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x2c\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x20\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x2c\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x38\x2c\x30\x20\x4c\x20\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x2c\
-\x31\x2e\x34\x38\x37\x34\x31\x33\x34\x20\x63\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x20\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x33\x34\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x33\x36\x39\x32\x20\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x2c\x2d\
-\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\x20\x30\x2e\x34\x31\x33\
-\x34\x36\x32\x34\x2c\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x31\
-\x20\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x2c\x30\x2e\x30\x30\x31\
-\x34\x32\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\
-\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\x39\x37\x32\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\x33\x31\x30\
-\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x2d\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\
-\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x37\x37\
-\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\
-\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x33\x2e\
-\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\x36\x31\x32\
-\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\x30\x2e\x31\
-\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x34\
-\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\x37\x31\x31\
-\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\x33\x34\x2c\
-\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\x2d\x30\x2e\
-\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\
-\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\x31\x31\x33\
-\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\x31\x33\x2c\
-\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\x35\x36\
-\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x33\x20\
-\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\
-\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x79\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x36\x61\x36\x65\x37\x31\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x98\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x32\x32\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x32\x35\x34\x2e\x30\x30\x30\x30\x30\x30\x29\
-\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\
-\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\
-\x28\x34\x32\x32\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x32\x35\x34\
-\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\
-\x30\x20\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\
-\x2c\x31\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\
-\x32\x30\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\
-\x30\x20\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\
-\x43\x32\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\
-\x30\x2c\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\x31\x2c\
-\x31\x37\x20\x4c\x39\x2c\x31\x37\x20\x4c\x39\x2c\x31\x35\x20\x4c\
-\x31\x31\x2c\x31\x35\x20\x4c\x31\x31\x2c\x31\x37\x20\x4c\x31\x31\
-\x2c\x31\x37\x20\x5a\x20\x4d\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\
-\x4c\x31\x32\x2e\x32\x2c\x31\x30\x2e\x32\x20\x43\x31\x31\x2e\x34\
-\x2c\x31\x30\x2e\x39\x20\x31\x31\x2c\x31\x31\x2e\x35\x20\x31\x31\
-\x2c\x31\x33\x20\x4c\x39\x2c\x31\x33\x20\x4c\x39\x2c\x31\x32\x2e\
-\x35\x20\x43\x39\x2c\x31\x31\x2e\x34\x20\x39\x2e\x34\x2c\x31\x30\
-\x2e\x34\x20\x31\x30\x2e\x32\x2c\x39\x2e\x37\x20\x4c\x31\x31\x2e\
-\x34\x2c\x38\x2e\x34\x20\x43\x31\x31\x2e\x38\x2c\x38\x2e\x31\x20\
-\x31\x32\x2c\x37\x2e\x36\x20\x31\x32\x2c\x37\x20\x43\x31\x32\x2c\
-\x35\x2e\x39\x20\x31\x31\x2e\x31\x2c\x35\x20\x31\x30\x2c\x35\x20\
-\x43\x38\x2e\x39\x2c\x35\x20\x38\x2c\x35\x2e\x39\x20\x38\x2c\x37\
-\x20\x4c\x36\x2c\x37\x20\x43\x36\x2c\x34\x2e\x38\x20\x37\x2e\x38\
-\x2c\x33\x20\x31\x30\x2c\x33\x20\x43\x31\x32\x2e\x32\x2c\x33\x20\
-\x31\x34\x2c\x34\x2e\x38\x20\x31\x34\x2c\x37\x20\x43\x31\x34\x2c\
-\x37\x2e\x39\x20\x31\x33\x2e\x36\x2c\x38\x2e\x37\x20\x31\x33\x2e\
-\x31\x2c\x39\x2e\x33\x20\x4c\x31\x33\x2e\x31\x2c\x39\x2e\x33\x20\
-\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\x32\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x38\x31\x2c\x30\x2c\x30\x2c\x30\x2e\
-\x39\x2c\x2d\x32\x31\x2e\x36\x37\x39\x36\x39\x39\x2c\x2d\x31\x30\
-\x31\x2e\x35\x33\x38\x39\x33\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x66\x66\x66\x66\
-\x38\x63\x22\x20\x64\x3d\x22\x4d\x20\x35\x32\x2e\x30\x31\x31\x39\
-\x37\x34\x2c\x31\x31\x35\x2e\x35\x39\x38\x38\x31\x20\x48\x20\x31\
-\x35\x36\x2e\x30\x36\x35\x38\x35\x20\x63\x20\x31\x31\x2e\x30\x38\
-\x2c\x30\x20\x32\x30\x2c\x38\x2e\x39\x32\x20\x32\x30\x2c\x32\x30\
-\x20\x76\x20\x34\x34\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\
-\x31\x31\x2e\x30\x38\x20\x2d\x38\x2e\x39\x32\x2c\x32\x30\x20\x2d\
-\x32\x30\x2c\x32\x30\x20\x68\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\
-\x33\x20\x2d\x31\x33\x2e\x30\x30\x36\x37\x34\x20\x6c\x20\x2d\x30\
-\x2e\x34\x30\x30\x34\x33\x2c\x32\x31\x2e\x30\x34\x39\x32\x37\x20\
-\x2d\x32\x35\x2e\x36\x31\x33\x30\x34\x2c\x2d\x32\x31\x2e\x30\x34\
-\x39\x32\x37\x20\x48\x20\x39\x31\x2e\x30\x33\x32\x31\x37\x38\x20\
-\x37\x38\x2e\x30\x32\x35\x34\x34\x33\x20\x36\x35\x2e\x30\x31\x38\
-\x37\x30\x39\x20\x35\x32\x2e\x30\x31\x31\x39\x37\x34\x20\x63\x20\
-\x2d\x31\x31\x2e\x30\x38\x2c\x30\x20\x2d\x32\x30\x2c\x2d\x38\x2e\
-\x39\x32\x20\x2d\x32\x30\x2c\x2d\x32\x30\x20\x76\x20\x2d\x34\x34\
-\x2e\x39\x32\x30\x36\x35\x20\x63\x20\x30\x2c\x2d\x31\x31\x2e\x30\
-\x38\x20\x38\x2e\x39\x32\x2c\x2d\x32\x30\x20\x32\x30\x2c\x2d\x32\
-\x30\x20\x7a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x2d\x31\x2e\x33\x2c\x30\x2c\x30\x2c\x2d\x31\
-\x2e\x33\x2c\x2d\x33\x31\x2e\x32\x39\x32\x39\x38\x37\x2c\x35\x2e\
-\x32\x34\x33\x31\x35\x32\x39\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x23\x33\x31\
-\x33\x36\x33\x62\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\
-\x74\x68\x3d\x22\x34\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\
-\x65\x22\x20\x64\x3d\x22\x6d\x20\x2d\x35\x30\x2e\x30\x30\x30\x30\
-\x30\x32\x2c\x2d\x34\x35\x2e\x35\x36\x35\x37\x35\x20\x2d\x31\x31\
-\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\x31\x35\x35\x36\x34\
-\x37\x20\x2d\x31\x31\x2e\x36\x30\x34\x37\x32\x32\x2c\x32\x30\x2e\
-\x31\x35\x35\x36\x34\x37\x33\x20\x2d\x31\x31\x2e\x36\x35\x32\x39\
-\x34\x32\x2c\x2d\x32\x30\x2e\x31\x32\x37\x38\x30\x37\x33\x20\x2d\
-\x31\x31\x2e\x36\x35\x32\x39\x34\x31\x2c\x2d\x32\x30\x2e\x31\x32\
-\x37\x38\x30\x38\x20\x32\x33\x2e\x32\x35\x37\x36\x36\x34\x2c\x2d\
-\x30\x2e\x30\x32\x37\x38\x34\x20\x7a\x22\x20\x2f\x3e\x0a\x20\x20\
-\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\
-\x74\x68\x3d\x22\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\
-\x20\x78\x3d\x22\x36\x31\x2e\x34\x35\x36\x37\x38\x37\x22\x20\x79\
-\x3d\x22\x35\x31\x2e\x39\x36\x31\x30\x37\x31\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x72\x65\x63\x74\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x22\
-\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x35\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x78\x3d\x22\x36\
-\x31\x2e\x34\x35\x36\x37\x38\x37\x22\x20\x79\x3d\x22\x33\x30\x2e\
-\x39\x36\x31\x30\x37\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x01\xf9\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x31\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\
-\x68\x20\x64\x3d\x22\x6d\x20\x35\x2e\x30\x38\x32\x33\x30\x32\x38\
-\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x2d\x33\x2e\x33\x31\
-\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\x20\x33\
-\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\x30\x35\x34\
-\x30\x38\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x39\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\
-\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x2d\x30\x2e\x34\x31\
-\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\
-\x2d\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\x20\x2d\
-\x33\x2e\x35\x39\x37\x33\x31\x30\x31\x37\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x31\x2c\x2d\x30\x2e\x31\
-\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\x31\
-\x39\x31\x2c\x2d\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\
-\x2d\x30\x2e\x35\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x34\x2e\x35\
-\x31\x32\x35\x38\x36\x36\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\
-\x37\x20\x63\x20\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\
-\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x34\x31\x33\x34\x33\x34\
-\x39\x2c\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x30\x2e\x35\
-\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x30\x2e\x31\
-\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\
-\x33\x20\x2d\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x33\x31\x33\x36\x33\x62\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xac\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
-\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x31\x37\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\
-\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x61\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x32\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x3e\x0a\x20\x20\x20\x20\
-\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\
-\x39\x62\x38\x22\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x38\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\x65\x69\x67\
-\x68\x74\x3d\x22\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\
-\x00\x00\x01\x18\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x30\x2e\x31\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\x3d\x22\x23\x62\x61\x62\x39\
-\x62\x38\x22\x20\x64\x3d\x22\x4d\x32\x32\x2e\x31\x2c\x31\x30\x32\
-\x32\x2e\x31\x4c\x2d\x32\x32\x2e\x31\x2c\x39\x37\x37\x2e\x39\x6c\
-\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\x30\x32\x32\x2e\x31\
-\x2c\x32\x32\x2e\x31\x5a\x6d\x32\x32\x30\x2c\x33\x30\x4c\x31\x39\
-\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\
-\x31\x30\x30\x30\x4c\x31\x32\x34\x32\x2e\x31\x2c\x35\x32\x2e\x31\
-\x5a\x6d\x32\x35\x30\x2c\x30\x4c\x34\x34\x37\x2e\x39\x2c\x31\x30\
-\x30\x37\x2e\x39\x6c\x31\x30\x30\x30\x2d\x31\x30\x30\x30\x4c\x31\
-\x34\x39\x32\x2e\x31\x2c\x35\x32\x2e\x31\x5a\x6d\x32\x35\x30\x2c\
-\x30\x4c\x36\x39\x37\x2e\x39\x2c\x31\x30\x30\x37\x2e\x39\x6c\x31\
-\x30\x33\x30\x2d\x31\x30\x33\x30\x4c\x31\x37\x37\x32\x2e\x31\x2c\
-\x32\x32\x2e\x31\x5a\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
-\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb9\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\
-\x30\x2c\x20\x2d\x38\x36\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x34\
-\x34\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x36\x2e\x30\x30\x30\
-\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\x43\x34\
-\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\x30\x20\
-\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\x20\x31\
-\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\x32\x30\
-\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\x30\x2c\
-\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\x30\x20\
-\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x38\x2c\x31\x35\x20\x4c\x33\
-\x2c\x31\x30\x20\x4c\x34\x2e\x34\x2c\x38\x2e\x36\x20\x4c\x38\x2c\
-\x31\x32\x2e\x32\x20\x4c\x31\x35\x2e\x36\x2c\x34\x2e\x36\x20\x4c\
-\x31\x37\x2c\x36\x20\x4c\x38\x2c\x31\x35\x20\x4c\x38\x2c\x31\x35\
-\x20\x5a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x84\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x38\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\
-\x28\x37\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\x69\x6c\
-\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\x6c\x6c\
-\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x33\x34\x31\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x38\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\
-\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\
-\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x33\x34\
-\x31\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x38\x39\x2e\x30\x30\x30\
-\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x34\x2c\x31\x2e\x34\x20\
-\x4c\x31\x32\x2e\x36\x2c\x30\x20\x4c\x37\x2c\x35\x2e\x36\x20\x4c\
-\x31\x2e\x34\x2c\x30\x20\x4c\x30\x2c\x31\x2e\x34\x20\x4c\x35\x2e\
-\x36\x2c\x37\x20\x4c\x30\x2c\x31\x32\x2e\x36\x20\x4c\x31\x2e\x34\
-\x2c\x31\x34\x20\x4c\x37\x2c\x38\x2e\x34\x20\x4c\x31\x32\x2e\x36\
-\x2c\x31\x34\x20\x4c\x31\x34\x2c\x31\x32\x2e\x36\x20\x4c\x38\x2e\
-\x34\x2c\x37\x20\x4c\x31\x34\x2c\x31\x2e\x34\x20\x5a\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\
-\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0a\
-\x00\x00\x03\xde\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
-\x74\x72\x69\x78\x28\x30\x2e\x36\x32\x31\x36\x34\x32\x38\x34\x2c\
-\x30\x2c\x30\x2c\x30\x2e\x36\x32\x33\x35\x37\x31\x31\x2c\x2d\x30\
-\x2e\x36\x33\x35\x33\x30\x34\x33\x34\x2c\x33\x2e\x36\x38\x31\x36\
-\x33\x31\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\
-\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x20\x37\x39\
-\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\x41\x20\x37\x30\x2c\
-\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x30\x2c\x38\x30\x20\x37\
-\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x38\x30\x2c\x31\x35\
-\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\x20\x31\x35\
-\x30\x2c\x38\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\x20\x30\
-\x20\x38\x30\x2c\x31\x30\x20\x37\x30\x2c\x37\x30\x20\x30\x20\x30\
-\x20\x30\x20\x37\x39\x2e\x37\x39\x36\x38\x37\x35\x2c\x31\x30\x20\
-\x5a\x20\x6d\x20\x33\x31\x2e\x31\x33\x36\x37\x31\x35\x2c\x32\x38\
-\x2e\x35\x20\x63\x20\x33\x2e\x31\x38\x36\x33\x32\x2c\x2d\x30\x2e\
-\x30\x30\x38\x37\x20\x36\x2e\x33\x37\x36\x33\x36\x2c\x31\x2e\x32\
-\x31\x31\x32\x30\x36\x20\x38\x2e\x38\x31\x34\x34\x36\x2c\x33\x2e\
-\x36\x36\x30\x31\x35\x36\x20\x34\x2e\x38\x37\x32\x37\x2c\x34\x2e\
-\x38\x39\x36\x35\x20\x34\x2e\x38\x39\x32\x39\x37\x2c\x31\x32\x2e\
-\x38\x35\x37\x37\x34\x34\x20\x30\x2e\x30\x34\x36\x39\x2c\x31\x37\
-\x2e\x37\x37\x37\x33\x34\x34\x20\x4c\x20\x39\x38\x2e\x35\x31\x39\
-\x35\x33\x31\x2c\x38\x31\x2e\x35\x31\x35\x36\x32\x35\x20\x31\x31\
-\x39\x2e\x38\x31\x38\x33\x36\x2c\x31\x30\x33\x2e\x31\x31\x35\x32\
-\x33\x20\x63\x20\x34\x2e\x38\x30\x36\x32\x2c\x34\x2e\x38\x38\x34\
-\x36\x20\x34\x2e\x37\x34\x30\x32\x32\x2c\x31\x32\x2e\x37\x39\x34\
-\x39\x38\x20\x2d\x30\x2e\x31\x34\x36\x34\x38\x2c\x31\x37\x2e\x36\
-\x37\x31\x38\x38\x20\x2d\x34\x2e\x38\x38\x38\x31\x2c\x34\x2e\x38\
-\x37\x34\x38\x20\x2d\x31\x32\x2e\x37\x34\x35\x39\x39\x2c\x34\x2e\
-\x38\x36\x32\x34\x31\x20\x2d\x31\x37\x2e\x35\x35\x30\x37\x39\x2c\
-\x2d\x30\x2e\x30\x32\x31\x35\x20\x4c\x20\x38\x30\x2e\x39\x36\x38\
-\x37\x35\x2c\x39\x39\x2e\x33\x31\x36\x34\x30\x36\x20\x35\x39\x2e\
-\x37\x37\x37\x33\x34\x34\x2c\x31\x32\x30\x2e\x38\x30\x36\x36\x34\
-\x20\x63\x20\x2d\x34\x2e\x38\x34\x38\x39\x2c\x34\x2e\x39\x32\x33\
-\x38\x20\x2d\x31\x32\x2e\x37\x33\x33\x31\x37\x35\x2c\x34\x2e\x39\
-\x34\x34\x37\x38\x20\x2d\x31\x37\x2e\x36\x30\x39\x33\x37\x35\x2c\
-\x30\x2e\x30\x34\x36\x39\x20\x2d\x34\x2e\x38\x37\x32\x37\x2c\x2d\
-\x34\x2e\x38\x39\x36\x35\x20\x2d\x34\x2e\x38\x39\x33\x36\x37\x35\
-\x2c\x2d\x31\x32\x2e\x38\x35\x37\x37\x35\x20\x2d\x30\x2e\x30\x34\
-\x36\x38\x37\x2c\x2d\x31\x37\x2e\x37\x37\x37\x33\x35\x20\x4c\x20\
-\x36\x33\x2e\x33\x39\x36\x34\x38\x34\x2c\x38\x31\x2e\x34\x39\x36\
-\x30\x39\x34\x20\x34\x32\x2e\x30\x39\x39\x36\x30\x39\x2c\x35\x39\
-\x2e\x38\x39\x38\x34\x33\x38\x20\x63\x20\x2d\x34\x2e\x38\x30\x36\
-\x39\x2c\x2d\x34\x2e\x38\x38\x34\x36\x20\x2d\x34\x2e\x37\x34\x32\
-\x31\x36\x38\x2c\x2d\x31\x32\x2e\x37\x39\x36\x39\x32\x39\x20\x30\
-\x2e\x31\x34\x34\x35\x33\x32\x2c\x2d\x31\x37\x2e\x36\x37\x33\x38\
-\x32\x39\x20\x34\x2e\x38\x38\x38\x31\x2c\x2d\x34\x2e\x38\x37\x34\
-\x31\x20\x31\x32\x2e\x37\x34\x37\x39\x33\x34\x2c\x2d\x34\x2e\x38\
-\x36\x32\x34\x31\x35\x20\x31\x37\x2e\x35\x35\x32\x37\x33\x34\x2c\
-\x30\x2e\x30\x32\x31\x34\x38\x20\x4c\x20\x38\x30\x2e\x39\x34\x39\
-\x32\x31\x39\x2c\x36\x33\x2e\x36\x39\x37\x32\x36\x36\x20\x31\x30\
-\x32\x2e\x31\x34\x30\x36\x32\x2c\x34\x32\x2e\x32\x30\x37\x30\x33\
-\x31\x20\x63\x20\x32\x2e\x34\x32\x34\x34\x36\x2c\x2d\x32\x2e\x34\
-\x36\x31\x39\x20\x35\x2e\x36\x30\x36\x36\x36\x2c\x2d\x33\x2e\x36\
-\x39\x38\x33\x36\x39\x20\x38\x2e\x37\x39\x32\x39\x37\x2c\x2d\x33\
-\x2e\x37\x30\x37\x30\x33\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x64\x39\x33\x63\x38\x22\x20\x66\x69\x6c\x6c\x2d\x6f\
-\x70\x61\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0a\x20\
-\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\xb2\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x20\
-\x77\x69\x64\x74\x68\x3d\x22\x37\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\
-\x6f\x64\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\
-\x65\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\
-\x63\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\
-\x20\x66\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\
-\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\
-\x6c\x61\x74\x65\x28\x2d\x32\x39\x39\x2e\x30\x30\x30\x30\x30\x30\
-\x2c\x20\x2d\x31\x32\x39\x2e\x30\x30\x30\x30\x30\x30\x29\x22\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\
-\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\x32\
-\x39\x39\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x31\x32\x39\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x2c\x31\x36\x20\
-\x43\x31\x2c\x31\x37\x2e\x31\x20\x31\x2e\x39\x2c\x31\x38\x20\x33\
-\x2c\x31\x38\x20\x4c\x31\x31\x2c\x31\x38\x20\x43\x31\x32\x2e\x31\
-\x2c\x31\x38\x20\x31\x33\x2c\x31\x37\x2e\x31\x20\x31\x33\x2c\x31\
-\x36\x20\x4c\x31\x33\x2c\x34\x20\x4c\x31\x2c\x34\x20\x4c\x31\x2c\
-\x31\x36\x20\x4c\x31\x2c\x31\x36\x20\x5a\x20\x4d\x31\x34\x2c\x31\
-\x20\x4c\x31\x30\x2e\x35\x2c\x31\x20\x4c\x39\x2e\x35\x2c\x30\x20\
-\x4c\x34\x2e\x35\x2c\x30\x20\x4c\x33\x2e\x35\x2c\x31\x20\x4c\x30\
-\x2c\x31\x20\x4c\x30\x2c\x33\x20\x4c\x31\x34\x2c\x33\x20\x4c\x31\
-\x34\x2c\x31\x20\x4c\x31\x34\x2c\x31\x20\x5a\x22\x2f\x3e\x0a\x20\
-\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x20\x20\x3c\x2f\
-\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x00\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\x36\x36\x22\
-\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x35\x22\
-\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x01\x13\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x30\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x39\x30\x22\x3e\x0a\x20\x20\x3c\x67\
-\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\
-\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
-\x20\x64\x3d\x22\x4d\x32\x2c\x32\x20\x68\x31\x34\x20\x76\x31\x34\
-\x20\x68\x2d\x30\x2e\x39\x20\x76\x2d\x31\x33\x2e\x31\x20\x68\x2d\
-\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\x32\
-\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\
-\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2c\x31\x36\x20\x68\x2d\x31\
-\x34\x20\x76\x2d\x31\x34\x20\x68\x30\x2e\x39\x20\x76\x31\x33\x2e\
-\x31\x20\x68\x31\x33\x2e\x31\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x32\x37\x32\x62\x32\x66\x22\x2f\x3e\x0a\x20\x20\x20\x20\
-\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x2c\x35\x20\x68\x38\
-\x20\x76\x38\x20\x68\x2d\x38\x20\x76\x2d\x38\x20\x7a\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
-\x3e\x0a\
-\x00\x00\x00\xc5\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x2e\x37\x35\
-\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\
-\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\
-\x33\x36\x22\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\
-\x69\x67\x68\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x34\x35\x22\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0a\
-\x00\x00\x01\xf6\
-\x3c\
-\x73\x76\x67\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\
-\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x73\x74\x72\x6f\x6b\x65\x3d\x22\x6e\x6f\x6e\x65\x22\
-\x20\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\x61\
-\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x67\x20\x66\
-\x69\x6c\x6c\x3d\x22\x23\x33\x31\x33\x36\x33\x62\x22\x20\x66\x69\
-\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\
-\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\
-\x6e\x73\x6c\x61\x74\x65\x28\x2d\x33\x38\x30\x2e\x30\x30\x30\x30\
-\x30\x30\x2c\x20\x2d\x34\x34\x2e\x30\x30\x30\x30\x30\x30\x29\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x67\x20\x74\x72\x61\x6e\x73\
-\x66\x6f\x72\x6d\x3d\x22\x74\x72\x61\x6e\x73\x6c\x61\x74\x65\x28\
-\x33\x38\x30\x2e\x30\x30\x30\x30\x30\x30\x2c\x20\x34\x34\x2e\x30\
-\x30\x30\x30\x30\x30\x29\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x30\x2c\x30\x20\
-\x43\x34\x2e\x35\x2c\x30\x20\x30\x2c\x34\x2e\x35\x20\x30\x2c\x31\
-\x30\x20\x43\x30\x2c\x31\x35\x2e\x35\x20\x34\x2e\x35\x2c\x32\x30\
-\x20\x31\x30\x2c\x32\x30\x20\x43\x31\x35\x2e\x35\x2c\x32\x30\x20\
-\x32\x30\x2c\x31\x35\x2e\x35\x20\x32\x30\x2c\x31\x30\x20\x43\x32\
-\x30\x2c\x34\x2e\x35\x20\x31\x35\x2e\x35\x2c\x30\x20\x31\x30\x2c\
-\x30\x20\x4c\x31\x30\x2c\x30\x20\x5a\x20\x4d\x31\x35\x2c\x31\x33\
-\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x31\x35\x20\x4c\x31\x30\x2c\
-\x31\x31\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x31\x35\x20\x4c\x35\x2c\
-\x31\x33\x2e\x36\x20\x4c\x38\x2e\x36\x2c\x31\x30\x20\x4c\x35\x2c\
-\x36\x2e\x34\x20\x4c\x36\x2e\x34\x2c\x35\x20\x4c\x31\x30\x2c\x38\
-\x2e\x36\x20\x4c\x31\x33\x2e\x36\x2c\x35\x20\x4c\x31\x35\x2c\x36\
-\x2e\x34\x20\x4c\x31\x31\x2e\x34\x2c\x31\x30\x20\x4c\x31\x35\x2c\
-\x31\x33\x2e\x36\x20\x4c\x31\x35\x2c\x31\x33\x2e\x36\x20\x5a\x22\
-\x2f\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\
-\x20\x20\x3c\x2f\x67\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x1c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\
-\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\
-\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\
-\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\
-\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x34\x62\x34\x62\x34\x62\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3d\x22\x31\x2e\x30\x22\x2f\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\x79\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\x30\x22\x3e\x0a\x20\x20\
-\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\
-\x63\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x33\x35\x22\x20\x73\
-\x74\x72\x6f\x6b\x65\x3d\x22\x23\x32\x37\x32\x62\x32\x66\x22\x20\
-\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x31\x30\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x1c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x30\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x36\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x32\x30\x29\x20\x74\x72\x61\x6e\x73\x6c\x61\x74\
-\x65\x28\x33\x20\x35\x2e\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2e\x39\x31\x36\x36\
-\x39\x37\x32\x2c\x31\x2e\x31\x38\x39\x34\x35\x39\x33\x20\x33\x2e\
-\x33\x31\x30\x33\x32\x31\x2c\x33\x2e\x33\x31\x30\x35\x34\x30\x38\
-\x20\x2d\x33\x2e\x33\x31\x31\x37\x34\x31\x37\x2c\x33\x2e\x33\x31\
-\x30\x35\x34\x30\x38\x20\x63\x20\x2d\x30\x2e\x31\x35\x37\x37\x30\
-\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\x31\
-\x35\x37\x37\x30\x32\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\
-\x30\x2c\x30\x2e\x35\x37\x31\x31\x37\x34\x39\x20\x30\x2e\x31\x35\
-\x37\x37\x30\x32\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x33\x20\x30\
-\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\x30\x2e\x31\x35\x37\x37\x31\
-\x32\x33\x20\x30\x2e\x35\x37\x31\x31\x33\x36\x39\x2c\x30\x20\x6c\
-\x20\x33\x2e\x35\x39\x37\x33\x31\x30\x32\x2c\x2d\x33\x2e\x35\x39\
-\x36\x31\x32\x38\x33\x20\x30\x2c\x30\x20\x30\x2c\x30\x20\x63\x20\
-\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x30\x2e\x31\x35\x37\x37\x30\x31\x39\x2c\x2d\
-\x30\x2e\x34\x31\x33\x34\x36\x32\x34\x20\x30\x2c\x2d\x30\x2e\x35\
-\x37\x31\x31\x37\x34\x38\x20\x4c\x20\x31\x2e\x34\x38\x36\x34\x31\
-\x33\x34\x2c\x30\x2e\x36\x31\x38\x32\x38\x34\x33\x37\x20\x63\x20\
-\x2d\x30\x2e\x31\x35\x37\x37\x30\x32\x2c\x2d\x30\x2e\x31\x35\x37\
-\x37\x31\x32\x34\x20\x2d\x30\x2e\x34\x31\x33\x34\x33\x34\x39\x2c\
-\x2d\x30\x2e\x31\x35\x37\x37\x31\x32\x34\x20\x2d\x30\x2e\x35\x37\
-\x31\x31\x33\x36\x39\x2c\x30\x20\x2d\x30\x2e\x31\x35\x36\x32\x38\
-\x31\x33\x2c\x30\x2e\x31\x35\x37\x37\x31\x32\x35\x20\x2d\x30\x2e\
-\x31\x35\x36\x32\x38\x31\x33\x2c\x30\x2e\x34\x31\x33\x34\x36\x32\
-\x34\x33\x20\x30\x2e\x30\x30\x31\x34\x32\x2c\x30\x2e\x35\x37\x31\
-\x31\x37\x34\x39\x33\x20\x7a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x23\
-\x33\x33\x61\x34\x64\x66\x22\x20\x66\x69\x6c\x6c\x2d\x6f\x70\x61\
-\x63\x69\x74\x79\x3d\x22\x30\x2e\x35\x22\x2f\x3e\x0a\x20\x20\x3c\
-\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x00\xc2\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\x2f\x3e\
-\x0a\x20\x20\x20\x20\x3c\x72\x65\x63\x74\x20\x66\x69\x6c\x6c\x3d\
-\x22\x23\x34\x62\x34\x62\x34\x62\x22\x20\x78\x3d\x22\x33\x36\x22\
-\x20\x79\x3d\x22\x32\x39\x2e\x37\x35\x22\x20\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x35\x22\
-\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
-\x0a\
-\x00\x00\x00\x80\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x30\x35\x22\x20\
-\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x39\x30\x22\x3e\x0a\x20\x20\
-\x3c\x67\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x73\x63\
-\x61\x6c\x65\x28\x35\x29\x22\x3e\x0a\x20\x20\x20\x20\x3c\x72\x65\
-\x63\x74\x20\x66\x69\x6c\x6c\x3d\x22\x23\x34\x62\x34\x62\x34\x62\
-\x22\x20\x78\x3d\x22\x33\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
-\x33\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x38\x22\x2f\x3e\
-\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x72\xfd\xf4\
-\x00\x6c\
-\x00\x69\x00\x67\x00\x68\x00\x74\
-\x00\x04\
-\x00\x06\xa8\x8b\
-\x00\x64\
-\x00\x61\x00\x72\x00\x6b\
-\x00\x17\
-\x0a\x80\x1e\x07\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x69\x00\x6e\x00\x66\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x69\
-\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1f\
-\x0a\xae\x2a\xc7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\
-\x00\x64\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x0f\x67\x35\x47\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x72\x00\x65\x00\x73\x00\x65\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1d\
-\x09\x07\x8c\x87\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\
-\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x0c\xe2\x65\xe7\
-\x00\x74\
-\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x12\
-\x01\x06\x86\x47\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\
-\x00\x67\
-\x00\x10\
-\x01\x0f\x47\x27\
-\x00\x76\
-\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x00\x72\x20\xe7\
-\x00\x68\
-\x00\x73\x00\x65\x00\x70\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x03\xc2\xd5\xc3\
-\x00\x73\
-\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\x00\x68\x00\x65\x00\x65\x00\x74\x00\x2e\x00\x71\x00\x73\x00\x73\
-\x00\x15\
-\x0f\xf3\xcd\x87\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x06\x53\x28\x27\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x17\
-\x0c\x65\xc3\x87\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x06\xeb\x5d\xe7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x01\x26\x22\xc7\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x76\x00\x69\x00\x6f\x00\x75\x00\x73\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x06\xe6\xeb\xe7\
-\x00\x75\
-\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x02\x9f\x08\x07\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x05\x8e\xb3\xc7\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x16\
-\x01\x75\xc1\x07\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\
-\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x04\xa2\xf1\x27\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1a\
-\x01\x87\xa3\xe7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x64\x00\x65\x00\x74\x00\x65\x00\x72\x00\x6d\
-\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x03\xa2\x30\xc7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6e\x00\x6f\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1a\
-\x0e\xbc\xce\xe7\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\x00\x64\x00\x69\x00\x73\
-\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x04\x00\x5d\x47\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x5f\x00\x6e\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x09\
-\x06\x98\x8e\xa7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x05\x5c\x0e\xa7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6d\x00\x6f\x00\x72\x00\x65\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x15\
-\x00\x61\x01\xc7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\
-\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x07\x98\xf6\xc7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x18\
-\x02\x20\x5d\xe7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\
-\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x04\x13\x00\xa7\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x71\x00\x75\x00\x65\x00\x73\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x05\x95\xd3\xa7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x63\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x01\x08\xc7\x27\
-\x00\x68\
-\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x23\
-\x06\xf2\x17\xc7\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x64\x00\x65\x00\x74\x00\x65\x00\x72\x00\x6d\
-\x00\x69\x00\x6e\x00\x61\x00\x74\x00\x65\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x0f\
-\x08\xae\x5c\x07\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x73\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x00\x88\x80\x07\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x63\x00\x72\x00\x69\x00\x74\x00\x69\x00\x63\x00\x61\x00\x6c\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x17\
-\x0c\xab\x5c\x87\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\
-\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x18\
-\x03\x8e\xd3\xe7\
-\x00\x72\
-\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\
-\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x01\xf2\x4c\xc7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x1c\
-\x01\xe0\x47\x87\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x5f\x00\x64\
-\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x0c\x59\x5a\xe7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x68\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x13\
-\x09\xbb\x14\xa7\
-\x00\x6d\
-\x00\x65\x00\x73\x00\x73\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x77\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x0e\
-\x0e\xde\xf7\x47\
-\x00\x6c\
-\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0a\xe5\x61\x87\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x0f\
-\x00\x72\x98\xe7\
-\x00\x76\
-\x00\x73\x00\x65\x00\x70\x00\x74\x00\x6f\x00\x6f\x00\x6c\x00\x62\x00\x61\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x06\x41\x4d\x07\
-\x00\x73\
-\x00\x69\x00\x7a\x00\x65\x00\x67\x00\x72\x00\x69\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x03\xae\x30\xc7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x6f\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x10\
-\x00\x38\x48\xa7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x0e\xd0\x99\xe7\
-\x00\x63\
-\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x12\
-\x08\x8f\x44\xa7\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x63\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x73\x00\x76\
-\x00\x67\
-\x00\x14\
-\x03\xf0\xa6\x47\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x65\x00\x6e\x00\x64\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x14\
-\x07\xec\xdc\x47\
-\x00\x63\
-\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x62\x00\x6f\x00\x78\x00\x5f\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\
-\x00\x73\x00\x76\x00\x67\
-\x00\x0e\
-\x0d\x4e\x7c\x07\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x65\x00\x6e\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x11\
-\x03\xbf\x8a\x87\
-\x00\x64\
-\x00\x69\x00\x61\x00\x6c\x00\x6f\x00\x67\x00\x5f\x00\x63\x00\x61\x00\x6e\x00\x63\x00\x65\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x11\
-\x0b\xda\x3d\x27\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\
-\x00\x13\
-\x08\xc8\x9b\x67\
-\x00\x72\
-\x00\x61\x00\x64\x00\x69\x00\x6f\x00\x5f\x00\x75\x00\x6e\x00\x63\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\x00\x73\
-\x00\x76\x00\x67\
-\x00\x17\
-\x0b\x6b\x2b\xe7\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x64\x00\x5f\x00\x68\x00\x6f\x00\x76\
-\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x06\x16\x28\x67\
-\x00\x62\
-\x00\x72\x00\x61\x00\x6e\x00\x63\x00\x68\x00\x5f\x00\x6d\x00\x6f\x00\x72\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x00\x48\xa0\xa7\
-\x00\x76\
-\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x39\x00\x00\x00\x3c\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x39\x00\x00\x00\x03\
-\x00\x00\x07\xba\x00\x00\x00\x00\x00\x01\x00\x00\xeb\x84\
-\x00\x00\x09\x84\x00\x00\x00\x00\x00\x01\x00\x00\xfc\xc7\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x00\xc2\xff\
-\x00\x00\x01\x70\x00\x00\x00\x00\x00\x01\x00\x00\x87\x70\
-\x00\x00\x07\x58\x00\x00\x00\x00\x00\x01\x00\x00\xe8\x46\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xd4\xa4\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x84\xc8\
-\x00\x00\x05\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xd0\x31\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x86\xcd\
-\x00\x00\x02\x62\x00\x00\x00\x00\x00\x01\x00\x00\xac\x8c\
-\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\xb4\x95\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\xb7\x71\
-\x00\x00\x06\x80\x00\x00\x00\x00\x00\x01\x00\x00\xdf\x4a\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xdb\x68\
-\x00\x00\x04\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xc6\x7e\
-\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xb0\x8e\
-\x00\x00\x06\x26\x00\x00\x00\x00\x00\x01\x00\x00\xd9\x6e\
-\x00\x00\x03\x90\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x2e\
-\x00\x00\x07\x9a\x00\x00\x00\x00\x00\x01\x00\x00\xe9\xc7\
-\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xf5\x4a\
-\x00\x00\x01\x94\x00\x01\x00\x00\x00\x01\x00\x00\x87\xd5\
-\x00\x00\x08\x32\x00\x00\x00\x00\x00\x01\x00\x00\xf2\xa4\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x1e\
-\x00\x00\x04\xe6\x00\x00\x00\x00\x00\x01\x00\x00\xc7\xd1\
-\x00\x00\x03\x34\x00\x00\x00\x00\x00\x01\x00\x00\xb5\x64\
-\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xc1\xfa\
-\x00\x00\x02\xd4\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x88\
-\x00\x00\x05\x14\x00\x00\x00\x00\x00\x01\x00\x00\xcf\x4f\
-\x00\x00\x09\x60\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x01\
-\x00\x00\x07\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xe8\xab\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\xa6\xc1\
-\x00\x00\x04\x12\x00\x00\x00\x00\x00\x01\x00\x00\xbe\x18\
-\x00\x00\x02\x92\x00\x00\x00\x00\x00\x01\x00\x00\xae\x89\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xaa\xea\
-\x00\x00\x05\x54\x00\x00\x00\x00\x00\x01\x00\x00\xd0\xd4\
-\x00\x00\x04\x8a\x00\x00\x00\x00\x00\x01\x00\x00\xc5\x2b\
-\x00\x00\x08\x60\x00\x00\x00\x00\x00\x01\x00\x00\xf3\x6a\
-\x00\x00\x08\x08\x00\x00\x00\x00\x00\x01\x00\x00\xf0\xee\
-\x00\x00\x05\xa0\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x91\
-\x00\x00\x09\x00\x00\x00\x00\x00\x00\x01\x00\x00\xf9\x64\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x83\x8f\
-\x00\x00\x06\xe2\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x63\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x8a\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x80\xf1\
-\x00\x00\x07\x30\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x96\
-\x00\x00\x09\x2c\x00\x00\x00\x00\x00\x01\x00\x00\xf9\xe1\
-\x00\x00\x08\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xf7\x44\
-\x00\x00\x06\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xdf\xc7\
-\x00\x00\x02\x0a\x00\x00\x00\x00\x00\x01\x00\x00\xa8\xed\
-\x00\x00\x05\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x61\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x84\xa6\
-\x00\x00\x08\x8e\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x81\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x6e\
-\x00\x00\x07\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xed\x0c\
-\x00\x00\x07\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x99\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x81\xc0\
-\x00\x00\x01\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xbc\
-\x00\x00\x07\xba\x00\x00\x00\x00\x00\x01\x00\x00\x6c\xc3\
-\x00\x00\x09\x84\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x06\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x44\x3e\
-\x00\x00\x01\x70\x00\x00\x00\x00\x00\x01\x00\x00\x08\xe6\
-\x00\x00\x07\x58\x00\x00\x00\x00\x00\x01\x00\x00\x69\x85\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x55\xe3\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x06\x3e\
-\x00\x00\x05\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x51\x70\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x08\x43\
-\x00\x00\x02\x62\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xcb\
-\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\x35\xd4\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\x38\xb0\
-\x00\x00\x06\x80\x00\x00\x00\x00\x00\x01\x00\x00\x60\x89\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x5c\xa7\
-\x00\x00\x04\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x47\xbd\
-\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x31\xcd\
-\x00\x00\x06\x26\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xad\
-\x00\x00\x03\x90\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x6d\
-\x00\x00\x07\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x6b\x06\
-\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x76\x89\
-\x00\x00\x01\x94\x00\x01\x00\x00\x00\x01\x00\x00\x09\x4b\
-\x00\x00\x08\x32\x00\x00\x00\x00\x00\x01\x00\x00\x73\xe3\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x5d\
-\x00\x00\x04\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x49\x10\
-\x00\x00\x03\x34\x00\x00\x00\x00\x00\x01\x00\x00\x36\xa3\
-\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x43\x39\
-\x00\x00\x02\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x33\xc7\
-\x00\x00\x05\x14\x00\x00\x00\x00\x00\x01\x00\x00\x50\x8e\
-\x00\x00\x09\x60\x00\x00\x00\x00\x00\x01\x00\x00\x7d\x40\
-\x00\x00\x07\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x69\xea\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x28\x00\
-\x00\x00\x04\x12\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x57\
-\x00\x00\x02\x92\x00\x00\x00\x00\x00\x01\x00\x00\x2f\xc8\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x29\
-\x00\x00\x05\x54\x00\x00\x00\x00\x00\x01\x00\x00\x52\x13\
-\x00\x00\x04\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x46\x6a\
-\x00\x00\x08\x60\x00\x00\x00\x00\x00\x01\x00\x00\x74\xa9\
-\x00\x00\x08\x08\x00\x00\x00\x00\x00\x01\x00\x00\x72\x2d\
-\x00\x00\x05\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x53\xd0\
-\x00\x00\x09\x00\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xa3\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x05\x05\
-\x00\x00\x06\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x63\xa2\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x02\x67\
-\x00\x00\x07\x30\x00\x00\x00\x00\x00\x01\x00\x00\x68\xd5\
-\x00\x00\x09\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x7b\x20\
-\x00\x00\x08\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x78\x83\
-\x00\x00\x06\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x61\x06\
-\x00\x00\x02\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x2c\
-\x00\x00\x05\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x58\xa0\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x06\x1c\
-\x00\x00\x08\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x75\xc0\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x3c\xad\
-\x00\x00\x07\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x4b\
-\x00\x00\x07\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x66\xd8\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x03\x36\
-\x00\x00\x01\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x25\xfb\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x39\x00\x00\x00\x3c\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x39\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x07\xba\x00\x00\x00\x00\x00\x01\x00\x00\xeb\x84\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x09\x84\x00\x00\x00\x00\x00\x01\x00\x00\xfc\xc7\
-\x00\x00\x01\x7f\x68\x1b\xde\x81\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x00\xc2\xff\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x01\x70\x00\x00\x00\x00\x00\x01\x00\x00\x87\x70\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x07\x58\x00\x00\x00\x00\x00\x01\x00\x00\xe8\x46\
-\x00\x00\x01\x7f\x68\x1b\xde\x81\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xd4\xa4\
-\x00\x00\x01\x7f\x68\x1b\xde\x7d\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x84\xc8\
-\x00\x00\x01\x7f\x68\x1b\xde\x80\
-\x00\x00\x05\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xd0\x31\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x86\xcd\
-\x00\x00\x01\x7f\x68\x1b\xde\x81\
-\x00\x00\x02\x62\x00\x00\x00\x00\x00\x01\x00\x00\xac\x8c\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\xb4\x95\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\xb7\x71\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x06\x80\x00\x00\x00\x00\x00\x01\x00\x00\xdf\x4a\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xdb\x68\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x04\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xc6\x7e\
-\x00\x00\x01\x7f\x68\x1b\xde\x80\
-\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xb0\x8e\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x06\x26\x00\x00\x00\x00\x00\x01\x00\x00\xd9\x6e\
-\x00\x00\x01\x7f\x68\x1b\xde\x7f\
-\x00\x00\x03\x90\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x2e\
-\x00\x00\x01\x7f\x68\x1b\xde\x7b\
-\x00\x00\x07\x9a\x00\x00\x00\x00\x00\x01\x00\x00\xe9\xc7\
-\x00\x00\x01\x7f\x68\x1b\xde\x7b\
-\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xf5\x4a\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x01\x94\x00\x01\x00\x00\x00\x01\x00\x00\x87\xd5\
-\x00\x00\x01\x7f\x68\x1b\xde\x7f\
-\x00\x00\x08\x32\x00\x00\x00\x00\x00\x01\x00\x00\xf2\xa4\
-\x00\x00\x01\x7f\x68\x1b\xde\x77\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x1e\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x04\xe6\x00\x00\x00\x00\x00\x01\x00\x00\xc7\xd1\
-\x00\x00\x01\x7f\x68\x1b\xde\x7d\
-\x00\x00\x03\x34\x00\x00\x00\x00\x00\x01\x00\x00\xb5\x64\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xc1\xfa\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x02\xd4\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x88\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x05\x14\x00\x00\x00\x00\x00\x01\x00\x00\xcf\x4f\
-\x00\x00\x01\x7f\x68\x1b\xde\x7f\
-\x00\x00\x09\x60\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x01\
-\x00\x00\x01\x7f\x68\x1b\xde\x77\
-\x00\x00\x07\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xe8\xab\
-\x00\x00\x01\x7f\x68\x1b\xde\x7f\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\xa6\xc1\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x04\x12\x00\x00\x00\x00\x00\x01\x00\x00\xbe\x18\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x02\x92\x00\x00\x00\x00\x00\x01\x00\x00\xae\x89\
-\x00\x00\x01\x7f\x68\x1b\xde\x80\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\xaa\xea\
-\x00\x00\x01\x7f\x68\x1b\xde\x7b\
-\x00\x00\x05\x54\x00\x00\x00\x00\x00\x01\x00\x00\xd0\xd4\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x04\x8a\x00\x00\x00\x00\x00\x01\x00\x00\xc5\x2b\
-\x00\x00\x01\x7f\x68\x1b\xde\x80\
-\x00\x00\x08\x60\x00\x00\x00\x00\x00\x01\x00\x00\xf3\x6a\
-\x00\x00\x01\x7f\x68\x1b\xde\x78\
-\x00\x00\x08\x08\x00\x00\x00\x00\x00\x01\x00\x00\xf0\xee\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x05\xa0\x00\x00\x00\x00\x00\x01\x00\x00\xd2\x91\
-\x00\x00\x01\x7f\x68\x1b\xde\x7b\
-\x00\x00\x09\x00\x00\x00\x00\x00\x00\x01\x00\x00\xf9\x64\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x83\x8f\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x06\xe2\x00\x00\x00\x00\x00\x01\x00\x00\xe2\x63\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x8a\
-\x00\x00\x01\x7f\x68\x1b\xde\x7d\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x80\xf1\
-\x00\x00\x01\x7f\x68\x1b\xde\x79\
-\x00\x00\x07\x30\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x96\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x09\x2c\x00\x00\x00\x00\x00\x01\x00\x00\xf9\xe1\
-\x00\x00\x01\x7f\x68\x1b\xde\x77\
-\x00\x00\x08\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xf7\x44\
-\x00\x00\x01\x7f\x68\x1b\xde\x77\
-\x00\x00\x06\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xdf\xc7\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x02\x0a\x00\x00\x00\x00\x00\x01\x00\x00\xa8\xed\
-\x00\x00\x01\x7f\x68\x1b\xde\x7d\
-\x00\x00\x05\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x61\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x84\xa6\
-\x00\x00\x01\x7f\x68\x1b\xde\x7f\
-\x00\x00\x08\x8e\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x81\
-\x00\x00\x01\x7f\x68\x1b\xde\x77\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x6e\
-\x00\x00\x01\x7f\x68\x1b\xde\x7e\
-\x00\x00\x07\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xed\x0c\
-\x00\x00\x01\x7f\x68\x1b\xde\x7a\
-\x00\x00\x07\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x99\
-\x00\x00\x01\x7f\x68\x1b\xde\x7c\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x81\xc0\
-\x00\x00\x01\x7f\x68\x1b\xde\x7b\
-\x00\x00\x01\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xbc\
-\x00\x00\x01\x7f\x68\x1b\xde\x80\
-\x00\x00\x07\xba\x00\x00\x00\x00\x00\x01\x00\x00\x6c\xc3\
-\x00\x00\x01\x7f\x68\x1b\xde\x70\
-\x00\x00\x09\x84\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x06\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-\x00\x00\x04\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x44\x3e\
-\x00\x00\x01\x7f\x68\x1b\xde\x6d\
-\x00\x00\x01\x70\x00\x00\x00\x00\x00\x01\x00\x00\x08\xe6\
-\x00\x00\x01\x7f\x68\x1b\xde\x72\
-\x00\x00\x07\x58\x00\x00\x00\x00\x00\x01\x00\x00\x69\x85\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x55\xe3\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x06\x3e\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-\x00\x00\x05\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x51\x70\
-\x00\x00\x01\x7f\x68\x1b\xde\x72\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x08\x43\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-\x00\x00\x02\x62\x00\x00\x00\x00\x00\x01\x00\x00\x2d\xcb\
-\x00\x00\x01\x7f\x68\x1b\xde\x6e\
-\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\x35\xd4\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x03\x56\x00\x00\x00\x00\x00\x01\x00\x00\x38\xb0\
-\x00\x00\x01\x7f\x68\x1b\xde\x6e\
-\x00\x00\x06\x80\x00\x00\x00\x00\x00\x01\x00\x00\x60\x89\
-\x00\x00\x01\x7f\x68\x1b\xde\x74\
-\x00\x00\x06\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x5c\xa7\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x04\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x47\xbd\
-\x00\x00\x01\x7f\x68\x1b\xde\x75\
-\x00\x00\x02\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x31\xcd\
-\x00\x00\x01\x7f\x68\x1b\xde\x74\
-\x00\x00\x06\x26\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xad\
-\x00\x00\x01\x7f\x68\x1b\xde\x74\
-\x00\x00\x03\x90\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x6d\
-\x00\x00\x01\x7f\x68\x1b\xde\x70\
-\x00\x00\x07\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x6b\x06\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x76\x89\
-\x00\x00\x01\x7f\x68\x1b\xde\x70\
-\x00\x00\x01\x94\x00\x01\x00\x00\x00\x01\x00\x00\x09\x4b\
-\x00\x00\x01\x7f\x68\x1b\xde\x75\
-\x00\x00\x08\x32\x00\x00\x00\x00\x00\x01\x00\x00\x73\xe3\
-\x00\x00\x01\x7f\x68\x1b\xde\x6d\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x5d\
-\x00\x00\x01\x7f\x68\x1b\xde\x6e\
-\x00\x00\x04\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x49\x10\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x03\x34\x00\x00\x00\x00\x00\x01\x00\x00\x36\xa3\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x04\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x43\x39\
-\x00\x00\x01\x7f\x68\x1b\xde\x6d\
-\x00\x00\x02\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x33\xc7\
-\x00\x00\x01\x7f\x68\x1b\xde\x72\
-\x00\x00\x05\x14\x00\x00\x00\x00\x00\x01\x00\x00\x50\x8e\
-\x00\x00\x01\x7f\x68\x1b\xde\x75\
-\x00\x00\x09\x60\x00\x00\x00\x00\x00\x01\x00\x00\x7d\x40\
-\x00\x00\x01\x7f\x68\x1b\xde\x6d\
-\x00\x00\x07\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x69\xea\
-\x00\x00\x01\x7f\x68\x1b\xde\x74\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x28\x00\
-\x00\x00\x01\x7f\x68\x1b\xde\x6d\
-\x00\x00\x04\x12\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x57\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x02\x92\x00\x00\x00\x00\x00\x01\x00\x00\x2f\xc8\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-\x00\x00\x02\x3e\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x29\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x05\x54\x00\x00\x00\x00\x00\x01\x00\x00\x52\x13\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x04\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x46\x6a\
-\x00\x00\x01\x7f\x68\x1b\xde\x75\
-\x00\x00\x08\x60\x00\x00\x00\x00\x00\x01\x00\x00\x74\xa9\
-\x00\x00\x01\x7f\x68\x1b\xde\x6e\
-\x00\x00\x08\x08\x00\x00\x00\x00\x00\x01\x00\x00\x72\x2d\
-\x00\x00\x01\x7f\x68\x1b\xde\x70\
-\x00\x00\x05\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x53\xd0\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x09\x00\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xa3\
-\x00\x00\x01\x7f\x68\x1b\xde\x74\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x05\x05\
-\x00\x00\x01\x7f\x68\x1b\xde\x6e\
-\x00\x00\x06\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x63\xa2\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x02\x67\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x07\x30\x00\x00\x00\x00\x00\x01\x00\x00\x68\xd5\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x09\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x7b\x20\
-\x00\x00\x01\x7f\x68\x1b\xde\x6c\
-\x00\x00\x08\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x78\x83\
-\x00\x00\x01\x7f\x68\x1b\xde\x6c\
-\x00\x00\x06\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x61\x06\
-\x00\x00\x01\x7f\x68\x1b\xde\x70\
-\x00\x00\x02\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x2c\
-\x00\x00\x01\x7f\x68\x1b\xde\x72\
-\x00\x00\x05\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x58\xa0\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x06\x1c\
-\x00\x00\x01\x7f\x68\x1b\xde\x75\
-\x00\x00\x08\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x75\xc0\
-\x00\x00\x01\x7f\x68\x1b\xde\x6c\
-\x00\x00\x03\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x3c\xad\
-\x00\x00\x01\x7f\x68\x1b\xde\x73\
-\x00\x00\x07\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x4b\
-\x00\x00\x01\x7f\x68\x1b\xde\x6f\
-\x00\x00\x07\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x66\xd8\
-\x00\x00\x01\x7f\x68\x1b\xde\x72\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x03\x36\
-\x00\x00\x01\x7f\x68\x1b\xde\x71\
-\x00\x00\x01\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x25\xfb\
-\x00\x00\x01\x7f\x68\x1b\xde\x76\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,147 @@
+"""Per-pixel offset and gain correction, computed from reference captures and stored per device.
+
+A reference is a run recorded while the camera looked at a uniform target of known temperature, such as a
+blackbody. One reference corrects offsets only (fixed-pattern noise); two or more also fit each pixel's gain.
+Bad pixels found in the references, or in other runs given with --bad-pixels, are replaced by their neighbours.
+
+    python calibration.py ttyACM0 --reference data/run_3 25.0 --reference data/run_4 45.0
+    python calibration.py ttyACM0 --bad-pixels data/run_5
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import numpy as np
+import badpixels
+import comm
+import time
+import sys
+
+
+CALIBRATION_DIR = comm.DATA_DIR / "calibration"
+
+
+class Calibration:
+    """Offset and gain maps for one device, applied as corrected = raw * gain + offset, and its bad pixels."""
+
+    def __init__(self, device_id: str, gain: np.ndarray, offset: np.ndarray, references: list = None, created: float = None,
+                 bad_pixels: np.ndarray = None):
+        self.device_id = device_id
+        self.gain = gain
+        self.offset = offset
+        self.references = references if references else []  # (temperature, frames averaged) per reference
+        self.created = created if created else time.time()
+        self.set_bad_pixels(bad_pixels if bad_pixels is not None else np.zeros(gain.shape, dtype=bool))
+
+    def set_bad_pixels(self, bad_pixels: np.ndarray):
+        self.bad_pixels = bad_pixels
+        self.repair = badpixels.RepairMap(bad_pixels) if bad_pixels.any() else None
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Corrects a frame into a new array, in one multiply and one in-place add, then repairs its bad pixels in place."""
+        corrected = np.multiply(data, self.gain)
+        corrected += self.offset
+        if self.repair:
+            self.repair.apply(corrected)
+        return corrected
+
+    def path(self) -> Path:
+        return path(self.device_id)
+
+    def save(self, file: Path = None):
+        """Writes the maps to the device's file in CALIBRATION_DIR, or to file."""
+        file = file if file else self.path()
+        file.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(file, gain=self.gain, offset=self.offset, bad_pixels=self.bad_pixels,
+                 references=np.array(self.references, dtype=float).reshape(-1, 2), created=self.created)
+
+
+def path(device_id: str) -> Path:
+    return CALIBRATION_DIR / f"{device_id}.npz"
+
+
+def load(device_id: str) -> Calibration:
+    """Returns the device's stored calibration, or None if it has none."""
+    file = path(device_id)
+    if not file.exists():
+        return None
+    with np.load(file) as maps:
+        return Calibration(device_id, maps["gain"], maps["offset"],
+                           [tuple(reference) for reference in maps["references"]], float(maps["created"]),
+                           maps["bad_pixels"] if "bad_pixels" in maps else None)
+
+
+def fit(device_id: str, references: list) -> Calibration:
+    """Fits each pixel's offset and gain to reference captures.
+
+    Args:
+        references (list): (temperature, frames) pairs, frames being an (n, rows, cols) stack looking at a
+            uniform target at that temperature
+
+    Returns:
+        Calibration: offset-only for a single reference, a per-pixel least-squares line for several
+    """
+    if not references:
+        raise ValueError("at least one reference is needed")
+    temperatures = np.array([temperature for temperature, _ in references], dtype=float)
+    # Averaging each reference first removes the temporal noise, leaving the fixed pattern
+    means = np.stack([np.mean(frames, axis=0) for _, frames in references])
+    counts = [len(frames) for _, frames in references]
+    if len(references) == 1:
+        gain = np.ones(means.shape[1:])
+        offset = temperatures[0] - means[0]
+    else:
+        # Least squares of temperature against raw reading, for every pixel at once
+        if np.ptp(temperatures) == 0:
+            raise ValueError("references must be at different temperatures")
+        raw_mean = means.mean(axis=0)
+        raw_centred = means - raw_mean
+        variance = np.einsum('kij,kij->ij', raw_centred, raw_centred)
+        covariance = np.einsum('k,kij->ij', temperatures - temperatures.mean(), raw_centred)
+        # A pixel reading the same at every temperature is stuck; bad pixel detection takes care of it
+        gain = np.divide(covariance, variance, out=np.ones(variance.shape), where=variance > 0)
+        offset = temperatures.mean() - gain * raw_mean
+    return Calibration(device_id, gain, offset, list(zip(temperatures, counts)))
+
+
+def identity(device_id: str, shape: tuple = comm.DATA_FORMAT) -> Calibration:
+    """A calibration that leaves values alone, for devices that only need bad pixels repaired."""
+    return Calibration(device_id, np.ones(shape), np.zeros(shape))
+
+
+def main(argv: list[str] = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("device",
+                        help="device id the maps are stored under: the port's name, e.g. ttyACM0 or COM3")
+    parser.add_argument("--reference", nargs=2, action="append", default=[], metavar=("RUN_DIR", "TEMPERATURE"),
+                        help="run of a uniform target at TEMPERATURE °C. Repeat for a gain correction")
+    parser.add_argument("--bad-pixels", type=Path, action="append", default=[], metavar="RUN_DIR",
+                        help="another run to look for bad pixels in. Without --reference the existing maps are kept")
+    args = parser.parse_args(argv)
+    if not args.reference and not args.bad_pixels:
+        parser.error("give at least one --reference or --bad-pixels run")
+    try:
+        references = [(float(temperature), comm.load_run(Path(run_dir)))
+                      for run_dir, temperature in args.reference]
+        if references:
+            calibration = fit(args.device, references)
+        else:
+            calibration = load(args.device) or identity(args.device, comm.load_run(args.bad_pixels[0]).shape[1:])
+        # Looked for after the gain and offset correction, so fixed-pattern noise doesn't pass for bad pixels
+        bad = np.zeros(calibration.gain.shape, dtype=bool)
+        for frames in [frames for _, frames in references] + [comm.load_run(run_dir) for run_dir in args.bad_pixels]:
+            bad |= badpixels.detect(frames * calibration.gain + calibration.offset)
+        calibration.set_bad_pixels(bad)
+    except ValueError as error:
+        parser.error(str(error))
+    calibration.save()
+    for (temperature, frames), (_, count) in zip(references, calibration.references):
+        residual = calibration.apply(frames.mean(axis=0)) - temperature
+        print(f"{temperature:g} °C: {count} frames, residual {np.abs(residual).max():.3f} °C max")
+    print(f"{len(calibration.repair) if calibration.repair else 0} bad pixels: " +
+          " ".join(f"{x},{y}" for y, x in zip(*np.nonzero(calibration.bad_pixels))))
+    print(f"gain {calibration.gain.min():.3f}..{calibration.gain.max():.3f}, "
+          f"offset {calibration.offset.min():.2f}..{calibration.offset.max():.2f} °C -> {calibration.path()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""Headless acquisition: captures frames straight to a run directory without importing Qt.
+
+    python cli.py --port /dev/ttyACM0 --frames 100
+    python cli.py --port Dummy --mode SAMPLE --duration 60 --png
+    python cli.py --port /dev/ttyACM0 --port /dev/ttyACM1 --duration 60
+    python cli.py --port /dev/ttyACM0 --wire-report
+"""
+from argparse import ArgumentParser
+from serial import Serial
+from pathlib import Path
+import acquisition
+import alarms
+import asyncio
+import calibration
+import comm
+import dummy
+import events
+import filters
+import metrics
+import roi
+import store
+import tracking
+import upsample
+import time
+import sys
+from typing import Tuple
+
+
+def open_serial(port: str, baudrate: str, mode: str):
+    """Opens a real serial port, or a DummySerial when port is 'Dummy'. 'Auto' opens at the default rate."""
+    if port == "Dummy":
+        return dummy.DummySerial(dummy.get_mode_from_str(mode))
+    if baudrate == comm.AUTO_BAUDRATE:
+        baudrate = comm.DEFAULT_BAUDRATE
+    # non-blocking: the acquisition core only reads what is already waiting
+    return Serial(port, baudrate=int(baudrate), timeout=0)
+
+
+def device_ids(ports: list[str]) -> list[str]:
+    """Short, filesystem-safe names for each port, e.g. /dev/ttyACM0 -> ttyACM0, numbered when repeated."""
+    names = [Path(port).name for port in ports]
+    return [f"{name}{names[:i].count(name)}" if names.count(name) > 1 else name
+            for i, name in enumerate(names)]
+
+
+def report_failure(device_id: str, error: Exception):
+    if isinstance(error, asyncio.TimeoutError):
+        print(f"{device_id}: REQUEST TIMEOUT", file=sys.stderr)
+    elif isinstance(error, comm.ChecksumError):
+        print(f"{device_id}: CORRUPT DATAFRAME ({error})", file=sys.stderr)
+    elif isinstance(error, acquisition.FrameLost):
+        print(f"{device_id}: FRAME LOST ({error})", file=sys.stderr)
+    else:
+        print(f"{device_id}: DATAFRAME FORMAT ERROR ({error})", file=sys.stderr)
+
+
+async def acquire(serials: dict, run_dir: Path, *, frames: int = None, duration: float = None, png: bool = False,
+                  sync: bool = False, depth: int = 1, negotiate: bool = False, compress: bool = False,
+                  checksum: bool = False, rois: roi.RoiSet = None, filter_spec: str = "none",
+                  interpolation: str = upsample.NEAREST, calibrate: bool = True, triggers: str = None,
+                  hold: int = events.HOLD_FRAMES, alarm_specs: list[str] = None,
+                  tracking_spec: str = None) -> metrics.Counters:
+    """Streams frames from every device until the frame count or duration is reached, saving each to run_dir.
+
+    Everything after run_dir is keyword-only, so options can be added without shifting the others.
+
+    Args:
+        serials (dict): open serial ports keyed by device id
+        sync (bool, optional): trigger all devices together and record the synchronized sets. Defaults to False.
+        depth (int, optional): sequenced requests kept in flight per device; 1 uses the plain protocol. Defaults to 1.
+        negotiate (bool, optional): negotiate the fastest baudrate with each device first. Defaults to False.
+        compress (bool, optional): ask each device for compressed dataframes. Defaults to False.
+        checksum (bool, optional): ask each device to checksum its dataframes. Defaults to False.
+        rois (roi.RoiSet, optional): regions to evaluate on every frame. Defaults to None.
+        filter_spec (str, optional): temporal filter applied to each device's frames, see filters.make. Defaults to "none".
+        interpolation (str, optional): how pngs are upsampled, one of upsample.METHODS. Defaults to nearest.
+        calibrate (bool, optional): apply each device's stored calibration, if it has one. Defaults to True.
+        triggers (str, optional): only save frames that differ from the background like this, and hold frames after
+            each, see events.parse_triggers. Defaults to None, saving every frame.
+        alarm_specs (list[str], optional): alarms checked on every frame as it's parsed, see alarms.Alarm. Changes
+            are printed and logged to alarms.csv straight away. Defaults to None.
+        tracking_spec (str, optional): follow hot blobs across every frame, saved or not, and record them in
+            tracks.csv, see tracking.parse_tracking. Defaults to None.
+    """
+    manager = acquisition.DeviceManager()
+    alarm_log = alarms.AlarmLog(run_dir) if alarm_specs else None
+
+    def report_alarm(device_id: str, event: alarms.AlarmEvent):
+        alarm_log.write(device_id, event)
+        print(f"{device_id}: ALARM {event.describe()}", file=sys.stderr, flush=True)
+
+    for device_id, serial in serials.items():
+        maps = calibration.load(device_id) if calibrate else None
+        if maps:
+            print(f"{device_id}: calibrated against {len(maps.references)} reference(s), "
+                  f"{time.strftime('%Y-%m-%d', time.localtime(maps.created))}")
+        manager.add(serial, device_id,
+                    on_message=lambda line, device_id=device_id: print(f"{device_id}: {line}", file=sys.stderr),
+                    calibration=maps,
+                    alarms=alarms.AlarmSet(alarm_specs, rois) if alarm_specs else None, on_alarm=report_alarm)
+    run_store = store.RunStore(run_dir, list(serials), rois, interpolation)
+    frame_filters = {device_id: filters.make(filter_spec) for device_id in serials}
+
+    gates = {device_id: events.Gate(events.EventDetector(**events.parse_triggers(triggers)), hold)
+             for device_id in serials} if triggers else {}
+    trackers = {device_id: tracking.Tracker(**tracking.parse_tracking(tracking_spec))
+                for device_id in serials} if tracking_spec else {}
+
+    def process(frame: acquisition.Frame) -> Tuple[bool, events.Event, list[tracking.Track]]:
+        """Filters a frame, tracks its hotspots and decides whether it's kept."""
+        frame.data = frame_filters[frame.device_id].apply(frame.data)
+        keep, event = gates[frame.device_id].check(frame.data) if gates else (True, None)
+        tracks = trackers[frame.device_id].update(frame.data) if trackers else []
+        frame.stamps.stamp("processed")
+        return keep, event, tracks
+
+    def finish(frame: acquisition.Frame, number: int = None, event: events.Event = None,
+               tracks: list[tracking.Track] = None):
+        if event:
+            run_store.save_event(frame, number, event)
+        if tracks:
+            run_store.save_tracks(frame, number, tracks)
+        if number:
+            frame.stamps.stamp("saved")
+        frame.stamps.finish()
+
+    manager.start()
+    if compress:
+        for device_id, enabled in (await manager.set_compression()).items():
+            if not enabled:
+                print(f"{device_id}: compression not supported, using plain dataframes", file=sys.stderr)
+    if checksum:
+        for device_id, enabled in (await manager.set_checksum()).items():
+            if not enabled:
+                print(f"{device_id}: checksums not supported, frames are unverified", file=sys.stderr)
+    if negotiate:
+        for device_id, (rate, fps) in (await manager.negotiate()).items():
+            print(f"{device_id}: {rate} baud, {fps:.2f} frames/s")
+    # frames used to measure the negotiated rate aren't part of the run
+    baseline = manager.counters().frames
+    start = time.monotonic()
+    try:
+        if sync:
+            async for frame_set in manager.sync_stream(frames, duration, on_failure=report_failure):
+                decisions = {device_id: process(frame) for device_id, frame in frame_set.frames.items()}
+                # a set is kept whole if any of its frames is
+                numbers = run_store.save_set(frame_set, png) \
+                    if any(keep for keep, _, _ in decisions.values()) else {}
+                for device_id, frame in frame_set.frames.items():
+                    finish(frame, numbers.get(device_id), *decisions[device_id][1:])
+        else:
+            async for frame in manager.stream(frames, duration, report_failure, depth):
+                keep, event, tracks = process(frame)
+                finish(frame, run_store.save(frame, png) if keep else None, event, tracks)
+    finally:
+        manager.close()
+        run_store.close()
+        if alarm_log:
+            alarm_log.close()
+    for device_id, device in manager.devices.items():
+        device.frame_timer.write(run_store.device_dir(device_id))
+        for line in device.frame_timer.summary():
+            print(f"{device_id} {line}")
+    for device_id, gate in gates.items():
+        print(f"{device_id}: {gate.events} events, kept {gate.kept} of {gate.seen} frames")
+    for device_id, tracker in trackers.items():
+        print(f"{device_id}: {tracker.next_id - 1} hotspot tracks")
+    if sync:
+        print(f"trigger skew: {manager.skew.summary()}")
+        print(f"arrival spread: {manager.spread.summary()}")
+    counters = manager.counters()
+    counters.frames -= baseline
+    elapsed = time.monotonic() - start
+    print(f"{counters.frames} frames in {elapsed:.1f} s ({counters.frames / elapsed:.2f} frames/s), "
+          f"{counters.timeouts} timeouts, {counters.parse_errors} parse errors, "
+          f"{counters.corrupt} corrupt ({counters.retries} re-requested), "
+          f"{counters.lost} lost, {counters.duplicates} duplicates, {counters.alarms} alarm changes -> {run_dir}")
+    return counters
+
+
+async def wire_report(serial, frames: int = 20):
+    """Measures the bytes per frame with plain and compressed dataframes, and the frame rate each allows per baudrate."""
+    device = acquisition.Device(serial)
+    device.start()
+    sizes = {}
+    try:
+        for encoding in ("plain", "compressed"):
+            if encoding == "compressed" and not await device.set_compression(True):
+                print("device doesn't support compression", file=sys.stderr)
+                break
+            start_frames, start_bytes = device.counters.frames, device.counters.bytes
+            async for frame in device.stream(frames, on_failure=report_failure):
+                pass
+            received = device.counters.frames - start_frames
+            if received:
+                sizes[encoding] = (device.counters.bytes - start_bytes) / received
+        if "compressed" in sizes:
+            await device.set_compression(False)
+    finally:
+        device.close()
+    print("bytes/frame: " + ", ".join(f"{encoding} {size:.0f}" for encoding, size in sizes.items()))
+    print("baudrate  " + "  ".join(f"{encoding + ' fps':>15}" for encoding in sizes))
+    for rate in comm.list_baudrates():
+        if rate.isdigit():
+            print(f"{rate:>8}  " + "  ".join(f"{comm.frame_rate(int(rate), size):15.2f}" for size in sizes.values()))
+    return sizes
+
+
+def main(argv: list[str] = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    ports = parser.add_mutually_exclusive_group(required=True)
+    ports.add_argument("--port", action="append",
+                       help="serial port, or 'Dummy' for simulated data. Repeat for several cameras")
+    ports.add_argument("--all", action="store_true",
+                       help="acquire from every serial port found")
+    parser.add_argument("--baudrate", default="115200", choices=comm.list_baudrates(),
+                        help="'Auto' negotiates the fastest rate each camera supports")
+    parser.add_argument("--mode", default="RANDOM", choices=dummy.get_modes(),
+                        help="data mode when --port is Dummy")
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument("--frames", type=int,
+                       help="number of frames to capture (default 1)")
+    limit.add_argument("--duration", type=float,
+                       help="stream for this many seconds")
+    parser.add_argument("--run-dir", type=Path,
+                        help="output directory (default: next data/run_N)")
+    parser.add_argument("--sync", action="store_true",
+                        help="trigger all cameras together; --frames then counts synchronized sets")
+    parser.add_argument("--pipeline", type=int, default=1, metavar="DEPTH",
+                        help="keep DEPTH sequenced requests in flight per camera (needs sequence-aware firmware)")
+    parser.add_argument("--compress", action="store_true",
+                        help="ask the cameras for compressed dataframes")
+    parser.add_argument("--checksum", action="store_true",
+                        help="ask the cameras to checksum each dataframe; corrupt frames are rejected and re-requested")
+    parser.add_argument("--roi", type=Path, metavar="FILE",
+                        help="JSON file of regions of interest whose mean/max/min are saved for every frame")
+    parser.add_argument("--filter", default="none", metavar="SPEC",
+                        help="temporal filter before saving: mean:N, ema:ALPHA, median:N or none")
+    parser.add_argument("--no-calibration", action="store_true",
+                        help="save raw values even for cameras with a stored calibration")
+    parser.add_argument("--trigger", nargs="?", const=events.DEFAULT_TRIGGERS, metavar="SPEC",
+                        help="only save frames that differ from a rolling background, e.g. delta:2,pixels:4,hotspot:5 "
+                        f"(default {events.DEFAULT_TRIGGERS})")
+    parser.add_argument("--hold", type=int, default=events.HOLD_FRAMES,
+                        help="frames saved after each triggering frame")
+    parser.add_argument("--track", nargs="?", const=tracking.DEFAULT_TRACKING, metavar="SPEC",
+                        help="follow hot blobs from frame to frame and record them in tracks.csv, "
+                        f"e.g. above:35,distance:3 (default {tracking.DEFAULT_TRACKING})")
+    parser.add_argument("--alarm", action="append", default=[], metavar="SPEC",
+                        help="alert as soon as a frame crosses a limit, e.g. max>45, rate>2 (°C/s) or roi:NAME>40. "
+                        "Repeatable; changes are logged to alarms.csv")
+    parser.add_argument("--wire-report", action="store_true",
+                        help="measure plain and compressed frame sizes and the frame rate at each baudrate, then exit")
+    parser.add_argument("--png", action="store_true",
+                        help="also render each frame to a png")
+    parser.add_argument("--interpolation", default=upsample.NEAREST, choices=upsample.METHODS,
+                        help="how --png upsamples the sensor pixels")
+    args = parser.parse_args(argv)
+    if args.frames is None and args.duration is None:
+        args.frames = 1
+
+    if args.wire_report:
+        port = args.port[0] if args.port else comm.list_serial_ports()[-1]
+        try:
+            return 0 if asyncio.run(wire_report(open_serial(port, args.baudrate, args.mode))) else 1
+        except (OSError, acquisition.StreamFailed) as error:
+            print(f"wire report failed: {error}", file=sys.stderr)
+            return 1
+
+    try:
+        rois = roi.load(args.roi) if args.roi else None
+    except (OSError, ValueError) as error:
+        parser.error(f"--roi: {error}")
+    try:
+        filters.make(args.filter)
+    except ValueError as error:
+        parser.error(f"--filter: {error}")
+    try:
+        if args.trigger:
+            events.parse_triggers(args.trigger)
+    except ValueError as error:
+        parser.error(f"--trigger: {error}")
+    try:
+        if args.track:
+            tracking.parse_tracking(args.track)
+    except ValueError as error:
+        parser.error(f"--track: {error}")
+    try:
+        alarms.AlarmSet(args.alarm, rois)
+    except ValueError as error:
+        parser.error(f"--alarm: {error}")
+
+    if args.run_dir:
+        run_dir = args.run_dir
+        run_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        run_dir = comm.init_run(comm.get_run())
+    port_names = args.port if args.port else comm.list_serial_ports()[1:]
+    try:
+        for directory in store.device_dirs(run_dir, device_ids(port_names)).values():
+            if directory.exists():
+                store.stored_frames(directory)
+    except ValueError as error:
+        parser.error(f"--run-dir: {error}")
+    serials = {device_id: open_serial(port, args.baudrate, args.mode)
+               for device_id, port in zip(device_ids(port_names), port_names)}
+
+    try:
+        counters = asyncio.run(acquire(
+            serials, run_dir, frames=args.frames, duration=args.duration, png=args.png, sync=args.sync,
+            depth=args.pipeline, negotiate=args.baudrate == comm.AUTO_BAUDRATE, compress=args.compress,
+            checksum=args.checksum, rois=rois, filter_spec=args.filter, interpolation=args.interpolation,
+            calibrate=not args.no_calibration, triggers=args.trigger, hold=args.hold, alarm_specs=args.alarm,
+            tracking_spec=args.track))
+    except (OSError, acquisition.StreamFailed) as error:
+        # frames saved so far stay in run_dir
+        print(f"acquisition failed: {error} -> {run_dir}", file=sys.stderr)
+        return 1
+    return 0 if counters.frames else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
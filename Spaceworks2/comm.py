@@ -1,26 +1,81 @@
 from serial.tools import list_ports
 from pathlib import Path
 import numpy as np
+import binascii
+import base64
+import zlib
 import os
 import re
+from typing import Tuple
 
 
 REQUEST_COMMAND = 'r'.encode('utf-8')
 REQUEST_TIMEOUT = 5  # seconds
+FAILURE_LIMIT = 10  # failed frames in a row after which a stream gives up
 
 PING_COMMAND = 'p'.encode('utf-8')
 PING_RESPONSE = 'o'.encode('utf-8')
 PING_TIMEOUT = 0.5  # seconds
 PING_INTERVAL = 5  # seconds
 
+# <B> asks the device for its baudrates, answered <B9600,19200,...>
+# <b460800> switches, acknowledged with <b460800> before the device changes rate.
+# The device returns to its previous rate if no ping arrives within BAUD_REVERT_TIMEOUT.
+BAUD_QUERY_COMMAND = 'B'.encode('utf-8')
+BAUD_SET_COMMAND = 'b'.encode('utf-8')
+BAUD_SETTLE = 0.05  # seconds both ends wait before using a new rate
+BAUD_REVERT_TIMEOUT = 1  # seconds
+BAUD_VERIFY_PINGS = 3
+AUTO_BAUDRATE = "Auto"
+DEFAULT_BAUDRATE = 115200
+
 DF_START_SEQ = '['.encode('utf-8')
 DF_END_SEQ = ']'.encode('utf-8')
 
+# A sequenced request <r17> is answered with [#17;...]
+SEQ_START = '#'
+SEQ_END = ';'
+SEQ_MODULUS = 65536
+
+# <k1> asks the device to end every dataframe with *XXXXXXXX, the CRC-32 in hex of everything between
+# the brackets before the *, sequence number included. <k0> turns it off; both are echoed as the ack.
+CHECKSUM_COMMAND = 'k'.encode('utf-8')
+CHECKSUM_SEP = '*'.encode('utf-8')
+CHECKSUM_LENGTH = 8
+CORRUPT_RETRIES = 2  # times an unsequenced request is repeated after a corrupt reply
+
 CMD_START_SEQ = '<'.encode('utf-8')
 CMD_END_SEQ = '>'.encode('utf-8')
 
+
+def encode_command(cmd: bytes) -> bytes:
+    """Frames a command so it can be sent in a single write"""
+    return CMD_START_SEQ + cmd + CMD_END_SEQ
+
+
+def sequenced_request(seq: int) -> bytes:
+    """A request command carrying a sequence number for the device to echo back"""
+    return REQUEST_COMMAND + str(seq).encode('utf-8')
+
+
+# Commands framed once up front
+ENCODED_COMMANDS = {cmd: encode_command(cmd)
+                    for cmd in (REQUEST_COMMAND, PING_COMMAND)}
+
 DATA_FORMAT = (24, 32)
 
+# <z1> asks the device for compressed dataframes, <z0> for plain text; both are echoed as the ack.
+# Sending <z1> again restarts the encoding with a keyframe.
+# A compressed payload is ~K17: (keyframe) or ~D17: (difference from frame 16) followed by base64 of the
+# zlib-compressed little endian int16 values in hundredths of a degree. The number counts frames sent.
+COMPRESS_COMMAND = 'z'.encode('utf-8')
+COMPRESSED_PREFIX = '~'
+COMPRESSED_HEADER_END = ':'
+KEYFRAME = 'K'
+DELTAFRAME = 'D'
+KEYFRAME_INTERVAL = 30  # frames between keyframes, bounds how long a lost frame stops deltas decoding
+VALUE_SCALE = 100
+
 SCRIPT_DIR = Path(__file__)
 DATA_DIR = (SCRIPT_DIR.parent.parent / "data").resolve()
 
@@ -36,8 +91,14 @@ def list_serial_ports() -> list[str]:
 
 
 def list_baudrates() -> list[str]:
-    """Lists baudrates to be used for serial communication."""
-    return ["9600", "19200", "28800", "38400", "57600", "76800", "115200"]
+    """Lists baudrates to be used for serial communication. 'Auto' negotiates the fastest the device supports."""
+    return [AUTO_BAUDRATE, "9600", "19200", "28800", "38400", "57600", "76800", "115200",
+            "230400", "460800", "921600", "1000000", "2000000"]
+
+
+def parse_baudrates(reply: str) -> list[int]:
+    """Parses the device's answer to a baudrate query, e.g. 'B9600,115200'"""
+    return [int(rate) for rate in reply[len(BAUD_QUERY_COMMAND):].split(',') if rate.strip().isdigit()]
 
 
 def process_data(raw: str) -> np.ndarray:
@@ -47,6 +108,85 @@ def process_data(raw: str) -> np.ndarray:
     return np.rot90(array, k=2)
 
 
+def save_csv(data: np.ndarray, path: Path):
+    """Saves a data array as a csv, one row per line."""
+    with open(path, 'w') as file:
+        for y in data:
+            file.write(",".join([str(x) for x in y]) + ';\n')
+
+
+def load_csv(path: Path) -> np.ndarray:
+    """Reads a frame written by save_csv."""
+    with open(path, 'r') as file:
+        return np.array([[float(x) for x in line.strip().rstrip(';').split(',')]
+                         for line in file if line.strip()])
+
+
+class FrameEncoder:
+    """Device side of the compressed encoding, used by DummySerial and to measure the savings."""
+
+    def __init__(self):
+        self.reference = None
+        self.count = 0
+
+    def encode(self, values: np.ndarray) -> str:
+        """Encodes a frame's values, in the order the device sends them, as a compressed payload."""
+        scaled = np.round(np.ravel(values) * VALUE_SCALE).astype('<i2')
+        if self.reference is None or self.count % KEYFRAME_INTERVAL == 0:
+            kind, body = KEYFRAME, scaled
+        else:
+            # int16 arithmetic wraps around, and the decoder wraps back the same way
+            kind, body = DELTAFRAME, scaled - self.reference
+        self.reference = scaled
+        header = COMPRESSED_PREFIX + kind + str(self.count) + COMPRESSED_HEADER_END
+        self.count = (self.count + 1) % SEQ_MODULUS
+        return header + base64.b64encode(zlib.compress(body.tobytes())).decode('ascii')
+
+
+class FrameDecoder:
+    """Parses the dataframes of one device, plain or compressed, keeping the frame deltas apply to."""
+
+    def __init__(self):
+        self.reference = None
+        self.count = None
+
+    def decode(self, raw: str) -> np.ndarray:
+        """Converts a dataframe payload to a 2d array. Raises ValueError if it's malformed or its reference was missed."""
+        if not raw.startswith(COMPRESSED_PREFIX):
+            return process_data(raw)
+        header, _, body = raw.partition(COMPRESSED_HEADER_END)
+        kind, count = header[1:2], header[2:]
+        if not count.isdigit():
+            raise ValueError(f"bad compressed header {header!r}")
+        try:
+            values = np.frombuffer(zlib.decompress(
+                base64.b64decode(body, validate=True)), dtype='<i2')
+        except (binascii.Error, zlib.error) as error:
+            raise ValueError(f"corrupt compressed dataframe: {error}")
+        if values.size != DATA_FORMAT[0] * DATA_FORMAT[1]:
+            raise ValueError(
+                f"expected {DATA_FORMAT[0] * DATA_FORMAT[1]} values, got {values.size}")
+        if kind == DELTAFRAME:
+            if self.count is None or (self.count + 1) % SEQ_MODULUS != int(count):
+                self.reference = self.count = None
+                raise ValueError(f"delta frame {count} without its reference")
+            values = self.reference + values
+        elif kind != KEYFRAME:
+            raise ValueError(f"unknown frame kind {kind!r}")
+        self.reference = values
+        self.count = int(count)
+        array = np.reshape(values / VALUE_SCALE, DATA_FORMAT)
+        return np.rot90(array, k=2)
+
+    def reset(self):
+        self.reference = self.count = None
+
+
+def frame_rate(baudrate: int, frame_bytes: float) -> float:
+    """Upper bound on frames per second for frames of frame_bytes on the wire at 8N1, 10 bits a byte."""
+    return baudrate / 10 / frame_bytes
+
+
 def get_run() -> int:
     """Checks which run folders exist and generates the next run number"""
     runs = [int(re.search("\d+", str(path.stem)).group())
@@ -61,12 +201,31 @@ def init_run(run: int) -> Path:
     return run_dir
 
 
+def frame_files(run_dir: Path) -> dict:
+    """Frame number -> path of every frame_N.csv in a directory, leaving out frame_stats.csv and the like."""
+    return {int(file.stem.split('_')[1]): file for file in run_dir.glob("frame_*.csv")
+            if file.stem.split('_')[1].isdigit()}
+
+
+def load_run(run_dir: Path) -> np.ndarray:
+    """Reads every frame_N.csv in a run directory as an (n, rows, cols) stack."""
+    files = frame_files(run_dir)
+    if not files:
+        raise ValueError(f"no frames in {run_dir}")
+    return np.stack([load_csv(files[number]) for number in sorted(files)])
+
+
 def remove_run_dir(run: int):
     """removes a run folder"""
     run_dir = DATA_DIR / f"run_{run}"
     os.rmdir(run_dir)
 
 
+def strip_line(raw: bytes) -> bytes:
+    """Removes the trailing newline, with or without a carriage return"""
+    return raw.rstrip(b'\r\n')
+
+
 def is_command(raw: bytes) -> bool:
     return True if raw[0] == int.from_bytes(CMD_START_SEQ, 'little') and raw[-1] == int.from_bytes(CMD_END_SEQ, 'little') else False
 
@@ -75,9 +234,58 @@ def decode_command(raw: bytes) -> str:
     return raw[1:-1].decode('utf-8')
 
 
+class ChecksumError(ValueError):
+    """A dataframe whose checksum doesn't match its contents, or that arrived truncated."""
+
+
+def add_checksum(content: bytes) -> bytes:
+    """Appends the checksum the device sends after a dataframe's contents"""
+    return content + CHECKSUM_SEP + b'%08X' % zlib.crc32(content)
+
+
+def verify_checksum(content: bytes, required: bool = False) -> bytes:
+    """Strips and checks a dataframe's checksum, if it has one. Raises ChecksumError on a mismatch.
+
+    Runs before any parsing, so a corrupt frame costs a single crc32 over the bytes.
+
+    Args:
+        required (bool, optional): checksums were turned on, so a frame without one (or whose separator was
+            corrupted) is rejected rather than passed on unchecked. Defaults to False.
+    """
+    if content[-CHECKSUM_LENGTH - 1:-CHECKSUM_LENGTH] != CHECKSUM_SEP:
+        if required:
+            raise ChecksumError("missing checksum")
+        return content
+    body, checksum = content[:-CHECKSUM_LENGTH - 1], content[-CHECKSUM_LENGTH:]
+    try:
+        expected = int(checksum, 16)
+    except ValueError:
+        raise ChecksumError(f"malformed checksum {checksum!r}")
+    if zlib.crc32(body) != expected:
+        raise ChecksumError("checksum mismatch")
+    return body
+
+
+def is_partial_dataframe(raw: bytes) -> bool:
+    """A line with only one of the dataframe delimiters, i.e. a dataframe that lost bytes on the way"""
+    return raw[:1] == DF_START_SEQ or raw[-1:] == DF_END_SEQ
+
+
 def is_dataframe(raw: bytes) -> bool:
     return True if raw[0] == int.from_bytes(DF_START_SEQ, 'little') and raw[-1] == int.from_bytes(DF_END_SEQ, 'little') else False
 
 
-def decode_df(raw: bytes) -> str:
-    return raw[1:-1].decode('utf-8')
+def decode_df(raw: bytes, checksum: bool = False) -> str:
+    """Returns a dataframe's contents after verifying its checksum, required if checksum. Raises ChecksumError."""
+    try:
+        return verify_checksum(raw[1:-1], checksum).decode('utf-8')
+    except UnicodeDecodeError:
+        raise ChecksumError("dataframe isn't valid text")
+
+
+def split_sequence(df: str) -> Tuple[int, str]:
+    """Splits the echoed sequence number off a decoded dataframe. The number is None for unsequenced frames"""
+    if df.startswith(SEQ_START):
+        head, _, payload = df.partition(SEQ_END)
+        return int(head[len(SEQ_START):]), payload
+    return None, df
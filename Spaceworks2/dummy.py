@@ -1,6 +1,7 @@
 from argparse import ArgumentError
 import numpy
 import re
+import time
 import comm
 
 
@@ -16,6 +17,9 @@ MODE_DICT = {
     "LINEAR": LINEAR
 }
 
+# Rates the simulated device can switch to
+BAUDRATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600, 2000000]
+
 NUM_VALS = 24*32
 RANGE = (10, 30)
 SPAN = RANGE[1]-RANGE[0]
@@ -25,60 +29,131 @@ class DummySerial:
     """Dummy serial port that can send SAMPLE camera data, LINEAR sweep, or RANDOM data
     """
 
-    def __init__(self, mode: int = RANDOM):
+    def __init__(self, mode: int = RANDOM, corruption: float = 0.0):
         """The one and only constructor. deal with it
 
         Args:
             mode (int, optional): data mode, either SAMPLE,LINEAR,or RANDOM. Defaults to SAMPLE.
+            corruption (float, optional): probability of a bit flipping in each dataframe, to simulate a noisy link. Defaults to 0.
         """
         self.mode = mode
-        self.requested = False
-        self.pinged = False
+        self.corruption = corruption
+        # the host side's rate, set by the host like on a real port
+        self.baudrate = comm.DEFAULT_BAUDRATE
+        # the simulated device's rate; nothing gets through while they differ
+        self.device_baudrate = comm.DEFAULT_BAUDRATE
+        # rate to return to if the switch isn't confirmed by a ping, and when it was made
+        self.fallback_baudrate = None
+        self.switched_at = 0
+        # set while the host has asked for compressed dataframes
+        self.encoder = None
+        self.checksum = False
+        # bytes written by the host that haven't formed a complete command yet
+        self.input = bytearray()
+        # replies waiting to be read by the host
+        self.output = bytearray()
+
+    def generate_text(self) -> str:
+        """Generates the comma separated values of one frame in the current mode."""
+        if self.mode == LINEAR:
+            return str([float('{:.2f}'.format(
+                float(SPAN*i/NUM_VALS)+RANGE[0])) for i in range(NUM_VALS)])[1:-1]
+        elif self.mode == RANDOM:
+            lst = []
+            for i in range(NUM_VALS):
+                lst.append('{:.2f}'.format(
+                    numpy.random.randint(RANGE[0]*10, RANGE[1]*10)*0.1))
+            return ", ".join(lst)
+        elif self.mode == SAMPLE:
+            lst = []
+            with open(comm.DATA_DIR/"SAMPLE_DATA.csv", 'r') as file:
+                for line in file.readlines():
+                    for item in re.split(',', line):
+                        # the file's line breaks would end the dataframe early
+                        lst.append(item.strip())
+            return ", ".join(lst)
+        else:
+            raise ArgumentError("invalid mode")
+
+    def generate_payload(self) -> str:
+        """One frame as the device would send it, compressed if the host asked for it."""
+        text = self.generate_text()
+        if self.encoder is None:
+            return text
+        return self.encoder.encode(numpy.array(text.split(','), dtype=float))
+
+    def queue_dataframe(self, content: str):
+        """Frames a dataframe, with its checksum if the host asked for one, and maybe damages it."""
+        data = content.encode('utf-8')
+        if self.checksum:
+            data = comm.add_checksum(data)
+        data = bytearray(comm.DF_START_SEQ + data + comm.DF_END_SEQ)
+        if numpy.random.random() < self.corruption:
+            data[numpy.random.randint(len(data))] ^= 1 << numpy.random.randint(7)
+        self.output += data + '\n'.encode('utf-8')
+
+    def respond(self, cmd: bytes):
+        """Queues the reply to a single decoded command."""
+        if self.fallback_baudrate and time.monotonic() - self.switched_at > comm.BAUD_REVERT_TIMEOUT:
+            self.device_baudrate = self.fallback_baudrate
+            self.fallback_baudrate = None
+        if self.baudrate != self.device_baudrate:
+            return
+        if cmd == comm.PING_COMMAND:
+            # confirms a pending switch
+            self.fallback_baudrate = None
+        if cmd == comm.BAUD_QUERY_COMMAND:
+            self.output += comm.encode_command(
+                comm.BAUD_QUERY_COMMAND + ",".join(str(rate) for rate in BAUDRATES).encode('utf-8')) + '\n'.encode('utf-8')
+        elif cmd.startswith(comm.BAUD_SET_COMMAND) and cmd[1:].isdigit() and int(cmd[1:]) in BAUDRATES:
+            self.output += comm.encode_command(cmd) + '\n'.encode('utf-8')
+            self.fallback_baudrate = self.device_baudrate
+            self.switched_at = time.monotonic()
+            self.device_baudrate = int(cmd[1:])
+        elif cmd in (comm.COMPRESS_COMMAND + b'0', comm.COMPRESS_COMMAND + b'1'):
+            self.encoder = comm.FrameEncoder() if cmd.endswith(b'1') else None
+            self.output += comm.encode_command(cmd) + '\n'.encode('utf-8')
+        elif cmd in (comm.CHECKSUM_COMMAND + b'0', comm.CHECKSUM_COMMAND + b'1'):
+            self.checksum = cmd.endswith(b'1')
+            self.output += comm.encode_command(cmd) + '\n'.encode('utf-8')
+        elif cmd.startswith(comm.REQUEST_COMMAND) and cmd[1:].isdigit():
+            # sequenced request, echo the number ahead of the data
+            self.queue_dataframe(comm.SEQ_START + cmd[1:].decode('utf-8') +
+                                 comm.SEQ_END + self.generate_payload())
+        elif cmd == comm.REQUEST_COMMAND:
+            self.queue_dataframe(self.generate_payload())
+        elif cmd == comm.PING_COMMAND:
+            self.output += comm.CMD_START_SEQ + comm.PING_RESPONSE + \
+                comm.CMD_END_SEQ + '\n'.encode('utf-8')
 
     def readline(self) -> bytes:
-        if self.requested:
-            if self.mode == LINEAR:
-                text = str([float('{:.2f}'.format(
-                    float(SPAN*i/NUM_VALS)+RANGE[0])) for i in range(NUM_VALS)])[1:-1]
-            elif self.mode == RANDOM:
-                lst = []
-                for i in range(NUM_VALS):
-                    lst.append('{:.2f}'.format(
-                        numpy.random.randint(RANGE[0]*10, RANGE[1]*10)*0.1))
-                text = ", ".join(lst)
-            elif self.mode == SAMPLE:
-                lst = []
-                with open(comm.DATA_DIR/"SAMPLE_DATA.csv", 'r') as file:
-                    for line in file.readlines():
-                        for item in re.split(',', line):
-                            lst.append(item)
-
-                text = ", ".join(lst)
-            else:
-                raise ArgumentError("invalid mode")
-
-            self.requested = False
-            data_frame = comm.DF_START_SEQ + \
-                bytes(text, encoding='utf-8') + comm.DF_END_SEQ
-            return data_frame
-        elif self.pinged:
-            self.pinged = False
-            return comm.CMD_START_SEQ + comm.PING_RESPONSE + comm.CMD_END_SEQ + '\n'.encode('utf-8')
+        end = self.output.find(b'\n') + 1 or len(self.output)
+        return self.read(end)
 
     def readlines(self) -> list[bytes]:
         return [self.readline()]
 
+    def read(self, size: int = 1) -> bytes:
+        data = bytes(self.output[:size])
+        del self.output[:size]
+        return data
+
     def isOpen(self) -> bool:
         return True
 
-    def inWaiting(self) -> bool:
-        return True if self.requested or self.pinged else False
-
-    def write(self, cmd: bytes):
-        if cmd == comm.REQUEST_COMMAND:
-            self.requested = True
-        elif cmd == comm.PING_COMMAND:
-            self.pinged = True
+    def inWaiting(self) -> int:
+        return len(self.output)
+
+    def write(self, data: bytes):
+        """Accepts command bytes in any split, answering each complete <cmd> as it is closed."""
+        self.input += data
+        while True:
+            start = self.input.find(comm.CMD_START_SEQ)
+            end = self.input.find(comm.CMD_END_SEQ, start + 1)
+            if start < 0 or end < 0:
+                break
+            self.respond(bytes(self.input[start + 1:end]))
+            del self.input[:end + 1]
 
     def flush(self):
         return
@@ -0,0 +1,133 @@
+"""Change detection against a rolling background, so unattended runs only keep frames where something happens.
+
+Triggers are given as a comma separated spec, e.g. 'delta:2,pixels:4,hotspot:5': a frame is an event when
+at least 4 pixels differ from the background by more than 2 °C, or its hottest pixel is 5 °C above the
+background's hottest.
+"""
+import numpy as np
+from typing import Tuple
+
+
+DEFAULT_TRIGGERS = "delta:2,pixels:4"
+BACKGROUND_ALPHA = 0.05  # weight of each quiet frame in the background
+EVENT_ALPHA_FACTOR = 0.1  # triggering frames are learnt this much slower, so lasting changes fade into the background
+WARMUP_FRAMES = 10  # frames learnt as background before anything can trigger
+HOLD_FRAMES = 5  # frames kept after the last triggering one
+
+
+class Event:
+    """Why a frame differed from the background."""
+
+    def __init__(self, reasons: list[str], changed: int, max_delta: float, hotspot: float):
+        self.reasons = reasons
+        self.changed = changed  # pixels beyond the delta threshold
+        self.max_delta = max_delta  # largest absolute difference from the background, °C
+        self.hotspot = hotspot  # frame max minus background max, °C
+
+    def describe(self) -> str:
+        return "+".join(self.reasons)
+
+
+class EventDetector:
+    """Per-pixel exponential background of one device's quiet frames, and the triggers a new frame is held against.
+
+    Triggering frames are learnt slowly rather than not at all: a passing event barely touches the background,
+    while a lasting change (a door left open, the sun moving) stops triggering after a while.
+    """
+
+    def __init__(self, delta: float = 2.0, pixels: int = 4, hotspot: float = None,
+                 alpha: float = BACKGROUND_ALPHA, warmup: int = WARMUP_FRAMES):
+        self.delta = delta
+        self.pixels = pixels
+        self.hotspot = hotspot
+        self.alpha = alpha
+        self.warmup = warmup
+        self.reset()
+
+    def reset(self):
+        self.background = None
+        self.learnt = 0
+
+    def check(self, data: np.ndarray) -> Event:
+        """Compares a frame with the background, learning it if nothing triggered. Returns the Event or None."""
+        if self.background is None:
+            self.background = np.array(data, dtype=float)
+            self.learnt = 1
+            return None
+        difference = data - self.background
+        magnitude = np.abs(difference)
+        changed = int(np.count_nonzero(magnitude > self.delta)) if self.delta is not None else 0
+        hotspot = float(data.max() - self.background.max())
+        event = None
+        if self.learnt >= self.warmup:
+            reasons = []
+            if self.delta is not None and changed >= self.pixels:
+                reasons.append("delta")
+            if self.hotspot is not None and hotspot > self.hotspot:
+                reasons.append("hotspot")
+            if reasons:
+                event = Event(reasons, changed, float(magnitude.max()), hotspot)
+        difference *= self.alpha if event is None else self.alpha * EVENT_ALPHA_FACTOR
+        self.background += difference
+        self.learnt += 1
+        return event
+
+
+def parse_spec(spec: str, kinds: dict, what: str) -> dict:
+    """Parses a comma separated spec of name:value options, like the trigger and tracking specs. Raises ValueError.
+
+    Args:
+        kinds (dict): option name -> type its value is converted to
+        what (str): what an option is called in error messages, e.g. "trigger"
+
+    Returns:
+        dict: option name -> value
+    """
+    options = {}
+    for item in spec.split(','):
+        name, _, value = item.strip().partition(':')
+        if name not in kinds:
+            raise ValueError(f"unknown {what} {name!r}, expected one of {', '.join(kinds)}")
+        try:
+            options[name] = kinds[name](value)
+        except ValueError:
+            raise ValueError(f"{what} {name} needs a number, got {value!r}")
+    return options
+
+
+def parse_triggers(spec: str) -> dict:
+    """Turns a trigger spec into EventDetector keyword arguments. Raises ValueError."""
+    kwargs = parse_spec(spec, {"delta": float, "pixels": int, "hotspot": float, "alpha": float, "warmup": int},
+                        "trigger")
+    if "hotspot" in kwargs and "delta" not in kwargs and "pixels" not in kwargs:
+        # hotspot on its own
+        kwargs["delta"] = None
+    return kwargs
+
+
+class Gate:
+    """Decides which frames of one device are stored: those that trigger, and HOLD_FRAMES after each."""
+
+    def __init__(self, detector: EventDetector, hold: int = HOLD_FRAMES):
+        self.detector = detector
+        self.hold = hold
+        self.remaining = 0
+        self.seen = 0
+        self.kept = 0
+        self.events = 0
+
+    def check(self, data: np.ndarray) -> Tuple[bool, Event]:
+        """Returns (keep, event); event is None for quiet frames, kept or not."""
+        self.seen += 1
+        event = self.detector.check(data)
+        if event:
+            self.events += 1
+            self.remaining = self.hold
+            keep = True
+        elif self.remaining:
+            self.remaining -= 1
+            keep = True
+        else:
+            keep = False
+        self.kept += keep
+        return keep, event
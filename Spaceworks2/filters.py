@@ -0,0 +1,141 @@
+"""Temporal filters over a device's frame stream, applied after parsing and before display and storage.
+
+Each filter keeps its history in arrays allocated on the first frame and updated in place afterwards.
+"""
+import numpy as np
+
+
+class Filter:
+    """Passes frames through unchanged. Filters keep per-device state, so use one instance per device."""
+
+    name = "none"
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Adds a frame to the history and returns the filtered frame as a new array."""
+        return data
+
+    def reset(self):
+        """Forgets the history, e.g. when the scene changes."""
+
+    def spec(self) -> str:
+        return self.name
+
+
+class RunningMean(Filter):
+    """Mean of the last `window` frames. A running sum makes each frame cost the same whatever the window."""
+
+    name = "mean"
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.ring = None
+        self.total = None
+        self.count = 0
+        self.index = 0
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.ring is None or self.ring.shape[1:] != data.shape:
+            self.ring = np.zeros((self.window,) + data.shape)
+            self.total = np.zeros(data.shape)
+            self.count = self.index = 0
+        slot = self.ring[self.index]
+        self.total -= slot
+        slot[...] = data
+        self.total += slot
+        self.index = (self.index + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+        if self.index == 0:
+            # Resum once per lap so rounding errors can't build up; amortized this is still O(pixels)
+            np.sum(self.ring, axis=0, out=self.total)
+        return self.total / self.count
+
+    def spec(self) -> str:
+        return f"{self.name}:{self.window}"
+
+
+class ExponentialAverage(Filter):
+    """Exponential moving average, each frame weighted by alpha and the history by 1 - alpha."""
+
+    name = "ema"
+
+    def __init__(self, alpha: float):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self.state = None
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.state is None or self.state.shape != data.shape:
+            self.state = np.array(data, dtype=float)
+        else:
+            self.state += self.alpha * (data - self.state)
+        return self.state.copy()
+
+    def spec(self) -> str:
+        return f"{self.name}:{self.alpha:g}"
+
+
+class RunningMedian(Filter):
+    """Per-pixel median of the last `window` frames, which rejects single-frame spikes the mean smears out.
+
+    Unlike the mean this costs O(pixels * window) per frame; windows stay small in practice.
+    """
+
+    name = "median"
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.ring = None
+        self.count = 0
+        self.index = 0
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        if self.ring is None or self.ring.shape[1:] != data.shape:
+            self.ring = np.zeros((self.window,) + data.shape)
+            self.count = self.index = 0
+        self.ring[self.index] = data
+        self.index = (self.index + 1) % self.window
+        self.count = min(self.count + 1, self.window)
+        return np.median(self.ring[:self.count], axis=0)
+
+    def spec(self) -> str:
+        return f"{self.name}:{self.window}"
+
+
+# Spec prefix -> (filter class, parameter type)
+KINDS = {
+    Filter.name: (Filter, None),
+    RunningMean.name: (RunningMean, int),
+    ExponentialAverage.name: (ExponentialAverage, float),
+    RunningMedian.name: (RunningMedian, int),
+}
+
+# Offered in the GUI
+PRESETS = ["none", "mean:4", "mean:16", "ema:0.3", "ema:0.1", "median:5"]
+
+
+def make(spec: str) -> Filter:
+    """Builds a filter from a spec such as 'mean:8', 'ema:0.2', 'median:5' or 'none'. Raises ValueError."""
+    kind, _, parameter = spec.partition(':')
+    if kind not in KINDS:
+        raise ValueError(f"unknown filter {kind!r}, expected one of {', '.join(KINDS)}")
+    cls, parameter_type = KINDS[kind]
+    if parameter_type is None:
+        return cls()
+    try:
+        return cls(parameter_type(parameter))
+    except ValueError as error:
+        raise ValueError(f"filter {spec!r}: {error}")
@@ -1,111 +1,173 @@
-import pyqtgraph.exporters
-import pyqtgraph as pg
-import numpy as np
 from PyQt5 import QtCore
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import *
 from PyQt5 import QtGui
 from serial import Serial
+from pathlib import Path
+import acquisition
+import alarms
+import asyncio
+import calibration
 import comm
-import time
 import dummy
-import matplotlib
-from pgcolorbar.colorlegend import ColorLegendItem
-from typing import Tuple
-from pathlib import Path
+import filters
+import html
+import importlib
+import metrics
+import roi
+import store
+import tracking
+import upsample
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # imported on first use, see preload_image_modules
+    import image
 
 
-class PgImageWindow(QMainWindow):
-    """Image dialog containing pyqtgraph heatmap"""
+class Terminal(QTextBrowser):
+    """Log view with a bounded history. Lines are queued and flushed together on a timer so a chatty device can't force a relayout per line."""
 
-    def __init__(self, data: np.ndarray, run: int, frame: int, run_dir: Path, parent=None):
+    MAX_BLOCKS = 5000
+    FLUSH_INTERVAL = 100  # milliseconds
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        # variables
-        self.data = data
-        self.run_dir = run_dir
-        self.frame = frame
-        # Plot and ViewBox
-        self.plotItem = pg.PlotItem()
-        self.viewBox = self.plotItem.getViewBox()
-        self.viewBox.setAspectLocked(True)
-        # Heatmap ImageItem
-        self.imageItem = pg.ImageItem()
-        self.imageItem.setImage(np.transpose(self.data), autoLevels=True)
-        self.imageItem.setAutoDownsample(True)
-        # Default scaling of heatmap
-        nRows, nCols = data.shape
-        self.plotItem.setRange(xRange=[-5, nCols+5], yRange=[0, nRows])
-        # Set colormap
-        self.imageItem.setColorMap(pg.colormap.getFromMatplotlib('plasma'))
-        self.plotItem.addItem(self.imageItem)
-        # Generate crosshair at hottest pixel
-        self.crosshair = pg.TargetItem(
-            pos=[16, 12], movable=True, size=50, label=self.get_label_at_pos, labelOpts={'offset': (40, -40), 'color': 'k', 'fill': pg.mkBrush((255, 255, 255, 127))}, pen=pg.mkPen(color='k', width=3))
-        self.crosshair.setPos(self.get_max_pos(self.data))
-        self.plotItem.addItem(self.crosshair)
-        # Generate colorbar
-        self.colorLegendItem = ColorLegendItem(
-            imageItem=self.imageItem,
-            showHistogram=True,
-            label='Temperature (°C)')
-        self.colorLegendItem.setMinimumHeight(60)
-        self.colorLegendItem.autoScaleFromImage()
-        # Graphics Layout
-        self.graphicsWidget = pg.GraphicsLayoutWidget()
-        self.graphicsWidget.addItem(self.plotItem, 0, 0)
-        self.graphicsWidget.addItem(self.colorLegendItem, 0, 1)
-        # Window layout
-        self.layout = QVBoxLayout()
-        self.layout.addWidget(self.graphicsWidget)
-        # Window settings
-        self.main_widget = QWidget()
-        self.main_widget.setLayout(self.layout)
-        self.setCentralWidget(self.main_widget)
-        self.setWindowTitle(f"Run {run} - Frame {frame}")
-        self.resize(1200, 800)
-        self.center()
-        self.save_img()
-        self.save_csv()
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        self.pending = []
+        self.flush_timer = QTimer()
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
+
+    def write(self, line: str, rich: bool = True):
+        """Queues a line for the next flush. Plain lines skip the HTML parser."""
+        self.pending.append((line, rich))
+
+    def flush(self):
+        """Appends all queued lines in one pass with repaints suspended."""
+        if not self.pending:
+            return
+        # Anything beyond the block limit would be evicted immediately anyway
+        pending = self.pending[-self.MAX_BLOCKS:]
+        self.pending = []
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.setUpdatesEnabled(False)
+        plain = []
+        for line, rich in pending:
+            if rich:
+                self.insert_plain(plain)
+                plain = []
+                self.append(line)
+            else:
+                plain.append(line)
+        self.insert_plain(plain)
+        self.setUpdatesEnabled(True)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def insert_plain(self, lines: list[str]):
+        """Inserts a run of plain text lines at the end with a single cursor operation."""
+        if not lines:
+            return
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock(QtGui.QTextBlockFormat(),
+                               QtGui.QTextCharFormat())
+        cursor.insertText("\n".join(lines), QtGui.QTextCharFormat())
 
-    def center(self):
-        """Centers the window in the active monitor"""
-        frameGm = self.frameGeometry()
-        screen = QApplication.desktop().screenNumber(
-            QApplication.desktop().cursor().pos())
-        centerPoint = QApplication.desktop().screenGeometry(screen).center()
-        frameGm.moveCenter(centerPoint)
-        self.move(frameGm.topLeft())
 
-    def get_label_at_pos(self, x_flt, y_flt) -> str:
-        """Generates a label for the crosshairs at a specific point"""
-        x = int(x_flt)
-        y = int(y_flt)
-        return f"{x},{y}\n{self.data[y][x]} °C"
-
-    def get_max_pos(self, data: np.ndarray) -> Tuple:
-        """Returns the position of the center of the hottest pixel"""
-        max_index = data.argmax()
-        y = int(max_index/32)
-        x = ((max_index) % 32)
-        return x+0.5, y+0.5
-
-    def save_img(self):
-        """Saves the heatmap as a png to the current run directory"""
-        exporter = pyqtgraph.exporters.ImageExporter(
-            self.graphicsWidget.scene())
-        exporter.export(
-            str((self.run_dir / f"frame_{self.frame}.png").resolve()))
-
-    def save_csv(self):
-        """Saves the data array as a csv."""
-        with open(self.run_dir / f"frame_{self.frame}.csv", 'w') as file:
-            for y in self.data:
-                file.write(",".join([str(x) for x in y]) + ';\n')
+class StatusPanel(QWidget):
+    """Compact grid of live acquisition health figures, refreshed at a fixed low rate."""
+
+    REFRESH_INTERVAL = 1000  # milliseconds
+
+    FIELDS = ["Frames/s", "Bytes/s", "Parse errors", "Timeouts", "Dropped",
+              "Lost/duplicate", "Corrupt/retried", "Queues (cmd/data)", "Ping RTT"]
+
+    def __init__(self, counters: metrics.Counters, get_queue_depths, parent=None):
+        super().__init__(parent)
+        self.counters = counters
+        self.get_queue_depths = get_queue_depths
+        self.values = {}
+        self.grid_layout = QGridLayout()
+        self.grid_layout.setContentsMargins(0, 0, 0, 0)
+        for i, field in enumerate(self.FIELDS):
+            value = QLabel("-", self)
+            value.setAlignment(QtCore.Qt.AlignRight)
+            self.grid_layout.addWidget(QLabel(field, self), i // 2, (i % 2) * 2)
+            self.grid_layout.addWidget(value, i // 2, (i % 2) * 2 + 1)
+            self.values[field] = value
+        self.setLayout(self.grid_layout)
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start()
+
+    def refresh(self):
+        """Pulls the latest counter values into the labels."""
+        fps, bps = self.counters.rates()
+        commands, data = self.get_queue_depths()
+        rtt = self.counters.ping_rtt
+        self.values["Frames/s"].setText(f"{fps:.2f}")
+        self.values["Bytes/s"].setText(f"{bps:.0f}")
+        self.values["Parse errors"].setText(str(self.counters.parse_errors))
+        self.values["Timeouts"].setText(str(self.counters.timeouts))
+        self.values["Dropped"].setText(str(self.counters.dropped))
+        self.values["Lost/duplicate"].setText(
+            f"{self.counters.lost}/{self.counters.duplicates}")
+        self.values["Corrupt/retried"].setText(
+            f"{self.counters.corrupt}/{self.counters.retries}")
+        self.values["Queues (cmd/data)"].setText(f"{commands}/{data}")
+        self.values["Ping RTT"].setText(
+            f"{rtt:.1f} ms" if rtt is not None else "-")
+
+
+class AsyncioPump:
+    """Drives an asyncio event loop from the Qt event loop.
+
+    Every INTERVAL the loop runs a single iteration: ready callbacks run and the selector is polled
+    without blocking, so coroutines and Qt widgets share the main thread.
+    """
+
+    INTERVAL = 5  # milliseconds
+
+    def __init__(self, on_error=None):
+        # called with the exception of any task that ends with one, since nothing awaits the tasks
+        self.on_error = on_error
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.timer = QTimer()
+        self.timer.setInterval(self.INTERVAL)
+        self.timer.timeout.connect(self.step)
+        self.timer.start()
+
+    def step(self):
+        # A modal dialog opened from a coroutine spins a nested Qt loop; don't re-enter asyncio from it
+        if self.loop.is_running():
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+    def run(self, coro) -> asyncio.Task:
+        """Schedules a coroutine on the loop."""
+        task = self.loop.create_task(coro)
+        task.add_done_callback(self.finished)
+        return task
+
+    def finished(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() and self.on_error:
+            self.on_error(task.exception())
 
 
 class MainWindow(QMainWindow):
     """Main window dialog."""
 
+    # (device id, alarms.AlarmEvent), emitted from the acquisition path as soon as a frame changes an alarm's state
+    alarm_changed = QtCore.pyqtSignal(str, object)
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         # window settings
@@ -117,8 +179,20 @@ class MainWindow(QMainWindow):
             getattr(QStyle, 'SP_ComputerIcon')))
         self.resize(500, 500)
         self.serial = None
-        self.command_buffer = []
-        self.data_buffer = []
+        self.device = None
+        self.pump = AsyncioPump(on_error=self.report_task_error)
+        self.frame_timer = metrics.FrameTimer()
+        self.counters = metrics.Counters()
+        self.rois = None
+        # whether the ROI definitions are in the run directory yet
+        self.rois_saved = False
+        self.frame_filter = filters.Filter()
+        self.interpolation = upsample.NEAREST
+        self.tracker = None
+        self.alarm_specs = []
+        # opened on the first alarm, so runs without any stay empty
+        self.alarm_log = None
+        self.alarm_changed.connect(self.show_alarm)
         # prompt for serial config
         self.dlg_serial_setup = SerialSetup(self)
         # Request button that's only active when ping is reciprocated
@@ -134,17 +208,47 @@ class MainWindow(QMainWindow):
         self.btn_burst.resize(self.btn_burst.sizeHint())
         self.btn_burst.clicked.connect(self.evt_burst)
         self.btn_burst.setEnabled(False)
+        self.btn_load_rois = QPushButton("Load ROIs", self)
+        self.btn_load_rois.resize(self.btn_load_rois.sizeHint())
+        self.btn_load_rois.clicked.connect(self.evt_load_rois)
+        # Temporal filter applied to every frame before it's shown and saved
+        self.cbb_filter = QComboBox(self)
+        self.cbb_filter.addItems(filters.PRESETS)
+        self.cbb_filter.activated.connect(self.evt_cbb_filter_activated)
+        self.filter_layout = QHBoxLayout()
+        self.filter_layout.addWidget(QLabel("Temporal filter", self))
+        self.filter_layout.addWidget(self.cbb_filter)
+        # Interpolation of the image window preview and its png
+        self.cbb_interpolation = QComboBox(self)
+        self.cbb_interpolation.addItems(upsample.METHODS)
+        self.cbb_interpolation.activated.connect(
+            self.evt_cbb_interpolation_activated)
+        self.filter_layout.addWidget(QLabel("Display", self))
+        self.filter_layout.addWidget(self.cbb_interpolation)
+        # Hot blobs followed from frame to frame, marked in the image windows and recorded in tracks.csv
+        self.chk_track = QCheckBox("Track hotspots", self)
+        self.chk_track.toggled.connect(self.evt_chk_track_toggled)
+        self.filter_layout.addWidget(self.chk_track)
+        # Alarms checked on every frame as it's parsed
+        self.txt_alarms = QLineEdit(self)
+        self.txt_alarms.setPlaceholderText("e.g. max>45, rate>2, roi:NAME>40")
+        self.txt_alarms.editingFinished.connect(self.evt_txt_alarms_edited)
+        self.alarm_layout = QHBoxLayout()
+        self.alarm_layout.addWidget(QLabel("Alarms", self))
+        self.alarm_layout.addWidget(self.txt_alarms)
+        # Live throughput and link health
+        self.status_panel = StatusPanel(
+            self.counters, self.queue_depths, self)
         # Terminal display
-        self.terminal = QTextBrowser(self)
-
-        self.serial_checker = QTimer()
-        self.serial_checker.setInterval(100)
-        self.serial_checker.timeout.connect(self.read_serial)
-        self.serial_checker.start()
+        self.terminal = Terminal(self)
         # Display widgets stacked vertically
         self.vert_layout = QVBoxLayout(self)
         self.vert_layout.addWidget(self.btn_request_frame)
         self.vert_layout.addWidget(self.btn_burst)
+        self.vert_layout.addWidget(self.btn_load_rois)
+        self.vert_layout.addLayout(self.filter_layout)
+        self.vert_layout.addLayout(self.alarm_layout)
+        self.vert_layout.addWidget(self.status_panel)
         self.vert_layout.addWidget(self.terminal)
         self.window = QWidget(self)
         self.window.setLayout(self.vert_layout)
@@ -154,68 +258,146 @@ class MainWindow(QMainWindow):
         self.center()
         self.show()
 
-    def read_serial(self) -> bool:
-        """checks serial port for data and loads it into appropriate buffer OR directs to terminal"""
+    def queue_depths(self) -> Tuple[int, int]:
+        """Returns the number of unhandled (commands, dataframes)."""
+        return self.device.queue_depths() if self.device else (0, 0)
 
-        if self.serial:
-            try:
-                available = self.serial.inWaiting()
-            except:
-                self.evt_serial_connection_error()
-            if(available):
-                # trim off trailing newline character
-                raw_line = self.serial.readline()[:-1]
-                if comm.is_command(raw_line):
-                    self.command_buffer.insert(
-                        0, comm.decode_command(raw_line))
-                elif comm.is_dataframe(raw_line):
-                    self.data_buffer.insert(0, comm.decode_df(raw_line))
-                else:
-                    self.update_terminal(raw_line.decode('utf-8'))
-                return True
-            else:
-                return False
-        else:
-            return False
+    def evt_load_rois(self):
+        """Loads regions of interest to overlay and evaluate on every frame from here on."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load ROIs", str(comm.DATA_DIR), "ROI files (*.json)")
+        if not path:
+            return
+        try:
+            self.rois = roi.load(path)
+        except (OSError, ValueError) as error:
+            self.update_terminal(f"Couldn't load ROIs: {error}", rich=False)
+            return
+        self.rois_saved = False
+        self.update_terminal(
+            f"<center><b>Loaded {len(self.rois)} ROIs</b></center>")
+        # ROI alarms are evaluated against the new set
+        self.apply_alarms()
+
+    def evt_txt_alarms_edited(self):
+        specs = [spec.strip() for spec in self.txt_alarms.text().split(',') if spec.strip()]
+        if specs != self.alarm_specs:
+            self.alarm_specs = specs
+            self.apply_alarms()
+
+    def apply_alarms(self):
+        """Hands the device a fresh set of alarms for the current specs and ROIs."""
+        if not self.alarm_specs:
+            if self.device:
+                self.device.alarms = None
+            return
+        try:
+            alarm_set = alarms.AlarmSet(self.alarm_specs, self.rois)
+        except ValueError as error:
+            self.update_terminal(f"Alarms not set: {error}", rich=False)
+            return
+        if self.device:
+            self.device.alarms = alarm_set
+        self.update_terminal(
+            f"<center><b>{len(alarm_set)} alarm(s) armed</b></center>")
 
-    def evt_burst(self):
-        for i in range(5):
-            img_dialog = self.request_frame()
-            img_dialog.close()
+    def record_alarm(self, device_id: str, event: alarms.AlarmEvent):
+        """Logs an alarm change before the frame goes any further, then signals it."""
+        if not self.alarm_log:
+            self.alarm_log = alarms.AlarmLog(self.run_dir)
+        self.alarm_log.write(device_id, event)
+        self.alarm_changed.emit(device_id, event)
 
-    def update_terminal(self, line: str):
+    def show_alarm(self, device_id: str, event: alarms.AlarmEvent):
+        colour = "red" if event.state == alarms.RAISED else "green"
+        self.update_terminal(
+            f"<center><b><font color='{colour}'>ALARM {html.escape(event.describe())}</font></b></center>")
+        if event.state == alarms.RAISED:
+            QApplication.beep()
+
+    def evt_cbb_filter_activated(self):
+        """Starts the chosen filter with an empty history."""
+        self.frame_filter = filters.make(self.cbb_filter.currentText())
+
+    def evt_cbb_interpolation_activated(self):
+        self.interpolation = self.cbb_interpolation.currentText()
+
+    def evt_chk_track_toggled(self, checked: bool):
+        """Starts tracking afresh, or stops it."""
+        self.tracker = tracking.Tracker(
+            **tracking.parse_tracking(tracking.DEFAULT_TRACKING)) if checked else None
+
+    def evt_burst(self):
+        self.pump.run(self.burst(5))
+
+    async def burst(self, count: int):
+        for i in range(count):
+            img_dialog = await self.request_frame()
+            if img_dialog:
+                img_dialog.close()
+        self.show_latency()
+
+    def show_latency(self):
+        """Prints the per-stage latency histograms to the terminal."""
+        self.update_terminal("<b>Frame latency</b>")
+        for line in self.frame_timer.summary():
+            self.update_terminal(line, rich=False)
+
+    def update_terminal(self, line: str, rich: bool = True):
         """Adds a line to the terminal display."""
-        self.terminal.append(line)
-        self.terminal.resize(self.terminal.sizeHint())
-        self.vert_layout.update()
+        self.terminal.write(line, rich)
 
-    def evt_btn_request(self):
-        img_dialog = self.request_frame()
-        img_dialog.show()
+    def report_task_error(self, error: Exception):
+        """Shows an error nothing else handled, raised by a coroutine run on the pump."""
+        self.update_terminal(
+            f"<center><b>ERROR: {html.escape(f'{type(error).__name__}: {error}')}</b></center>")
 
-    def request_frame(self) -> PgImageWindow:
-        """Requests a data frame over serial and displays it."""
-        self.serial_command(comm.REQUEST_COMMAND)
+    def evt_btn_request(self):
+        self.pump.run(self.show_frame())
 
-        timeout = time.time() + comm.REQUEST_TIMEOUT
-        while self.data_buffer == []:
-            self.read_serial()
-            if time.time() > timeout:
-                self.update_terminal("<center><b>REQUEST TIMEOUT</b></center>")
-                return
+    async def show_frame(self):
+        img_dialog = await self.request_frame()
+        if img_dialog:
+            img_dialog.show()
 
-        raw_data = self.data_buffer.pop(0)
+    async def request_frame(self) -> "image.PgImageWindow":
+        """Requests a data frame over serial and displays it."""
+        # pyqtgraph and pgcolorbar are only needed once frames arrive
+        import image
         try:
-            array = comm.process_data(raw_data)
-        except:
+            frame = await self.device.request_frame()
+        except asyncio.TimeoutError:
+            self.update_terminal("<center><b>REQUEST TIMEOUT</b></center>")
+            return
+        except comm.ChecksumError:
+            self.update_terminal(
+                "<center><b>CORRUPT DATAFRAME</b></center>")
+            return
+        except ValueError:
             self.update_terminal(
                 "<center><b>DATAFRAME FORMAT ERROR</b></center>")
             return
+        except OSError:
+            # the port failed; already reported through on_error
+            return
+        frame.data = self.frame_filter.apply(frame.data)
+        tracks = self.tracker.update(frame.data) if self.tracker else []
+        frame.stamps.stamp("processed")
         # Open Image Window
-        image_dialog = PgImageWindow(
-            array, self.run, self.frame, self.run_dir, self)
+        image_dialog = image.PgImageWindow(
+            frame.data, self.run, self.frame, self.run_dir, self, frame.stamps, self.rois, self.interpolation, tracks,
+            frame.device_id)
+        frame.stamps.finish()
+        store.append_raw(self.run_dir, frame.data, frame.timestamp)
+        if tracks:
+            store.append_tracks(self.run_dir, frame.device_id, self.frame,
+                                frame.timestamp, tracks)
+        if self.rois and not self.rois_saved:
+            self.rois.save(self.run_dir / store.ROI_DEFINITIONS_FILE)
+            self.rois_saved = True
+        self.frame_timer.write(self.run_dir)
         self.update_terminal(
-            f"<center><b>Frame {self.frame} received</b></center>")
+            f"<center><b>Frame {self.frame} received ({self.frame_timer.last_total:.0f} ms)</b></center>")
         self.frame += 1
         return image_dialog
 
@@ -232,16 +414,58 @@ class MainWindow(QMainWindow):
                 dummy.get_mode_from_str(baudrate))
         else:
             try:
-                self.serial = Serial(port, baudrate=int(baudrate))
+                # non-blocking: the acquisition core only reads what is already waiting
+                self.serial = Serial(port, baudrate=comm.DEFAULT_BAUDRATE if baudrate == comm.AUTO_BAUDRATE else int(baudrate),
+                                     timeout=0)
             except:
                 self.evt_serial_connection_error()
                 return
+        # the port's name, like the CLI's device ids, so the csv files and calibrations of both match
+        device_id = Path(port).name
+        maps = calibration.load(device_id)
+        self.device = acquisition.Device(
+            self.serial,
+            device_id,
+            on_message=lambda line: self.update_terminal(line, rich=False),
+            # the error dialog is modal, so open it from Qt rather than from inside the asyncio loop
+            on_error=lambda error: QTimer.singleShot(
+                0, self.serial_connection_lost),
+            counters=self.counters,
+            frame_timer=self.frame_timer,
+            calibration=maps,
+            on_alarm=self.record_alarm)
+        self.device.start()
+        self.apply_alarms()
+        if maps:
+            self.update_terminal(
+                f"<center><b>Applying calibration for {maps.device_id}</b></center>")
 
         self.update_terminal(
             "<center><b>Serial connection initiated.</b></center>")
+        # Checksummed frames if the firmware supports them; older firmware just doesn't answer
+        self.pump.run(self.device.set_checksum())
+        if baudrate == comm.AUTO_BAUDRATE:
+            self.pump.run(self.negotiate_baudrate())
+        # Load the plotting stack while the user is still reading the terminal, not on the first request
+        QTimer.singleShot(0, self.preload_image_modules)
+
+    async def negotiate_baudrate(self):
+        """Moves the link to the fastest rate the device supports and reports the frame rate it achieves."""
+        rate = await self.device.negotiate_baudrate(
+            lambda line: self.update_terminal(line, rich=False))
+        fps = await self.device.measure_frame_rate()
+        self.update_terminal(
+            f"<center><b>Link at {rate} baud, {fps:.2f} frames/s</b></center>")
+
+    def preload_image_modules(self):
+        """Imports the heavy plotting modules ahead of the first frame."""
+        importlib.import_module("image")
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """Prompt for close if serial active. Delete run directory if no images were saved"""
+        if self.alarm_log:
+            self.alarm_log.close()
+            self.alarm_log = None
         if list(self.run_dir.glob('*')) == []:
             comm.remove_run_dir(self.run)
         if self.serial:
@@ -257,6 +481,9 @@ class MainWindow(QMainWindow):
 
     def evt_serial_connection_error(self):
         """Display error if serial connection dropped. Prompts for Serial setup"""
+        if self.device:
+            self.device.close()
+            self.device = None
         self.serial = None
         error = QMessageBox.critical(
             self, "Serial Error", "The serial connection has encountered an error.")
@@ -266,35 +493,26 @@ class MainWindow(QMainWindow):
 
     def ping_serial(self):
         """Pings serial object and enables request button if it's active"""
-        # This one's a bit of a doozy so I'll comment it fully
-        if self.serial and self.serial.isOpen():
-            # Send 'ping'
-            self.serial_command(comm.PING_COMMAND)
-
-            # Wait for a response (this should probably be done in a QThread.... whatever im not quite sure how to do it)
-            timeout = time.process_time() + comm.PING_TIMEOUT
-            while self.command_buffer == []:
-                self.read_serial()
-                if time.process_time() > timeout:
-                    self.btn_request_frame.setEnabled(False)
-                    self.btn_burst.setEnabled(False)
-                    self.update_terminal(
-                        "<center><b>Serial device not responding (PING TIMEOUT)</b></center>")
-                    return
-            # Read lines until a pong is found. if a line doesn't contain the pong, pass it to the terminal
-            raw_line = self.command_buffer.pop(0)
-            # If the 'pong' is in those lines, enable the button and pass the rest of the lines to the terminal
-            if raw_line == comm.PING_RESPONSE.decode('utf-8'):
-                self.btn_request_frame.setEnabled(True)
-                self.btn_burst.setEnabled(True)
-            # If the response isn't the pong, just deactivate the button
-            else:
-                self.btn_request_frame.setEnabled(False)
-                self.btn_burst.setEnabled(False)
+        if self.device and self.serial.isOpen():
+            self.pump.run(self.ping())
         else:
             self.btn_request_frame.setEnabled(False)
             self.btn_burst.setEnabled(False)
 
+    async def ping(self):
+        """Enables the request buttons only while the device answers pings."""
+        try:
+            await self.device.ping()
+            alive = True
+        except asyncio.TimeoutError:
+            self.update_terminal(
+                "<center><b>Serial device not responding (PING TIMEOUT)</b></center>")
+            alive = False
+        except (ValueError, OSError):
+            alive = False
+        self.btn_request_frame.setEnabled(alive)
+        self.btn_burst.setEnabled(alive)
+
     def center(self):
         """Centers the window in the active monitor"""
         frameGm = self.frameGeometry()
@@ -304,12 +522,6 @@ class MainWindow(QMainWindow):
         frameGm.moveCenter(centerPoint)
         self.move(frameGm.topLeft())
 
-    def serial_command(self, cmd: bytes):
-        self.serial.write(comm.CMD_START_SEQ)
-        self.serial.write(cmd)
-        self.serial.write(comm.CMD_END_SEQ)
-        self.serial.flush()
-
 
 class SerialSetup(QDialog):
     """Serial port setup dialog."""
@@ -0,0 +1,155 @@
+import pyqtgraph.exporters
+import pyqtgraph as pg
+import numpy as np
+from PyQt5.QtWidgets import *
+from PyQt5.QtCore import QRectF
+from pgcolorbar.colorlegend import ColorLegendItem
+from typing import Tuple
+from pathlib import Path
+import colormap
+import comm
+import metrics
+import roi
+import stats
+import store
+import tracking
+import upsample
+
+
+_plasma = None
+
+
+def plasma_colormap() -> pg.ColorMap:
+    """Returns the pyqtgraph colormap built from the shared plasma LUT. Built once per process."""
+    global _plasma
+    if _plasma is None:
+        _plasma = pg.ColorMap(np.linspace(0, 1, 256), colormap.plasma_lut())
+    return _plasma
+
+
+class PgImageWindow(QMainWindow):
+    """Image dialog containing pyqtgraph heatmap"""
+
+    def __init__(self, data: np.ndarray, run: int, frame: int, run_dir: Path, parent=None, stamps: metrics.FrameStamps = None,
+                 rois: roi.RoiSet = None, interpolation: str = upsample.NEAREST, tracks: list[tracking.Track] = None,
+                 device_id: str = "0"):
+        super().__init__(parent)
+        # variables
+        self.data = data
+        self.device_id = device_id
+        self.rois = rois
+        self.run_dir = run_dir
+        self.frame = frame
+        self.stamps = stamps
+        self.stats = stats.compute(data)[0]
+        # Plot and ViewBox
+        self.plotItem = pg.PlotItem()
+        self.viewBox = self.plotItem.getViewBox()
+        self.viewBox.setAspectLocked(True)
+        # Heatmap ImageItem
+        self.imageItem = pg.ImageItem()
+        if interpolation == upsample.NEAREST:
+            self.imageItem.setImage(np.transpose(self.data), autoLevels=True)
+        else:
+            # Smooth preview, coloured on the raw frame's range and stretched over the sensor pixel grid
+            preview = upsample.cache.upsample(self.data, method=interpolation)
+            self.imageItem.setImage(np.transpose(preview),
+                                    levels=(self.data.min(), self.data.max()))
+        self.imageItem.setAutoDownsample(True)
+        # Default scaling of heatmap
+        nRows, nCols = data.shape
+        self.imageItem.setRect(QRectF(0, 0, nCols, nRows))
+        self.plotItem.setRange(xRange=[-5, nCols+5], yRange=[0, nRows])
+        # Set colormap
+        self.imageItem.setColorMap(plasma_colormap())
+        self.plotItem.addItem(self.imageItem)
+        # Generate crosshair at hottest pixel
+        self.crosshair = pg.TargetItem(
+            pos=[16, 12], movable=True, size=50, label=self.get_label_at_pos, labelOpts={'offset': (40, -40), 'color': 'k', 'fill': pg.mkBrush((255, 255, 255, 127))}, pen=pg.mkPen(color='k', width=3))
+        self.crosshair.setPos(self.get_max_pos(self.data))
+        self.plotItem.addItem(self.crosshair)
+        # Outline and label each ROI with its mean
+        if self.rois:
+            self.roi_values = self.rois.evaluate(self.data)
+            for region, values in zip(self.rois.rois, self.roi_values):
+                points = region.outline()
+                self.plotItem.addItem(pg.PlotCurveItem(
+                    points[:, 0], points[:, 1], pen=pg.mkPen(color='w', width=2)))
+                label = pg.TextItem(f"{region.name} {values[0]:.1f} °C",
+                                    color='w', anchor=(0, 1))
+                label.setPos(*points.min(axis=0))
+                self.plotItem.addItem(label)
+        # Circle each tracked hotspot at its centroid, the centre of pixel (x, y) being at (x + 0.5, y + 0.5)
+        if tracks:
+            self.plotItem.addItem(pg.ScatterPlotItem(
+                [track.blob.x + 0.5 for track in tracks], [track.blob.y + 0.5 for track in tracks],
+                symbol='o', size=20, pen=pg.mkPen(color='c', width=2), brush=None))
+            for track in tracks:
+                label = pg.TextItem(f"#{track.track_id}", color='c', anchor=(0, 0))
+                label.setPos(track.blob.x + 1, track.blob.y + 1)
+                self.plotItem.addItem(label)
+        # Generate colorbar
+        self.colorLegendItem = ColorLegendItem(
+            imageItem=self.imageItem,
+            showHistogram=True,
+            label='Temperature (°C)')
+        self.colorLegendItem.setMinimumHeight(60)
+        self.colorLegendItem.autoScaleFromImage()
+        # Graphics Layout
+        self.graphicsWidget = pg.GraphicsLayoutWidget()
+        self.graphicsWidget.addItem(self.plotItem, 0, 0)
+        self.graphicsWidget.addItem(self.colorLegendItem, 0, 1)
+        # Window layout
+        self.layout = QVBoxLayout()
+        self.layout.addWidget(self.graphicsWidget)
+        # Window settings
+        self.main_widget = QWidget()
+        self.main_widget.setLayout(self.layout)
+        self.setCentralWidget(self.main_widget)
+        self.setWindowTitle(f"Run {run} - Frame {frame}")
+        values = dict(zip(stats.FIELDS, self.stats))
+        self.statusBar().showMessage(
+            "   ".join(f"{field} {values[field]:.2f} °C" for field in stats.FIELDS if not field.endswith(("_x", "_y"))))
+        self.resize(1200, 800)
+        self.center()
+        if self.stamps:
+            self.stamps.stamp("displayed")
+        self.save_img()
+        self.save_csv()
+        store.append_stats(self.run_dir, self.device_id, self.frame, self.stats)
+        if self.rois:
+            store.append_rois(self.run_dir, self.device_id, self.frame,
+                              self.rois, self.roi_values)
+        if self.stamps:
+            self.stamps.stamp("saved")
+
+    def center(self):
+        """Centers the window in the active monitor"""
+        frameGm = self.frameGeometry()
+        screen = QApplication.desktop().screenNumber(
+            QApplication.desktop().cursor().pos())
+        centerPoint = QApplication.desktop().screenGeometry(screen).center()
+        frameGm.moveCenter(centerPoint)
+        self.move(frameGm.topLeft())
+
+    def get_label_at_pos(self, x_flt, y_flt) -> str:
+        """Generates a label for the crosshairs at a specific point"""
+        x = int(x_flt)
+        y = int(y_flt)
+        return f"{x},{y}\n{self.data[y][x]} °C"
+
+    def get_max_pos(self, data: np.ndarray) -> Tuple:
+        """Returns the position of the center of the hottest pixel"""
+        y, x = np.unravel_index(data.argmax(), data.shape)
+        return x+0.5, y+0.5
+
+    def save_img(self):
+        """Saves the heatmap as a png to the current run directory"""
+        exporter = pyqtgraph.exporters.ImageExporter(
+            self.graphicsWidget.scene())
+        exporter.export(
+            str((self.run_dir / f"frame_{self.frame}.png").resolve()))
+
+    def save_csv(self):
+        """Saves the data array as a csv."""
+        comm.save_csv(self.data, self.run_dir / f"frame_{self.frame}.csv")
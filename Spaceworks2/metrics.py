@@ -0,0 +1,174 @@
+from pathlib import Path
+import bisect
+import time
+from typing import Tuple
+
+
+# Order of the stages a frame passes through on its way from request to disk
+STAGES = ["sent", "first_byte", "received", "parsed", "processed", "displayed", "saved"]
+
+# Histogram bucket upper edges in milliseconds, roughly logarithmic
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+# Finer buckets for cross-device trigger skew, which should stay well below a millisecond
+SKEW_BUCKETS_MS = [0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50]
+
+STATS_FILE = "stats.txt"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram. Recording a sample is a bisect and an increment."""
+
+    def __init__(self, buckets: list[float] = BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def record(self, value_ms: float):
+        """Adds a single sample in milliseconds."""
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Estimates the p-th percentile as the upper edge of the bucket containing it."""
+        if not self.count:
+            return 0.0
+        target = p / 100 * self.count
+        running = 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> str:
+        return f"n={self.count} mean={self.mean():.3g}ms p50<={self.percentile(50):g}ms p95<={self.percentile(95):g}ms max={self.max:.3g}ms"
+
+
+class FrameTimer:
+    """Records monotonic timestamps at each stage of a frame's lifecycle and aggregates the time spent between consecutive stages."""
+
+    def __init__(self, stages: list[str] = STAGES):
+        self.stages = stages
+        self.histograms = {stage: Histogram() for stage in stages[1:]}
+        self.total = Histogram()
+        self.current = {}
+        self.last_total = 0.0
+
+    def start(self):
+        """Begins timing a new frame, marking it as sent."""
+        self.current = {self.stages[0]: time.perf_counter()}
+
+    def stamp(self, stage: str):
+        """Marks a stage as reached for the current frame. Only the first stamp of a stage counts."""
+        if self.current and stage not in self.current:
+            self.current[stage] = time.perf_counter()
+
+    def finish(self):
+        """Closes the current frame and folds its stage durations into the histograms."""
+        self.record(self.current)
+        self.current = {}
+
+    def begin(self) -> "FrameStamps":
+        """Starts a frame timed independently of the current one, for requests that overlap."""
+        return FrameStamps(self, {self.stages[0]: time.perf_counter()})
+
+    def detach(self) -> "FrameStamps":
+        """Hands the current frame's stamps over to a FrameStamps so the next frame can be started."""
+        stamps = FrameStamps(self, self.current)
+        self.current = {}
+        return stamps
+
+    def record(self, times: dict):
+        """Folds one frame's stage timestamps into the histograms."""
+        previous = None
+        for stage in self.stages:
+            if stage not in times:
+                continue
+            if previous is not None:
+                self.histograms[stage].record(
+                    (times[stage] - times[previous]) * 1000)
+            previous = stage
+        if previous is not None and previous != self.stages[0]:
+            self.last_total = (
+                times[previous] - times[self.stages[0]]) * 1000
+            self.total.record(self.last_total)
+
+    def cancel(self):
+        """Discards the current frame without recording it, e.g. on timeout."""
+        self.current = {}
+
+    def summary(self) -> list[str]:
+        """Returns one line per stage describing the time spent reaching it from the previous stage."""
+        lines = [f"{stage}: {hist.summary()}" for stage,
+                 hist in self.histograms.items() if hist.count]
+        if self.total.count:
+            lines.append(f"total: {self.total.summary()}")
+        return lines
+
+    def write(self, run_dir: Path):
+        """Writes the stage summaries and raw bucket counts to the run's stats file."""
+        with open(run_dir / STATS_FILE, 'w') as file:
+            file.write("# latency per stage, measured from the previous stage\n")
+            for line in self.summary():
+                file.write(line + '\n')
+            file.write("\n# bucket upper edges (ms): " +
+                       ",".join(str(b) for b in BUCKETS_MS) + ",inf\n")
+            for stage, hist in list(self.histograms.items()) + [("total", self.total)]:
+                file.write(f"{stage}: " +
+                           ",".join(str(n) for n in hist.counts) + '\n')
+
+
+class FrameStamps:
+    """Stage timestamps of one frame after it has left the acquisition path, where requests overlap."""
+
+    def __init__(self, timer: FrameTimer, times: dict):
+        self.timer = timer
+        self.times = times
+
+    def stamp(self, stage: str):
+        if self.times and stage not in self.times:
+            self.times[stage] = time.perf_counter()
+
+    def finish(self):
+        self.timer.record(self.times)
+        self.times = {}
+
+
+class Counters:
+    """Running totals maintained by the acquisition path. Cheap enough to bump on every line."""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+        self.parse_errors = 0
+        self.corrupt = 0  # dataframes rejected by their checksum or truncated
+        self.retries = 0  # requests repeated after a corrupt reply
+        self.alarms = 0  # alarms raised or cleared
+        self.timeouts = 0
+        self.dropped = 0
+        self.lost = 0  # sequenced requests overtaken by a later reply
+        self.duplicates = 0  # sequenced replies seen twice
+        self.ping_rtt = None  # milliseconds, None until the first pong
+        self._last_time = time.monotonic()
+        self._last_frames = 0
+        self._last_bytes = 0
+
+    def rates(self) -> Tuple[float, float]:
+        """Returns (frames/s, bytes/s) since the previous call."""
+        now = time.monotonic()
+        elapsed = max(now - self._last_time, 1e-6)
+        fps = (self.frames - self._last_frames) / elapsed
+        bps = (self.bytes - self._last_bytes) / elapsed
+        self._last_time = now
+        self._last_frames = self.frames
+        self._last_bytes = self.bytes
+        return fps, bps
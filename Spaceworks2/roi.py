@@ -0,0 +1,177 @@
+"""Regions of interest on the sensor grid, evaluated for every frame with one matrix product.
+
+ROI files are JSON lists, coordinates in pixels of the frame as displayed (x is the column, y the row):
+
+    [{"name": "die", "rect": [4, 2, 8, 6]},
+     {"name": "hotspot", "circle": [16, 12, 3]},
+     {"name": "edge", "polygon": [[0, 0], [10, 0], [0, 10]]}]
+
+A pixel belongs to an ROI when its centre, (x + 0.5, y + 0.5), lies inside it.
+"""
+from pathlib import Path
+import numpy as np
+import json
+import comm
+
+
+# Columns of RoiSet.evaluate
+FIELDS = ["mean", "max", "min"]
+
+
+class Roi:
+    """Base class: a named region that can rasterize itself onto the sensor grid."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def outline(self) -> np.ndarray:
+        """Closed outline as an (n, 2) array of x, y points, for drawing."""
+        raise NotImplementedError
+
+    def mask(self, shape: tuple = comm.DATA_FORMAT) -> np.ndarray:
+        """Boolean mask of the pixels whose centres lie inside the region."""
+        y, x = np.mgrid[0:shape[0], 0:shape[1]] + 0.5
+        return self.contains(x, y)
+
+
+class Rect(Roi):
+    def __init__(self, name: str, x: float, y: float, width: float, height: float):
+        super().__init__(name)
+        self.x, self.y, self.width, self.height = x, y, width, height
+
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return (x >= self.x) & (x < self.x + self.width) & (y >= self.y) & (y < self.y + self.height)
+
+    def outline(self) -> np.ndarray:
+        x2, y2 = self.x + self.width, self.y + self.height
+        return np.array([(self.x, self.y), (x2, self.y), (x2, y2), (self.x, y2), (self.x, self.y)])
+
+    def to_json(self) -> dict:
+        return {"name": self.name, "rect": [self.x, self.y, self.width, self.height]}
+
+
+class Circle(Roi):
+    def __init__(self, name: str, x: float, y: float, radius: float):
+        super().__init__(name)
+        self.x, self.y, self.radius = x, y, radius
+
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return (x - self.x) ** 2 + (y - self.y) ** 2 <= self.radius ** 2
+
+    def outline(self) -> np.ndarray:
+        angles = np.linspace(0, 2 * np.pi, 65)
+        return np.column_stack([self.x + self.radius * np.cos(angles), self.y + self.radius * np.sin(angles)])
+
+    def to_json(self) -> dict:
+        return {"name": self.name, "circle": [self.x, self.y, self.radius]}
+
+
+class Polygon(Roi):
+    def __init__(self, name: str, points: list):
+        super().__init__(name)
+        self.points = [tuple(point) for point in points]
+
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Even-odd rule: count the edges a ray towards +x crosses, for every pixel at once."""
+        inside = np.zeros(x.shape, dtype=bool)
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:] + self.points[:1]):
+            if y1 == y2:
+                continue
+            crosses = (y1 > y) != (y2 > y)
+            inside ^= crosses & (x < x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+        return inside
+
+    def outline(self) -> np.ndarray:
+        return np.array(self.points + self.points[:1], dtype=float)
+
+    def to_json(self) -> dict:
+        return {"name": self.name, "polygon": [list(point) for point in self.points]}
+
+
+SHAPES = {"rect": Rect, "circle": Circle, "polygon": Polygon}
+
+
+# Coordinates each shape takes, polygons taking a list of x, y pairs
+COORDINATES = {"rect": 4, "circle": 3}
+
+
+def is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def from_json(entry: dict) -> Roi:
+    """Builds an ROI from one entry of an ROI file. Raises ValueError if it isn't one."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"ROI must be an object: {entry!r}")
+    for key, cls in SHAPES.items():
+        if key in entry:
+            args = entry[key]
+            name = str(entry.get("name", key))
+            if cls is Polygon:
+                valid = isinstance(args, list) and len(args) >= 3 and all(
+                    isinstance(point, list) and len(point) == 2 and all(map(is_number, point)) for point in args)
+            else:
+                valid = isinstance(args, list) and len(args) == COORDINATES[key] and all(map(is_number, args))
+            if not valid:
+                raise ValueError(f"bad {key} coordinates: {args!r}")
+            return cls(name, args) if cls is Polygon else cls(name, *args)
+    raise ValueError(f"ROI needs one of {', '.join(SHAPES)}: {entry!r}")
+
+
+class RoiSet:
+    """ROIs rasterized once, so evaluating all of them on a frame is a matrix product and two masked reductions."""
+
+    def __init__(self, rois: list[Roi], shape: tuple = comm.DATA_FORMAT):
+        self.rois = rois
+        self.shape = shape
+        self.names = [roi.name for roi in rois]
+        self.masks = np.array([roi.mask(shape).ravel() for roi in rois], dtype=bool).reshape(
+            len(rois), shape[0] * shape[1])
+        counts = self.masks.sum(axis=1)
+        empty = [roi.name for roi, count in zip(rois, counts) if not count]
+        if empty:
+            raise ValueError(f"ROIs without any pixels: {', '.join(empty)}")
+        # Each row averages its ROI's pixels
+        self.weights = (self.masks / counts[:, np.newaxis]).T
+        # Added before max and min so pixels outside an ROI never win
+        self.max_offset = np.where(self.masks, 0, -np.inf)
+        self.min_offset = np.where(self.masks, 0, np.inf)
+
+    def __len__(self) -> int:
+        return len(self.rois)
+
+    def evaluate(self, frames: np.ndarray) -> np.ndarray:
+        """Mean, max and min of every ROI.
+
+        Args:
+            frames (np.ndarray): a (rows, cols) frame or an (n, rows, cols) stack
+
+        Returns:
+            np.ndarray: (len(self), len(FIELDS)) for a frame, (n, len(self), len(FIELDS)) for a stack
+        """
+        frames = np.asarray(frames, dtype=float)
+        flat = frames.reshape(-1, 1, self.masks.shape[1])
+        means = flat[:, 0] @ self.weights
+        maxima = (flat + self.max_offset).max(axis=2)
+        minima = (flat + self.min_offset).min(axis=2)
+        result = np.stack([means, maxima, minima], axis=2)
+        return result[0] if frames.ndim == 2 else result
+
+    def save(self, path: Path):
+        with open(path, 'w') as file:
+            json.dump([roi.to_json() for roi in self.rois], file, indent=1)
+
+
+def load(path: Path, shape: tuple = comm.DATA_FORMAT) -> RoiSet:
+    """Reads an ROI file. Raises ValueError if it's malformed."""
+    with open(path, 'r') as file:
+        try:
+            entries = json.load(file)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path}: {error}")
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a list of ROIs")
+    return RoiSet([from_json(entry) for entry in entries], shape)
@@ -1,13 +1,18 @@
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QFile, QTextStream
+from PyQt5.QtCore import QFile, QTextStream, QResource
+from pathlib import Path
 import gui
 import sys
-import breeze_resources
+
+
+# Dark Breeze theme assets only, as a binary Qt resource (rcc -binary format)
+STYLE_RESOURCE = Path(__file__).parent / "breeze_dark.rcc"
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
+    QResource.registerResource(str(STYLE_RESOURCE))
     file = QFile(":/dark/stylesheet.qss")
     file.open(QFile.ReadOnly | QFile.Text)
     stream = QTextStream(file)
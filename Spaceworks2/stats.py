@@ -0,0 +1,87 @@
+"""Per-frame statistics, computed for a whole stack of frames at once.
+
+    python stats.py --frames 10000    # throughput benchmark
+"""
+from argparse import ArgumentParser
+import numpy as np
+import time
+
+
+PERCENTILES = [5, 50, 95]
+
+# Columns of the array returned by compute. Locations are (x, y) pixel indices: column and row of the frame as displayed.
+FIELDS = ["min", "max", "mean", "std"] + [f"p{p}" for p in PERCENTILES] + \
+    ["hot_x", "hot_y", "cold_x", "cold_y"]
+
+
+def compute(frames: np.ndarray) -> np.ndarray:
+    """Statistics of a stack of frames.
+
+    Args:
+        frames (np.ndarray): shape (n, rows, cols), or a single (rows, cols) frame
+
+    Returns:
+        np.ndarray: shape (n, len(FIELDS)), one row per frame in FIELDS order
+    """
+    frames = np.asarray(frames, dtype=float)
+    if frames.ndim == 2:
+        frames = frames[np.newaxis]
+    n, rows, cols = frames.shape
+    flat = frames.reshape(n, rows * cols)
+    size = flat.shape[1]
+    # One partial sort yields min, max and the neighbours of every percentile
+    positions = np.array(PERCENTILES) / 100 * (size - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, size - 1)
+    kth = np.unique(np.concatenate([[0, size - 1], lower, upper]))
+    ordered = np.partition(flat, kth, axis=1)
+    fraction = positions - lower
+    percentiles = ordered[:, lower] * (1 - fraction) + ordered[:, upper] * fraction
+    mean = flat.mean(axis=1)
+    # E[x^2] - E[x]^2 in one multiply-accumulate, without a centred copy of the stack
+    variance = np.einsum('ij,ij->i', flat, flat) / size - mean * mean
+    hot_y, hot_x = np.unravel_index(flat.argmax(axis=1), (rows, cols))
+    cold_y, cold_x = np.unravel_index(flat.argmin(axis=1), (rows, cols))
+    return np.column_stack([ordered[:, 0], ordered[:, -1], mean, np.sqrt(np.maximum(variance, 0)),
+                            percentiles, hot_x, hot_y, cold_x, cold_y])
+
+
+def frame_stats(data: np.ndarray) -> dict:
+    """Statistics of a single frame, keyed by field name."""
+    return dict(zip(FIELDS, compute(data)[0]))
+
+
+def format_row(row: np.ndarray) -> str:
+    """Formats one row of compute's output as csv fields, locations as integers."""
+    return ",".join(f"{value:.0f}" if field.endswith(("_x", "_y")) else f"{value:.3f}"
+                    for field, value in zip(FIELDS, row))
+
+
+def benchmark(frames: int = 10000, shape: tuple = (24, 32), batch: int = 1000):
+    """Prints the throughput of per-frame and batched statistics against a plain numpy reference."""
+    stack = np.random.uniform(10, 30, (frames,) + shape)
+
+    def reference(data):
+        return [data.min(), data.max(), data.mean(), data.std(), *np.percentile(data, PERCENTILES),
+                *np.unravel_index(data.argmax(), data.shape)[::-1], *np.unravel_index(data.argmin(), data.shape)[::-1]]
+
+    start = time.perf_counter()
+    expected = np.array([reference(data) for data in stack])
+    timings = {"reference": time.perf_counter() - start}
+    start = time.perf_counter()
+    single = np.concatenate([compute(data) for data in stack])
+    timings["per frame"] = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = np.concatenate([compute(stack[i:i + batch]) for i in range(0, frames, batch)])
+    timings[f"batches of {batch}"] = time.perf_counter() - start
+    assert np.allclose(single, expected) and np.allclose(batched, expected)
+    for name, elapsed in timings.items():
+        print(f"{name:>16}: {frames / elapsed:10.0f} frames/s ({elapsed * 1e6 / frames:.1f} us/frame)")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.frames, batch=args.batch)
@@ -0,0 +1,251 @@
+from pathlib import Path
+import numpy as np
+import json
+import acquisition
+import comm
+import events
+import roi
+import stats
+import tracking
+import upsample
+
+
+INDEX_FILE = "index.csv"
+SYNC_FILE = "sync.csv"
+FRAME_STATS_FILE = "frame_stats.csv"
+ROI_FILE = "rois.csv"
+ROI_DEFINITIONS_FILE = "rois.json"
+EVENTS_FILE = "events.csv"
+TRACKS_FILE = "tracks.csv"
+TRACKS_HEADER = "device,frame,timestamp,track,x,y,pixels,peak,mean"
+# Every saved frame is also appended, as float32, to a raw file per device directory: frame N is record N-1
+RAW_FILE = "frames.f32"
+RAW_TIMES_FILE = "timestamps.f64"
+RAW_META_FILE = "frames.json"
+RAW_DTYPE = np.dtype('<f4')
+RAW_TIMES_DTYPE = np.dtype('<f8')
+PNG_SCALE = 10  # each sensor pixel becomes PNG_SCALE x PNG_SCALE png pixels
+
+
+def save_png(data: np.ndarray, path: Path, interpolation: str = upsample.NEAREST):
+    """Renders a frame with the plasma LUT and saves it as a png. Requires Pillow.
+
+    Args:
+        interpolation (str, optional): one of upsample.METHODS. Nearest keeps the sensor pixels as blocks. Defaults to nearest.
+    """
+    from PIL import Image
+    import colormap
+    if interpolation == upsample.NEAREST:
+        rgb = colormap.render_rgb(data)
+        rgb = np.repeat(np.repeat(rgb, PNG_SCALE, axis=0), PNG_SCALE, axis=1)
+    else:
+        rows, cols = data.shape
+        smooth = upsample.cache.upsample(
+            data, (rows * PNG_SCALE, cols * PNG_SCALE), interpolation)
+        # the same colour scale as the raw frame; bicubic overshoot is clipped
+        rgb = colormap.render_rgb(smooth, (data.min(), data.max()))
+    Image.fromarray(rgb).save(path)
+
+
+def open_csv(path: Path, header: str):
+    """Opens a csv for appending, writing the header line if the file is new."""
+    new = not path.exists()
+    file = open(path, 'a')
+    if new:
+        file.write(header + '\n')
+    return file
+
+
+def stats_header() -> str:
+    return "device,frame," + ",".join(stats.FIELDS)
+
+
+def append_stats(run_dir: Path, device_id: str, number: int, row: np.ndarray):
+    """Adds one frame's statistics to the run's frame_stats.csv, for writers that don't keep a RunStore."""
+    with open_csv(run_dir / FRAME_STATS_FILE, stats_header()) as file:
+        file.write(f"{device_id},{number},{stats.format_row(row)}\n")
+
+
+def roi_rows(device_id: str, number: int, rois: roi.RoiSet, values: np.ndarray) -> str:
+    """One line of rois.csv per ROI."""
+    return "".join(f"{device_id},{number},{name}," + ",".join(f"{value:.3f}" for value in row) + "\n"
+                   for name, row in zip(rois.names, values))
+
+
+def append_rois(run_dir: Path, device_id: str, number: int, rois: roi.RoiSet, values: np.ndarray):
+    """Adds one frame's ROI values to the run's rois.csv, for writers that don't keep a RunStore."""
+    with open_csv(run_dir / ROI_FILE, "device,frame,roi," + ",".join(roi.FIELDS)) as file:
+        file.write(roi_rows(device_id, number, rois, values))
+
+
+def track_rows(device_id: str, number: int, timestamp: float, tracks: list[tracking.Track]) -> str:
+    """One line of tracks.csv per track seen in a frame. Frames that weren't saved have no number."""
+    frame = number if number else ""
+    return "".join(f"{device_id},{frame},{timestamp:.6f},{track.track_id},{track.blob.x:.3f},{track.blob.y:.3f},"
+                   f"{track.blob.pixels},{track.blob.peak:.3f},{track.blob.mean:.3f}\n" for track in tracks)
+
+
+def append_tracks(run_dir: Path, device_id: str, number: int, timestamp: float, tracks: list[tracking.Track]):
+    """Adds one frame's tracks to the run's tracks.csv, for writers that don't keep a RunStore."""
+    with open_csv(run_dir / TRACKS_FILE, TRACKS_HEADER) as file:
+        file.write(track_rows(device_id, number, timestamp, tracks))
+
+
+class RawWriter:
+    """Appends frames and their arrival times to the raw files that timeseries reads without parsing any csv."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.frames = open(directory / RAW_FILE, 'ab')
+        self.times = open(directory / RAW_TIMES_FILE, 'ab')
+
+    def write(self, data: np.ndarray, timestamp: float):
+        if not (self.directory / RAW_META_FILE).exists():
+            with open(self.directory / RAW_META_FILE, 'w') as file:
+                json.dump({"shape": list(data.shape), "dtype": RAW_DTYPE.str}, file)
+        self.frames.write(np.ascontiguousarray(data, dtype=RAW_DTYPE).tobytes())
+        self.times.write(np.array(timestamp, dtype=RAW_TIMES_DTYPE).tobytes())
+
+    def close(self):
+        self.frames.close()
+        self.times.close()
+
+
+def append_raw(directory: Path, data: np.ndarray, timestamp: float):
+    """Appends one frame to the raw files, for writers that don't keep a RunStore."""
+    writer = RawWriter(directory)
+    writer.write(data, timestamp)
+    writer.close()
+
+
+def stored_frames(directory: Path) -> int:
+    """Frames already in a directory's raw files, so a reused run directory carries on numbering after them.
+
+    A record cut short by a crash is dropped, and the timestamps are trimmed or NaN-padded to match, so the next
+    frame lands at its own record. Raises ValueError for a directory with csv frames but no raw file, whose
+    numbering the raw file couldn't follow.
+    """
+    meta_path = directory / RAW_META_FILE
+    if not meta_path.exists():
+        if comm.frame_files(directory):
+            raise ValueError(f"{directory} has frames but no {RAW_FILE}; "
+                             "convert it with timeseries.py --convert or use a new run directory")
+        return 0
+    with open(meta_path) as file:
+        meta = json.load(file)
+    frame_bytes = int(np.prod(meta["shape"])) * np.dtype(meta["dtype"]).itemsize
+    count = (directory / RAW_FILE).stat().st_size // frame_bytes if (directory / RAW_FILE).exists() else 0
+    with open(directory / RAW_FILE, 'ab') as file:
+        file.truncate(count * frame_bytes)
+    with open(directory / RAW_TIMES_FILE, 'ab') as file:
+        times = file.tell() // RAW_TIMES_DTYPE.itemsize
+        file.truncate(min(times, count) * RAW_TIMES_DTYPE.itemsize)
+        file.write(np.full(max(count - times, 0), np.nan, RAW_TIMES_DTYPE).tobytes())
+    return count
+
+
+def device_dirs(run_dir: Path, device_ids: list[str]) -> dict:
+    """Where each device's frames go: the run directory itself for one device, a subdirectory each for several."""
+    return {device_id: run_dir / device_id if len(device_ids) > 1 else run_dir for device_id in device_ids}
+
+
+class RunStore:
+    """Writes the frames of one run, from one or more devices, to its run directory.
+
+    With a single device frames go straight into the run directory as before; with several, each device gets
+    a subdirectory. Every saved frame is also listed in index.csv with its device and arrival time, which is
+    what lines frames from different cameras up against each other, and its statistics go to frame_stats.csv.
+    Frames are also appended to frames.f32 for timeseries; in a reused run directory numbering carries on
+    after the frames already there.
+    Given ROIs, their values for every frame go to rois.csv and their definitions to rois.json.
+    """
+
+    def __init__(self, run_dir: Path, device_ids: list[str], rois: roi.RoiSet = None,
+                 interpolation: str = upsample.NEAREST):
+        self.run_dir = run_dir
+        self.directories = device_dirs(run_dir, device_ids)
+        for directory in self.directories.values():
+            directory.mkdir(parents=True, exist_ok=True)
+        self.numbers = {device_id: stored_frames(directory) for device_id, directory in self.directories.items()}
+        self.raw = {device_id: RawWriter(self.device_dir(device_id)) for device_id in device_ids}
+        self.index = open_csv(run_dir / INDEX_FILE,
+                              "device,frame,timestamp,latency_ms")
+        self.stats = open_csv(run_dir / FRAME_STATS_FILE, stats_header())
+        self.rois = rois
+        self.interpolation = interpolation
+        self.roi_file = None
+        if rois:
+            rois.save(run_dir / ROI_DEFINITIONS_FILE)
+            self.roi_file = open_csv(run_dir / ROI_FILE,
+                                     "device,frame,roi," + ",".join(roi.FIELDS))
+        self.sync = None
+        self.events = None
+        self.tracks = None
+
+    def device_dir(self, device_id: str) -> Path:
+        return self.directories[device_id]
+
+    def save(self, frame: acquisition.Frame, png: bool = False) -> int:
+        """Saves a frame as the device's next frame_N.csv (and .png) and returns N."""
+        self.numbers[frame.device_id] += 1
+        number = self.numbers[frame.device_id]
+        directory = self.device_dir(frame.device_id)
+        comm.save_csv(frame.data, directory / f"frame_{number}.csv")
+        if png:
+            save_png(frame.data, directory /
+                     f"frame_{number}.png", self.interpolation)
+        self.raw[frame.device_id].write(frame.data, frame.timestamp)
+        self.index.write(
+            f"{frame.device_id},{number},{frame.timestamp:.6f},{frame.latency():.3f}\n")
+        self.stats.write(
+            f"{frame.device_id},{number},{stats.format_row(stats.compute(frame.data)[0])}\n")
+        if self.rois:
+            self.roi_file.write(roi_rows(frame.device_id, number, self.rois,
+                                         self.rois.evaluate(frame.data)))
+        return number
+
+    def save_event(self, frame: acquisition.Frame, number: int, event: events.Event):
+        """Records why a saved frame triggered in events.csv."""
+        if self.events is None:
+            self.events = open_csv(self.run_dir / EVENTS_FILE,
+                                   "device,frame,timestamp,reasons,changed_pixels,max_delta,hotspot")
+        self.events.write(f"{frame.device_id},{number},{frame.timestamp:.6f},{event.describe()},"
+                          f"{event.changed},{event.max_delta:.3f},{event.hotspot:.3f}\n")
+
+    def save_tracks(self, frame: acquisition.Frame, number: int, tracks: list[tracking.Track]):
+        """Records the tracks seen in a frame in tracks.csv, whether or not the frame itself was saved."""
+        if not tracks:
+            return
+        if self.tracks is None:
+            self.tracks = open_csv(self.run_dir / TRACKS_FILE, TRACKS_HEADER)
+        self.tracks.write(track_rows(frame.device_id, number, frame.timestamp, tracks))
+
+    def save_set(self, frame_set: acquisition.FrameSet, png: bool = False) -> dict:
+        """Saves every frame of a synchronized set and records which frames belong together in sync.csv.
+
+        Offsets are relative to the first device triggered, in milliseconds. Returns device id -> frame number.
+        """
+        if self.sync is None:
+            self.sync = open_csv(self.run_dir / SYNC_FILE,
+                                 "set,device,frame,sent_offset_ms,received_offset_ms")
+        origin = min(frame_set.sent.values())
+        numbers = {}
+        for device_id, frame in frame_set.frames.items():
+            numbers[device_id] = number = self.save(frame, png)
+            self.sync.write(f"{frame_set.number},{device_id},{number},"
+                            f"{(frame_set.sent[device_id] - origin) * 1000:.3f},{(frame.received - origin) * 1000:.3f}\n")
+        return numbers
+
+    def close(self):
+        for writer in self.raw.values():
+            writer.close()
+        self.index.close()
+        self.stats.close()
+        if self.roi_file:
+            self.roi_file.close()
+        if self.sync:
+            self.sync.close()
+        if self.events:
+            self.events.close()
+        if self.tracks:
+            self.tracks.close()
@@ -0,0 +1,202 @@
+"""Time series of pixels and ROIs over stored runs, read from the raw frames.f32 instead of every frame_N.csv.
+
+Frames are memory-mapped, so a pixel's history is a strided view reading one value per frame. For long runs a
+pixel-major copy of the frames (pixels.f32) is built on first use and extended as the run grows; it turns each
+history into one contiguous read. Runs recorded before frames.f32 existed are converted with --convert.
+
+    python timeseries.py data/run_3 --pixel 16 12 --pixel 3 4
+    python timeseries.py data/run_3 --roi rois.json
+    python timeseries.py data/run_1 --convert
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import numpy as np
+import comm
+import json
+import os
+import roi
+import store
+import sys
+import time
+
+
+INDEX_FILE = "pixels.f32"
+INDEX_META_FILE = "pixels.json"
+INDEX_MIN_FRAMES = 1000  # shorter runs read the frames directly; the index wouldn't pay for itself
+INDEX_CHUNK = 4096  # frames transposed at a time while building the index
+
+
+class Series:
+    """The raw frames of one device in a run.
+
+    Args:
+        run_dir (Path): the run directory
+        device_id (str, optional): the device's subdirectory, for runs from several cameras. Defaults to None.
+    """
+
+    def __init__(self, run_dir: Path, device_id: str = None):
+        self.directory = Path(run_dir) / device_id if device_id else Path(run_dir)
+        meta_path = self.directory / store.RAW_META_FILE
+        if not meta_path.exists():
+            raise ValueError(f"no {store.RAW_FILE} in {self.directory}, convert the run first")
+        with open(meta_path) as file:
+            meta = json.load(file)
+        self.shape = tuple(meta["shape"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.pixels = self.shape[0] * self.shape[1]
+        self.reload()
+
+    def reload(self):
+        """Maps the frames written so far, ignoring a partly written last one."""
+        frame_bytes = self.pixels * self.dtype.itemsize
+        self.count = os.path.getsize(self.directory / store.RAW_FILE) // frame_bytes
+        self.frames = np.memmap(self.directory / store.RAW_FILE, self.dtype, 'r', shape=(self.count,) + self.shape) \
+            if self.count else np.zeros((0,) + self.shape, self.dtype)
+        times_path = self.directory / store.RAW_TIMES_FILE
+        times = np.fromfile(times_path, store.RAW_TIMES_DTYPE) if times_path.exists() else np.zeros(0)
+        self.timestamps = np.full(self.count, np.nan)
+        self.timestamps[:min(len(times), self.count)] = times[:self.count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def pixel(self, x: int, y: int, use_index: bool = None) -> np.ndarray:
+        """History of the pixel in column x, row y.
+
+        Args:
+            use_index (bool, optional): read it from the pixel-major index, building or extending that first.
+                Defaults to None, doing so for runs of INDEX_MIN_FRAMES frames or more.
+
+        Returns:
+            np.ndarray: (frames,) float32 values, frame N at position N-1
+        """
+        rows, cols = self.shape
+        if not (0 <= x < cols and 0 <= y < rows):
+            raise ValueError(f"pixel {x},{y} is outside the {cols}x{rows} frame")
+        if self.use_index(use_index):
+            return np.array(self.index()[y * cols + x, :self.count])
+        return np.array(self.frames[:, y, x])
+
+    def roi(self, region: roi.Roi, use_index: bool = None) -> np.ndarray:
+        """Mean of an ROI in every frame, as (frames,) float64 values."""
+        mask = region.mask(self.shape).ravel()
+        if not mask.any():
+            raise ValueError(f"ROI {region.name} has no pixels")
+        if self.use_index(use_index):
+            # the ROI's pixel rows of the index, averaged a block of pixels at a time
+            index = self.index()
+            total = np.zeros(self.count)
+            pixels = np.flatnonzero(mask)
+            for start in range(0, len(pixels), 64):
+                total += index[pixels[start:start + 64], :self.count].sum(axis=0, dtype=float)
+            return total / len(pixels)
+        means = np.empty(self.count)
+        flat = self.frames.reshape(self.count, -1)
+        for start in range(0, self.count, INDEX_CHUNK):
+            means[start:start + INDEX_CHUNK] = flat[start:start + INDEX_CHUNK][:, mask].mean(axis=1)
+        return means
+
+    def use_index(self, use_index: bool) -> bool:
+        return use_index if use_index is not None else self.count >= INDEX_MIN_FRAMES
+
+    def index(self) -> np.memmap:
+        """The pixel-major index, (pixels, capacity), with the first len(self) columns filled.
+
+        Capacity is doubled whenever the run outgrows it, so a growing run is mostly extended rather than rebuilt.
+        """
+        meta_path = self.directory / INDEX_META_FILE
+        meta = {"frames": 0, "capacity": 0}
+        if meta_path.exists() and (self.directory / INDEX_FILE).exists():
+            with open(meta_path) as file:
+                meta = json.load(file)
+        if meta["frames"] > self.count:
+            # the frames were rewritten since
+            meta = {"frames": 0, "capacity": 0}
+        if self.count > meta["capacity"]:
+            capacity = max(INDEX_CHUNK, 1 << (self.count - 1).bit_length())
+            index = np.memmap(self.directory / INDEX_FILE, self.dtype, 'w+', shape=(self.pixels, capacity))
+            meta = {"frames": 0, "capacity": capacity}
+        else:
+            index = np.memmap(self.directory / INDEX_FILE, self.dtype, 'r+', shape=(self.pixels, meta["capacity"]))
+        if meta["frames"] < self.count:
+            flat = self.frames.reshape(self.count, -1)
+            for start in range(meta["frames"], self.count, INDEX_CHUNK):
+                stop = min(start + INDEX_CHUNK, self.count)
+                index[:, start:stop] = flat[start:stop].T
+            index.flush()
+            meta["frames"] = self.count
+            with open(meta_path, 'w') as file:
+                json.dump(meta, file)
+        return index
+
+
+def convert(run_dir: Path, device_id: str = None) -> int:
+    """Writes the raw files for a run saved only as frame_N.csv, arrival times taken from index.csv.
+
+    Missing frame numbers are filled with NaN frames, so frame N stays at position N-1. Returns the frame count.
+    """
+    directory = Path(run_dir) / device_id if device_id else Path(run_dir)
+    if (directory / store.RAW_FILE).exists():
+        raise ValueError(f"{directory} already has {store.RAW_FILE}")
+    files = comm.frame_files(directory)
+    if not files:
+        raise ValueError(f"no frames in {directory}")
+    timestamps = {}
+    index_path = Path(run_dir) / store.INDEX_FILE
+    if index_path.exists():
+        with open(index_path) as file:
+            next(file)
+            for line in file:
+                device, number, timestamp = line.split(',')[:3]
+                if device_id is None or device == device_id:
+                    timestamps[int(number)] = float(timestamp)
+    writer = store.RawWriter(directory)
+    try:
+        shape = None
+        for number in range(1, max(files) + 1):
+            if number in files:
+                data = comm.load_csv(files[number])
+                shape = data.shape
+            else:
+                data = np.full(shape if shape else comm.load_csv(files[min(files)]).shape, np.nan)
+            writer.write(data, timestamps.get(number, np.nan))
+    finally:
+        writer.close()
+    return max(files)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("run_dir", type=Path)
+    parser.add_argument("--device", help="device subdirectory, for runs from several cameras")
+    parser.add_argument("--convert", action="store_true", help="write frames.f32 for a run saved only as csv")
+    parser.add_argument("--pixel", nargs=2, type=int, action="append", default=[], metavar=("X", "Y"),
+                        help="print the history of the pixel in column X, row Y. Repeatable")
+    parser.add_argument("--roi", type=Path, metavar="FILE", help="print the mean of every ROI in FILE per frame")
+    args = parser.parse_args(argv)
+    try:
+        if args.convert:
+            start = time.perf_counter()
+            count = convert(args.run_dir, args.device)
+            print(f"{count} frames converted in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        series = Series(args.run_dir, args.device)
+        columns = {}
+        start = time.perf_counter()
+        for x, y in args.pixel:
+            columns[f"{x},{y}"] = series.pixel(x, y)
+        if args.roi:
+            for region in roi.load(args.roi).rois:
+                columns[region.name] = series.roi(region)
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    if columns:
+        print("frame,timestamp," + ",".join(f'"{name}"' for name in columns))
+        for i in range(len(series)):
+            print(f"{i + 1},{series.timestamps[i]:.6f}," + ",".join(f"{values[i]:.3f}" for values in columns.values()))
+        print(f"{len(columns)} series of {len(series)} frames in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
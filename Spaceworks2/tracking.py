@@ -0,0 +1,177 @@
+"""Detection of hot blobs in each frame and tracking of them from frame to frame, fast enough to run on the stream.
+
+Tracking is configured with a comma separated spec like the event triggers, e.g. 'delta:5,pixels:2,distance:3':
+blobs are 8-connected groups of at least 2 pixels more than 5 °C above the frame's median, and a blob continues
+a track whose predicted position is within 3 pixels. 'above:T' uses a fixed threshold of T °C instead.
+
+Positions are in sensor pixels, x along columns and y along rows, with pixel centres at whole numbers like the
+hot_x and hot_y of frame_stats.csv.
+"""
+import numpy as np
+import events
+
+
+DEFAULT_TRACKING = "delta:5,pixels:2"
+MIN_PIXELS = 2  # smaller blobs are taken for noise
+MAX_DISTANCE = 3.0  # pixels between a track's predicted position and a blob continuing it
+LOST_FRAMES = 5  # frames a track may go unseen before it ends
+
+# Half of the 8-connected neighbourhood; the other half is the same links seen from the other end
+FORWARD = [(0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def label(mask: np.ndarray) -> np.ndarray:
+    """Labels the 8-connected components of a boolean image, without scipy.
+
+    Only the masked pixels and the links between neighbouring ones are looked at. Every pixel starts with its own
+    label, each link hands the smaller of its two labels to both ends, and pointer jumping (a pixel adopting its
+    label's label) lets long blobs settle in a few passes.
+
+    Returns:
+        np.ndarray: int labels 0..n-1 per pixel, -1 outside the mask
+    """
+    rows, cols = mask.shape
+    # index of each masked pixel, with a border of -1 below and either side so neighbours never wrap
+    index = np.full((rows + 1, cols + 2), -1)
+    ys, xs = np.nonzero(mask)
+    index[ys, xs + 1] = np.arange(len(ys))
+    ends = []
+    for dy, dx in FORWARD:
+        other = index[ys + dy, xs + 1 + dx]
+        linked = other >= 0
+        ends.append((np.flatnonzero(linked), other[linked]))
+    a = np.concatenate([a for a, _ in ends])
+    b = np.concatenate([b for _, b in ends])
+    labels = np.arange(len(ys))
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        settled = labels.copy()
+        np.minimum.at(settled, a, low)
+        np.minimum.at(settled, b, low)
+        # a label is the index of a pixel in the same component, whose own label is no larger
+        settled = settled[settled]
+        if np.array_equal(settled, labels):
+            break
+        labels = settled
+    result = np.full((rows, cols), -1)
+    result[ys, xs] = np.unique(labels, return_inverse=True)[1]
+    return result
+
+
+class Blob:
+    """A connected group of hot pixels in one frame."""
+
+    def __init__(self, x: float, y: float, pixels: int, peak: float, mean: float):
+        self.x = x  # centroid weighted by each pixel's excess over the threshold, sub-pixel
+        self.y = y
+        self.pixels = pixels
+        self.peak = peak  # °C
+        self.mean = mean  # °C
+
+
+def detect(data: np.ndarray, threshold: float, min_pixels: int = MIN_PIXELS) -> list[Blob]:
+    """Finds the blobs above threshold, their properties summed per label in single bincount passes."""
+    mask = data > threshold
+    if not mask.any():
+        return []
+    labels = label(mask)
+    ys, xs = np.nonzero(mask)
+    ids = labels[ys, xs]
+    values = data[ys, xs]
+    excess = values - threshold
+    count = np.bincount(ids)
+    weight = np.bincount(ids, excess)
+    x = np.bincount(ids, excess * xs) / weight
+    y = np.bincount(ids, excess * ys) / weight
+    mean = np.bincount(ids, values) / count
+    peak = np.full(len(count), -np.inf)
+    np.maximum.at(peak, ids, values)
+    return [Blob(float(x[i]), float(y[i]), int(count[i]), float(peak[i]), float(mean[i]))
+            for i in np.flatnonzero(count >= min_pixels)]
+
+
+class Track:
+    """A blob followed across frames, predicted to keep its velocity while unseen."""
+
+    def __init__(self, track_id: int, blob: Blob):
+        self.track_id = track_id
+        self.blob = blob
+        self.x = blob.x
+        self.y = blob.y
+        self.vx = 0.0  # pixels per frame
+        self.vy = 0.0
+        self.seen = 1
+        self.missed = 0  # frames since it was last seen
+
+    def predict(self) -> tuple:
+        return self.x + self.vx * (self.missed + 1), self.y + self.vy * (self.missed + 1)
+
+    def extend(self, blob: Blob):
+        elapsed = self.missed + 1
+        self.vx = (blob.x - self.x) / elapsed
+        self.vy = (blob.y - self.y) / elapsed
+        self.x = blob.x
+        self.y = blob.y
+        self.blob = blob
+        self.seen += 1
+        self.missed = 0
+
+
+class Tracker:
+    """Detects the blobs of one device's frames and associates them with its tracks."""
+
+    def __init__(self, above: float = None, delta: float = 5.0, pixels: int = MIN_PIXELS,
+                 distance: float = MAX_DISTANCE, lost: int = LOST_FRAMES):
+        self.above = above
+        self.delta = delta
+        self.pixels = pixels
+        self.distance = distance
+        self.lost = lost
+        self.tracks = []
+        self.next_id = 1
+
+    def threshold(self, data: np.ndarray) -> float:
+        return self.above if self.above is not None else float(np.median(data)) + self.delta
+
+    def update(self, data: np.ndarray) -> list[Track]:
+        """Tracks a frame's blobs. Returns the tracks seen in it, new ones included.
+
+        Association is greedy on distance: the closest track and blob within self.distance pair up first.
+        """
+        blobs = detect(data, self.threshold(data), self.pixels)
+        pairs = []
+        if self.tracks and blobs:
+            predicted = np.array([track.predict() for track in self.tracks])
+            positions = np.array([(blob.x, blob.y) for blob in blobs])
+            distances = np.hypot(*(predicted[:, np.newaxis] - positions[np.newaxis]).transpose(2, 0, 1))
+            candidates = np.argwhere(distances <= self.distance)
+            pairs = candidates[np.argsort(distances[tuple(candidates.T)], kind='stable')]
+        matched_tracks, matched_blobs = set(), set()
+        seen = []
+        for t, b in pairs:
+            if t in matched_tracks or b in matched_blobs:
+                continue
+            matched_tracks.add(t)
+            matched_blobs.add(b)
+            self.tracks[t].extend(blobs[b])
+            seen.append(self.tracks[t])
+        survivors = []
+        for t, track in enumerate(self.tracks):
+            if t not in matched_tracks:
+                track.missed += 1
+            if track.missed <= self.lost:
+                survivors.append(track)
+        self.tracks = survivors
+        for b, blob in enumerate(blobs):
+            if b not in matched_blobs:
+                track = Track(self.next_id, blob)
+                self.next_id += 1
+                self.tracks.append(track)
+                seen.append(track)
+        return sorted(seen, key=lambda track: track.track_id)
+
+
+def parse_tracking(spec: str) -> dict:
+    """Turns a tracking spec into Tracker keyword arguments. Raises ValueError."""
+    return events.parse_spec(spec, {"above": float, "delta": float, "pixels": int, "distance": float, "lost": int},
+                             "tracking option")
@@ -0,0 +1,96 @@
+"""Interpolated upsampling of frames for display and export.
+
+Interpolation along each axis is linear in the data, so it is a matrix: an upsampled frame is
+rows_weights @ frame @ cols_weights.T, two small matrix products with weights computed once per size.
+"""
+from collections import OrderedDict
+import functools
+import numpy as np
+
+
+NEAREST = "nearest"
+BILINEAR = "bilinear"
+BICUBIC = "bicubic"
+METHODS = [NEAREST, BILINEAR, BICUBIC]
+
+DEFAULT_FACTOR = 10  # 24x32 -> 240x320
+CACHE_SIZE = 32  # upsampled frames kept by a FrameCache
+CUBIC_A = -0.5  # Keys' cubic convolution parameter, as used by most image libraries
+
+
+def cubic(t: np.ndarray) -> np.ndarray:
+    """Keys' cubic convolution kernel."""
+    t = np.abs(t)
+    return np.where(t <= 1, ((CUBIC_A + 2) * t - (CUBIC_A + 3)) * t * t + 1,
+                    np.where(t < 2, CUBIC_A * (((t - 5) * t + 8) * t - 4), 0.0))
+
+
+@functools.lru_cache(maxsize=None)
+def weights(size_in: int, size_out: int, method: str) -> np.ndarray:
+    """(size_out, size_in) matrix resampling one axis. Output and input pixel centres are aligned, edges are clamped."""
+    if method not in METHODS:
+        raise ValueError(f"unknown interpolation {method!r}, expected one of {', '.join(METHODS)}")
+    # position of each output pixel centre in input pixel coordinates
+    source = (np.arange(size_out) + 0.5) * size_in / size_out - 0.5
+    matrix = np.zeros((size_out, size_in))
+    rows = np.arange(size_out)
+    if method == NEAREST:
+        matrix[rows, np.clip(np.floor(source + 0.5).astype(int), 0, size_in - 1)] = 1
+    else:
+        base = np.floor(source).astype(int)
+        taps = [0, 1] if method == BILINEAR else [-1, 0, 1, 2]
+        for tap in taps:
+            distance = source - (base + tap)
+            weight = 1 - np.abs(distance) if method == BILINEAR else cubic(distance)
+            # clamping folds taps beyond the edge onto the edge pixel
+            np.add.at(matrix, (rows, np.clip(base + tap, 0, size_in - 1)), weight)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def output_shape(data: np.ndarray, shape: tuple = None) -> tuple:
+    """The shape upsample produces: shape, or DEFAULT_FACTOR times the frame's own."""
+    rows, cols = data.shape
+    return tuple(shape) if shape else (rows * DEFAULT_FACTOR, cols * DEFAULT_FACTOR)
+
+
+def upsample(data: np.ndarray, shape: tuple = None, method: str = BILINEAR) -> np.ndarray:
+    """Resamples a frame to shape, by default DEFAULT_FACTOR times its own."""
+    rows, cols = data.shape
+    shape = output_shape(data, shape)
+    return weights(rows, shape[0], method) @ data @ weights(cols, shape[1], method).T
+
+
+class FrameCache:
+    """Remembers the most recent upsampled frames, so redrawing or exporting a frame doesn't upsample it again.
+
+    Frames are keyed on their contents, so a frame that was filtered or calibrated in the meantime is redone.
+    """
+
+    def __init__(self, size: int = CACHE_SIZE):
+        self.size = size
+        self.frames = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def upsample(self, data: np.ndarray, shape: tuple = None, method: str = BILINEAR) -> np.ndarray:
+        """As upsample, but returns the cached result for a frame seen before. Don't modify what it returns."""
+        # keyed on the resolved shape, so the default and an explicit request for the same size share an entry
+        shape = output_shape(data, shape)
+        key = (data.shape, data.tobytes(), shape, method)
+        result = self.frames.get(key)
+        if result is not None:
+            self.hits += 1
+            self.frames.move_to_end(key)
+            return result
+        self.misses += 1
+        result = upsample(data, shape, method)
+        result.setflags(write=False)
+        self.frames[key] = result
+        if len(self.frames) > self.size:
+            self.frames.popitem(last=False)
+        return result
+
+
+# Shared by the image windows and the png export
+cache = FrameCache()